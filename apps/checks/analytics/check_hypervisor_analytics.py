@@ -2,15 +2,14 @@ from datetime import datetime
 from decimal import Decimal
 import logging
 
-import tqdm
 from apps.checks.base_objects import analysis_item, base_analyzer_object
 from apps.checks.helpers.database import get_hypervisor_last_status
 from apps.checks.helpers.endpoint import get_csv_analytics_data_from_endpoint
+from apps.checks.helpers.transfers import get_transfer_scan
 from bins.apis.etherscan_utilities import etherscan_helper
 from bins.configuration import CONFIGURATION
 from bins.database.helpers import get_from_localdb
 from bins.general.enums import Chain, Protocol, text_to_chain
-from bins.w3.protocols.gamma.collectors import generic_transfer_collector
 
 
 def check_hypervisors_analytics(
@@ -699,7 +698,6 @@ class analytics_analyzer(base_analyzer_object):
                     to_addresses=[row2["address"]],
                     block_ini=row1["block"],
                     block_end=row2["block"],
-                    max_blocks_step=10000,
                 ):
 
                     # check that those operations are not in database ( corresponding to deposits or withdraws)
@@ -746,47 +744,10 @@ class analytics_analyzer(base_analyzer_object):
         to_addresses: list[str],
         block_ini: int,
         block_end: int,
-        max_blocks_step: int = 1000,
     ) -> list[dict]:
-        transfer_data_helper = generic_transfer_collector(
-            network=chain.database_name,
-            from_addresses=from_addresses,
-            to_addresses=to_addresses,
-        )
-
-        transfers_to_hypes = []
-
-        with tqdm.tqdm(total=100) as progress_bar:
-            # create callback progress funtion
-            def _update_progress(text=None, remaining=None, total=None):
-                # set text
-                if text:
-                    progress_bar.set_description(text)
-                # set total
-                if total:
-                    progress_bar.total = total
-                # update current
-                if remaining:
-                    progress_bar.update(((total - remaining) - progress_bar.n))
-                else:
-                    progress_bar.update(1)
-                # refresh
-                progress_bar.refresh()
-
-            # set progress callback to data collector
-            transfer_data_helper.progress_callback = _update_progress
-
-            for operations in transfer_data_helper.operations_generator(
-                block_ini=block_ini,
-                block_end=block_end,
-                max_blocks=max_blocks_step,
-            ):
-                # filter any transfer that is not a direct transfer ( deposit or withdraw)
-                for operation in operations:
-                    if operation["address"] in to_addresses:
-                        # this is a deposit or withdraw,
-                        continue
-                    # process operation
-                    transfers_to_hypes.append(operation)
-
-        return transfers_to_hypes
+        """Direct transfers ( not deposits or withdraws ) from addresses to hypervisors between two blocks.
+            Only the blocks not scanned by previous checks are queried ( see transfer_scan )
+        """
+        return get_transfer_scan(
+            chain=chain, from_addresses=from_addresses, to_addresses=to_addresses
+        ).get_transfers(block_ini=block_ini, block_end=block_end)
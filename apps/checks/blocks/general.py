@@ -1,7 +1,8 @@
 import logging
 from apps.checks.base_objects import analysis_item, base_analyzer_object
+from apps.checks.helpers.database import get_offending_ids
 from bins.database.common.db_collections_common import database_global, database_local
-from bins.database.helpers import get_default_globaldb, get_from_localdb
+from bins.database.helpers import get_default_globaldb, get_default_localdb
 from bins.general.enums import Chain
 
 
@@ -12,7 +13,8 @@ def check_localdb_blocks(local_db_manager: database_local):
         local_db_manager (database_local):
     """
 
-    if blocks_operatons := local_db_manager.get_items_from_database(
+    if blocks_operatons := get_offending_ids(
+        database=local_db_manager,
         collection_name="operations",
         find={"blockNumber": {"$not": {"$type": "int"}}},
     ):
@@ -20,8 +22,10 @@ def check_localdb_blocks(local_db_manager: database_local):
             f" Found {len(blocks_operatons)} operations with the block field not being int"
         )
 
-    if blocks_status := local_db_manager.get_items_from_database(
-        collection_name="status", find={"block": {"$not": {"$type": "int"}}}
+    if blocks_status := get_offending_ids(
+        database=local_db_manager,
+        collection_name="status",
+        find={"block": {"$not": {"$type": "int"}}},
     ):
         logging.getLogger(__name__).warning(
             f" Found {len(blocks_status)} hypervisor status with the block field not being int"
@@ -35,11 +39,13 @@ def check_globaldb_blocks(global_db_manager: database_global):
         global_db_manager (database_global):
     """
 
-    if blocks_usd_prices := global_db_manager.get_items_from_database(
-        collection_name="usd_prices", find={"block": {"$not": {"$type": "int"}}}
+    if blocks_usd_prices := get_offending_ids(
+        database=global_db_manager,
+        collection_name="usd_prices",
+        find={"block": {"$not": {"$type": "int"}}},
     ):
         logging.getLogger(__name__).warning(
-            f" Found {len(blocks_usd_prices)} usd prices with the block field not being int: database '{global_db_manager._db_name}' collection 'usd_prices'   ids-> {[x['_id'] for x in blocks_usd_prices]}"
+            f" Found {len(blocks_usd_prices)} usd prices with the block field not being int: database '{global_db_manager._db_name}' collection 'usd_prices'   ids-> {blocks_usd_prices}"
         )
         # try replacing those found non int block prices to int
         # replace_blocks_to_int()
@@ -49,19 +55,21 @@ class blocks_analyzer(base_analyzer_object):
     def __init__(self):
         super().__init__()
 
-    def check_localdb_blocks(self, chain: Chain):
-        """check if blocks are typed correctly
+    def check_localdb_blocks(self, chain: Chain, batch_size: int = 5000):
+        """check if blocks are typed correctly ( only offending ids are retrieved )
 
         Args:
-            local_db_manager (database_local):
+            chain (Chain):
+            batch_size (int, optional): cursor batch size. Defaults to 5000.
         """
+        local_db = get_default_localdb(network=chain.database_name)
 
-        if blocks_operatons := get_from_localdb(
-            network=chain.database_name,
-            collection="operations",
+        if blocks_operatons := get_offending_ids(
+            database=local_db,
+            collection_name="operations",
             find={"blockNumber": {"$not": {"$type": "int"}}},
+            batch_size=batch_size,
         ):
-
             # create item
             self.items.append(
                 analysis_item(
@@ -72,25 +80,29 @@ class blocks_analyzer(base_analyzer_object):
                 )
             )
 
-        if blocks_status := get_from_localdb(
-            network=chain.database_name,
-            collection="status",
+        if blocks_status := get_offending_ids(
+            database=local_db,
+            collection_name="status",
             find={"block": {"$not": {"$type": "int"}}},
+            batch_size=batch_size,
         ):
             self.items.append(
                 analysis_item(
                     name="blocks",
-                    data=blocks_operatons,
+                    data=blocks_status,
                     log_message=f" Found {len(blocks_status)} hypervisor status with the block field not being int in {chain.database_name}",
                     telegram_message=f" Found {len(blocks_status)} hypervisor status with the block field not being int in {chain.database_name}",
                 )
             )
 
-    def check_globaldb_blocks(self):
-        """check that blocks have the correct type"""
+    def check_globaldb_blocks(self, batch_size: int = 5000):
+        """check that blocks have the correct type ( only offending ids are retrieved )"""
 
-        if blocks_usd_prices := get_default_globaldb().get_items_from_database(
-            collection_name="usd_prices", find={"block": {"$not": {"$type": "int"}}}
+        if blocks_usd_prices := get_offending_ids(
+            database=get_default_globaldb(),
+            collection_name="usd_prices",
+            find={"block": {"$not": {"$type": "int"}}},
+            batch_size=batch_size,
         ):
             self.items.append(
                 analysis_item(
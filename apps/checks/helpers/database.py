@@ -1,4 +1,10 @@
-from bins.database.helpers import get_from_localdb
+from bins.database.common.database_ids import create_id_price
+from bins.database.common.db_collections_common import db_collections_common
+from bins.database.helpers import (
+    get_default_globaldb,
+    get_default_localdb,
+    get_from_localdb,
+)
 from bins.general.enums import Chain, queueItemType
 
 
@@ -77,3 +83,112 @@ def get_hypervisor_related_operations(
         },
         sort=[("block", 1)],
     )
+
+
+# CHECK RUNNERS: only offending ids leave the database
+
+
+def get_offending_ids(
+    database: db_collections_common,
+    collection_name: str,
+    find: dict,
+    batch_size: int = 5000,
+) -> list[str]:
+    """Ids of the items matching a check condition, streaming only the id field
+
+    Args:
+        database (db_collections_common):
+        collection_name (str):
+        find (dict): offending items condition
+        batch_size (int, optional): cursor batch size. Defaults to 5000.
+
+    Returns:
+        list[str]: offending item ids
+    """
+    return [
+        x["id"]
+        for x in database.iter_items_from_database(
+            collection_name=collection_name,
+            find=find,
+            projection={"_id": 0, "id": 1},
+            batch_size=batch_size,
+        )
+    ]
+
+
+def iter_status_token_blocks(chain: Chain, batch_size: int = 5000):
+    """Yield the unique token address and block pairs of the hypervisor status collection,
+        grouped at the database ( only those two fields leave the database )
+
+    Yields:
+        tuple[str, int]: token address, block
+    """
+    for x in get_default_localdb(network=chain.database_name).iter_items_from_database(
+        collection_name="status",
+        aggregate=[
+            {
+                "$project": {
+                    "_id": 0,
+                    "tokens": [
+                        {
+                            "address": "$pool.token0.address",
+                            "block": "$pool.token0.block",
+                        },
+                        {
+                            "address": "$pool.token1.address",
+                            "block": "$pool.token1.block",
+                        },
+                    ],
+                }
+            },
+            {"$unwind": "$tokens"},
+            {"$group": {"_id": {"address": "$tokens.address", "block": "$tokens.block"}}},
+        ],
+        allowDiskUse=True,
+        batch_size=batch_size,
+    ):
+        yield x["_id"]["address"], x["_id"]["block"]
+
+
+def get_status_prices_missing(chain: Chain, batch_size: int = 5000) -> set[str]:
+    """Price ids of the hypervisor status tokens without usd price ( greater than zero ).
+        Status token blocks are streamed and checked against the global database in batches,
+        so the whole price id set is never loaded.
+
+    Args:
+        chain (Chain):
+        batch_size (int, optional): price ids checked at once. Defaults to 5000.
+
+    Returns:
+        set[str]: price ids not found
+    """
+    global_db = get_default_globaldb()
+    missing = set()
+    ids = []
+    for address, block in iter_status_token_blocks(chain=chain, batch_size=batch_size):
+        ids.append(
+            create_id_price(
+                network=chain.database_name, block=block, token_address=address
+            )
+        )
+        if len(ids) >= batch_size:
+            missing.update(get_prices_missing(database=global_db, ids=ids))
+            ids = []
+    if ids:
+        missing.update(get_prices_missing(database=global_db, ids=ids))
+
+    return missing
+
+
+def get_prices_missing(database: db_collections_common, ids: list[str]) -> set[str]:
+    """Price ids of a batch without usd price ( greater than zero ) in the database"""
+    found = {
+        x["id"]
+        for x in database.iter_items_from_database(
+            collection_name="usd_prices",
+            find={"id": {"$in": ids}, "price": {"$gt": 0}},
+            projection={"_id": 0, "id": 1},
+            batch_size=len(ids),
+        )
+    }
+    return set(ids) - found
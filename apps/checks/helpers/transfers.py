@@ -0,0 +1,249 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from bins.errors.general import ProcessingError
+from bins.general import file_utilities
+from bins.general.enums import Chain, error_identity
+from bins.w3.protocols.gamma.collectors import generic_transfer_collector
+
+
+class transfer_scan:
+    """Resumable scan of the Transfer logs sent from a list of addresses to another ( filtered by the indexed 'from' and 'to' topics at the RPC ).
+    Transfers found are appended to a file after each query and the scanned block range is saved apart, so only blocks outside that range are queried on later runs.
+    The blocks queried at once grow or shrink to keep each query around target_logs log entries.
+    """
+
+    def __init__(
+        self,
+        chain: Chain,
+        from_addresses: list[str],
+        to_addresses: list[str],
+        folder: str = "data/cache/transfers",
+        step: int = 10000,
+        min_step: int = 100,
+        max_step: int = 500000,
+        target_logs: int = 1000,
+    ):
+        """
+
+        Args:
+            chain (Chain):
+            from_addresses (list[str]): transfer senders
+            to_addresses (list[str]): transfer recipients
+            folder (str, optional): where to save the scan. Defaults to "data/cache/transfers".
+            step (int, optional): initial blocks per query. Defaults to 10000.
+            min_step (int, optional): minimum blocks per query. Defaults to 100.
+            max_step (int, optional): maximum blocks per query. Defaults to 500000.
+            target_logs (int, optional): log entries per query to aim for. Defaults to 1000.
+        """
+        self.chain = chain
+        self.from_addresses = sorted({x.lower() for x in from_addresses})
+        self.to_addresses = sorted({x.lower() for x in to_addresses})
+        self.folder = folder
+        # addresses can be too many to fit a file name
+        self.filename = "{}_{}".format(
+            chain.database_name,
+            hashlib.sha1(
+                ",".join(self.from_addresses + ["->"] + self.to_addresses).encode()
+            ).hexdigest(),
+        )
+        self.step = step
+        self.min_step = min_step
+        self.max_step = max_step
+        self.target_logs = target_logs
+
+        self._lock = threading.RLock()
+        self._collector = None
+
+        _saved = (
+            file_utilities.load_json(filename=self.filename, folder_path=self.folder)
+            or {}
+        )
+        # scanned block range ( both included )
+        self._block_ini: int | None = _saved.get("block_ini")
+        self._block_end: int | None = _saved.get("block_end")
+        # { (transactionHash, logIndex): transfer }
+        self._transfers: dict[tuple, dict] = self._load_transfers()
+        # blocks queried in this process ( log purposes )
+        self.blocks_queried = 0
+
+    def get_transfers(
+        self,
+        block_ini: int,
+        block_end: int,
+        to_addresses: list[str] | None = None,
+    ) -> list[dict]:
+        """Direct transfers sent from the scan addresses between two blocks ( both included ), scanning only the blocks not scanned yet
+
+        Args:
+            block_ini (int):
+            block_end (int):
+            to_addresses (list[str] | None, optional): recipients ( of the scan ). Transfers of the recipients own token ( deposits and withdraws ) are not included. Defaults to all scan recipients.
+
+        Returns:
+            list[dict]: generic_transfer_collector operation items
+        """
+        self.scan(block_ini=block_ini, block_end=block_end)
+
+        to_addresses = {x.lower() for x in to_addresses or self.to_addresses}
+        return sorted(
+            (
+                x
+                for x in self._transfers.values()
+                if block_ini <= x["blockNumber"] <= block_end
+                and x["dst"] in to_addresses
+                and x["address"] not in to_addresses
+            ),
+            key=lambda x: (x["blockNumber"], x["logIndex"]),
+        )
+
+    def scan(self, block_ini: int, block_end: int):
+        """Extend the scanned block range to include block_ini and block_end"""
+        with self._lock:
+            if self._block_ini is None:
+                # nothing scanned yet
+                self._block_ini, self._block_end = block_ini, block_ini - 1
+
+            if block_ini < self._block_ini:
+                # keep the scanned range contiguous: saved when the whole range is scanned
+                self._scan_range(block_ini, self._block_ini - 1)
+                self._block_ini = block_ini
+                self._save_range()
+
+            if block_end > self._block_end:
+                # saves progress after each query
+                self._scan_range(self._block_end + 1, block_end, checkpoint=True)
+
+    # INTERNAL
+
+    def _scan_range(self, block_ini: int, block_end: int, checkpoint: bool = False):
+        """Query the logs between two blocks, adapting the blocks per query to the log density
+
+        Args:
+            checkpoint (bool, optional): save after each query ( the range starts right after the scanned one ). Defaults to False.
+        """
+        logging.getLogger(__name__).debug(
+            f" Scanning {self.chain.database_name} transfers from {self.from_addresses} to {self.to_addresses} between blocks {block_ini} and {block_end}"
+        )
+        block = block_ini
+        while block <= block_end:
+            to_block = min(block_end, block + self.step - 1)
+            try:
+                transfers = self._get_logs(block_ini=block, block_end=to_block)
+            except ProcessingError as e:
+                if (
+                    e.identity == error_identity.TOO_MANY_BLOCKS_TO_QUERY
+                    and self.step > self.min_step
+                ):
+                    self.step = max(self.min_step, self.step // 2)
+                    logging.getLogger(__name__).debug(
+                        f" Too many blocks to query. Lowering the transfer scan step to {self.step}"
+                    )
+                    continue
+                raise
+
+            self.blocks_queried += to_block - block + 1
+            logs = len(transfers)
+            # transfers of a query interrupted before saving its range are already loaded
+            transfers = [
+                x
+                for x in transfers
+                if (x["transactionHash"], x["logIndex"]) not in self._transfers
+            ]
+            for x in transfers:
+                self._transfers[(x["transactionHash"], x["logIndex"])] = x
+            # append before the range including them is saved
+            self._append_transfers(transfers)
+
+            # adapt the step to the log density
+            if logs > self.target_logs:
+                self.step = max(self.min_step, self.step * self.target_logs // logs)
+            elif logs < self.target_logs // 2:
+                self.step = min(self.max_step, self.step * 2)
+
+            if checkpoint:
+                self._block_end = to_block
+                self._save_range()
+            block = to_block + 1
+
+    def _get_logs(self, block_ini: int, block_end: int) -> list[dict]:
+        """Decoded transfers between two blocks ( one eth_getLogs query )"""
+        if self._collector is None:
+            self._collector = generic_transfer_collector(
+                network=self.chain.database_name,
+                from_addresses=self.from_addresses,
+                to_addresses=self.to_addresses,
+            )
+        entries = self._collector._web3_helper.get_all_entries(
+            filter={
+                "fromBlock": block_ini,
+                "toBlock": block_end,
+                "topics": self._collector._create_transfer_topics(
+                    from_addresses=self.from_addresses, to_addresses=self.to_addresses
+                ),
+            },
+            rpcKey_names=["private", "public"],
+        )
+        return [self._collector.decode_transfer(event) for event in entries or []]
+
+    def _save_range(self):
+        file_utilities.save_json(
+            filename=self.filename,
+            data={
+                "network": self.chain.database_name,
+                "from_addresses": self.from_addresses,
+                "to_addresses": self.to_addresses,
+                "block_ini": self._block_ini,
+                "block_end": self._block_end,
+            },
+            folder_path=self.folder,
+        )
+
+    @property
+    def _transfers_path(self) -> str:
+        return os.path.join(self.folder, f"{self.filename}_transfers.jsonl")
+
+    def _append_transfers(self, transfers: list[dict]):
+        if not transfers:
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        with open(self._transfers_path, "a") as f:
+            f.writelines(f"{json.dumps(x)}\n" for x in transfers)
+
+    def _load_transfers(self) -> dict[tuple, dict]:
+        """Saved transfers"""
+        transfers = {}
+        if os.path.exists(self._transfers_path):
+            with open(self._transfers_path, "r") as f:
+                for line in f:
+                    try:
+                        x = json.loads(line)
+                    except json.JSONDecodeError:
+                        # partially written line
+                        continue
+                    transfers[(x["transactionHash"], x["logIndex"])] = x
+        return transfers
+
+
+# one scan per chain, senders and recipients ( and process )
+TRANSFER_SCANS = {}
+TRANSFER_SCANS_LOCK = threading.Lock()
+
+
+def get_transfer_scan(
+    chain: Chain, from_addresses: list[str], to_addresses: list[str]
+) -> transfer_scan:
+    key = (
+        chain,
+        tuple(sorted({x.lower() for x in from_addresses})),
+        tuple(sorted({x.lower() for x in to_addresses})),
+    )
+    with TRANSFER_SCANS_LOCK:
+        if key not in TRANSFER_SCANS:
+            TRANSFER_SCANS[key] = transfer_scan(
+                chain=chain, from_addresses=from_addresses, to_addresses=to_addresses
+            )
+        return TRANSFER_SCANS[key]
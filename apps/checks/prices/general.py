@@ -2,7 +2,7 @@ import logging
 
 import tqdm
 from apps.checks.base_objects import analysis_item, base_analyzer_object
-from bins.database.common.database_ids import create_id_price
+from apps.checks.helpers.database import get_status_prices_missing
 
 from bins.database.common.db_collections_common import database_global, database_local
 from bins.database.helpers import get_default_globaldb, get_from_localdb
@@ -14,29 +14,18 @@ class price_analyzer(base_analyzer_object):
     def __init__(self):
         super().__init__()
 
-    def check_status_prices(self, chain: Chain):
-        """Check that all status tokens have usd prices"""
-        # get all prices + address + block
-        prices = {
-            x["id"]
-            for x in get_default_globaldb().get_unique_prices_addressBlock(
-                network=chain.database_name
-            )
-        }
-
-        # get tokens and blocks present in database
-        prices_todo = set()
-
-        for x in get_from_localdb(network=chain.database_name, collection="status"):
-            for i in [0, 1]:
-                db_id = create_id_price(
-                    network=chain.database_name,
-                    block=x["pool"][f"token{i}"]["block"],
-                    token_address=x["pool"][f"token{i}"]["address"],
-                )
+    def check_status_prices(self, chain: Chain, batch_size: int = 5000):
+        """Check that all status tokens have usd prices
+            ( unique status token blocks are grouped at the database and checked against usd_prices in batches )
+        """
+        # total prices with price greater than zero
+        prices = get_default_globaldb().count_documents(
+            collection_name="usd_prices",
+            filter={"network": chain.database_name, "price": {"$gt": 0}},
+        )
 
-                if db_id not in prices:
-                    prices_todo.add(db_id)
+        # token blocks present in database without price
+        prices_todo = get_status_prices_missing(chain=chain, batch_size=batch_size)
 
         if prices_todo:
             # create item
@@ -44,8 +33,8 @@ class price_analyzer(base_analyzer_object):
                 analysis_item(
                     name="prices",
                     data=prices_todo,
-                    log_message=f" Found {len(prices_todo)} token blocks without price, from a total of {len(prices)} ({len(prices_todo) / len(prices):,.1%}) in {chain.database_name}",
-                    telegram_message=f" Found {len(prices_todo)} token blocks without price, from a total of {len(prices)} ({len(prices_todo) / len(prices):,.1%}) in {chain.database_name}",
+                    log_message=f" Found {len(prices_todo)} token blocks without price, from a total of {prices} ({len(prices_todo) / prices if prices else 1:,.1%}) in {chain.database_name}",
+                    telegram_message=f" Found {len(prices_todo)} token blocks without price, from a total of {prices} ({len(prices_todo) / prices if prices else 1:,.1%}) in {chain.database_name}",
                 )
             )
 
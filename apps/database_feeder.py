@@ -33,6 +33,7 @@ from bins.database.common.db_collections_common import (
 from .feeds.static import (
     feed_hypervisor_static,
     feed_rewards_static,
+    sync_hypervisor_registries,
     update_static_feeRecipients,
 )
 
@@ -201,6 +202,25 @@ def main(option="operations"):
     if option == "global_reports":
         feed_global_reports()
     else:
+        registry_states = {}
+        if option in ("static", "static_hypervisors"):
+            # discover added/removed hypervisors of all registries at once
+            registry_states = sync_hypervisor_registries(
+                targets=[
+                    (network, dex)
+                    for protocol in CONFIGURATION["script"]["protocols"]
+                    for network in (
+                        CONFIGURATION["_custom_"]["cml_parameters"].networks
+                        or CONFIGURATION["script"]["protocols"][protocol]["networks"]
+                    )
+                    for dex in CONFIGURATION["script"]["protocols"][protocol][
+                        "networks"
+                    ].get(network, [])
+                    if not CONFIGURATION["_custom_"]["cml_parameters"].protocols
+                    or dex in CONFIGURATION["_custom_"]["cml_parameters"].protocols
+                ]
+            )
+
         # CHAIN/PROTOCOL FEEDS
         for protocol in CONFIGURATION["script"]["protocols"]:
             # override networks if specified in cml
@@ -233,6 +253,7 @@ def main(option="operations"):
                                 rewrite=CONFIGURATION["_custom_"][
                                     "cml_parameters"
                                 ].rewrite,
+                                registry_state=registry_states.get((network, dex)),
                             )
 
                             # feed rewarders static
@@ -375,6 +396,7 @@ def main(option="operations"):
                                 rewrite=CONFIGURATION["_custom_"][
                                     "cml_parameters"
                                 ].rewrite,
+                                registry_state=registry_states.get((network, dex)),
                             )
                         except Exception as e:
                             logging.getLogger(__name__).exception(
@@ -6,7 +6,10 @@ from multiprocessing.pool import Pool
 import time
 
 import tqdm
-from apps.feeds.returns.builds import get_last_return_data_from_db
+from apps.feeds.returns.builds import (
+    build_hypervisor_returns_checkpoint,
+    get_last_return_data_from_db,
+)
 from apps.feeds.returns.objects import period_yield_data
 from apps.feeds.status.rewards.general import create_reward_status_from_hype_status
 from apps.repair.prices.helpers import get_price
@@ -130,6 +133,8 @@ def feed_latest_hypervisor_returns_work(
     # decide wether to start from 1)hypervisor_returns or 2)latest_hypervisor_returns block
     # control var
     block_ini = None
+    # running aggregates the new periods are added to ( see below )
+    checkpoint_collection = "hypervisor_returns_checkpoints"
 
     # check if last hypervisor status block is lower than latest_hypervisor_returns end block
     if (
@@ -146,6 +151,7 @@ def feed_latest_hypervisor_returns_work(
         # start from 2)latest_hypervisor_returns
         # first snapshot should be the next block after latest_hypervisor_returns end_block
         block_ini = latest_hypervisor_returns["timeframe"]["end"]["block"] + 1
+        checkpoint_collection = "latest_hypervisor_returns_checkpoints"
 
     if not block_ini and hypervisor_returns:
         # start from 1)hypervisor_returns
@@ -240,12 +246,38 @@ def feed_latest_hypervisor_returns_work(
 
     # convert to dict and save
     if save_to_database and period_yield_list:
-        try:
-            # save converted to dict results to database
-            save_latest_hypervisor_returns_to_database(
+        # add only the new periods to the running aggregates of the periods before them
+        local_db = get_default_localdb(network=chain.database_name)
+        new_checkpoint = None
+        if (
+            checkpoint := local_db.get_hypervisor_returns_checkpoint(
+                address=hypervisor_address, collection_name=checkpoint_collection
+            )
+        ) and checkpoint["block"] == block_ini - 1:
+            new_checkpoint = build_hypervisor_returns_checkpoint(
                 chain=chain,
-                period_yield_list=[x.to_dict() for x in period_yield_list],
+                hypervisor_address=hypervisor_address,
+                checkpoint=checkpoint,
+                yield_data_list=period_yield_list,
+            )
+        else:
+            logging.getLogger(__name__).debug(
+                f" No {checkpoint_collection} at block {block_ini - 1} for {chain.database_name} {hypervisor_address}. Latest returns aggregates not updated"
             )
+
+        try:
+            # save converted to dict results to database
+            if (
+                save_latest_hypervisor_returns_to_database(
+                    chain=chain,
+                    period_yield_list=[x.to_dict() for x in period_yield_list],
+                )
+                and new_checkpoint
+            ):
+                local_db.set_hypervisor_returns_checkpoint(
+                    data=new_checkpoint,
+                    collection_name="latest_hypervisor_returns_checkpoints",
+                )
         except AttributeError as e:
             # AttributeError: 'NoneType' object has no attribute 'to_dict'
             logging.getLogger(__name__).error(
@@ -406,7 +438,7 @@ def create_rewards_adhoc(chain: Chain, hypervisor_status: dict) -> list[dict]:
 def save_latest_hypervisor_returns_to_database(
     chain: Chain,
     period_yield_list: list[dict],
-):
+) -> bool:
     # save all at once
     if db_return := get_default_localdb(
         network=chain.database_name
@@ -417,7 +449,9 @@ def save_latest_hypervisor_returns_to_database(
         logging.getLogger(__name__).debug(
             f"     {chain.database_name} saved latest returns -> del: {db_return.deleted_count}  ins: {db_return.inserted_count}  mod: {db_return.modified_count}  ups: {db_return.upserted_count} matched: {db_return.matched_count}"
         )
+        return True
     else:
         logging.getLogger(__name__).error(
             f"  database did not return anything while trying to save latest hypervisor returns to database for {chain.database_name}"
         )
+    return False
@@ -98,6 +98,9 @@ def feed_prices(
         )
         # log errors
         _errors = 0
+        # prices are saved in bulk: items not saved are counted by the writer
+        price_writer = global_db_manager.get_bulk_writer(collection_name="usd_prices")
+        _writer_errors_ini = price_writer.error_count
 
         with tqdm.tqdm(total=len(items_to_process)) as progress_bar:
 
@@ -154,6 +157,7 @@ def feed_prices(
                                 token_address=token,
                                 price_usd=price_usd,
                                 source=source,
+                                bulk=True,
                             )
                         else:
                             # error found
@@ -177,6 +181,7 @@ def feed_prices(
                             token_address=token,
                             price_usd=price_usd,
                             source=source,
+                            bulk=True,
                         )
                     else:
                         # error found
@@ -185,6 +190,10 @@ def feed_prices(
                     # add one
                     progress_bar.update(1)
 
+        # save remaining queued prices and add all items not saved during this run
+        price_writer.flush()
+        _errors += price_writer.error_count - _writer_errors_ini
+
         with contextlib.suppress(Exception):
             if _errors > 0:
                 logging.getLogger(__name__).info(
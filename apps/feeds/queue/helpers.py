@@ -1,26 +1,32 @@
 import logging
 import time
 from apps.feeds.queue.queue_item import QueueItem
+from bins.database.common.db_collections_common import database_local
 from bins.database.helpers import get_default_localdb
 
 
 def to_free_or_not_to_free_item(
     network: str,
     queue_item: QueueItem,
+    local_db: database_local | None = None,
 ) -> bool:
     """Free item from processing if count is lower than X,
         so that after X fails, next time will need an unlock before processing, (unlock = taking longer to process)
+        Items waiting for one that is not freed are released ( they would wait forever otherwise )
 
     Args:
         queue_item (QueueItem):
-        local_db (database_local):
+        local_db (database_local, optional): . Defaults to the network default local database.
 
     Returns:
         bool: freed or not
     """
+    if local_db is None:
+        local_db = get_default_localdb(network=network)
+
     # do not free items not
     if queue_item.count < 5 and queue_item.can_be_processed:
-        if db_return := get_default_localdb(network=network).free_queue_item(
+        if db_return := local_db.free_queue_item(
             id=queue_item.id, count=queue_item.count
         ):
             return True
@@ -34,7 +40,7 @@ def to_free_or_not_to_free_item(
         )
         # save item with count
 
-        if db_return := get_default_localdb(network=network).find_one_and_update(
+        if db_return := local_db.find_one_and_update(
             collection_name="queue",
             find={"id": queue_item.id},
             update={"$set": {"count": queue_item.count}},
@@ -43,4 +49,11 @@ def to_free_or_not_to_free_item(
                 f" Updated count of queue item {queue_item.type} {queue_item.id} to {queue_item.count}"
             )
 
+        # dependents can't wait for an item that may never be processed
+        if db_return := local_db.release_queue_item_dependents(id=queue_item.id):
+            if db_return.modified_count:
+                logging.getLogger(__name__).warning(
+                    f" {network}'s queue items waiting for {queue_item.type} {queue_item.id} have been released because it failed {queue_item.count} times"
+                )
+
     return False
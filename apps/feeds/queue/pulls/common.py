@@ -1,5 +1,6 @@
 # Main processing function
 from datetime import datetime, timezone
+from functools import partial
 import logging
 import time
 
@@ -16,9 +17,13 @@ from apps.feeds.queue.pulls.revenue_operation import pull_from_queue_revenue_ope
 from apps.feeds.queue.pulls.reward import pull_from_queue_reward_status
 from apps.feeds.queue.pulls.user import pull_from_queue_user_operation
 from apps.feeds.queue.queue_item import QueueItem
+from bins.database.common.latest_prices import get_latest_price_snapshot
 from bins.database.helpers import get_default_localdb
 from bins.general.enums import queueItemType
 from bins.general.general_utilities import log_time_passed, seconds_to_time_passed
+from bins.performance.costs import track_costs
+from bins.performance.metrics import build_queue_item_event, report_queue_item_event
+from bins.w3.helpers.rpcs import RPC_MANAGER
 
 
 def pull_from_queue(
@@ -96,7 +101,7 @@ def get_item_from_queue(
 def process_queue_item_type(network: str, queue_item: QueueItem) -> bool:
     """Get item from queue and process it.
 
-        Items with count>0 will be processed if queue.can_be_processed is True
+        Items will only be processed if queue.can_be_processed is True ( all dependencies processed )
 
     Args:
         network (str): network name
@@ -108,8 +113,12 @@ def process_queue_item_type(network: str, queue_item: QueueItem) -> bool:
     """
 
     if queue_item.can_be_processed == False:
-        logging.getLogger(__name__).error(
-            f" {network}'s queue item {queue_item.id} cannot be processed yet (more cooldown time defined). Will be processed later"
+        logging.getLogger(__name__).debug(
+            f" {network}'s queue item {queue_item.id} cannot be processed yet ( {len(queue_item.dependencies)} dependencies pending). Will be processed later"
+        )
+        # set queue item free without altering its count
+        get_default_localdb(network=network).free_queue_item(
+            id=queue_item.id, count=queue_item.count - 1
         )
         return False
 
@@ -150,7 +159,10 @@ def process_queue_item_type(network: str, queue_item: QueueItem) -> bool:
         return pull_common_processing_work(
             network=network,
             queue_item=queue_item,
-            pull_func=pull_from_queue_latest_multiFeeDistribution,
+            pull_func=partial(
+                pull_from_queue_latest_multiFeeDistribution,
+                prices=get_latest_price_snapshot(network=network),
+            ),
         )
 
     elif queue_item.type == queueItemType.REVENUE_OPERATION:
@@ -194,8 +206,25 @@ def process_queue_item_type(network: str, queue_item: QueueItem) -> bool:
 def pull_common_processing_work(
     network: str, queue_item: QueueItem, pull_func: callable
 ):
-    # build a result variable
-    result = pull_func(network=network, queue_item=queue_item)
+    # rpc usage before processing ( workers process one item at a time )
+    ini_rpc_calls, ini_rpc_cus = RPC_MANAGER.totals()
+
+    # build a result variable ( attributing rpc and db costs to this item )
+    with track_costs(network=network, type=queue_item.type) as costs:
+        result = pull_func(network=network, queue_item=queue_item)
+
+    # telemetry
+    end_rpc_calls, end_rpc_cus = RPC_MANAGER.totals()
+    report_queue_item_event(
+        build_queue_item_event(
+            network=network,
+            queue_item=queue_item,
+            result=result,
+            rpc_calls=end_rpc_calls - ini_rpc_calls,
+            rpc_cus=end_rpc_cus - ini_rpc_cus,
+            costs=costs.as_list(),
+        )
+    )
 
     # benchmark
     if result:
@@ -207,6 +236,10 @@ def pull_common_processing_work(
                 logging.getLogger(__name__).debug(
                     f" {network}'s queue item {queue_item.id} has been removed from queue"
                 )
+                # set as ready the items waiting for this one
+                get_default_localdb(network=network).release_queue_item_dependents(
+                    id=queue_item.id
+                )
             else:
                 logging.getLogger(__name__).warning(
                     f" {network}'s queue item {queue_item.id} has not been removed from queue. database returned {db_return.raw_result}"
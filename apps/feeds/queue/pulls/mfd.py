@@ -4,11 +4,14 @@ from apps.errors.actions import process_error
 from apps.feeds.latest.mutifeedistribution.item import multifeeDistribution_snapshot
 from apps.feeds.queue.queue_item import QueueItem
 from bins.database.common.database_ids import create_id_latest_multifeedistributor
+from bins.database.common.latest_prices import (
+    get_latest_price_snapshot,
+    latest_price_snapshot,
+)
 from bins.database.helpers import (
     get_default_localdb,
     get_from_localdb,
     get_latest_price_from_db,
-    get_latest_prices_from_db,
 )
 
 from bins.errors.general import ProcessingError
@@ -18,11 +21,13 @@ from bins.w3.builders import build_hypervisor
 
 # multiFeeDistribution
 def pull_from_queue_latest_multiFeeDistribution(
-    network: str, queue_item: QueueItem
+    network: str,
+    queue_item: QueueItem,
+    prices: latest_price_snapshot | None = None,
 ) -> bool:
     # build a list of itmes to be saved to the database
     if save_todb := build_multiFeeDistribution_from_queueItem(
-        network=network, queue_item=queue_item
+        network=network, queue_item=queue_item, prices=prices
     ):
         # save to latest_multifeedistribution collection database
         if db_return := get_default_localdb(network=network).replace_items_to_database(
@@ -46,7 +51,7 @@ def pull_from_queue_latest_multiFeeDistribution(
 
 
 def build_multiFeeDistribution_from_queueItem(
-    network: str, queue_item: QueueItem
+    network: str, queue_item: QueueItem, prices: latest_price_snapshot | None = None
 ) -> list[dict]:
     # build a list of itmes to be saved to the database
     save_todb = []
@@ -57,7 +62,8 @@ def build_multiFeeDistribution_from_queueItem(
             f"  -> Processing queue's {network} {queue_item.type} {queue_item.id}"
         )
 
-        _prices = get_latest_prices_from_db(network=network)
+        # latest prices shared by all items processed ( reloaded only when changed )
+        _prices = (prices or get_latest_price_snapshot(network=network)).prices
 
         # get rewards related to this mfd
         rewards_related_info = get_rewarders_by_mfd(
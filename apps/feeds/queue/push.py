@@ -9,6 +9,10 @@ from bins.database.common.database_ids import (
     create_id_rewards_status,
 )
 from bins.database.common.db_collections_common import database_global, database_local
+from bins.database.common.price_coverage import (
+    get_price_coverage_index,
+    update_price_coverage,
+)
 from bins.database.helpers import (
     get_default_globaldb,
     get_default_localdb,
@@ -18,6 +22,7 @@ from bins.general.enums import (
     Chain,
     Protocol,
     queueItemType,
+    text_to_chain,
 )
 
 
@@ -124,79 +129,53 @@ def build_and_save_queue_from_hypervisor_status(hypervisor_status: dict, network
     if items := build_queue_items_from_hypervisor_status(
         hypervisor_status=hypervisor_status, network=network
     ):
-        get_default_localdb(network=network).replace_items_to_database(
-            data=items, collection_name="queue"
+        local_db = get_default_localdb(network=network)
+        local_db.replace_items_to_database(data=items, collection_name="queue")
+        # dependencies processed before these items were saved will not release them
+        local_db.release_queue_items_missing_dependencies(
+            ids=[x["id"] for x in items if x.get("dependencies")]
         )
 
 
 def build_queue_items_from_hypervisor_status(
     hypervisor_status: dict, network: str
 ) -> list[QueueItem]:
-    # create local database manager
-    db_name = f"{network}_gamma"
+    # create database managers
     mongo_url = CONFIGURATION["sources"]["database"]["mongo_server_url"]
     local_db = database_local(
         mongo_url=mongo_url,
-        db_name=db_name,
+        db_name=f"{network}_gamma",
     )
-    # build items to update
-    items = []
+    global_db = database_global(mongo_url=mongo_url)
+
+    # avoid rewards if there is no hypervisor supply
+    if int(hypervisor_status["totalSupply"]) <= 0:
+        logging.getLogger(__name__).warning(
+            f" {network}'s {hypervisor_status['address']} hypervisor has no supply at block {hypervisor_status['block']}. Can't queue reward status scrape."
+        )
+        return
 
-    # token 0 price
+    # price candidates  { price id: (token address, queue item data) }
+    token_prices = {}
+    # token 0 and 1 prices
     price0_id = create_id_price(
         network=network,
         block=hypervisor_status["block"],
         token_address=hypervisor_status["pool"]["token0"]["address"],
     )
-    if not database_global(mongo_url=mongo_url).get_items_from_database(
-        collection_name="usd_prices",
-        find={"id": price0_id},
-    ):
-        # add to queue
-        items.append(
-            QueueItem(
-                type=queueItemType.PRICE,
-                block=hypervisor_status["block"],
-                address=hypervisor_status["pool"]["token0"]["address"],
-                data=hypervisor_status,
-            ).as_dict
-        )
-    else:
-        logging.getLogger(__name__).debug(
-            f" {network}'s {hypervisor_status['pool']['token0']['address']} token at block {hypervisor_status['block']} is already in database"
-        )
-
-    # token 1 price
+    token_prices[price0_id] = (
+        hypervisor_status["pool"]["token0"]["address"],
+        hypervisor_status,
+    )
     price1_id = create_id_price(
         network=network,
         block=hypervisor_status["block"],
         token_address=hypervisor_status["pool"]["token1"]["address"],
     )
-    if not database_global(mongo_url=mongo_url).get_items_from_database(
-        collection_name="usd_prices",
-        find={"id": price1_id},
-    ):
-        # add to queue
-        items.append(
-            QueueItem(
-                type=queueItemType.PRICE,
-                block=hypervisor_status["block"],
-                address=hypervisor_status["pool"]["token1"]["address"],
-                data=hypervisor_status,
-            ).as_dict
-        )
-    else:
-        logging.getLogger(__name__).debug(
-            f" {network}'s {hypervisor_status['pool']['token1']['address']} token at block {hypervisor_status['block']} is already in database"
-        )
-
-    # Rewards
-    # avoid rewards if there is no hypervisor supply
-    if int(hypervisor_status["totalSupply"]) <= 0:
-        logging.getLogger(__name__).warning(
-            f" {network}'s {hypervisor_status['address']} hypervisor has no supply at block {hypervisor_status['block']}. Can't queue reward status scrape."
-        )
-        return
+    token_prices[price1_id] = (
+        hypervisor_status["pool"]["token1"]["address"],
+        hypervisor_status,
+    )
 
     # get a list of rewards_static rewardToken linked with hypervisor_address
     # make sure hype block is greater than static reward block
@@ -207,6 +186,8 @@ def build_queue_items_from_hypervisor_status(
         logging.getLogger(__name__).error(
             f" Can't get tokens excluded from {network} rewards_static queue items. Error: {e}"
         )
+    # reward status candidates  { reward status id: (reward price id, reward static) }
+    reward_statuses = {}
     for reward_static in local_db.get_items_from_database(
         collection_name="rewards_static",
         find={
@@ -237,35 +218,68 @@ def build_queue_items_from_hypervisor_status(
             block=hypervisor_status["block"],
             token_address=reward_static["rewardToken"],
         )
-        if not database_global(mongo_url=mongo_url).get_items_from_database(
-            collection_name="usd_prices",
-            find={"id": reward_price_id},
-        ):
-            # add price
+        if reward_price_id not in token_prices:
+            token_prices[reward_price_id] = (reward_static["rewardToken"], reward_static)
+
+        # reward status
+        reward_status_id = create_id_rewards_status(
+            hypervisor_address=reward_static["hypervisor_address"],
+            rewarder_address=reward_static["rewarder_address"],
+            rewardToken_address=reward_static["rewardToken"],
+            block=hypervisor_status["block"],
+        )
+        reward_statuses[reward_status_id] = (reward_price_id, reward_static)
+
+    # check existence of all candidates at once
+    missing_prices = global_db.get_missing_ids(
+        collection_name="usd_prices", ids=list(token_prices.keys())
+    )
+    missing_reward_statuses = local_db.get_missing_ids(
+        collection_name="rewards_status", ids=list(reward_statuses.keys())
+    )
+
+    # new status token blocks without price ( coverage only tracks pool tokens )
+    update_price_coverage(
+        network=network,
+        references=[
+            (token_prices[price_id][0], hypervisor_status["block"])
+            for price_id in (price0_id, price1_id)
+            if price_id in missing_prices
+        ],
+    )
+
+    # build items to update
+    items = []
+    # price queue ids reward status items will depend on  { price id: queue id }
+    price_queue_ids = {}
+
+    for price_id, (token_address, data) in token_prices.items():
+        if price_id in missing_prices:
+            # add to queue
             items.append(
                 QueueItem(
                     type=queueItemType.PRICE,
                     block=hypervisor_status["block"],
-                    address=reward_static["rewardToken"],
-                    data=reward_static,
+                    address=token_address,
+                    data=data,
                 ).as_dict
             )
+            price_queue_ids[price_id] = items[-1]["id"]
         else:
             logging.getLogger(__name__).debug(
-                f" {network}'s {reward_static['rewardToken']} token at block {hypervisor_status['block']} is already in database"
+                f" {network}'s {token_address} token at block {hypervisor_status['block']} is already in database"
             )
 
-        # add reward_status
-        reward_status_id = create_id_rewards_status(
-            hypervisor_address=reward_static["hypervisor_address"],
-            rewarder_address=reward_static["rewarder_address"],
-            rewardToken_address=reward_static["rewardToken"],
-            block=hypervisor_status["block"],
-        )
-        if not local_db.get_items_from_database(
-            collection_name="rewards_status",
-            find={"id": reward_status_id},
-        ):
+    for reward_status_id, (reward_price_id, reward_static) in reward_statuses.items():
+        if reward_status_id in missing_reward_statuses:
+            # wait for the prices to be scraped
+            reward_dependencies = []
+            for price_id in (price0_id, price1_id, reward_price_id):
+                if (
+                    price_id in price_queue_ids
+                    and price_queue_ids[price_id] not in reward_dependencies
+                ):
+                    reward_dependencies.append(price_queue_ids[price_id])
             # add to queue
             items.append(
                 QueueItem(
@@ -276,6 +290,7 @@ def build_queue_items_from_hypervisor_status(
                         "reward_static": reward_static,
                         "hypervisor_status": hypervisor_status,
                     },
+                    dependencies=reward_dependencies,
                 ).as_dict
             )
         else:
@@ -320,6 +335,64 @@ def build_queue_items_from_hypervisor_status(
 #         get_default_localdb(network=network).replace_items_to_database(data=items, collection_name="queue")
 
 
+def build_and_save_queue_from_price_coverage(
+    network: str,
+    token_addresses: list[str] | None = None,
+    block_ini: int = 0,
+    block_end: int | None = None,
+    limit: int | None = None,
+) -> int:
+    """Queue the status token blocks without usd price found by the network price coverage index
+        ( those already queued are not replaced )
+
+    Args:
+        network (str):
+        token_addresses (list[str] | None, optional): tokens to queue. Defaults to all.
+        block_ini (int, optional): . Defaults to 0.
+        block_end (int | None, optional): . Defaults to any.
+        limit (int | None, optional): maximum items to queue, most recent blocks first. Defaults to no limit.
+
+    Returns:
+        int: number of items queued
+    """
+    coverage = get_price_coverage_index(network=network)
+    excluded = TOKEN_ADDRESS_EXCLUDE.get(text_to_chain(network), {})
+
+    if token_addresses:
+        missing = [
+            (address.lower(), block)
+            for address in token_addresses
+            for block in coverage.missing(
+                address=address, block_ini=block_ini, block_end=block_end
+            )
+        ]
+    else:
+        missing = list(coverage.iter_missing(block_ini=block_ini, block_end=block_end))
+    missing = sorted(
+        [x for x in missing if x[0] not in excluded], key=lambda x: x[1], reverse=True
+    )[:limit]
+
+    items = {}
+    for address, block in missing:
+        item = QueueItem(
+            type=queueItemType.PRICE, block=block, address=address, data={}
+        ).as_dict
+        items[item["id"]] = item
+    if not items:
+        return 0
+
+    local_db = get_default_localdb(network=network)
+    if items := [
+        items[x]
+        for x in local_db.get_missing_ids(collection_name="queue", ids=list(items))
+    ]:
+        local_db.replace_items_to_database(data=items, collection_name="queue")
+    logging.getLogger(__name__).debug(
+        f" {len(items)} of {len(missing)} {network} token blocks without price queued"
+    )
+    return len(items)
+
+
 def build_and_save_queue_from_hypervisor_static(hypervisor_static: dict, network: str):
     pass
 
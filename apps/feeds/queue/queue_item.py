@@ -1,6 +1,6 @@
 import time
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from bins.configuration import CONFIGURATION
 
 from bins.database.common.database_ids import create_id_operation, create_id_queue
@@ -18,6 +18,9 @@ class QueueItem:
     creation: float = 0
     _id: str | None = None  # db only
     count: int = 0
+    # queue ids that need to be processed before this item can be
+    dependencies: list[str] = field(default_factory=list)
+    ready: bool | None = None
 
     def __post_init__(self):
         # setup id
@@ -34,6 +37,10 @@ class QueueItem:
         # make sure block is an int
         self.block = int(self.block)
 
+        # items without pending dependencies are ready to be processed
+        if self.ready is None:
+            self.ready = not self.dependencies
+
     def _setup_id(self):
         # setup id
         if self.type == queueItemType.REWARD_STATUS:
@@ -99,34 +106,18 @@ class QueueItem:
             "id": self.id,
             "creation": self.creation,
             "count": self.count,
+            "dependencies": self.dependencies,
+            "ready": self.ready,
         }
 
     @property
     def can_be_processed(self) -> bool:
-        """Check if sufficient time has passed since creation
+        """Check if all items this one depends on have already been processed
 
         Returns:
             bool:
         """
-
-        # disable this check
-        return True
-
-        if self.count > 20:
-            # this item needs to be manually checked
-            return False
-        elif self.count > 10:
-            # 1 day + 2^count seconds
-            min_seconds_passed = 60 * 60 * 24
-            time_passed = time.time() - self.creation
-            tmp_sec_to_pass = 2 ** (self.count) + min_seconds_passed
-            return time_passed > tmp_sec_to_pass
-        elif self.count > 5:
-            time_passed = time.time() - self.creation
-            # 1 hour
-            return time_passed > 60 * 60
-
-        return True
+        return self.ready
 
 
 ### Helpers ###
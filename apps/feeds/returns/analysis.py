@@ -4,7 +4,7 @@ import math
 
 from bins.general.enums import Chain
 from bins.general.general_utilities import flatten_dict
-from .objects import period_yield_data
+from .objects import period_yield_data, token_group
 
 
 def returns_sumary(yield_data: list[period_yield_data], feeType: str = "lps") -> dict:
@@ -998,14 +998,73 @@ def log_debug_data(
 
 
 class period_yield_analyzer:
+    # running aggregates saved in checkpoints ( so that new periods only add deltas to them )
+    CHECKPOINT_FIELDS = [
+        "_total_seconds",
+        "_ini_timestamp",
+        "_ini_price_per_share",
+        "_ini_supply",
+        "_deposit_qtty_token0",
+        "_deposit_qtty_token1",
+        "_fees_qtty_token0_aggregated",
+        "_fees_qtty_token1_aggregated",
+        "_fees_usd_token0_aggregated",
+        "_fees_usd_token1_aggregated",
+        "_fees_usd_total_aggregated",
+        "_fees_per_share_aggregated",
+        "_fees_per_share_yield_aggregated",
+        "_rewards_per_share_aggregated",
+        "_rewards_per_share_yield_aggregated",
+        "_rewards_usd_total_aggregated",
+        "_impermanent_qtty_token0_aggregated",
+        "_impermanent_qtty_token1_aggregated",
+        "_impermanent_usd_token0_aggregated",
+        "_impermanent_usd_token1_aggregated",
+        "_impermanent_per_share_aggregated",
+        "_impermanent_per_share_yield_aggregated",
+        "_impermanent_usd_total_aggregated",
+        "_hype_roi_usd_total_aggregated",
+        "_hype_roi_qtty_token0_aggregated",
+        "_hype_roi_qtty_token1_aggregated",
+        "_hype_roi_per_share_aggregated",
+        "_hype_roi_per_share_yield_aggregated",
+        "_net_roi_usd_total_aggregated",
+        "_net_roi_per_share_aggregated",
+        "_net_roi_per_share_yield_aggregated",
+        "_price_variation_token0",
+        "_price_variation_token1",
+        "_period_hodl_deposited_yield",
+        "_period_hodl_fifty_yield",
+        "_period_hodl_token0_yield",
+        "_period_hodl_token1_yield",
+    ]
+
     def __init__(
         self,
         chain: Chain,
         yield_data_list: list[period_yield_data],
         hypervisor_static: dict,
+        checkpoint: dict | None = None,
     ) -> None:
+        """
+
+        Args:
+            chain (Chain):
+            yield_data_list (list[period_yield_data]): sorted yield data
+            hypervisor_static (dict):
+            checkpoint (dict | None, optional): result of a previous analysis 'get_checkpoint'.
+                    When provided, only periods ending after the checkpoint are processed, starting from its aggregated values. Defaults to None.
+        """
         # save base data
         self.chain = chain
+        self.checkpoint = checkpoint
+        # only periods after the checkpoint
+        if checkpoint:
+            yield_data_list = [
+                x
+                for x in yield_data_list
+                if x.timeframe.end.block > checkpoint["block"]
+            ]
         # filter yield_data_list outliers
         self.yield_data_list = self.discard_data_outliers(
             yield_data_list=yield_data_list
@@ -1016,6 +1075,8 @@ class period_yield_analyzer:
         self.hypervisor_static = hypervisor_static
         # init other vars
         self._initialize()
+        if checkpoint:
+            self._restore_checkpoint(checkpoint)
         # execute analysis
         self._execute_analysis()
 
@@ -1834,6 +1895,31 @@ class period_yield_analyzer:
         # ):
         #     raise Exception("USD qtty calculation error")
 
+    # CHECKPOINT
+    def get_checkpoint(self) -> dict:
+        """Running aggregates after the last analyzed period.
+            Use it as the 'checkpoint' of the next analysis to only process new periods.
+
+        Returns:
+            dict:
+        """
+        return {
+            "id": self.hypervisor_static["address"],
+            "address": self.hypervisor_static["address"],
+            "block": self.yield_data_list[-1].timeframe.end.block,
+            "timestamp": self.yield_data_list[-1].timeframe.end.timestamp,
+            "ini_prices": self._ini_prices.to_dict(),
+            "rewards_token_symbols": sorted(self._rewards_token_symbols),
+            **{field[1:]: getattr(self, field) for field in self.CHECKPOINT_FIELDS},
+        }
+
+    def _restore_checkpoint(self, checkpoint: dict):
+        for field in self.CHECKPOINT_FIELDS:
+            setattr(self, field, checkpoint[field[1:]])
+        self._ini_prices = token_group()
+        self._ini_prices.from_dict(checkpoint["ini_prices"])
+        self._rewards_token_symbols = set(checkpoint["rewards_token_symbols"])
+
     # GETTERS
     def get_graph(self) -> list[dict]:
         return self._graph_data
@@ -20,6 +20,7 @@ from bins.w3.builders import (
     get_latest_block,
 )
 
+from .vectorized import build_period_yield_analyzer
 from .objects import period_yield_data
 
 
@@ -114,6 +115,26 @@ def feed_hypervisor_returns_work(
             f" >25,000 items found for {chain.database_name} {hypervisor_address}. Limiting from {block_ini} to {block_end} blocks. Will continue from {block_end} on next loop ( make sure it happens)"
         )
 
+    local_db = get_default_localdb(network=chain.database_name)
+    if checkpoint := local_db.get_hypervisor_returns_checkpoint(
+        address=hypervisor_address
+    ):
+        if block_ini < checkpoint["block"]:
+            # periods already aggregated in the returns checkpoint are being recalculated: rebuild it
+            logging.getLogger(__name__).debug(
+                f" {chain.database_name} {hypervisor_address} returns checkpoint at block {checkpoint['block']} is being recalculated from block {block_ini}. Removing it."
+            )
+            local_db.delete_hypervisor_returns_checkpoint(address=hypervisor_address)
+            checkpoint = None
+        elif block_ini != checkpoint["block"]:
+            # behind the saved returns ( a failed checkpoint save ): add the saved periods after it
+            checkpoint = update_hypervisor_returns_checkpoint(
+                chain=chain, hypervisor_address=hypervisor_address
+            )
+            if checkpoint and block_ini != checkpoint["block"]:
+                # new periods are added from database once saved
+                checkpoint = None
+
     try:
         if period_yield_list := create_period_yields(
             chain=chain,
@@ -122,11 +143,24 @@ def feed_hypervisor_returns_work(
             block_end=block_end,
             try_solve_errors=True,
         ):
+            # add the new periods to the running aggregates before saving ( saving converts their values )
+            new_checkpoint = (
+                build_hypervisor_returns_checkpoint(
+                    chain=chain,
+                    hypervisor_address=hypervisor_address,
+                    checkpoint=checkpoint,
+                    yield_data_list=period_yield_list,
+                )
+                if checkpoint
+                else None
+            )
+
             # convert to dict and save
+            saved = 0
             try:
                 _todict = [x.to_dict() for x in period_yield_list]
                 # save converted to dict results to database
-                save_hypervisor_returns_to_database(
+                saved = save_hypervisor_returns_to_database(
                     chain=chain,
                     period_yield_list=_todict,
                 )
@@ -139,6 +173,14 @@ def feed_hypervisor_returns_work(
                 logging.getLogger(__name__).exception(
                     f" Could not convert yield result to dictionary, so not saved -> {e}"
                 )
+
+            if new_checkpoint and saved == len(period_yield_list):
+                local_db.set_hypervisor_returns_checkpoint(data=new_checkpoint)
+            elif saved:
+                # first checkpoint or not all periods saved: aggregate what is in database
+                update_hypervisor_returns_checkpoint(
+                    chain=chain, hypervisor_address=hypervisor_address
+                )
     except ProcessingError as e:
         logging.getLogger(__name__).error(
             f" Could not create yield data for {chain.database_name} {hypervisor_address} -> {e}"
@@ -150,7 +192,12 @@ def feed_hypervisor_returns_work(
 def save_hypervisor_returns_to_database(
     chain: Chain,
     period_yield_list: list[dict],
-):
+) -> int:
+    """Save hypervisor returns to database, up to the first inconsistent one
+
+    Returns:
+        int: number of hypervisor returns saved
+    """
     # convert to Decimal128 and check basic consistency
     to_save = []
     for i in range(len(period_yield_list)):
@@ -182,10 +229,11 @@ def save_hypervisor_returns_to_database(
         # save all at once
         if db_return := get_default_localdb(
             network=chain.database_name
-        ).set_hypervisor_return_bulk(data=period_yield_list):
+        ).set_hypervisor_return_bulk(data=to_save):
             logging.getLogger(__name__).debug(
                 f"     {chain.database_name} saved returns -> del: {db_return.deleted_count}  ins: {db_return.inserted_count}  mod: {db_return.modified_count}  ups: {db_return.upserted_count} matched: {db_return.matched_count}"
             )
+            return len(to_save)
         else:
             logging.getLogger(__name__).error(
                 f"  database did not return anything while trying to save hypervisor returns to database for {chain.database_name}"
@@ -194,6 +242,98 @@ def save_hypervisor_returns_to_database(
         logging.getLogger(__name__).error(
             f"  No hypervisor returns to save ( check errors above)"
         )
+    return 0
+
+
+def update_hypervisor_returns_checkpoint(
+    chain: Chain, hypervisor_address: str
+) -> dict | None:
+    """Add the hypervisor returns saved after the last checkpoint to its running aggregates
+        ( fees, impermanent, rewards, per share values, hodl comparisons ) and save the new checkpoint.
+        When no checkpoint exists, it is built from all the hypervisor returns in database ( once ).
+
+    Args:
+        chain (Chain):
+        hypervisor_address (str):
+
+    Returns:
+        dict | None: current checkpoint
+    """
+    local_db = get_default_localdb(network=chain.database_name)
+    checkpoint = local_db.get_hypervisor_returns_checkpoint(address=hypervisor_address)
+
+    # only periods not aggregated yet
+    find = {"address": hypervisor_address}
+    if checkpoint:
+        find["timeframe.end.timestamp"] = {"$gt": checkpoint["timestamp"]}
+
+    yield_data_list = []
+    for item in get_from_localdb(
+        network=chain.database_name,
+        collection="hypervisor_returns",
+        find=find,
+        sort=[("timeframe.ini.block", 1)],
+        batch_size=1000,
+    ):
+        yield_data = period_yield_data()
+        yield_data.from_dict(database_local.convert_d128_to_decimal(item))
+        yield_data_list.append(yield_data)
+
+    if new_checkpoint := build_hypervisor_returns_checkpoint(
+        chain=chain,
+        hypervisor_address=hypervisor_address,
+        checkpoint=checkpoint,
+        yield_data_list=yield_data_list,
+    ):
+        local_db.set_hypervisor_returns_checkpoint(data=new_checkpoint)
+        return new_checkpoint
+    return checkpoint
+
+
+def build_hypervisor_returns_checkpoint(
+    chain: Chain,
+    hypervisor_address: str,
+    checkpoint: dict | None,
+    yield_data_list: list[period_yield_data],
+) -> dict | None:
+    """Running aggregates after adding the periods ending after the checkpoint ( only those are analyzed )
+
+    Args:
+        chain (Chain):
+        hypervisor_address (str):
+        checkpoint (dict | None): current checkpoint. None to aggregate all periods
+        yield_data_list (list[period_yield_data]): sorted periods
+
+    Returns:
+        dict | None: new checkpoint or None when there is nothing to add
+    """
+    if checkpoint:
+        yield_data_list = [
+            x
+            for x in yield_data_list
+            if x.timeframe.end.timestamp > checkpoint["timestamp"]
+        ]
+    if not yield_data_list:
+        return None
+
+    try:
+        # exact ( decimal ) mode: checkpoints are restored by both analyzers
+        return build_period_yield_analyzer(
+            chain=chain,
+            yield_data_list=yield_data_list,
+            hypervisor_static=get_from_localdb(
+                network=chain.database_name,
+                collection="static",
+                find={"address": hypervisor_address},
+            )[0],
+            checkpoint=checkpoint,
+            mode="decimal",
+        ).get_checkpoint()
+    except Exception as e:
+        logging.getLogger(__name__).warning(
+            f" Could not add {len(yield_data_list)} new periods to {chain.database_name} {hypervisor_address} returns checkpoint -> {e}"
+        )
+    return None
 
 
 def create_period_yields(
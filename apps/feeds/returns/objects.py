@@ -13,7 +13,7 @@ from bins.errors.general import ProcessingError
 from bins.general.enums import Chain, error_identity, text_to_chain, text_to_protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class time_location:
     timestamp: int = None
     block: int = None
@@ -34,8 +34,12 @@ class time_location:
             "block": self.block,
         }
 
+    def from_dict(self, item: dict):
+        self.timestamp = item["timestamp"]
+        self.block = item["block"]
+
 
-@dataclass
+@dataclass(slots=True)
 class period_timeframe:
     ini: time_location = None
     end: time_location = None
@@ -57,16 +61,14 @@ class period_timeframe:
         }
 
     def from_dict(self, item: dict):
-        self.ini = time_location(
-            timestamp=item["ini"]["timestamp"], block=item["ini"]["block"]
-        )
-        self.end = time_location(
-            timestamp=item["end"]["timestamp"], block=item["end"]["block"]
-        )
+        self.ini = time_location()
+        self.ini.from_dict(item["ini"])
+        self.end = time_location()
+        self.end.from_dict(item["end"])
 
 
 # TODO: merge token_group with database object
-@dataclass
+@dataclass(slots=True)
 class token_group:
     token0: Decimal = None
     token1: Decimal = None
@@ -82,7 +84,7 @@ class token_group:
         self.token1 = item["token1"]
 
 
-@dataclass
+@dataclass(slots=True)
 class underlying_value:
     qtty: token_group = None
     details: dict = None
@@ -99,7 +101,7 @@ class underlying_value:
         self.details = item["details"]
 
 
-@dataclass
+@dataclass(slots=True)
 class qtty_usd_yield:
     qtty: token_group = None
     period_yield: Decimal = None
@@ -117,7 +119,7 @@ class qtty_usd_yield:
         self.period_yield = item["period_yield"]
 
 
-@dataclass
+@dataclass(slots=True)
 class rewards_group:
     usd: Decimal = None
     period_yield: Decimal = None
@@ -136,7 +138,7 @@ class rewards_group:
         self.details = item["details"]
 
 
-@dataclass
+@dataclass(slots=True)
 class status_group:
     prices: token_group = None
     underlying: underlying_value = None
@@ -157,7 +159,7 @@ class status_group:
         self.supply = item["supply"]
 
 
-@dataclass
+@dataclass(slots=True)
 class period_status:
     ini: status_group = None
     end: status_group = None
@@ -184,7 +186,7 @@ class period_status:
         self.end.from_dict(item["end"])
 
 
-@dataclass
+@dataclass(slots=True)
 class period_yield_data:
     """This class contains all the data needed to calculate the yield of a period
     for a given hypervisor.
@@ -0,0 +1,652 @@
+from decimal import Decimal
+import logging
+
+from bins.general.enums import Chain
+
+from .analysis import period_yield_analyzer
+from .objects import period_yield_data, token_group
+
+try:
+    import numpy as np
+except ImportError:
+    # period_yield_analyzer ( loop ) is used instead
+    np = None
+
+
+YEAR_IN_SECONDS = 60 * 60 * 24 * 365
+
+
+class period_yield_columns:
+    """Columnar arrays of a period_yield_data list ( one array per field ) and the derived per period values
+    modes:
+        float: numpy float64 arrays ( fastest )
+        decimal: numpy object arrays of Decimal ( exact, same results as period_yield_analyzer )
+    """
+
+    def __init__(self, yield_data_list: list[period_yield_data], mode: str = "float"):
+        if np is None:
+            raise ImportError("numpy is needed to use columnar period yield data")
+        if mode not in ("float", "decimal"):
+            raise ValueError(f" Invalid mode {mode}. Use float or decimal")
+
+        self.mode = mode
+        self.zero = Decimal("0") if mode == "decimal" else 0.0
+
+        # raw fields
+        self.ini_timestamp = self._column(
+            [x.timeframe.ini.timestamp for x in yield_data_list]
+        )
+        self.end_timestamp = self._column(
+            [x.timeframe.end.timestamp for x in yield_data_list]
+        )
+        self.ini_price0 = self._column(
+            [x.status.ini.prices.token0 for x in yield_data_list]
+        )
+        self.ini_price1 = self._column(
+            [x.status.ini.prices.token1 for x in yield_data_list]
+        )
+        self.end_price0 = self._column(
+            [x.status.end.prices.token0 for x in yield_data_list]
+        )
+        self.end_price1 = self._column(
+            [x.status.end.prices.token1 for x in yield_data_list]
+        )
+        self.ini_qtty0 = self._column(
+            [x.status.ini.underlying.qtty.token0 for x in yield_data_list]
+        )
+        self.ini_qtty1 = self._column(
+            [x.status.ini.underlying.qtty.token1 for x in yield_data_list]
+        )
+        self.end_qtty0 = self._column(
+            [x.status.end.underlying.qtty.token0 for x in yield_data_list]
+        )
+        self.end_qtty1 = self._column(
+            [x.status.end.underlying.qtty.token1 for x in yield_data_list]
+        )
+        self.ini_supply = self._column([x.status.ini.supply for x in yield_data_list])
+        self.end_supply = self._column([x.status.end.supply for x in yield_data_list])
+        self.fees_qtty0 = self._column([x.fees.qtty.token0 for x in yield_data_list])
+        self.fees_qtty1 = self._column([x.fees.qtty.token1 for x in yield_data_list])
+        self.rewards_usd = self._column([x.rewards.usd for x in yield_data_list])
+
+        # derived ( same as period_yield_data properties )
+        self.seconds = self.end_timestamp - self.ini_timestamp
+        self.ini_underlying_usd = (
+            self.ini_qtty0 * self.ini_price0 + self.ini_qtty1 * self.ini_price1
+        )
+        self.end_underlying_usd = (
+            self.end_qtty0 * self.end_price0 + self.end_qtty1 * self.end_price1
+        )
+        self.fees_usd = self._column([x.period_fees_usd for x in yield_data_list])
+        self.price_per_share_at_ini = self.safe_div(
+            self.ini_underlying_usd, self.ini_supply
+        )
+        self.price_per_share = self.safe_div(self.end_underlying_usd, self.end_supply)
+        self.fees_per_share = self.safe_div(self.fees_usd, self.end_supply)
+        self.rewards_per_share = self.safe_div(self.rewards_usd, self.end_supply)
+        self.impermanent_per_share = (
+            self.price_per_share - self.price_per_share_at_ini - self.fees_per_share
+        )
+
+    def __len__(self) -> int:
+        return len(self.seconds)
+
+    def filter(self, mask) -> "period_yield_columns":
+        """Keep only the rows where mask is True ( in place )"""
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray):
+                setattr(self, name, value[mask])
+        return self
+
+    def outliers_mask(
+        self, max_reward_yield: float = 2.0, max_fees_yield: float = 2.0
+    ):
+        """Rows to keep, same criteria as period_yield_analyzer.discard_data_outliers"""
+        max_reward_yield = self._scalar(max_reward_yield)
+        max_fees_yield = self._scalar(max_fees_yield)
+        return (
+            (self.seconds != 0)
+            & (
+                abs(self.safe_div(self.impermanent_per_share, self.price_per_share_at_ini))
+                <= max_reward_yield
+            )
+            & (
+                self.safe_div(self.rewards_usd, self.ini_underlying_usd)
+                <= max_reward_yield
+            )
+            & (
+                self.safe_div(self.fees_per_share, self.price_per_share_at_ini)
+                <= max_fees_yield
+            )
+        )
+
+    def div(self, numerator, denominator):
+        """Element wise division, raising like scalar division when a denominator is zero"""
+        if not (denominator != 0).all():
+            raise ZeroDivisionError("division by zero")
+        return numerator / denominator
+
+    def safe_div(self, numerator, denominator):
+        """Element wise division, zero where the denominator is zero"""
+        if not isinstance(denominator, np.ndarray):
+            if not denominator:
+                return np.full(len(numerator), self.zero, dtype=numerator.dtype)
+            return numerator / denominator
+        result = np.full(len(denominator), self.zero, dtype=denominator.dtype)
+        mask = denominator != 0
+        result[mask] = numerator[mask] / denominator[mask]
+        return result
+
+    def _scalar(self, value):
+        if self.mode == "decimal":
+            return value if isinstance(value, Decimal) else Decimal(str(value))
+        return float(value)
+
+    def _column(self, values: list):
+        # None values are zero ( like in period_yield_analyzer )
+        if self.mode == "decimal":
+            return np.array(
+                [self._scalar(x) if x else self.zero for x in values], dtype=object
+            )
+        return np.array([float(x) if x else 0.0 for x in values], dtype=np.float64)
+
+
+class period_yield_vector_analyzer:
+    """Same results as period_yield_analyzer ( graph and checkpoint ),
+    computed over columnar arrays with cumulative operations instead of looping thru each period
+    """
+
+    def __init__(
+        self,
+        chain: Chain,
+        yield_data_list: list[period_yield_data],
+        hypervisor_static: dict,
+        checkpoint: dict | None = None,
+        mode: str = "float",
+    ) -> None:
+        """
+
+        Args:
+            chain (Chain):
+            yield_data_list (list[period_yield_data]): sorted yield data
+            hypervisor_static (dict):
+            checkpoint (dict | None, optional): see period_yield_analyzer. Defaults to None.
+            mode (str, optional): float or decimal. Defaults to "float".
+        """
+        self.chain = chain
+        self.hypervisor_static = hypervisor_static
+        self.checkpoint = checkpoint
+
+        if checkpoint:
+            yield_data_list = [
+                x
+                for x in yield_data_list
+                if x.timeframe.end.block > checkpoint["block"]
+            ]
+
+        # discard outliers
+        columns = period_yield_columns(yield_data_list=yield_data_list, mode=mode)
+        mask = columns.outliers_mask()
+        self.yield_data_list = [x for x, keep in zip(yield_data_list, mask) if keep]
+        if len(self.yield_data_list) != len(yield_data_list):
+            logging.getLogger(__name__).debug(
+                f" -    A Total of {len(yield_data_list) - len(self.yield_data_list)} yield items have been identified as outliers and discarded"
+            )
+        if not self.yield_data_list:
+            raise Exception("No data to analyze")
+        self.columns = columns.filter(mask)
+
+        # period and aggregated series { name: array }
+        self.series = {}
+        self._compute()
+
+    # MAIN
+    def _compute(self):
+        c = self.columns
+        s = self.series
+        cp = self.checkpoint
+
+        def cumsum(name, values):
+            # added in the same order as period_yield_analyzer ( starting from the checkpoint value )
+            start = c._scalar(cp[name]) if cp else c.zero
+            return np.cumsum(
+                np.concatenate((np.array([start], dtype=values.dtype), values))
+            )[1:]
+
+        # initial values
+        if cp:
+            self._ini_timestamp = cp["ini_timestamp"]
+            ini_pps = c._scalar(cp["ini_price_per_share"])
+            ini_price0 = c._scalar(cp["ini_prices"]["token0"] or 0)
+            ini_price1 = c._scalar(cp["ini_prices"]["token1"] or 0)
+            self._ini_supply = cp["ini_supply"]
+            deposit0 = c._scalar(cp["deposit_qtty_token0"] or 0)
+            deposit1 = c._scalar(cp["deposit_qtty_token1"] or 0)
+            self._rewards_token_symbols = set(cp["rewards_token_symbols"])
+        else:
+            idx = int(np.argmin(c.ini_timestamp))
+            self._ini_timestamp = self.yield_data_list[idx].timeframe.ini.timestamp
+            ini_pps = c.price_per_share_at_ini[idx]
+            ini_price0 = c.ini_price0[idx]
+            ini_price1 = c.ini_price1[idx]
+            self._ini_supply = self.yield_data_list[idx].status.ini.supply
+            deposit0 = c.ini_qtty0[idx]
+            deposit1 = c.ini_qtty1[idx]
+            self._rewards_token_symbols = set()
+        for item in self.yield_data_list:
+            for detail in item.rewards.details or []:
+                self._rewards_token_symbols.add(detail["symbol"])
+
+        self._ini_price_per_share = ini_pps
+        self._ini_prices = (ini_price0, ini_price1)
+        self._deposit_qtty = (deposit0, deposit1)
+
+        def ini_div(values):
+            return values / ini_pps if ini_pps else np.full(len(c), c.zero, dtype=values.dtype)
+
+        s["total_seconds"] = cumsum("total_seconds", c.seconds)
+
+        # FEES
+        s["fees_qtty_token0_period"] = c.fees_qtty0
+        s["fees_qtty_token1_period"] = c.fees_qtty1
+        s["fees_usd_token0_period"] = c.fees_qtty0 * c.end_price0
+        s["fees_usd_token1_period"] = c.fees_qtty1 * c.end_price1
+        s["fees_usd_total_period"] = c.fees_usd
+        s["fees_per_share_period"] = c.fees_per_share
+        s["fees_per_share_yield_period"] = c.safe_div(
+            c.fees_per_share, c.price_per_share_at_ini
+        )
+        for name in (
+            "fees_qtty_token0",
+            "fees_qtty_token1",
+            "fees_usd_token0",
+            "fees_usd_token1",
+            "fees_usd_total",
+            "fees_per_share",
+        ):
+            s[f"{name}_aggregated"] = cumsum(
+                f"{name}_aggregated", s[f"{name}_period"]
+            )
+        s["fees_per_share_yield_aggregated"] = ini_div(s["fees_per_share_aggregated"])
+
+        # REWARDS
+        s["rewards_per_share_period"] = c.rewards_per_share
+        s["rewards_usd_total_period"] = c.rewards_usd
+        s["rewards_per_share_yield_period"] = c.safe_div(
+            c.rewards_per_share, c.price_per_share_at_ini
+        )
+        for name in ("rewards_per_share", "rewards_usd_total"):
+            s[f"{name}_aggregated"] = cumsum(
+                f"{name}_aggregated", s[f"{name}_period"]
+            )
+        s["rewards_per_share_yield_aggregated"] = ini_div(
+            s["rewards_per_share_aggregated"]
+        )
+
+        # RETURN HYPERVISOR ( fees + impermanent )
+        s["hype_roi_usd_total_period"] = (
+            c.price_per_share * c.end_supply - c.price_per_share_at_ini * c.ini_supply
+        )
+        s["hype_roi_qtty_token0_period"] = c.end_qtty0 - c.ini_qtty0
+        s["hype_roi_qtty_token1_period"] = c.end_qtty1 - c.ini_qtty1
+        s["hype_roi_per_share_period"] = c.price_per_share - c.price_per_share_at_ini
+        s["hype_roi_per_share_yield_period"] = c.safe_div(
+            s["hype_roi_per_share_period"], c.price_per_share_at_ini
+        )
+        for name in (
+            "hype_roi_usd_total",
+            "hype_roi_qtty_token0",
+            "hype_roi_qtty_token1",
+            "hype_roi_per_share",
+        ):
+            s[f"{name}_aggregated"] = cumsum(
+                f"{name}_aggregated", s[f"{name}_period"]
+            )
+        s["hype_roi_per_share_yield_aggregated"] = ini_div(
+            s["hype_roi_per_share_aggregated"]
+        )
+
+        # IMPERMANENT
+        s["impermanent_qtty_token0_period"] = c.end_qtty0 - c.ini_qtty0 - c.fees_qtty0
+        s["impermanent_qtty_token1_period"] = c.end_qtty1 - c.ini_qtty1 - c.fees_qtty1
+        s["impermanent_usd_token0_period"] = (
+            c.end_qtty0 * c.end_price0
+            - c.ini_qtty0 * c.ini_price0
+            - c.fees_qtty0 * c.end_price0
+        )
+        s["impermanent_usd_token1_period"] = (
+            c.end_qtty1 * c.end_price1
+            - c.ini_qtty1 * c.ini_price1
+            - c.fees_qtty1 * c.end_price1
+        )
+        s["impermanent_usd_total_period"] = (
+            s["impermanent_usd_token0_period"] + s["impermanent_usd_token1_period"]
+        )
+        # fees per share not protected against zero supply ( like period_yield_analyzer )
+        s["impermanent_per_share_period"] = (
+            c.price_per_share - c.price_per_share_at_ini - c.div(c.fees_usd, c.end_supply)
+        )
+        s["impermanent_per_share_yield_period"] = c.safe_div(
+            s["impermanent_per_share_period"], c.price_per_share_at_ini
+        )
+        for name in (
+            "impermanent_qtty_token0",
+            "impermanent_qtty_token1",
+            "impermanent_usd_token0",
+            "impermanent_usd_token1",
+            "impermanent_usd_total",
+        ):
+            s[f"{name}_aggregated"] = cumsum(
+                f"{name}_aggregated", s[f"{name}_period"]
+            )
+        # not an addition of periods ( avoids errors due to missing periods )
+        s["impermanent_per_share_aggregated"] = (
+            c.price_per_share - ini_pps - s["fees_per_share_aggregated"]
+        )
+        s["impermanent_per_share_yield_aggregated"] = ini_div(
+            s["impermanent_per_share_aggregated"]
+        )
+
+        # RETURN NET ( fees + impermanent + rewards )
+        s["net_roi_usd_total_period"] = (
+            s["hype_roi_usd_total_period"] + s["rewards_usd_total_period"]
+        )
+        s["net_roi_per_share_period"] = (
+            s["hype_roi_per_share_period"] + s["rewards_per_share_period"]
+        )
+        s["net_roi_per_share_yield_period"] = c.safe_div(
+            s["net_roi_per_share_period"], c.price_per_share_at_ini
+        )
+        for name in ("net_roi_usd_total", "net_roi_per_share"):
+            s[f"{name}_aggregated"] = cumsum(
+                f"{name}_aggregated", s[f"{name}_period"]
+            )
+        s["net_roi_per_share_yield_aggregated"] = ini_div(
+            s["net_roi_per_share_aggregated"]
+        )
+
+        # PRICE VARIATION
+        s["price_variation_token0"] = (
+            (c.end_price0 - ini_price0) / ini_price0
+            if ini_price0
+            else np.full(len(c), c.zero, dtype=c.end_price0.dtype)
+        )
+        s["price_variation_token1"] = (
+            (c.end_price1 - ini_price1) / ini_price1
+            if ini_price1
+            else np.full(len(c), c.zero, dtype=c.end_price1.dtype)
+        )
+
+        # COMPARISON
+        deposit_usd = deposit0 * ini_price0 + deposit1 * ini_price1
+        # zero initial prices raise ( like period_yield_analyzer )
+        if not (ini_price0 and ini_price1):
+            raise ZeroDivisionError("division by zero")
+        fifty0 = (deposit_usd / 2) / ini_price0
+        fifty1 = (deposit_usd / 2) / ini_price1
+        hold0 = deposit_usd / ini_price0
+        hold1 = deposit_usd / ini_price1
+        for name, values in (
+            ("period_hodl_deposited", deposit0 * c.end_price0 + deposit1 * c.end_price1),
+            ("period_hodl_fifty", fifty0 * c.end_price0 + fifty1 * c.end_price1),
+            ("period_hodl_token0", hold0 * c.end_price0),
+            ("period_hodl_token1", hold1 * c.end_price1),
+        ):
+            s[name] = values
+            s[f"{name}_yield"] = (
+                (values - deposit_usd) / deposit_usd
+                if deposit_usd
+                else np.full(len(c), c.zero, dtype=values.dtype)
+            )
+
+        # YEAR extrapolations
+        year = c._scalar(YEAR_IN_SECONDS)
+        total_seconds = s["total_seconds"]
+        s["year_fees_per_share_yield"] = (
+            c.safe_div(s["fees_per_share_yield_aggregated"], total_seconds) * year
+        )
+        s["year_fees_qtty_usd"] = (
+            c.safe_div(s["fees_usd_total_aggregated"], total_seconds) * year
+        )
+        s["year_fees_qtty_token0"] = (
+            c.safe_div(s["fees_qtty_token0_aggregated"], total_seconds) * year
+        )
+        s["year_fees_qtty_token1"] = (
+            c.safe_div(s["fees_qtty_token1_aggregated"], total_seconds) * year
+        )
+        s["year_rewards_qtty_usd"] = (
+            c.safe_div(s["rewards_usd_total_aggregated"], total_seconds) * year
+        )
+        s["year_rewards_per_share_yield"] = ini_div(
+            c.safe_div(s["rewards_per_share_aggregated"], total_seconds) * year
+        )
+
+    # CHECKPOINT
+    def get_checkpoint(self) -> dict:
+        """Same as period_yield_analyzer.get_checkpoint"""
+        result = {
+            "id": self.hypervisor_static["address"],
+            "address": self.hypervisor_static["address"],
+            "block": self.yield_data_list[-1].timeframe.end.block,
+            "timestamp": self.yield_data_list[-1].timeframe.end.timestamp,
+            "ini_prices": token_group(
+                token0=self._ini_prices[0], token1=self._ini_prices[1]
+            ).to_dict(),
+            "rewards_token_symbols": sorted(self._rewards_token_symbols),
+            "ini_timestamp": self._ini_timestamp,
+            "ini_price_per_share": self._ini_price_per_share,
+            "ini_supply": self._ini_supply,
+            "deposit_qtty_token0": self._deposit_qtty[0],
+            "deposit_qtty_token1": self._deposit_qtty[1],
+        }
+        for field in period_yield_analyzer.CHECKPOINT_FIELDS:
+            name = field[1:]
+            if name not in result:
+                result[name] = self.series[name][-1]
+
+        result["total_seconds"] = int(result["total_seconds"])
+        # numpy scalars to python
+        return {
+            k: v.item() if isinstance(v, np.generic) else v for k, v in result.items()
+        }
+
+    # GETTERS
+    def get_graph(self) -> list[dict]:
+        """Same as period_yield_analyzer.get_graph"""
+        # python values
+        s = {k: v.tolist() for k, v in self.series.items()}
+        price_per_share_ini = self.columns.price_per_share_at_ini.tolist()
+        price_per_share_end = self.columns.price_per_share.tolist()
+        result = []
+        for i, yield_item in enumerate(self.yield_data_list):
+            # build rewards details
+            _rwds_details = {
+                x: {"qtty": 0, "usd": 0, "seconds": 0, "period yield": 0}
+                for x in self._rewards_token_symbols
+            }
+            for reward_detail in yield_item.rewards.details or []:
+                _rwds_details[reward_detail["symbol"]] = {
+                    "qtty": reward_detail["qtty"],
+                    "usd": reward_detail["usd"],
+                    "seconds": reward_detail["seconds"],
+                    "period yield": reward_detail["period yield"],
+                }
+            _status_ini = yield_item.status.ini.to_dict()
+            _status_ini["prices"]["share"] = price_per_share_ini[i]
+            _status_end = yield_item.status.end.to_dict()
+            _status_end["prices"]["share"] = price_per_share_end[i]
+
+            net_yield = s["net_roi_per_share_yield_aggregated"][i]
+            hodl = {
+                x: s[f"period_hodl_{x}_yield"][i]
+                for x in ("deposited", "fifty", "token0", "token1")
+            }
+            result.append(
+                {
+                    "chain": self.chain.database_name,
+                    "address": self.hypervisor_static["address"],
+                    "symbol": self.hypervisor_static["symbol"],
+                    "block": yield_item.timeframe.end.block,
+                    "timestamp": yield_item.timeframe.end.timestamp,
+                    "timestamp_from": yield_item.timeframe.ini.timestamp,
+                    "datetime_from": f"{yield_item.timeframe.ini.datetime:%Y-%m-%d %H:%M:%S}",
+                    "datetime_to": f"{yield_item.timeframe.end.datetime:%Y-%m-%d %H:%M:%S}",
+                    "period_seconds": s["total_seconds"][i],
+                    "status": {
+                        "ini": _status_ini,
+                        "end": _status_end,
+                    },
+                    "fees": {
+                        "point": {
+                            "yield": s["fees_per_share_yield_period"][i],
+                            "total_usd": s["fees_usd_total_period"][i],
+                            "qtty_token0": s["fees_qtty_token0_period"][i],
+                            "qtty_token1": s["fees_qtty_token1_period"][i],
+                            "usd_token0": s["fees_usd_token0_period"][i],
+                            "usd_token1": s["fees_usd_token1_period"][i],
+                            "per_share": s["fees_per_share_period"][i],
+                        },
+                        "period": {
+                            "yield": s["fees_per_share_yield_aggregated"][i],
+                            "total_usd": s["fees_usd_total_aggregated"][i],
+                            "qtty_token0": s["fees_qtty_token0_aggregated"][i],
+                            "qtty_token1": s["fees_qtty_token1_aggregated"][i],
+                            "usd_token0": s["fees_usd_token0_aggregated"][i],
+                            "usd_token1": s["fees_usd_token1_aggregated"][i],
+                            "per_share": s["fees_per_share_aggregated"][i],
+                        },
+                        "year": {
+                            "yield": s["year_fees_per_share_yield"][i],
+                            "total_usd": s["year_fees_qtty_usd"][i],
+                            "qtty_token0": s["year_fees_qtty_token0"][i],
+                            "qtty_token1": s["year_fees_qtty_token1"][i],
+                        },
+                    },
+                    "rewards": {
+                        "point": {
+                            "yield": s["rewards_per_share_yield_period"][i],
+                            "total_usd": s["rewards_usd_total_period"][i],
+                            "per_share": s["rewards_per_share_period"][i],
+                        },
+                        "period": {
+                            "yield": s["rewards_per_share_yield_aggregated"][i],
+                            "total_usd": s["rewards_usd_total_aggregated"][i],
+                            "per_share": s["rewards_per_share_aggregated"][i],
+                        },
+                        "year": {
+                            "yield": s["year_rewards_per_share_yield"][i],
+                            "total_usd": s["year_rewards_qtty_usd"][i],
+                        },
+                        "details": _rwds_details,
+                    },
+                    "impermanent": {
+                        "point": {
+                            "yield": s["impermanent_per_share_yield_period"][i],
+                            "total_usd": s["impermanent_usd_total_period"][i],
+                            "qtty_token0": s["impermanent_qtty_token0_period"][i],
+                            "qtty_token1": s["impermanent_qtty_token1_period"][i],
+                            "usd_token0": s["impermanent_usd_token0_period"][i],
+                            "usd_token1": s["impermanent_usd_token1_period"][i],
+                            "per_share": s["impermanent_per_share_period"][i],
+                        },
+                        "period": {
+                            "yield": s["impermanent_per_share_yield_aggregated"][i],
+                            "total_usd": s["impermanent_usd_total_aggregated"][i],
+                            "qtty_token0": s["impermanent_qtty_token0_aggregated"][i],
+                            "qtty_token1": s["impermanent_qtty_token1_aggregated"][i],
+                            "usd_token0": s["impermanent_usd_token0_aggregated"][i],
+                            "usd_token1": s["impermanent_usd_token1_aggregated"][i],
+                            "per_share": s["impermanent_per_share_aggregated"][i],
+                        },
+                    },
+                    "roi": {
+                        "point": {
+                            "return": s["net_roi_per_share_yield_period"][i],
+                            "total_usd": s["net_roi_usd_total_period"][i],
+                        },
+                        "period": {
+                            "return": net_yield,
+                            "total_usd": s["net_roi_usd_total_aggregated"][i],
+                        },
+                        "point_hypervisor": {
+                            "return": s["hype_roi_per_share_yield_period"][i],
+                            "total_usd": s["hype_roi_usd_total_period"][i],
+                            "qtty_token0": s["hype_roi_qtty_token0_period"][i],
+                            "qtty_token1": s["hype_roi_qtty_token1_period"][i],
+                        },
+                        "period_hypervisor": {
+                            "return": s["hype_roi_per_share_yield_aggregated"][i],
+                            "total_usd": s["hype_roi_usd_total_aggregated"][i],
+                            "qtty_token0": s["hype_roi_qtty_token0_aggregated"][i],
+                            "qtty_token1": s["hype_roi_qtty_token1_aggregated"][i],
+                        },
+                    },
+                    "price": {
+                        "period": {
+                            "variation_token0": s["price_variation_token0"][i],
+                            "variation_token1": s["price_variation_token1"][i],
+                        },
+                    },
+                    "comparison": {
+                        "return": {
+                            "gamma": net_yield,
+                            "hodl_deposited": hodl["deposited"],
+                            "hodl_fifty": hodl["fifty"],
+                            "hodl_token0": hodl["token0"],
+                            "hodl_token1": hodl["token1"],
+                        },
+                        "gamma_vs": {
+                            f"hodl_{x}": (
+                                ((net_yield + 1) / (value + 1)) if value != -1 else 0
+                            )
+                            - 1
+                            for x, value in hodl.items()
+                        },
+                    },
+                    # compatible with old version
+                    "year_feeApr": s["year_fees_per_share_yield"][i],
+                    "year_feeApy": s["year_fees_per_share_yield"][i],
+                    "year_allRewards2": s["year_rewards_per_share_yield"][i],
+                    "period_feeApr": s["fees_per_share_yield_aggregated"][i],
+                    "period_rewardsApr": s["rewards_per_share_yield_aggregated"][i],
+                    "period_lping": net_yield,
+                    "period_hodl_deposited": hodl["deposited"],
+                    "period_hodl_fifty": hodl["fifty"],
+                    "period_hodl_token0": hodl["token0"],
+                    "period_hodl_token1": hodl["token1"],
+                    "period_netApr": net_yield,
+                    "period_impermanentResult": s[
+                        "impermanent_per_share_yield_aggregated"
+                    ][i],
+                    "gamma_vs_hodl": ((net_yield + 1) / (hodl["deposited"] + 1)) - 1,
+                }
+            )
+        return result
+
+
+def build_period_yield_analyzer(
+    chain: Chain,
+    yield_data_list: list[period_yield_data],
+    hypervisor_static: dict,
+    checkpoint: dict | None = None,
+    mode: str = "float",
+) -> period_yield_vector_analyzer | period_yield_analyzer:
+    """Vectorized analyzer when numpy is available, period_yield_analyzer otherwise
+
+    Args:
+        mode (str, optional): float or decimal ( exact ). Defaults to "float".
+    """
+    if np is None:
+        return period_yield_analyzer(
+            chain=chain,
+            yield_data_list=yield_data_list,
+            hypervisor_static=hypervisor_static,
+            checkpoint=checkpoint,
+        )
+    return period_yield_vector_analyzer(
+        chain=chain,
+        yield_data_list=yield_data_list,
+        hypervisor_static=hypervisor_static,
+        checkpoint=checkpoint,
+        mode=mode,
+    )
@@ -36,9 +36,11 @@ from bins.w3.protocols.camelot.rewarder import (
     camelot_rewards_nitro_pool_factory,
 )
 
-from bins.w3.protocols.general import erc20, bep20
 
 from bins.w3.protocols.gamma.registry import gamma_hypervisor_registry
+from bins.w3.protocols.gamma.registry_snapshot import (
+    get_hypervisor_registry_snapshot,
+)
 from bins.w3.protocols.gamma.rewarder import (
     gamma_masterchef_rewarder,
     gamma_rewarder,
@@ -52,17 +54,23 @@ from bins.w3.protocols.zyberswap.rewarder import zyberswap_masterchef_v1
 from bins.w3.protocols.beamswap.rewarder import beamswap_masterchef_v2
 from bins.w3.protocols.angle.rewarder import angle_merkle_distributor_creator
 from bins.w3.protocols.ramses.hypervisor import gamma_hypervisor as ramses_hypervisor
+from bins.w3.protocols.ramses.rewarder import get_gauges_rewards
 from bins.w3.protocols.pharaoh.hypervisor import gamma_hypervisor as pharaoh_hypervisor
 from bins.w3.protocols.cleopatra.hypervisor import (
     gamma_hypervisor as cleopatra_hypervisor,
 )
 
-from bins.apis.etherscan_utilities import etherscan_helper
+from bins.w3.helpers.contract_creation import get_contract_creation_index
 
 
 # hypervisors static data
 def feed_hypervisor_static(
-    protocol: str, network: str, dex: str, rewrite: bool = False, threaded: bool = True
+    protocol: str,
+    network: str,
+    dex: str,
+    rewrite: bool = False,
+    threaded: bool = True,
+    registry_state: dict | None = None,
 ):
     """Save hypervisor static data using web3 calls from a hypervisor's registry
 
@@ -72,6 +80,7 @@ def feed_hypervisor_static(
         dex (str):
         rewrite (bool): Force rewrite all hypervisors found
         threaded (bool):
+        registry_state (dict | None, optional): registry snapshot sync result ( see sync_hypervisor_registries ). Defaults to None: sync it now.
     """
 
     logging.getLogger(__name__).info(
@@ -80,7 +89,11 @@ def feed_hypervisor_static(
 
     # hypervisors to process
     hypervisors_to_process = _get_static_hypervisors_to_process(
-        network=network, dex=dex, rewrite=rewrite
+        network=network, dex=dex, rewrite=rewrite, registry_state=registry_state
+    )
+    # resolve all hypervisor creations at once
+    get_contract_creation_index(network=network).get_many(
+        addresses=[x["address"] for x in hypervisors_to_process]
     )
 
     # set log list of hypervisors with errors
@@ -1268,6 +1281,31 @@ def create_rewards_static_merkl(
     return result
 
 
+def _get_gauges_rewards(
+    network: str, hype_statuses: list, rewarder_type: str
+) -> dict[str, list[dict]]:
+    """Rewards of the hypervisors gauges ( ramses like ), read in one multicall batch per block
+
+    Args:
+        network (str):
+        hype_statuses (list): hypervisors with a gauge set
+        rewarder_type (str):
+
+    Returns:
+        dict[str, list[dict]]: { gauge address: gauge.get_rewards items }
+    """
+    result = {}
+    for reward_data in get_gauges_rewards(
+        network=network,
+        gauges=[(x.gauge.address, x.block) for x in hype_statuses],
+        rewarder_type=rewarder_type,
+        convert_bint=True,
+        timestamps={x.block: x._timestamp for x in hype_statuses},
+    ):
+        result.setdefault(reward_data["rewarder_address"], []).append(reward_data)
+    return result
+
+
 def create_rewards_static_ramses(
     chain: Chain,
     hypervisors: list[dict],
@@ -1285,12 +1323,19 @@ def create_rewards_static_ramses(
         "creation_block": {},
         "receiver_address": {},
     }
+    # create all hypervisors at the same block, so their gauges are read together
+    hype_statuses = []
+    timestamp = 0
     for hype_static in hypervisors:
         if rewrite or hype_static["address"].lower() not in already_processed:
             # create ramses hypervisor
             hype_status = ramses_hypervisor(
-                address=hype_static["address"], network=chain.database_name, block=block
+                address=hype_static["address"],
+                network=chain.database_name,
+                block=block,
+                timestamp=timestamp,
             )
+            block, timestamp = hype_status.block, hype_status._timestamp
 
             # check if gauge is set ( not 0x0000...)
             if (
@@ -1301,87 +1346,90 @@ def create_rewards_static_ramses(
                     f" Gauge is not set for ramses hype:{hype_static['address']}. Skipping static rewards processing"
                 )
                 continue
+            hype_statuses.append((hype_static, hype_status))
 
-            if hype_rewards := hype_status.gauge.get_rewards(convert_bint=True):
-                logging.getLogger(__name__).debug(
-                    f" Found {len(hype_rewards)} static rewards for the hypervisor {hype_static['address']}"
-                )
+    gauges_rewards = _get_gauges_rewards(
+        network=chain.database_name,
+        hype_statuses=[x[1] for x in hype_statuses],
+        rewarder_type=rewarderType.RAMSES_v2,
+    )
 
-                # add block creation data to cache
-                if (
-                    not hype_rewards[0]["rewarder_address"]
-                    in ephemeral_cache["creation_block"]
-                ):
-                    if creation_data := _get_contract_creation_block(
-                        network=chain.database_name,
-                        contract_address=hype_rewards[0]["rewarder_address"],
-                    ):
-                        ephemeral_cache["creation_block"][
-                            hype_rewards[0]["rewarder_address"]
-                        ] = creation_data["block"]
-                    else:
-                        logging.getLogger(__name__).debug(
-                            f"  No contract creation date found for ramses reward static {hype_rewards[0]['rewarder_address']}. Using Hypervisor's {hype_static['address']}"
-                        )
-                        ephemeral_cache["creation_block"][
-                            hype_rewards[0]["rewarder_address"]
-                        ] = hype_static["block"]
-                # set contract creation block
-                creation_block = ephemeral_cache["creation_block"][
-                    hype_rewards[0]["rewarder_address"]
-                ]
+    for hype_static, hype_status in hype_statuses:
+        if hype_rewards := [
+            dict(x) for x in gauges_rewards.get(hype_status.gauge.address.lower(), [])
+        ]:
+            logging.getLogger(__name__).debug(
+                f" Found {len(hype_rewards)} static rewards for the hypervisor {hype_static['address']}"
+            )
 
-                for reward_data in hype_rewards:
-                    # token ephemeral cache
-                    if (
-                        not reward_data["rewardToken"].lower()
-                        in ephemeral_cache["tokens"]
-                    ):
-                        logging.getLogger(__name__).debug(
-                            f" adding token {reward_data['rewardToken']} in ephemeral cache"
-                        )
-                        # build erc20 helper
-                        erc20_helper = build_erc20_helper(
-                            chain=chain, address=reward_data["rewardToken"], cached=True
-                        )
-                        ephemeral_cache["tokens"][
-                            reward_data["rewardToken"].lower()
-                        ] = {
-                            "symbol": erc20_helper.symbol,
-                            "decimals": erc20_helper.decimals,
-                        }
-                    # receiver address ephemeral cache
-                    if (
-                        not hype_status.address.lower()
-                        in ephemeral_cache["receiver_address"]
-                    ):
-                        ephemeral_cache["receiver_address"][
-                            hype_status.address.lower()
-                        ] = hype_status.receiver.address.lower()
-
-                    reward_data["hypervisor_address"] = hype_status.address.lower()
-                    reward_data["rewardToken_symbol"] = ephemeral_cache["tokens"][
-                        reward_data["rewardToken"].lower()
-                    ]["symbol"]
-                    reward_data["rewardToken_decimals"] = ephemeral_cache["tokens"][
-                        reward_data["rewardToken"].lower()
-                    ]["decimals"]
-                    reward_data["total_hypervisorToken_qtty"] = str(
-                        hype_status.totalSupply
+            # add block creation data to cache
+            if (
+                not hype_rewards[0]["rewarder_address"]
+                in ephemeral_cache["creation_block"]
+            ):
+                if creation_data := _get_contract_creation_block(
+                    network=chain.database_name,
+                    contract_address=hype_rewards[0]["rewarder_address"],
+                ):
+                    ephemeral_cache["creation_block"][
+                        hype_rewards[0]["rewarder_address"]
+                    ] = creation_data["block"]
+                else:
+                    logging.getLogger(__name__).debug(
+                        f"  No contract creation date found for ramses reward static {hype_rewards[0]['rewarder_address']}. Using Hypervisor's {hype_static['address']}"
                     )
+                    ephemeral_cache["creation_block"][
+                        hype_rewards[0]["rewarder_address"]
+                    ] = hype_static["block"]
+            # set contract creation block
+            creation_block = ephemeral_cache["creation_block"][
+                hype_rewards[0]["rewarder_address"]
+            ]
 
-                    # HACK: set rewarder_registry as the 'receiver' -> MultiFeeDistribution contract address
-                    reward_data["rewarder_registry"] = ephemeral_cache[
-                        "receiver_address"
-                    ][hype_status.address.lower()]
-
-                    # add block creation data
-                    reward_data["block"] = creation_block
+            for reward_data in hype_rewards:
+                # token ephemeral cache
+                if not reward_data["rewardToken"].lower() in ephemeral_cache["tokens"]:
                     logging.getLogger(__name__).debug(
-                        f"  Processed ramses {chain.database_name}'s {reward_data['rewarder_address']} {reward_data['rewardToken_symbol']} static rewarder at {reward_data['block']}"
+                        f" adding token {reward_data['rewardToken']} in ephemeral cache"
                     )
-                    # add to result
-                    result.append(reward_data)
+                    # build erc20 helper
+                    erc20_helper = build_erc20_helper(
+                        chain=chain, address=reward_data["rewardToken"], cached=True
+                    )
+                    ephemeral_cache["tokens"][reward_data["rewardToken"].lower()] = {
+                        "symbol": erc20_helper.symbol,
+                        "decimals": erc20_helper.decimals,
+                    }
+                # receiver address ephemeral cache
+                if (
+                    not hype_status.address.lower()
+                    in ephemeral_cache["receiver_address"]
+                ):
+                    ephemeral_cache["receiver_address"][
+                        hype_status.address.lower()
+                    ] = hype_status.receiver.address.lower()
+
+                reward_data["hypervisor_address"] = hype_status.address.lower()
+                reward_data["rewardToken_symbol"] = ephemeral_cache["tokens"][
+                    reward_data["rewardToken"].lower()
+                ]["symbol"]
+                reward_data["rewardToken_decimals"] = ephemeral_cache["tokens"][
+                    reward_data["rewardToken"].lower()
+                ]["decimals"]
+                reward_data["total_hypervisorToken_qtty"] = str(hype_status.totalSupply)
+
+                # HACK: set rewarder_registry as the 'receiver' -> MultiFeeDistribution contract address
+                reward_data["rewarder_registry"] = ephemeral_cache["receiver_address"][
+                    hype_status.address.lower()
+                ]
+
+                # add block creation data
+                reward_data["block"] = creation_block
+                logging.getLogger(__name__).debug(
+                    f"  Processed ramses {chain.database_name}'s {reward_data['rewarder_address']} {reward_data['rewardToken_symbol']} static rewarder at {reward_data['block']}"
+                )
+                # add to result
+                result.append(reward_data)
     return result
 
 
@@ -1412,12 +1460,19 @@ def create_rewards_static_pharaoh(
         "creation_block": {},
         "receiver_address": {},
     }
+    # create all hypervisors at the same block, so their gauges are read together
+    hype_statuses = []
+    timestamp = 0
     for hype_static in hypervisors:
         if rewrite or hype_static["address"].lower() not in already_processed:
             # create hypervisor
             hype_status = pharaoh_hypervisor(
-                address=hype_static["address"], network=chain.database_name, block=block
+                address=hype_static["address"],
+                network=chain.database_name,
+                block=block,
+                timestamp=timestamp,
             )
+            block, timestamp = hype_status.block, hype_status._timestamp
 
             # check if gauge is set ( not 0x0000...)
             if (
@@ -1428,87 +1483,90 @@ def create_rewards_static_pharaoh(
                     f" Gauge is not set for pharaoh hype:{hype_static['address']}. Skipping static rewards processing"
                 )
                 continue
+            hype_statuses.append((hype_static, hype_status))
 
-            if hype_rewards := hype_status.gauge.get_rewards(convert_bint=True):
-                logging.getLogger(__name__).debug(
-                    f" Found {len(hype_rewards)} static rewards for the hypervisor {hype_static['address']}"
-                )
+    gauges_rewards = _get_gauges_rewards(
+        network=chain.database_name,
+        hype_statuses=[x[1] for x in hype_statuses],
+        rewarder_type=rewarderType.PHARAOH,
+    )
 
-                # add block creation data to cache
-                if (
-                    not hype_rewards[0]["rewarder_address"]
-                    in ephemeral_cache["creation_block"]
-                ):
-                    if creation_data := _get_contract_creation_block(
-                        network=chain.database_name,
-                        contract_address=hype_rewards[0]["rewarder_address"],
-                    ):
-                        ephemeral_cache["creation_block"][
-                            hype_rewards[0]["rewarder_address"]
-                        ] = creation_data["block"]
-                    else:
-                        logging.getLogger(__name__).debug(
-                            f"  No contract creation date found for pharaoh reward static {hype_rewards[0]['rewarder_address']}. Using Hypervisor's {hype_static['address']}"
-                        )
-                        ephemeral_cache["creation_block"][
-                            hype_rewards[0]["rewarder_address"]
-                        ] = hype_static["block"]
-                # set contract creation block
-                creation_block = ephemeral_cache["creation_block"][
-                    hype_rewards[0]["rewarder_address"]
-                ]
+    for hype_static, hype_status in hype_statuses:
+        if hype_rewards := [
+            dict(x) for x in gauges_rewards.get(hype_status.gauge.address.lower(), [])
+        ]:
+            logging.getLogger(__name__).debug(
+                f" Found {len(hype_rewards)} static rewards for the hypervisor {hype_static['address']}"
+            )
 
-                for reward_data in hype_rewards:
-                    # token ephemeral cache
-                    if (
-                        not reward_data["rewardToken"].lower()
-                        in ephemeral_cache["tokens"]
-                    ):
-                        logging.getLogger(__name__).debug(
-                            f" adding token {reward_data['rewardToken']} in ephemeral cache"
-                        )
-                        # build erc20 helper
-                        erc20_helper = build_erc20_helper(
-                            chain=chain, address=reward_data["rewardToken"], cached=True
-                        )
-                        ephemeral_cache["tokens"][
-                            reward_data["rewardToken"].lower()
-                        ] = {
-                            "symbol": erc20_helper.symbol,
-                            "decimals": erc20_helper.decimals,
-                        }
-                    # receiver address ephemeral cache
-                    if (
-                        not hype_status.address.lower()
-                        in ephemeral_cache["receiver_address"]
-                    ):
-                        ephemeral_cache["receiver_address"][
-                            hype_status.address.lower()
-                        ] = hype_status.receiver.address.lower()
-
-                    reward_data["hypervisor_address"] = hype_status.address.lower()
-                    reward_data["rewardToken_symbol"] = ephemeral_cache["tokens"][
-                        reward_data["rewardToken"].lower()
-                    ]["symbol"]
-                    reward_data["rewardToken_decimals"] = ephemeral_cache["tokens"][
-                        reward_data["rewardToken"].lower()
-                    ]["decimals"]
-                    reward_data["total_hypervisorToken_qtty"] = str(
-                        hype_status.totalSupply
+            # add block creation data to cache
+            if (
+                not hype_rewards[0]["rewarder_address"]
+                in ephemeral_cache["creation_block"]
+            ):
+                if creation_data := _get_contract_creation_block(
+                    network=chain.database_name,
+                    contract_address=hype_rewards[0]["rewarder_address"],
+                ):
+                    ephemeral_cache["creation_block"][
+                        hype_rewards[0]["rewarder_address"]
+                    ] = creation_data["block"]
+                else:
+                    logging.getLogger(__name__).debug(
+                        f"  No contract creation date found for pharaoh reward static {hype_rewards[0]['rewarder_address']}. Using Hypervisor's {hype_static['address']}"
                     )
+                    ephemeral_cache["creation_block"][
+                        hype_rewards[0]["rewarder_address"]
+                    ] = hype_static["block"]
+            # set contract creation block
+            creation_block = ephemeral_cache["creation_block"][
+                hype_rewards[0]["rewarder_address"]
+            ]
 
-                    # HACK: set rewarder_registry as the 'receiver' -> MultiFeeDistribution contract address
-                    reward_data["rewarder_registry"] = ephemeral_cache[
-                        "receiver_address"
-                    ][hype_status.address.lower()]
-
-                    # add block creation data
-                    reward_data["block"] = creation_block
+            for reward_data in hype_rewards:
+                # token ephemeral cache
+                if not reward_data["rewardToken"].lower() in ephemeral_cache["tokens"]:
                     logging.getLogger(__name__).debug(
-                        f"  Processed pharaoh {chain.database_name}'s {reward_data['rewarder_address']} {reward_data['rewardToken_symbol']} static rewarder at {reward_data['block']}"
+                        f" adding token {reward_data['rewardToken']} in ephemeral cache"
                     )
-                    # add to result
-                    result.append(reward_data)
+                    # build erc20 helper
+                    erc20_helper = build_erc20_helper(
+                        chain=chain, address=reward_data["rewardToken"], cached=True
+                    )
+                    ephemeral_cache["tokens"][reward_data["rewardToken"].lower()] = {
+                        "symbol": erc20_helper.symbol,
+                        "decimals": erc20_helper.decimals,
+                    }
+                # receiver address ephemeral cache
+                if (
+                    not hype_status.address.lower()
+                    in ephemeral_cache["receiver_address"]
+                ):
+                    ephemeral_cache["receiver_address"][
+                        hype_status.address.lower()
+                    ] = hype_status.receiver.address.lower()
+
+                reward_data["hypervisor_address"] = hype_status.address.lower()
+                reward_data["rewardToken_symbol"] = ephemeral_cache["tokens"][
+                    reward_data["rewardToken"].lower()
+                ]["symbol"]
+                reward_data["rewardToken_decimals"] = ephemeral_cache["tokens"][
+                    reward_data["rewardToken"].lower()
+                ]["decimals"]
+                reward_data["total_hypervisorToken_qtty"] = str(hype_status.totalSupply)
+
+                # HACK: set rewarder_registry as the 'receiver' -> MultiFeeDistribution contract address
+                reward_data["rewarder_registry"] = ephemeral_cache["receiver_address"][
+                    hype_status.address.lower()
+                ]
+
+                # add block creation data
+                reward_data["block"] = creation_block
+                logging.getLogger(__name__).debug(
+                    f"  Processed pharaoh {chain.database_name}'s {reward_data['rewarder_address']} {reward_data['rewardToken_symbol']} static rewarder at {reward_data['block']}"
+                )
+                # add to result
+                result.append(reward_data)
     return result
 
 
@@ -1539,12 +1597,19 @@ def create_rewards_static_cleopatra(
         "creation_block": {},
         "receiver_address": {},
     }
+    # create all hypervisors at the same block, so their gauges are read together
+    hype_statuses = []
+    timestamp = 0
     for hype_static in hypervisors:
         if rewrite or hype_static["address"].lower() not in already_processed:
             # create hypervisor
             hype_status = cleopatra_hypervisor(
-                address=hype_static["address"], network=chain.database_name, block=block
+                address=hype_static["address"],
+                network=chain.database_name,
+                block=block,
+                timestamp=timestamp,
             )
+            block, timestamp = hype_status.block, hype_status._timestamp
 
             # check if gauge is set ( not 0x0000...)
             if (
@@ -1555,87 +1620,90 @@ def create_rewards_static_cleopatra(
                     f" Gauge is not set for cleopatra hype:{hype_static['address']}. Skipping static rewards processing"
                 )
                 continue
+            hype_statuses.append((hype_static, hype_status))
 
-            if hype_rewards := hype_status.gauge.get_rewards(convert_bint=True):
-                logging.getLogger(__name__).debug(
-                    f" Found {len(hype_rewards)} static rewards for the hypervisor {hype_static['address']}"
-                )
+    gauges_rewards = _get_gauges_rewards(
+        network=chain.database_name,
+        hype_statuses=[x[1] for x in hype_statuses],
+        rewarder_type=rewarderType.CLEOPATRA,
+    )
 
-                # add block creation data to cache
-                if (
-                    not hype_rewards[0]["rewarder_address"]
-                    in ephemeral_cache["creation_block"]
-                ):
-                    if creation_data := _get_contract_creation_block(
-                        network=chain.database_name,
-                        contract_address=hype_rewards[0]["rewarder_address"],
-                    ):
-                        ephemeral_cache["creation_block"][
-                            hype_rewards[0]["rewarder_address"]
-                        ] = creation_data["block"]
-                    else:
-                        logging.getLogger(__name__).debug(
-                            f"  No contract creation date found for cleopatra reward static {hype_rewards[0]['rewarder_address']}. Using Hypervisor's {hype_static['address']} "
-                        )
-                        ephemeral_cache["creation_block"][
-                            hype_rewards[0]["rewarder_address"]
-                        ] = hype_static["block"]
-                # set contract creation block
-                creation_block = ephemeral_cache["creation_block"][
-                    hype_rewards[0]["rewarder_address"]
-                ]
+    for hype_static, hype_status in hype_statuses:
+        if hype_rewards := [
+            dict(x) for x in gauges_rewards.get(hype_status.gauge.address.lower(), [])
+        ]:
+            logging.getLogger(__name__).debug(
+                f" Found {len(hype_rewards)} static rewards for the hypervisor {hype_static['address']}"
+            )
 
-                for reward_data in hype_rewards:
-                    # token ephemeral cache
-                    if (
-                        not reward_data["rewardToken"].lower()
-                        in ephemeral_cache["tokens"]
-                    ):
-                        logging.getLogger(__name__).debug(
-                            f" adding token {reward_data['rewardToken']} in ephemeral cache"
-                        )
-                        # build erc20 helper
-                        erc20_helper = build_erc20_helper(
-                            chain=chain, address=reward_data["rewardToken"], cached=True
-                        )
-                        ephemeral_cache["tokens"][
-                            reward_data["rewardToken"].lower()
-                        ] = {
-                            "symbol": erc20_helper.symbol,
-                            "decimals": erc20_helper.decimals,
-                        }
-                    # receiver address ephemeral cache
-                    if (
-                        not hype_status.address.lower()
-                        in ephemeral_cache["receiver_address"]
-                    ):
-                        ephemeral_cache["receiver_address"][
-                            hype_status.address.lower()
-                        ] = hype_status.receiver.address.lower()
-
-                    reward_data["hypervisor_address"] = hype_status.address.lower()
-                    reward_data["rewardToken_symbol"] = ephemeral_cache["tokens"][
-                        reward_data["rewardToken"].lower()
-                    ]["symbol"]
-                    reward_data["rewardToken_decimals"] = ephemeral_cache["tokens"][
-                        reward_data["rewardToken"].lower()
-                    ]["decimals"]
-                    reward_data["total_hypervisorToken_qtty"] = str(
-                        hype_status.totalSupply
+            # add block creation data to cache
+            if (
+                not hype_rewards[0]["rewarder_address"]
+                in ephemeral_cache["creation_block"]
+            ):
+                if creation_data := _get_contract_creation_block(
+                    network=chain.database_name,
+                    contract_address=hype_rewards[0]["rewarder_address"],
+                ):
+                    ephemeral_cache["creation_block"][
+                        hype_rewards[0]["rewarder_address"]
+                    ] = creation_data["block"]
+                else:
+                    logging.getLogger(__name__).debug(
+                        f"  No contract creation date found for cleopatra reward static {hype_rewards[0]['rewarder_address']}. Using Hypervisor's {hype_static['address']} "
                     )
+                    ephemeral_cache["creation_block"][
+                        hype_rewards[0]["rewarder_address"]
+                    ] = hype_static["block"]
+            # set contract creation block
+            creation_block = ephemeral_cache["creation_block"][
+                hype_rewards[0]["rewarder_address"]
+            ]
 
-                    # HACK: set rewarder_registry as the 'receiver' -> MultiFeeDistribution contract address
-                    reward_data["rewarder_registry"] = ephemeral_cache[
-                        "receiver_address"
-                    ][hype_status.address.lower()]
-
-                    # add block creation data
-                    reward_data["block"] = creation_block
+            for reward_data in hype_rewards:
+                # token ephemeral cache
+                if not reward_data["rewardToken"].lower() in ephemeral_cache["tokens"]:
                     logging.getLogger(__name__).debug(
-                        f"  Processed cleopatra {chain.database_name}'s {reward_data['rewarder_address']} {reward_data['rewardToken_symbol']} static rewarder at {reward_data['block']}"
+                        f" adding token {reward_data['rewardToken']} in ephemeral cache"
                     )
-                    # add to result
-                    result.append(reward_data)
+                    # build erc20 helper
+                    erc20_helper = build_erc20_helper(
+                        chain=chain, address=reward_data["rewardToken"], cached=True
+                    )
+                    ephemeral_cache["tokens"][reward_data["rewardToken"].lower()] = {
+                        "symbol": erc20_helper.symbol,
+                        "decimals": erc20_helper.decimals,
+                    }
+                # receiver address ephemeral cache
+                if (
+                    not hype_status.address.lower()
+                    in ephemeral_cache["receiver_address"]
+                ):
+                    ephemeral_cache["receiver_address"][
+                        hype_status.address.lower()
+                    ] = hype_status.receiver.address.lower()
+
+                reward_data["hypervisor_address"] = hype_status.address.lower()
+                reward_data["rewardToken_symbol"] = ephemeral_cache["tokens"][
+                    reward_data["rewardToken"].lower()
+                ]["symbol"]
+                reward_data["rewardToken_decimals"] = ephemeral_cache["tokens"][
+                    reward_data["rewardToken"].lower()
+                ]["decimals"]
+                reward_data["total_hypervisorToken_qtty"] = str(hype_status.totalSupply)
+
+                # HACK: set rewarder_registry as the 'receiver' -> MultiFeeDistribution contract address
+                reward_data["rewarder_registry"] = ephemeral_cache["receiver_address"][
+                    hype_status.address.lower()
+                ]
+
+                # add block creation data
+                reward_data["block"] = creation_block
+                logging.getLogger(__name__).debug(
+                    f"  Processed cleopatra {chain.database_name}'s {reward_data['rewarder_address']} {reward_data['rewardToken_symbol']} static rewarder at {reward_data['block']}"
+                )
+                # add to result
+                result.append(reward_data)
     return result
 
 
@@ -2334,7 +2402,7 @@ def _get_static_hypervisor_addresses_to_process(
 
 
 def _get_static_hypervisors_to_process(
-    network: str, dex: str, rewrite: bool = False
+    network: str, dex: str, rewrite: bool = False, registry_state: dict | None = None
 ) -> list[dict]:
     """Get a list of hypervisors to process, using the database dict format so that:
           {"address":<hypervisor address>} is returned in case the hype does not exist in the db
@@ -2344,6 +2412,7 @@ def _get_static_hypervisors_to_process(
         network (str):
         dex (str):
         rewrite (bool, optional): Rewrite database content. Defaults to False.
+        registry_state (dict | None, optional): registry snapshot sync result. Defaults to None: sync it now.
 
     Returns:
         list[dict]: list of hypervisors to process
@@ -2374,6 +2443,7 @@ def _get_static_hypervisors_to_process(
         network=network,
         dex=dex,
         exclude_addresses=hypervisor_addresses_toExclude,
+        registry_state=registry_state,
     )
     # log disabled hypes
     if hypervisor_addresses_disabled:
@@ -2400,6 +2470,7 @@ def _get_filtered_hypervisor_addresses_from_registry(
     protocol: str = "gamma",
     block: int = 0,
     exclude_addresses: list = [],
+    registry_state: dict | None = None,
 ) -> tuple[list[str], list[str]]:
     """get filtered hypervisor addresses from registry
 
@@ -2409,6 +2480,7 @@ def _get_filtered_hypervisor_addresses_from_registry(
         protocol (str, optional): _description_. Defaults to "gamma".
         block (int, optional): _description_. Defaults to 0.
         exclude_addresses (list, optional): _description_. Defaults to [].
+        registry_state (dict | None, optional): registry snapshot sync result ( already synced ). Defaults to None: sync it now.
 
     Returns:
         tuple[list[str],list[str]]:  list of addresses to be processed, list of addresses disabled by contract
@@ -2431,26 +2503,93 @@ def _get_filtered_hypervisor_addresses_from_registry(
         filters: dict = (
             CONFIGURATION["script"]["protocols"].get(protocol, {}).get("filters", {})
         )
-        exclude_addresses += [
+        exclude_addresses = set(exclude_addresses) | {
             x.lower()
             for x in filters.get("hypervisors_not_included", {}).get(network, [])
-        ]
+        }
         logging.getLogger(__name__).debug(
             f"   excluding {len(exclude_addresses)} hypervisors: {exclude_addresses}"
         )
-        # apply filters
-        gamma_registry.apply_blacklist(blacklist=exclude_addresses)
 
-        # get hypes & return
-        return gamma_registry.get_hypervisors_addresses()
+        if registry_state is None:
+            # only read the registry indexes added since the last run
+            registry_state = get_hypervisor_registry_snapshot(
+                network=network, address=registry_address
+            ).sync(registry=gamma_registry)
+            for event in ("added", "removed"):
+                if registry_state[event]:
+                    logging.getLogger(__name__).info(
+                        f"   {len(registry_state[event])} {network} {dex} hypervisors {event} at registry level: {registry_state[event]}"
+                    )
+
+        # apply filters & return
+        return [
+            x
+            for x in registry_state["hypervisors"]
+            if x not in exclude_addresses and not gamma_registry.is_blacklisted(x)
+        ], registry_state["disabled"]
 
     except ValueError as e:
         logging.getLogger(__name__).error(
-            f" Error while fetching hypes from {gamma_registry._network} registry   .error: {e}"
+            f" Error while fetching hypes from {network} registry   .error: {e}"
         )
 
     # return an empty hype address list
-    return []
+    return [], []
+
+
+def sync_hypervisor_registries(
+    targets: list[tuple[str, str]], max_workers: int = 4
+) -> dict[tuple[str, str], dict]:
+    """Sync the hypervisor registry snapshots of multiple networks and dexes concurrently,
+        logging the hypervisors added and removed since the last sync
+
+    Args:
+        targets (list[tuple[str, str]]): ( network, dex ) pairs
+        max_workers (int, optional): . Defaults to 4.
+
+    Returns:
+        dict[tuple[str, str], dict]: { ( network, dex ): registry_snapshot.sync result }
+    """
+
+    def _sync(network: str, dex: str) -> dict:
+        registry_address = (
+            STATIC_REGISTRY_ADDRESSES.get(network, {})
+            .get("hypervisors", {})
+            .get(dex, None)
+        )
+        return get_hypervisor_registry_snapshot(
+            network=network, address=registry_address
+        ).sync(
+            registry=gamma_hypervisor_registry(
+                address=registry_address, network=network
+            )
+        )
+
+    result = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {
+            ex.submit(_sync, network, dex): (network, dex)
+            for network, dex in set(targets)
+            if STATIC_REGISTRY_ADDRESSES.get(network, {})
+            .get("hypervisors", {})
+            .get(dex, None)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            network, dex = futures[future]
+            try:
+                result[(network, dex)] = future.result()
+            except Exception as e:
+                logging.getLogger(__name__).error(
+                    f" Error while syncing {network} {dex} hypervisor registry. error: {e}"
+                )
+                continue
+            for event in ("added", "removed"):
+                if result[(network, dex)][event]:
+                    logging.getLogger(__name__).info(
+                        f"   {len(result[(network, dex)][event])} {network} {dex} hypervisors {event} at registry level: {result[(network, dex)][event]}"
+                    )
+    return result
 
 
 def _get_contract_creation_block(network: str, contract_address: str) -> dict:
@@ -2464,53 +2603,7 @@ def _get_contract_creation_block(network: str, contract_address: str) -> dict:
     Returns:
         dict: "block":
               "timestamp":
+              "creator": ( None when found on-chain )
+              "txHash": ( None when found on-chain )
     """
-    # create an etherescan helper
-    cg_helper = etherscan_helper(api_keys=CONFIGURATION["sources"]["api_keys"])
-
-    if contract_creation_data := cg_helper.get_contract_creation(
-        network=network, contract_addresses=[contract_address]
-    ):
-        for item in contract_creation_data:
-            try:
-                if (
-                    "contractAddress" in item
-                    and item["contractAddress"].lower() == contract_address.lower()
-                ):
-                    # this is the contract creation transaction
-
-                    # create dummy web3 object
-                    dummyw3 = (
-                        bep20(
-                            address="0x0000000000000000000000000000000000000000",
-                            network=network,
-                            block=0,
-                        )
-                        if network == "binance"
-                        else erc20(
-                            address="0x0000000000000000000000000000000000000000",
-                            network=network,
-                            block=0,
-                        )
-                    )
-                    # retrieve block data
-                    if creation_tx := dummyw3._getTransactionReceipt(
-                        txHash=item["txHash"]
-                    ):
-                        block_data = dummyw3._getBlockData(
-                            block=creation_tx.blockNumber
-                        )
-                        return {
-                            "block": block_data.number,
-                            "timestamp": block_data.timestamp,
-                        }
-                    else:
-                        logging.getLogger(__name__).error(
-                            f" Can't get the tx receipt for {item['txHash']}"
-                        )
-            except Exception as e:
-                logging.getLogger(__name__).error(
-                    f" Error while fetching contract creation data from etherscan. error: {e}"
-                )
-
-    return None
+    return get_contract_creation_index(network=network).get(address=contract_address)
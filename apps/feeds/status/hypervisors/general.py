@@ -155,6 +155,12 @@ def feed_hypervisor_status(
 
     # set log list of hypervisors with errors
     _errors = 0
+    # status are saved in bulk: items not saved are counted by the writer
+    status_writer = database_local(
+        mongo_url=CONFIGURATION["sources"]["database"]["mongo_server_url"],
+        db_name=f"{network}_gamma",
+    ).get_bulk_writer(collection_name="status")
+    _writer_errors_ini = status_writer.error_count
 
     with tqdm.tqdm(total=len(toProcess_block_address), leave=False) as progress_bar:
         if threaded:
@@ -165,7 +171,7 @@ def feed_hypervisor_status(
                     network,
                     item["block"],
                     static_info[item["address"]]["dex"],
-                    # False,
+                    True,
                 )
                 for item in toProcess_block_address.values()
             )
@@ -208,6 +214,7 @@ def feed_hypervisor_status(
                     network=network,
                     block=item["block"],
                     dex=static_info[item["address"]]["dex"],
+                    bulk=True,
                 ):
                     # error found
                     _errors += 1
@@ -220,6 +227,10 @@ def feed_hypervisor_status(
                 # update progress
                 progress_bar.update(1)
 
+    # save remaining queued status and add all items not saved during this run
+    status_writer.flush()
+    _errors += status_writer.error_count - _writer_errors_ini
+
     with contextlib.suppress(Exception):
         if _errors > 0:
             logging.getLogger(__name__).info(
@@ -234,7 +245,7 @@ def feed_hypervisor_status(
 
 
 def create_and_save_hypervisor_status(
-    address: str, network: str, block: int, dex: str
+    address: str, network: str, block: int, dex: str, bulk: bool = False
 ) -> bool:
     """create hyperivor status at the specified block and save it into the database
 
@@ -243,6 +254,7 @@ def create_and_save_hypervisor_status(
         network (Chain):
         block (int):
         dex (str):
+        bulk (bool, optional): queue it in the status bulk writer ( flush it when done ). Defaults to False.
 
     Returns:
         bool: saved or not
@@ -259,7 +271,9 @@ def create_and_save_hypervisor_status(
             address=address, network=network, block=block, dex=dex, cached=True
         ):
             # save hype
-            database_local(mongo_url=mongo_url, db_name=db_name).set_status(data=hype)
+            database_local(mongo_url=mongo_url, db_name=db_name).set_status(
+                data=hype, bulk=bulk
+            )
             # return success
             return True
     except Exception as e:
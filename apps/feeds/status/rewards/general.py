@@ -35,6 +35,9 @@ def feed_rewards_status(network: str | None = None, protocol: str = "gamma"):
     mongo_url = CONFIGURATION["sources"]["database"]["mongo_server_url"]
     db_name = f"{network}_{protocol}"
     local_db = database_local(mongo_url=mongo_url, db_name=db_name)
+    # rewards status are saved in bulk: items not saved are counted by the writer
+    rewards_writer = local_db.get_bulk_writer(collection_name="rewards_status")
+    _writer_errors_ini = rewards_writer.error_count
 
     # get a list of static rewarders linked to hypes
     to_be_processed_reward_static = local_db.get_items_from_database(
@@ -61,7 +64,7 @@ def feed_rewards_status(network: str | None = None, protocol: str = "gamma"):
 
                     if tmp > 0:
                         # add to database
-                        local_db.set_rewards_status(data=reward)
+                        local_db.set_rewards_status(data=reward, bulk=True)
                     else:
                         logging.getLogger(__name__).debug(
                             f" {network}'s {reward['rewarder_address']} {reward['block']} not saved due to 0 rewards per second"
@@ -75,6 +78,13 @@ def feed_rewards_status(network: str | None = None, protocol: str = "gamma"):
             )
             progress_bar.update(1)
 
+    # save remaining queued rewards status
+    rewards_writer.flush()
+    if errors := rewards_writer.error_count - _writer_errors_ini:
+        logging.getLogger(__name__).error(
+            f" {errors} {network}'s rewards status could not be saved to database. last error-> {rewards_writer.errors[-1]}"
+        )
+
 
 def feed_rewards_status_loop(
     network: str, rewarder_static: dict, rewrite: bool = False
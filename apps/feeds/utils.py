@@ -429,3 +429,114 @@ def group_by_hypervisors(db_data_list) -> list[dict]:
 
     # return
     return list(result.values())
+
+
+class hypervisor_periods_stream:
+    """Sorted by block hypervisor status items ( with operations, rewards_status and rewards_static )
+        for hypervisor period calculations, streamed from the database in bounded batches,
+        so that any hypervisor age can be processed without 16Mb aggregation limits nor holding all its history in memory.
+
+        Only the period blocks ( integers ) are loaded at once:  operation blocks and operation blocks - 1.
+
+    Usage:
+        stream = hypervisor_periods_stream(network=..., hypervisor_address=..., timestamp_ini=..., timestamp_end=...)
+        for status in stream:
+            ...
+        # resume later from the last processed item
+        hypervisor_periods_stream(..., resume_block=stream.resume_token)
+    """
+
+    def __init__(
+        self,
+        network: str,
+        hypervisor_address: str,
+        timestamp_ini: int | None = None,
+        timestamp_end: int | None = None,
+        block_ini: int | None = None,
+        block_end: int | None = None,
+        only_return_last_items: int | None = None,
+        resume_block: int | None = None,
+        batch_size: int = 200,
+    ):
+        """
+        Args:
+            network (str):
+            hypervisor_address (str):
+            timestamp_ini, timestamp_end, block_ini, block_end: period to process ( like get_hypervisors_data_for_apr )
+            only_return_last_items (int | None, optional): only the last items are returned. Defaults to None.
+            resume_block (int | None, optional): only items with block greater than this are returned. Defaults to None.
+            batch_size (int, optional): status items queried per batch. Defaults to 200.
+        """
+        if not timestamp_ini and not block_ini or not timestamp_end and not block_end:
+            raise ValueError("timestamps or blocks must be provided")
+
+        self.network = network
+        self.hypervisor_address = hypervisor_address
+        self.only_return_last_items = only_return_last_items
+        self.batch_size = batch_size
+        # last block returned
+        self.resume_token = resume_block
+
+        # period blocks
+        local_db = get_default_localdb(network=network)
+        operation_blocks = local_db.get_distinct_items_from_database(
+            collection_name="operations",
+            field="blockNumber",
+            condition=local_db.query_hypervisor_periods_match(
+                hypervisor_addresses=[hypervisor_address],
+                timestamp_ini=timestamp_ini,
+                timestamp_end=timestamp_end,
+                block_ini=block_ini,
+                block_end=block_end,
+            ),
+        )
+        self.blocks = sorted(
+            {x for block in operation_blocks for x in (block, block - 1)}
+        )
+        if resume_block:
+            self.blocks = [x for x in self.blocks if x > resume_block]
+
+    def __iter__(self):
+        if self.only_return_last_items:
+            items = self._last_items(qtty=self.only_return_last_items)
+        else:
+            items = self._items()
+
+        for item in items:
+            self.resume_token = item["block"]
+            yield item
+
+    def _items(self):
+        for idx in range(0, len(self.blocks), self.batch_size):
+            yield from self._get_batch(blocks=self.blocks[idx : idx + self.batch_size])
+
+    def _last_items(self, qtty: int) -> list[dict]:
+        # walk backwards till enough items are found
+        result = []
+        end = len(self.blocks)
+        while end > 0 and len(result) < qtty:
+            ini = max(0, end - self.batch_size)
+            result = self._get_batch(blocks=self.blocks[ini:end]) + result
+            end = ini
+        return result[-qtty:]
+
+    def _get_batch(self, blocks: list[int]) -> list[dict]:
+        if not blocks:
+            return []
+
+        result = []
+        for item in get_from_localdb(
+            network=self.network,
+            collection="status",
+            aggregate=get_default_localdb(
+                network=self.network
+            ).query_hypervisor_periods_status(
+                hypervisor_address=self.hypervisor_address, blocks=blocks
+            ),
+            batch_size=self.batch_size,
+        ):
+            # only one status per block
+            if result and result[-1]["block"] == item["block"]:
+                continue
+            result.append(item)
+        return result
@@ -1,7 +1,7 @@
 from datetime import datetime
 import logging
 from apps.feeds.operations import feed_operations_hypervisors
-from apps.feeds.utils import get_hypervisors_data_for_apr
+from apps.feeds.utils import hypervisor_periods_stream
 from bins.database.helpers import get_from_localdb
 from bins.errors.general import ProcessingError
 from bins.general.enums import Chain, Protocol, error_identity, text_to_protocol
@@ -137,152 +137,96 @@ class hypervisor_periods_base:
         # reset all variables
         self.reset()
 
-        # get data from database
-        if data_list := get_hypervisors_data_for_apr(
+        # stream sorted hypervisor status ( + operations, rewards... ) from database
+        stream = hypervisor_periods_stream(
             network=chain.database_name,
-            hypervisor_addresses=[hypervisor_address],
+            hypervisor_address=hypervisor_address,
             timestamp_ini=timestamp_ini or 1400000000 if not block_ini else None,
             timestamp_end=timestamp_end,
             block_ini=block_ini,
             block_end=block_end,
             only_return_last_items=only_use_last_items,
-        ):
-            # loop for each hypervisor data found { _id: <hypervisor_address> ,  {status: <hypervisor status data + operations + rewards...>}
-            for hype_data in data_list:
-                # check data consistency
-                if not "status" in hype_data:
-                    raise ValueError(f"Invalid hypervisor data: {hype_data}")
-
-                # check first item
-                self._hypervisor_periods_first_item_checks(
+        )
+        status_items = iter(stream)
+
+        if first_item := next(status_items, None):
+            # hypervisor data passed to hook functions:
+            #   status items are streamed, so only the first one is included, along with all the period blocks
+            hype_data = {
+                "_id": hypervisor_address,
+                "status": [first_item],
+                "blocks": stream.blocks,
+            }
+
+            # check first item
+            self._hypervisor_periods_first_item_checks(
+                chain=chain,
+                first_item=first_item,
+                timestamp_ini=timestamp_ini,
+                block_ini=block_ini,
+                try_solve_errors=try_solve_errors,
+                only_use_last_items=only_use_last_items,
+            )
+
+            ###### START #######
+            # define loop working vars
+            last_item = None
+            last_item_type = None
+
+            ##### EXECUTE PRE-LOOP FUNCTION
+            self._execute_preLoop(hypervisor_data=hype_data)
+
+            # log from date and blocks found for this hypervisor
+            try:
+                logging.getLogger(__name__).debug(
+                    f" data found for {chain.database_name} {first_item['address']} from {datetime.fromtimestamp(first_item['timestamp'])} [{first_item['timestamp']}] ->  {len(stream.blocks)} period blocks"
+                )
+            except Exception:
+                pass
+
+            # loop thu each hype status data ( hypervisor status found for that particular time period )
+            idx = 0
+            status_data = first_item
+            while status_data:
+                # look ahead to know when this is the last item
+                next_status_data = next(status_items, None)
+
+                # execute the loop work
+                if returned_type := self._loop_work(
                     chain=chain,
-                    first_item=hype_data["status"][0],
-                    timestamp_ini=timestamp_ini,
-                    block_ini=block_ini,
+                    idx=idx,
+                    hype_data=hype_data,
+                    hypervisor_address=hypervisor_address,
+                    current_item=status_data,
+                    last_item=last_item,
+                    last_item_type=last_item_type,
                     try_solve_errors=try_solve_errors,
-                    only_use_last_items=only_use_last_items,
-                )
-
-                ###### START #######
-                # define loop working vars
-                last_item = None
-                last_item_type = None
+                ):
+                    last_item_type = returned_type
 
-                ##### EXECUTE PRE-LOOP FUNCTION
-                self._execute_preLoop(hypervisor_data=hype_data)
+                # set last item
+                last_item = status_data
 
-                # log from to dates data found for this hypervisor
-                try:
-                    _i = datetime.fromtimestamp(hype_data["status"][0]["timestamp"])
-                    _e = datetime.fromtimestamp(hype_data["status"][-1]["timestamp"])
-                    logging.getLogger(__name__).debug(
-                        f" total data found for {chain.database_name} {hype_data['status'][0]['address']} from {_i} [{hype_data['status'][0]['timestamp']}] to {_e} [{hype_data['status'][-1]['timestamp']}]  ({(_e - _i).total_seconds()/(60*60*24):,.2f} days)"
-                    )
-                except Exception:
-                    pass
-                # loop thu each hype status data ( hypervisor status found for that particular time period )
-                for idx, status_data in enumerate(hype_data["status"]):
-                    # execute the loop work
-                    if returned_type := self._loop_work(
+                # if this is the last idx and last_item == ini, then we can decide wether to scrape a new item using the last block/timestamp defined or not
+                if next_status_data is None and last_item_type == "ini":
+                    self._process_last_ini_item(
                         chain=chain,
-                        idx=idx,
-                        hype_data=hype_data,
                         hypervisor_address=hypervisor_address,
-                        current_item=status_data,
+                        hype_data=hype_data,
+                        idx=idx,
+                        status_data=status_data,
                         last_item=last_item,
                         last_item_type=last_item_type,
+                        timestamp_end=timestamp_end,
+                        block_end=block_end,
                         try_solve_errors=try_solve_errors,
-                    ):
-                        last_item_type = returned_type
-
-                    # set last item
-                    last_item = status_data
-
-                    # if this is the last idx and last_item == ini, then we can decide wether to scrape a new item using the last block/timestamp defined or not
-                    if idx == len(hype_data["status"]) - 1 and last_item_type == "ini":
-                        # we rarely need to scrape a new item, because normal operations narrow choices to items at operation blocks or -1 blocks...
-                        # but if we scrape at current time periods and last known item is an initial value, then we need to scrape a new item,
-                        # and prices ( being current prices )
-                        if block_end and last_item["block"] < block_end:
-                            # scrape block_end
-                            if new_last_item := self._scrape_last_item(
-                                chain=chain,
-                                hypervisor_address=hypervisor_address,
-                                block=block_end,
-                                protocol=text_to_protocol(status_data["dex"]),
-                                hypervisor_status=status_data,
-                            ):
-                                logging.getLogger(__name__).debug(
-                                    f" {chain.database_name}'s {status_data['dex']} {hypervisor_address} creating the last item on-the-fly at block_end {block_end}"
-                                )
-                                # last loop work
-                                self._loop_work(
-                                    chain=chain,
-                                    idx=idx + 1,
-                                    hype_data=hype_data,
-                                    hypervisor_address=hypervisor_address,
-                                    current_item=new_last_item,
-                                    last_item=last_item,
-                                    last_item_type=last_item_type,
-                                    try_solve_errors=try_solve_errors,
-                                )
-                            else:
-                                # we should be creating a new item but the _scrape_last_item function did not return anything... probably bc its not implemented
-                                # may be a problem when len(hype_data["status"]) == 1
-                                if len(hype_data["status"]) == 1:
-                                    logging.getLogger(__name__).warning(
-                                        f" {chain.database_name}'s {status_data['dex']} {hypervisor_address} has only one item and _scrape_last_item did not return anything, so it has not enough data to calculate returns."
-                                    )
-
-                        elif timestamp_end and last_item["timestamp"] < timestamp_end:
-                            # convert timestamp_end to block_end and scrape block_end
-                            hypervisor = build_hypervisor(
-                                network=chain.database_name,
-                                protocol=text_to_protocol(status_data["dex"]),
-                                block=0,
-                                hypervisor_address=hypervisor_address,
-                                cached=True,
-                            )
-                            if block := hypervisor.blockNumberFromTimestamp(
-                                timestamp=timestamp_end
-                            ):
-                                # scrape block_end
-                                if new_last_item := self._scrape_last_item(
-                                    chain=chain,
-                                    hypervisor_address=hypervisor_address,
-                                    block=block,
-                                    protocol=text_to_protocol(status_data["dex"]),
-                                    hypervisor_status=status_data,
-                                ):
-                                    logging.getLogger(__name__).debug(
-                                        f" {chain.database_name}'s {status_data['dex']} {hypervisor_address} creating the last item on-the-fly at block_end {block}"
-                                    )
-                                    # last loop work
-                                    self._loop_work(
-                                        chain=chain,
-                                        idx=idx + 1,
-                                        hype_data=hype_data,
-                                        hypervisor_address=hypervisor_address,
-                                        current_item=new_last_item,
-                                        last_item=last_item,
-                                        last_item_type=last_item_type,
-                                        try_solve_errors=try_solve_errors,
-                                    )
-                                else:
-                                    #
-                                    if len(hype_data["status"]) == 1:
-                                        logging.getLogger(__name__).warning(
-                                            f" {chain.database_name}'s {status_data['dex']} {hypervisor_address} has only one item and _scrape_last_item did not return anything, so it has not enough data to calculate returns."
-                                        )
-
-                        else:
-                            #   no need to scrape because last_item is the last item of the defined period, that happen to be a initial value
-                            logging.getLogger(__name__).debug(
-                                f" {chain.database_name} {status_data['address']} last index {idx} is an initial value, but also the last period value."
-                            )
-
-                ##### EXECUTE OUT-LOOP FUNCTION
-                self._execute_postLoop(hypervisor_data=hype_data)
+                    )
+
+                status_data = next_status_data
+                idx += 1
+
+            ##### EXECUTE OUT-LOOP FUNCTION
+            self._execute_postLoop(hypervisor_data=hype_data)
 
         else:
             logging.getLogger(__name__).error(
@@ -291,6 +235,77 @@ class hypervisor_periods_base:
 
         return self.result
 
+    def _process_last_ini_item(
+        self,
+        chain: Chain,
+        hypervisor_address: str,
+        hype_data: dict,
+        idx: int,
+        status_data: dict,
+        last_item: dict,
+        last_item_type: str,
+        timestamp_end: int | None,
+        block_end: int | None,
+        try_solve_errors: bool,
+    ):
+        """The last item available is an initial value:  scrape a new last item, when the defined period ends after it
+
+        Args:
+            idx (int): last item index
+        """
+        # we rarely need to scrape a new item, because normal operations narrow choices to items at operation blocks or -1 blocks...
+        # but if we scrape at current time periods and last known item is an initial value, then we need to scrape a new item,
+        # and prices ( being current prices )
+        block = None
+        if block_end and last_item["block"] < block_end:
+            block = block_end
+        elif timestamp_end and last_item["timestamp"] < timestamp_end:
+            # convert timestamp_end to block_end
+            hypervisor = build_hypervisor(
+                network=chain.database_name,
+                protocol=text_to_protocol(status_data["dex"]),
+                block=0,
+                hypervisor_address=hypervisor_address,
+                cached=True,
+            )
+            block = hypervisor.blockNumberFromTimestamp(timestamp=timestamp_end)
+            if not block:
+                return
+        else:
+            #   no need to scrape because last_item is the last item of the defined period, that happen to be a initial value
+            logging.getLogger(__name__).debug(
+                f" {chain.database_name} {status_data['address']} last index {idx} is an initial value, but also the last period value."
+            )
+            return
+
+        # scrape block_end
+        if new_last_item := self._scrape_last_item(
+            chain=chain,
+            hypervisor_address=hypervisor_address,
+            block=block,
+            protocol=text_to_protocol(status_data["dex"]),
+            hypervisor_status=status_data,
+        ):
+            logging.getLogger(__name__).debug(
+                f" {chain.database_name}'s {status_data['dex']} {hypervisor_address} creating the last item on-the-fly at block_end {block}"
+            )
+            # last loop work
+            self._loop_work(
+                chain=chain,
+                idx=idx + 1,
+                hype_data=hype_data,
+                hypervisor_address=hypervisor_address,
+                current_item=new_last_item,
+                last_item=last_item,
+                last_item_type=last_item_type,
+                try_solve_errors=try_solve_errors,
+            )
+        elif idx == 0:
+            # we should be creating a new item but the _scrape_last_item function did not return anything... probably bc its not implemented
+            logging.getLogger(__name__).warning(
+                f" {chain.database_name}'s {status_data['dex']} {hypervisor_address} has only one item and _scrape_last_item did not return anything, so it has not enough data to calculate returns."
+            )
+
     def _loop_work(
         self,
         chain: Chain,
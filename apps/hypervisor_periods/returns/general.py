@@ -49,9 +49,9 @@ class hypervisor_periods_returns(hypervisor_periods_base):
             hypervisor_data["status"][0]["pool"]["token0"]["address"],
             hypervisor_data["status"][0]["pool"]["token1"]["address"],
         ]
-        # get the max and min blocks from the ordered hype status list
-        min_block = min([x["block"] for x in hypervisor_data["status"]])
-        max_block = max([x["block"] for x in hypervisor_data["status"]])
+        # get the max and min blocks from the ordered period blocks
+        min_block = hypervisor_data["blocks"][0]
+        max_block = hypervisor_data["blocks"][-1]
         # get prices
         self.token_prices = {
             f"{x['address']}_{x['block']}": x["price"]
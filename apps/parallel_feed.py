@@ -1,7 +1,7 @@
 import logging
 import time
 import threading
-from multiprocessing import Pool
+from multiprocessing import Pool, Queue
 from apps.feeds.queue.pulls.common import pull_from_queue
 from apps.feeds.queue.queue_item import (
     create_selector_per_network,
@@ -10,6 +10,12 @@ from apps.feeds.queue.queue_item import (
 
 from bins.configuration import CONFIGURATION
 from bins.general.enums import queueItemType
+from bins.performance.metrics import (
+    init_worker_metrics,
+    start_metrics_collector,
+    start_metrics_server,
+    start_queue_depth_updater,
+)
 
 
 PARALEL_TASKS = []
@@ -50,7 +56,33 @@ def process_queues(
         )
         item_selector_per_network = create_selector_per_network()
 
-    with Pool() as p:
+    # live queue telemetry
+    pool_kwargs = {}
+    if (metrics_config := CONFIGURATION["script"].get("queue_metrics", {})) and (
+        metrics_config.get("enabled", False)
+    ):
+        events_queue = Queue(maxsize=10000)
+        pool_kwargs = {"initializer": init_worker_metrics, "initargs": (events_queue,)}
+        start_metrics_collector(
+            events_queue=events_queue, jsonl_path=metrics_config.get("jsonl_path")
+        )
+        start_queue_depth_updater(
+            networks=list(
+                {
+                    network
+                    for protocol in CONFIGURATION["script"]["protocols"]
+                    for network in (
+                        CONFIGURATION["_custom_"]["cml_parameters"].networks
+                        or CONFIGURATION["script"]["protocols"][protocol]["networks"]
+                    )
+                }
+            ),
+            interval=metrics_config.get("queue_depth_interval", 60),
+        )
+        if port := metrics_config.get("port"):
+            start_metrics_server(port=port, host=metrics_config.get("host", "127.0.0.1"))
+
+    with Pool(**pool_kwargs) as p:
         while True:
             for protocol in CONFIGURATION["script"]["protocols"]:
                 # override networks if specified in cml
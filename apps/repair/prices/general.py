@@ -1,6 +1,6 @@
 from apps.repair.prices.database import repair_prices_from_database
 from apps.repair.prices.logs import repair_prices_from_logs
-from apps.repair.prices.status import repair_prices_from_status
+from apps.repair.prices.status import repair_prices_from_price_coverage
 from bins.configuration import CONFIGURATION
 
 
@@ -8,7 +8,8 @@ from bins.configuration import CONFIGURATION
 def repair_prices(min_count: int = 1):
     repair_prices_from_logs(min_count=min_count, add_to_queue=True)
 
-    repair_prices_from_status(
+    # hypervisor status token blocks without price ( reward tokens are repaired from database )
+    repair_prices_from_price_coverage(
         max_repair_per_network=CONFIGURATION["_custom_"]["cml_parameters"].maximum
         or 500
     )
@@ -1,6 +1,7 @@
 import logging
 
 import tqdm
+from apps.feeds.queue.push import build_and_save_queue_from_price_coverage
 from apps.feeds.queue.queue_item import QueueItem
 
 from bins.configuration import CONFIGURATION, TOKEN_ADDRESS_EXCLUDE
@@ -188,6 +189,35 @@ def repair_prices_from_status(
                 progress_bar.update(1)
 
 
+def repair_prices_from_price_coverage(max_repair_per_network: int | None = None):
+    """Add the hypervisor status token blocks without price found by each network price coverage index to the QUEUE
+        ( the index is rebuilt from database when expired )
+    """
+    logging.getLogger(__name__).info(
+        f">Queue hypervisor status token blocks without price using the price coverage index"
+    )
+    # override networks if specified in cml
+    networks = CONFIGURATION["_custom_"]["cml_parameters"].networks or list(
+        {
+            network
+            for protocol in CONFIGURATION["script"]["protocols"]
+            for network in CONFIGURATION["script"]["protocols"][protocol]["networks"]
+        }
+    )
+    for network in networks:
+        try:
+            queued = build_and_save_queue_from_price_coverage(
+                network=network, limit=max_repair_per_network
+            )
+            logging.getLogger(__name__).info(
+                f" {queued} {network} token blocks without price added to the queue"
+            )
+        except Exception as e:
+            logging.getLogger(__name__).exception(
+                f" error in {network} while queueing prices from the price coverage index  {e} "
+            )
+
+
 def shouldBe_price_ids_from_status_rewards(
     network: str, batch_size: int = 100000
 ) -> set[str]:
@@ -1,4 +1,8 @@
+import bisect
 import json
+import os
+import threading
+import time
 from pycoingecko import CoinGeckoAPI
 from pycoingecko.utils import func_args_preprocessing
 import datetime as dt
@@ -6,9 +10,16 @@ import logging
 
 import requests
 from bins.cache.cache_utilities import CACHE_LOCK, file_backend
+from bins.general import net_utilities
 
 from bins.configuration import CONFIGURATION
 
+try:
+    import fcntl
+except ImportError:
+    # no file locks available: range files are not shared between processes
+    fcntl = None
+
 
 class coingecko_cache(file_backend):
     def _init_cache(self):
@@ -63,6 +74,268 @@ class coingecko_cache(file_backend):
         return None
 
 
+class coingecko_range_cache:
+    """Historic price time series per network and token, built from the market_chart/range downloads.
+    Overlapping ranges are merged, so one download serves any timestamp within it.
+
+    Each network and token has its own append-only file ( <folder>/<network>_<token address>.jsonl )
+    with one line per download, so saving a download only appends it:
+        {"ranges": [[from timestamp, to timestamp], ...], "points": [[timestamp, price], ...]}
+    Lines appended by other processes are read when a timestamp is not covered.
+    Files are compacted to one line once they grow over compact_lines. Their first line
+    {"generation": <random id>} changes when compacted, so readers know to read them again.
+    """
+
+    # lines per file before it is compacted
+    compact_lines = 50
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self._lock = threading.Lock()
+        # { key: {"ranges": [[ini, end], ...], "timestamps": [...], "prices": [...],
+        #         "generation": str, "offset": int, "lines": int} }  sorted in memory
+        self._items = {}
+
+    def add_data(
+        self,
+        network: str,
+        contract_address: str,
+        from_timestamp: int,
+        to_timestamp: int,
+        prices: list,
+    ) -> bool:
+        """Add a downloaded price range
+
+        Args:
+            network (str):
+            contract_address (str):
+            from_timestamp (int): range start ( seconds )
+            to_timestamp (int): range end ( seconds )
+            prices (list): coingecko's [[timestamp in ms, price], ...]
+
+        Returns:
+            bool: saved to file
+        """
+        line = {
+            "ranges": [[int(from_timestamp), int(to_timestamp)]],
+            "points": [[int(x[0] / 1000), x[1]] for x in prices if x and len(x) == 2],
+        }
+        key = self._build_key(network=network, contract_address=contract_address)
+        with self._lock:
+            try:
+                self._sync(key=key, line=line)
+                return True
+            except OSError as e:
+                logging.getLogger(__name__).error(
+                    f" Could not save coingecko's {key} price range. error: {e}"
+                )
+                # keep it in memory anyway
+                self._merge(item=self._item(key), lines=[line])
+                return False
+
+    def get_data(
+        self, network: str, contract_address: str, timestamp: int, tolerance: int
+    ) -> float | None:
+        """Price of the nearest point within tolerance
+
+        Args:
+            network (str):
+            contract_address (str):
+            timestamp (int): seconds
+            tolerance (int): maximum seconds between timestamp and the nearest price point
+
+        Returns:
+            float | None: None when there is no price point within tolerance ( see covers )
+        """
+        key = self._build_key(network=network, contract_address=contract_address)
+        with self._lock:
+            item = self._covering_item(key=key, timestamp=timestamp)
+            if item is None:
+                return None
+
+            # nearest point
+            timestamps = item["timestamps"]
+            idx = bisect.bisect_left(timestamps, timestamp)
+            nearest = [
+                i
+                for i in (idx - 1, idx)
+                if 0 <= i < len(timestamps)
+                and abs(timestamps[i] - timestamp) <= tolerance
+            ]
+            if not nearest:
+                return None
+            return item["prices"][
+                min(nearest, key=lambda i: abs(timestamps[i] - timestamp))
+            ]
+
+    def covers(self, network: str, contract_address: str, timestamp: int) -> bool:
+        """Whether a downloaded range covers the timestamp ( so there is nothing new to download )"""
+        key = self._build_key(network=network, contract_address=contract_address)
+        with self._lock:
+            return self._covering_item(key=key, timestamp=timestamp) is not None
+
+    def _covering_item(self, key: str, timestamp: int) -> dict | None:
+        """Item covering the timestamp, reading what other processes saved when not covered in memory"""
+        item = self._item(key)
+        if not self._covered(item=item, timestamp=timestamp):
+            try:
+                self._sync(key=key)
+            except OSError as e:
+                logging.getLogger(__name__).error(
+                    f" Could not load coingecko's {key} price ranges. error: {e}"
+                )
+            if not self._covered(item=item, timestamp=timestamp):
+                return None
+        return item
+
+    @staticmethod
+    def _covered(item: dict, timestamp: int) -> bool:
+        idx = bisect.bisect_right(item["ranges"], [timestamp, float("inf")]) - 1
+        return idx >= 0 and item["ranges"][idx][1] >= timestamp
+
+    def _item(self, key: str) -> dict:
+        if key not in self._items:
+            self._items[key] = self._item_template()
+        return self._items[key]
+
+    def _sync(self, key: str, line: dict | None = None):
+        """Read the lines added to the key file since last read and append a new one ( holding the file lock )"""
+        path = os.path.join(self.folder, f"{key}.jsonl")
+        if line is None and not os.path.exists(path):
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        item = self._item(key)
+
+        while True:
+            f = open(path, "a+b")
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            # the file may have been compacted ( replaced ) while waiting for the lock
+            if (
+                os.path.exists(path)
+                and os.fstat(f.fileno()).st_ino == os.stat(path).st_ino
+            ):
+                break
+            f.close()
+
+        # closing the file releases the lock
+        with f:
+            f.seek(0)
+            if not (header := f.readline()).endswith(b"\n"):
+                # new file
+                header = self._generation_line()
+                f.truncate(0)
+                f.write(header)
+            generation = json.loads(header)["generation"]
+            if item["generation"] != generation:
+                # new or compacted file: read it all again
+                item.update(self._item_template())
+                item.update({"generation": generation, "offset": len(header)})
+            f.seek(item["offset"])
+            lines = []
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    # partially written line
+                    break
+                lines.append(json.loads(raw))
+                item["offset"] += len(raw)
+            if line:
+                f.seek(0, os.SEEK_END)
+                raw = (json.dumps(line) + "\n").encode()
+                f.write(raw)
+                f.flush()
+                item["offset"] += len(raw)
+                lines.append(line)
+            item["lines"] += len(lines)
+            self._merge(item=item, lines=lines)
+
+            if line and item["lines"] > self.compact_lines:
+                self._compact(path=path, item=item)
+
+    def _compact(self, path: str, item: dict):
+        """Replace the file with one line holding the merged ranges and points ( call it holding the file lock )"""
+        header = self._generation_line()
+        raw = (
+            json.dumps(
+                {
+                    "ranges": item["ranges"],
+                    "points": [
+                        list(x) for x in zip(item["timestamps"], item["prices"])
+                    ],
+                }
+            )
+            + "\n"
+        ).encode()
+        temp_path = f"{path}_{os.getpid()}_{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(header + raw)
+        os.replace(temp_path, path)
+        item.update(
+            {
+                "generation": json.loads(header)["generation"],
+                "offset": len(header) + len(raw),
+                "lines": 1,
+            }
+        )
+
+    @staticmethod
+    def _generation_line() -> bytes:
+        return (json.dumps({"generation": os.urandom(8).hex()}) + "\n").encode()
+
+    @staticmethod
+    def _item_template() -> dict:
+        return {
+            "ranges": [],
+            "timestamps": [],
+            "prices": [],
+            "generation": None,
+            "offset": 0,
+            "lines": 0,
+        }
+
+    @staticmethod
+    def _merge(item: dict, lines: list[dict]):
+        if not lines:
+            return
+
+        # merge ranges
+        merged_ranges = []
+        for ini, end in sorted(
+            item["ranges"] + [x for line in lines for x in line["ranges"]]
+        ):
+            if merged_ranges and ini <= merged_ranges[-1][1]:
+                merged_ranges[-1][1] = max(merged_ranges[-1][1], end)
+            else:
+                merged_ranges.append([ini, end])
+        item["ranges"] = merged_ranges
+
+        # merge points ( keeping the timestamps sorted index )
+        if points := [x for line in lines for x in line["points"]]:
+            merged = dict(zip(item["timestamps"], item["prices"]))
+            merged.update((x[0], x[1]) for x in points)
+            item["timestamps"] = sorted(merged)
+            item["prices"] = [merged[x] for x in item["timestamps"]]
+
+    def _build_key(self, network: str, contract_address: str) -> str:
+        return f"{network}_{contract_address.lower()}"
+
+
+# singleton ( loaded on first use )
+COINGECKO_RANGE_CACHE: coingecko_range_cache | None = None
+
+
+def get_coingecko_range_cache() -> coingecko_range_cache:
+    global COINGECKO_RANGE_CACHE
+    if COINGECKO_RANGE_CACHE is None:
+        COINGECKO_RANGE_CACHE = coingecko_range_cache(
+            folder=os.path.join(
+                CONFIGURATION.get("cache", {}).get("save_path", None) or "data/cache",
+                "coingecko_range",
+            )
+        )
+    return COINGECKO_RANGE_CACHE
+
+
 class coingecko_apiMod(CoinGeckoAPI):
     def __init__(self, api_key: str = "", retries=5):
         # init custom persistent cache
@@ -70,11 +343,18 @@ class coingecko_apiMod(CoinGeckoAPI):
         # init parent
         super().__init__(api_key, retries)
 
-    def __request(self, url):
+    def _request(self, url):
+        """Get the url content ( all api calls go thru here, parent class calls included )"""
+        # coingecko limits are shared by all workers using the same key
+        rate_limiter = net_utilities.get_rate_limiter(
+            api="coingecko", rate=0.5, capacity=5, key=self.api_key or ""
+        )
+        rate_limiter.acquire()
         try:
             response = self.session.get(url, timeout=self.request_timeout)
         except requests.exceptions.RequestException:
             raise
+        rate_limiter.update_from_response(response=response, default_backoff=60)
 
         try:
             response.raise_for_status()
@@ -91,7 +371,10 @@ class coingecko_apiMod(CoinGeckoAPI):
 
             raise
 
-    def __api_url_params(self, api_url, params, api_url_has_params=False):
+    # parent class methods call its name mangled __request: route them to _request
+    _CoinGeckoAPI__request = _request
+
+    def _api_url_params(self, api_url, params, api_url_has_params=False):
         # if using pro version of CoinGecko, inject key in every call
         if self.api_key:
             params["x_cg_pro_api_key"] = self.api_key
@@ -124,7 +407,7 @@ class coingecko_apiMod(CoinGeckoAPI):
             from_timestamp,
             to_timestamp,
         )
-        api_url = self.__api_url_params(api_url_base, kwargs, api_url_has_params=True)
+        api_url = self._api_url_params(api_url_base, kwargs, api_url_has_params=True)
 
         # search in cache
         response = self.cache.get_data(api_url_base)
@@ -132,7 +415,7 @@ class coingecko_apiMod(CoinGeckoAPI):
         if response == None:
             # get from coingecko
             try:
-                response = self.__request(api_url)
+                response = self._request(api_url)
 
             except requests.HTTPError as e:
                 for err in e.args:
@@ -337,6 +620,28 @@ class coingecko_price_helper:
                 # timestamp has a non accepted by coingeko format "3333333.0"
                 timestamp = int(timestamp.split(".")[0])
 
+        # search the downloaded time series first
+        tolerance = CONFIGURATION.get("sources", {}).get(
+            "coingecko_price_tolerance", 3600
+        )
+        if (
+            price := get_coingecko_range_cache().get_data(
+                network=network,
+                contract_address=contract_address,
+                timestamp=int(timestamp),
+                tolerance=tolerance,
+            )
+        ) is not None:
+            return price
+        if get_coingecko_range_cache().covers(
+            network=network, contract_address=contract_address, timestamp=int(timestamp)
+        ):
+            # already downloaded: there is no price close enough
+            logging.getLogger(__name__).debug(
+                f" Price not found for contract {contract_address} at {network}  for timestamp {timestamp}"
+            )
+            return 0
+
         # get price from coingecko
         cg = coingecko_apiMod(
             api_key=CONFIGURATION.get("sources", {}).get("coingeko_api_key", ""),
@@ -394,6 +699,23 @@ class coingecko_price_helper:
 
             _data = {"prices": [[]], "error": "dontknow"}
 
+        # keep the whole time series downloaded
+        if _data and "error" not in _data and isinstance(_data.get("prices"), list):
+            get_coingecko_range_cache().add_data(
+                network=network,
+                contract_address=contract_address,
+                from_timestamp=timestamp,
+                to_timestamp=min(to_timestamp, int(time.time())),
+                prices=_data["prices"],
+            )
+            if price := get_coingecko_range_cache().get_data(
+                network=network,
+                contract_address=contract_address,
+                timestamp=int(timestamp),
+                tolerance=tolerance,
+            ):
+                return price
+
         # check if result has actually a price in it
         try:
             if _data["prices"][0]:
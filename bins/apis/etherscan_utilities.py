@@ -1,4 +1,12 @@
+import concurrent.futures
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
+
+from ..configuration import CONFIGURATION
 from ..general import net_utilities
 
 
@@ -38,31 +46,66 @@ class etherscan_helper:
         "blastscan": "blast",
     }
 
-    def __init__(self, api_keys: dict):
+    # seconds the responses of each action are kept in the disk cache ( None: never expire, not listed: not cached )
+    _cache_ttl = {
+        "getabi": None,
+        "getcontractcreation": None,
+        "getblocknobytime": None,
+        "tokensupply": 60,
+        "tokentx": 600,
+        "txlist": 600,
+    }
+    # requests per second of each api key ( and network ) and without api key
+    _rate = 5
+    _rate_no_key = 0.2
+    # contract addresses per getcontractcreation request
+    _creation_addresses_per_call = 5
+
+    def __init__(
+        self, api_keys: dict, cache: bool = True, cache_folder: str | None = None
+    ):
         """Etherscan minimal API wrapper
         Args:
-           api_keys (dict): {<network>:<APIKEY>} or {"etherscan":<key> , "polygonscan":key...}
+           api_keys (dict): {<network>:<APIKEY>} or {"etherscan":<key> , "polygonscan":key...}. A list of keys is rotated on each request
+           cache (bool, optional): use the disk cache. Defaults to True.
+           cache_folder (str | None, optional): disk cache folder. Defaults to <cache save_path>/etherscan.
         """
 
         self._api_keys = self.__setup_apiKeys(api_keys)
 
-        self.__RATE_LIMIT = net_utilities.rate_limit(rate_max_sec=5)  #  rate limiter
+        self._cache = (
+            etherscan_cache(
+                folder=cache_folder
+                or os.path.join(
+                    CONFIGURATION.get("cache", {}).get("save_path", None)
+                    or "data/cache",
+                    "etherscan",
+                )
+            )
+            if cache
+            else None
+        )
 
         # api network keys must be present in any case
         for k in self._urls.keys():
             if k not in self._api_keys.keys():
-                self._api_keys[k] = ""
+                self._api_keys[k] = []
 
     # SETUP
     def __setup_apiKeys(self, apiKeys: dict):
-        """arrange api keys in an easier way to handle
+        """arrange api keys in an easier way to handle: { network: [keys] }
         Args:
            tokens (_type_): as stated in config.yaml file
         """
         result = {}
         for k, v in apiKeys.items():
             if k.lower() in self._key_network_matches.keys():
-                result[self._key_network_matches[k.lower()]] = v
+                network = self._key_network_matches[k.lower()]
+                keys = result.setdefault(network, [])
+                # one key or a list of keys
+                for key in [v] if isinstance(v, str) else v or []:
+                    if key and key not in keys:
+                        keys.append(key)
 
         return result
 
@@ -71,82 +114,28 @@ class etherscan_helper:
         if self._check_network_available(network=network) is False:
             return None
 
-        url = "{}/api?{}&apiKey={}".format(
-            self._urls[network.lower()],
-            self.build_url_arguments(
-                module="stats", action="tokensupply", contractaddress=contract_address
-            ),
-            self._api_keys[network.lower()],
+        return self._request_int(
+            network=network,
+            module="stats",
+            action="tokensupply",
+            contractaddress=contract_address,
         )
 
-        return self._request_data(url)
-
     def get_contract_transactions(self, network: str, contract_address: str) -> list:
         if self._check_network_available(network=network) is False:
             return []
-        result = []
-        page = 1  # define pagination var
-        offset = 10000  # items to be presented with on each query
-
-        # loop till no more results are retrieved
-        while True:
-            try:
-                url = "{}/api?{}&apiKey={}".format(
-                    self._urls[network.lower()],
-                    self.build_url_arguments(
-                        module="account",
-                        action="tokentx",
-                        contractaddress=contract_address,
-                        startblock=0,
-                        endblock=99999999,
-                        page=page,
-                        offset=offset,
-                        sort="asc",
-                    ),
-                    self._api_keys[network.lower()],
-                )
-
-                # rate control
-                self.__RATE_LIMIT.continue_when_safe()
-
-                # get data
-                _data = net_utilities.get_request(
-                    url
-                )  #  {"status":"1","message":"OK-Missing/Invalid API Key, rate limit of 1/5sec applied","result":....}
-
-                if _data["status"] == "1":
-                    # query when thru ok
-                    if _data["result"]:
-                        # Add data to result
-                        result += _data["result"]
-
-                        if len(_data["result"]) < offset:
-                            # there is no more data to be scraped
-                            break
-                        else:
-                            # add pagination var
-                            page += 1
-                    else:
-                        # no data
-                        break
-                else:
-                    logging.getLogger(__name__).debug(
-                        " {} for {} in {}  . error message: {}".format(
-                            _data["message"], contract_address, network
-                        )
-                    )
-                    break
-
-            except Exception:
-                # do not continue
-                logging.getLogger(__name__).error(
-                    f' Unexpected error while querying url {url}    . error message: {_data["message"]}'
-                )
 
-                break
-
-        # return result
-        return result
+        return self._request_all_pages(
+            network=network,
+            offset=10000,
+            reference=contract_address,
+            module="account",
+            action="tokentx",
+            contractaddress=contract_address,
+            startblock=0,
+            endblock=99999999,
+            sort="asc",
+        )
 
     def get_wallet_normal_transactions(self, network: str, wallet_address: str) -> list:
         """
@@ -160,69 +149,18 @@ class etherscan_helper:
         """
         if self._check_network_available(network=network) is False:
             return []
-        result = []
-        page = 1  # define pagination var
-        offset = 10000  # items to be presented with on each query
-
-        # loop till no more results are retrieved
-        while True:
-            try:
-                url = "{}/api?{}&apiKey={}".format(
-                    self._urls[network.lower()],
-                    self.build_url_arguments(
-                        module="account",
-                        action="txlist",
-                        contractaddress=wallet_address,
-                        startblock=0,
-                        endblock=99999999,
-                        page=page,
-                        offset=offset,
-                        sort="asc",
-                    ),
-                    self._api_keys[network.lower()],
-                )
-
-                # rate control
-                self.__RATE_LIMIT.continue_when_safe()
-
-                # get data
-                _data = net_utilities.get_request(
-                    url
-                )  #  {"status":"1","message":"OK-Missing/Invalid API Key, rate limit of 1/5sec applied","result":....}
-
-                if _data["status"] == "1":
-                    # query when thru ok
-                    if _data["result"]:
-                        # Add data to result
-                        result += _data["result"]
-
-                        if len(_data["result"]) < offset:
-                            # there is no more data to be scraped
-                            break
-                        else:
-                            # add pagination var
-                            page += 1
-                    else:
-                        # no data
-                        break
-                else:
-                    logging.getLogger(__name__).debug(
-                        " {} for {} in {}  . error message: {}".format(
-                            _data["message"], wallet_address, network
-                        )
-                    )
-                    break
-
-            except Exception:
-                # do not continue
-                logging.getLogger(__name__).error(
-                    f' Unexpected error while querying url {url}    . error message: {_data["message"]}'
-                )
-
-                break
 
-        # return result
-        return result
+        return self._request_all_pages(
+            network=network,
+            offset=10000,
+            reference=wallet_address,
+            module="account",
+            action="txlist",
+            contractaddress=wallet_address,
+            startblock=0,
+            endblock=99999999,
+            sort="asc",
+        )
 
     def get_wallet_erc20_transactions(
         self,
@@ -256,91 +194,36 @@ class etherscan_helper:
         if self._check_network_available(network=network) is False:
             return []
 
-        result = []
-        page = 1  # define pagination var
-        offset = 5000  # items to be presented with on each query
-
-        # loop till no more results are retrieved
-        while True:
-            try:
-                url = "{}/api?{}&apiKey={}".format(
-                    self._urls[network.lower()],
-                    self.build_url_arguments(
-                        module="account",
-                        action="tokentx",
-                        address=wallet_address,
-                        startblock=startblock,
-                        endblock=endblock,
-                        page=page,
-                        offset=offset,
-                        sort="asc",
-                    ),
-                    self._api_keys[network.lower()],
-                )
-
-                # rate control
-                self.__RATE_LIMIT.continue_when_safe()
-
-                # get data
-                _data = net_utilities.get_request(
-                    url
-                )  #  {"status":"1","message":"OK-Missing/Invalid API Key, rate limit of 1/5sec applied","result":....}
-
-                if _data["status"] == "1":
-                    # query when thru ok
-                    if _data["result"]:
-                        # Add data to result
-                        result += _data["result"]
-
-                        if len(_data["result"]) < offset:
-                            # there is no more data to be scraped
-                            break
-                        else:
-                            # add pagination var
-                            page += 1
-                    else:
-                        # no data
-                        break
-                else:
-                    logging.getLogger(__name__).debug(
-                        " {} for {} in {}  . error message: {}".format(
-                            _data["message"], wallet_address, network
-                        )
-                    )
-                    break
-
-            except Exception:
-                # do not continue
-                logging.getLogger(__name__).error(
-                    f' Unexpected error while querying url {url}    . error message: {_data["message"]}'
-                )
-
-                break
-
-        # return result
-        return result
+        return self._request_all_pages(
+            network=network,
+            offset=5000,
+            reference=wallet_address,
+            module="account",
+            action="tokentx",
+            address=wallet_address,
+            startblock=startblock,
+            endblock=endblock,
+            sort="asc",
+        )
 
     def get_block_by_timestamp(self, network: str, timestamp: int) -> int | None:
         if self._check_network_available(network=network) is False:
             return None
 
-        url = "{}/api?{}&apiKey={}".format(
-            self._urls[network.lower()],
-            self.build_url_arguments(
-                module="block",
-                action="getblocknobytime",
-                closest="before",
-                timestamp=timestamp,
-            ),
-            self._api_keys[network.lower()],
+        return self._request_int(
+            network=network,
+            # the closest block to a recent timestamp may still change
+            cache=timestamp < time.time() - 3600,
+            module="block",
+            action="getblocknobytime",
+            closest="before",
+            timestamp=timestamp,
         )
 
-        return self._request_data(url)
-
     def get_contract_creation(
         self, network: str, contract_addresses: list[str]
     ) -> list:
-        """_summary_
+        """Contract creation of each address: cached per address, and requested in batches of addresses when not cached
 
         Args:
             network (str): _description_
@@ -357,65 +240,39 @@ class etherscan_helper:
             return []
 
         result = []
-        page = 1  # define pagination var
-        offset = 10000  # items to be presented with on each query
-        # loop till no more results are retrieved
-        while True:
-            try:
-                # format contract address to match api requirements
-                contract_addresses_string = ",".join(contract_addresses)
-
-                url = "{}/api?{}&apiKey={}".format(
-                    self._urls[network.lower()],
-                    self.build_url_arguments(
-                        module="contract",
-                        action="getcontractcreation",
-                        contractaddresses=contract_addresses_string,
-                        page=page,
-                        offset=offset,
-                        sort="asc",
-                    ),
-                    self._api_keys[network.lower()],
+        missing = []
+        for address in contract_addresses:
+            if self._cache and (
+                item := self._cache.get(
+                    key=self._creation_cache_key(network=network, address=address)
                 )
-
-                # rate control
-                self.__RATE_LIMIT.continue_when_safe()
-
-                # get data
-                _data = net_utilities.get_request(
-                    url
-                )  #  {"status":"1","message":"OK-Missing/Invalid API Key, rate limit of 1/5sec applied","result":....}
-
-                if _data["status"] == "1":
-                    # query when thru ok
-                    if _data["result"]:
-                        # Add data to result
-                        result += _data["result"]
-
-                        if len(_data["result"]) < offset:
-                            # there is no more data to be scraped
-                            break
-                        else:
-                            # add pagination var
-                            page += 1
-                    else:
-                        # no data
-                        break
-                else:
-                    logging.getLogger(__name__).debug(
-                        " {} for {} in {}  . error message: {}".format(
-                            _data["message"], contract_addresses, network
-                        )
+            ):
+                result.append(item)
+            else:
+                missing.append(address)
+
+        for i in range(0, len(missing), self._creation_addresses_per_call):
+            addresses = missing[i : i + self._creation_addresses_per_call]
+            items = self._request_all_pages(
+                network=network,
+                offset=10000,
+                reference=addresses,
+                # cached per address
+                cache=False,
+                module="contract",
+                action="getcontractcreation",
+                contractaddresses=",".join(addresses),
+                sort="asc",
+            )
+            if self._cache:
+                for item in items:
+                    self._cache.set(
+                        key=self._creation_cache_key(
+                            network=network, address=item["contractAddress"]
+                        ),
+                        data=item,
                     )
-                    break
-
-            except Exception as e:
-                # do not continue
-                logging.getLogger(__name__).error(
-                    f' Unexpected error while querying url {url}    . error message: {_data["message"] if _data else e}'
-                )
-
-                break
+            result += items
 
         # return result
         return result
@@ -428,68 +285,178 @@ class etherscan_helper:
             contract_address (str): _description_
 
         Returns:
-            str | None: _description_
+            str | None: abi json string
         """
         if self._check_network_available(network=network) is False:
-            return []
+            return None
 
-        result = []
-        # loop till no more results are retrieved
-        try:
-            url = "{}/api?{}&apiKey={}".format(
-                self._urls[network.lower()],
-                self.build_url_arguments(
-                    module="contract",
-                    action="getabi",
-                    address=contract_address,
-                ),
-                self._api_keys[network.lower()],
+        _data = self._request(
+            network=network,
+            module="contract",
+            action="getabi",
+            address=contract_address.lower(),
+        )
+        if not _data:
+            return None
+
+        if _data["status"] != "1":
+            logging.getLogger(__name__).debug(
+                " {} for {} in {}  . error message: {}".format(
+                    _data["message"], contract_address, network
+                )
             )
+            return None
+
+        return _data["result"] or None
+
+    # INTERNAL
+    def _request(self, network: str, cache: bool = True, **kwargs) -> dict | None:
+        """Api response ( from the disk cache when the action is cached ).
+            Concurrent identical requests wait for the first one and share its response
+
+        Args:
+            network (str):
+            cache (bool, optional): use the disk cache. Defaults to True.
+            kwargs: request arguments ( module, action ... )
+
+        Returns:
+            dict | None: {"status":"1","message":"OK-Missing/Invalid API Key, rate limit of 1/5sec applied","result":....}
+        """
+        network = network.lower()
+        key = etherscan_cache.key(network=network, **kwargs)
+        ttl = self._cache_ttl.get(kwargs.get("action"), 0)
+        cache = cache and self._cache is not None and ttl != 0
+
+        if cache and (_data := self._cache.get(key=key, ttl=ttl)) is not None:
+            return _data
+
+        def _get():
+            _data = self._get(network=network, **kwargs)
+            if cache and _data and _data.get("status") == "1":
+                self._cache.set(key=key, data=_data)
+            return _data
+
+        return _coalesce(key=key, func=_get)
+
+    def _get(self, network: str, max_retry: int = 2, **kwargs) -> dict | None:
+        """Query the api using the network keys in turns ( each key has its own rate limit ).
+            Rate limited responses are retried with the next key"""
+        keys = self._api_keys.get(network) or [""]
+        for _ in range(len(keys) + max_retry):
+            api_key = _next_api_key(network=network, keys=keys)
 
             # rate control
-            self.__RATE_LIMIT.continue_when_safe()
+            # keyless calls have their own ( much lower ) configurable limit
+            rate_limiter = net_utilities.get_rate_limiter(
+                api="etherscan" if api_key else "etherscan_no_key",
+                rate=self._rate if api_key else self._rate_no_key,
+                key=api_key,
+                endpoint=network,
+            )
+            rate_limiter.acquire()
 
-            # get data
-            _data = net_utilities.get_request(
-                url
-            )  #  {"status":"1","message":"OK-Missing/Invalid API Key, rate limit of 1/5sec applied","result":....}
+            url = "{}/api?{}&apiKey={}".format(
+                self._urls[network], self.build_url_arguments(**kwargs), api_key
+            )
+            # connections are reused
+            response = net_utilities.get_response(
+                url=url, session=net_utilities.get_session(name="etherscan")
+            )
+            rate_limiter.update_from_response(response=response)
+
+            try:
+                _data = response.json()
+            except Exception as e:
+                # do not expose api keys in logs
+                logging.getLogger(__name__).error(
+                    f" Unexpected error while querying {kwargs.get('action')} in {network}    . error message: {e}"
+                )
+                return None
+
+            if _data.get("status") == "0" and "rate limit" in str(
+                _data.get("result", "")
+            ).lower():
+                # Max rate limit reached
+                rate_limiter.backoff(seconds=1)
+                continue
+
+            return _data
+
+        logging.getLogger(__name__).error(
+            f" Etherscan rate limit reached while querying {kwargs.get('action')} in {network}"
+        )
+        return None
+
+    def _request_all_pages(
+        self, network: str, offset: int, reference, cache: bool = True, **kwargs
+    ) -> list:
+        """Results of all pages
+
+        Args:
+            network (str):
+            offset (int): items per page
+            reference: what is being queried ( log purposes )
+            cache (bool, optional): use the disk cache. Defaults to True.
+        """
+        result = []
+        page = 1  # define pagination var
+
+        # loop till no more results are retrieved
+        while True:
+            _data = self._request(
+                network=network, cache=cache, page=page, offset=offset, **kwargs
+            )
+            if not _data:
+                # do not continue
+                logging.getLogger(__name__).error(
+                    f" Unexpected error while querying {kwargs.get('action')} for {reference} in {network}"
+                )
+                break
 
             if _data["status"] == "1":
                 # query when thru ok
                 if _data["result"]:
                     # Add data to result
                     result += _data["result"]
+
+                    if len(_data["result"]) < offset:
+                        # there is no more data to be scraped
+                        break
+                    else:
+                        # add pagination var
+                        page += 1
                 else:
                     # no data
-                    pass
+                    break
             else:
                 logging.getLogger(__name__).debug(
                     " {} for {} in {}  . error message: {}".format(
-                        _data["message"], contract_address, network
+                        _data["message"], reference, network
                     )
                 )
+                break
 
-        except Exception as e:
-            # do not continue
-            logging.getLogger(__name__).error(
-                f' Unexpected error while querying url {url}    . error message: {_data["message"] if _data else e}'
-            )
-
-        # return result
         return result
 
-    def _request_data(self, url):
-        self.__RATE_LIMIT.continue_when_safe()
-        _data = net_utilities.get_request(url)
-        if _data["status"] == "1":
+    def _request_int(self, network: str, cache: bool = True, **kwargs) -> int:
+        _data = self._request(network=network, cache=cache, **kwargs)
+        if _data and _data["status"] == "1":
             return int(_data["result"])
 
         logging.getLogger(__name__).error(
-            f" Unexpected error while querying url {url}    . error message: {_data}"
+            f" Unexpected error while querying {kwargs.get('action')} in {network}    . error message: {_data}"
         )
 
         return 0
 
+    def _creation_cache_key(self, network: str, address: str) -> str:
+        return etherscan_cache.key(
+            network=network.lower(),
+            module="contract",
+            action="getcontractcreation",
+            contractaddress=address.lower(),
+        )
+
     # HELPERs
     def build_url_arguments(self, **kargs) -> str:
         result = ""
@@ -498,6 +465,10 @@ class etherscan_helper:
             result += f"{separator}{k}={v}"
         return result
 
+    def has_api_key(self, network: str) -> bool:
+        """Whether an api key is configured for the network"""
+        return bool(self._api_keys.get(network.lower()))
+
     def _check_network_available(self, network: str) -> bool:
         if network.lower() in self._urls.keys():
             return True
@@ -506,3 +477,92 @@ class etherscan_helper:
                 f" Network {network} not available in etherscan helper"
             )
             return False
+
+
+class etherscan_cache:
+    """Disk cache of etherscan responses, one file per request named after the hash of its network and arguments
+    ( api keys excluded ), so any helper instance or process finds it.
+    """
+
+    def __init__(self, folder: str):
+        self.folder = folder
+
+    @staticmethod
+    def key(network: str, **kwargs) -> str:
+        return hashlib.sha256(
+            json.dumps({"network": network, **kwargs}, sort_keys=True).encode()
+        ).hexdigest()
+
+    def get(self, key: str, ttl: float | None = None):
+        """Cached data or None when not found or older than ttl seconds
+
+        Args:
+            key (str):
+            ttl (float | None, optional): seconds. Defaults to never expire.
+        """
+        try:
+            with open(self._path(key), "r") as f:
+                item = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.getLogger(__name__).warning(
+                f" Could not load etherscan cache file {self._path(key)}. error: {e}"
+            )
+            return None
+
+        if ttl is not None and time.time() - item["saved"] > ttl:
+            return None
+        return item["data"]
+
+    def set(self, key: str, data):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file and replace ( readers never see partial files )
+        temp_path = f"{path}_{os.getpid()}_{threading.get_ident()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"saved": time.time(), "data": data}, f)
+        os.replace(temp_path, path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.folder, key[:2], f"{key}.json")
+
+
+# next api key to use per network ( shared by all helper instances )
+API_KEY_ROTATION = {}
+API_KEY_ROTATION_LOCK = threading.Lock()
+
+
+def _next_api_key(network: str, keys: list[str]) -> str:
+    with API_KEY_ROTATION_LOCK:
+        position = API_KEY_ROTATION.get(network, 0)
+        API_KEY_ROTATION[network] = position + 1
+    return keys[position % len(keys)]
+
+
+# requests being made  { cache key: future }
+IN_FLIGHT_REQUESTS = {}
+IN_FLIGHT_REQUESTS_LOCK = threading.Lock()
+
+
+def _coalesce(key: str, func):
+    """Call func, or wait for the result of the same call already being made by another thread"""
+    with IN_FLIGHT_REQUESTS_LOCK:
+        future = IN_FLIGHT_REQUESTS.get(key)
+        owner = future is None
+        if owner:
+            future = IN_FLIGHT_REQUESTS[key] = concurrent.futures.Future()
+
+    if not owner:
+        return future.result()
+
+    try:
+        result = func()
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with IN_FLIGHT_REQUESTS_LOCK:
+            IN_FLIGHT_REQUESTS.pop(key, None)
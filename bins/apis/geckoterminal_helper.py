@@ -7,8 +7,6 @@ from ..cache.cache_utilities import pool_token_cache
 
 from ..general import net_utilities
 
-from ratelimit import RateLimitException, limits, sleep_and_retry
-
 
 POOL_TOKEN_CACHE = pool_token_cache(time_limit=3600)
 
@@ -125,10 +123,6 @@ class geckoterminal_price_helper:
                         logging.getLogger(__name__).exception(
                             f"Error while getting pool address from {pool_data['id']}: {e}"
                         )
-        except RateLimitException as e:
-            logging.getLogger(__name__).debug(
-                f"Rate limit fired while getting price historic for {token_address}: {e}"
-            )
         except Exception as e:
             logging.getLogger(__name__).exception(
                 f"Error while getting price historic for {token_address}: {e}"
@@ -145,10 +139,6 @@ class geckoterminal_price_helper:
                     f"Price found for {token_address} in pools: {price}"
                 )
                 return price
-        except RateLimitException as e:
-            logging.getLogger(__name__).debug(
-                f"Rate limit fired while getting price now for {token_address}: {e}"
-            )
         except Exception as e:
             logging.getLogger(__name__).exception(
                 f"Error while getting price now for {token_address}: {e}"
@@ -474,40 +464,44 @@ def request_data(url, timeout, sleepnretry: bool = False):
         return request_data_limited(url=url, timeout=timeout)
 
 
-@limits(calls=1, period=3, raise_on_limit=False)
 def request_data_limited(url, timeout):
-    if data := net_utilities.get_request(url=url, timeout_secs=timeout):
-        if "data" in data:
-            return data
-        else:
-            # {'status': '429', 'title': 'Rate Limited', 'debug': 'free limit'}
-            if "status" in data and data["status"] == "429":
-                logging.getLogger(__name__).warning(
-                    f" Rate Limited by geckoterminal. retrying in 1 sec..."
-                )
-            else:
-                logging.getLogger(__name__).warning(
-                    f"no data returned by geckoterminal {url} -> {data}. retrying in 1 sec..."
-                )
-            time.sleep(1)
-    return None
+    # do not wait when the shared rate limit is exhausted
+    if not _rate_limiter().acquire(timeout=0):
+        return None
+    return _request_data(url=url, timeout=timeout)
 
 
-@sleep_and_retry
-@limits(calls=1, period=3, raise_on_limit=True)
 def request_data_sleepnretry(url, timeout):
-    if data := net_utilities.get_request(url=url, timeout_secs=timeout):
+    _rate_limiter().acquire()
+    return _request_data(url=url, timeout=timeout)
+
+
+def _rate_limiter() -> net_utilities.token_bucket:
+    # geckoterminal free limit ( 1 call every 3 seconds ) shared by all workers
+    return net_utilities.get_rate_limiter(api="geckoterminal", rate=1 / 3)
+
+
+def _request_data(url, timeout):
+    response = net_utilities.get_response(url=url, timeout_secs=timeout)
+    _rate_limiter().update_from_response(response=response, default_backoff=3)
+    try:
+        data = response.json() if response is not None else None
+    except Exception:
+        data = None
+
+    if data:
         if "data" in data:
             return data
         else:
             # {'status': '429', 'title': 'Rate Limited', 'debug': 'free limit'}
             if "status" in data and data["status"] == "429":
                 logging.getLogger(__name__).warning(
-                    f" Rate Limited by geckoterminal. retrying in 1 sec..."
+                    f" Rate Limited by geckoterminal. backing off..."
                 )
+                _rate_limiter().backoff(seconds=3)
             else:
                 logging.getLogger(__name__).warning(
-                    f"no data returned by geckoterminal -> {data}. retrying in 1 sec..."
+                    f"no data returned by geckoterminal {url} -> {data}. retrying in 1 sec..."
                 )
-            time.sleep(1)
+                time.sleep(1)
     return None
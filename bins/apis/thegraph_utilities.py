@@ -1,18 +1,16 @@
 import sys
 
+import concurrent.futures
 import datetime as dt
 import logging
+import queue
+import threading
 import time
 
 from ..general import net_utilities
 from ..cache import cache_utilities
 
 
-from ratelimit import limits, sleep_and_retry
-
-
-@sleep_and_retry
-@limits(calls=1, period=1)
 def place_rate_limited_query(
     url: str,
     query: dict,
@@ -21,6 +19,10 @@ def place_rate_limited_query(
     wait_secs: int = 5,
     timeout_secs: int = 3,
 ):
+    # 1 call per second per endpoint, shared by all workers
+    net_utilities.get_rate_limiter(
+        api="thegraph", rate=1, endpoint=url.split("://")[-1]
+    ).acquire()
     return net_utilities.post_request(
         url=url,
         query=query,
@@ -64,10 +66,20 @@ class thegraph_scraper_helper:
     def init_URLS(self):
         self._URLS = {}
 
-    def get_all_results(self, network: str, query_name: str, **kwargs) -> list:
+    def get_all_results(
+        self,
+        network: str,
+        query_name: str,
+        pagination: str = "skip",
+        shards: int = 1,
+        **kwargs,
+    ) -> list:
         """
         network:str = "ethereum"
         query_name:str = "uniswapV3Hypervisors" or "accounts"
+        pagination:str = "skip" or "id"  ( id_gt keyset pagination: no skip limit, orderby is ignored.
+                                           Raises when a page can't be retrieved, so incomplete results are never returned nor cached )
+        shards:int = id ranges queried concurrently when pagination is "id"
 
         kwargs=
             where:str = " id : '0x0000000000' "
@@ -87,6 +99,29 @@ class thegraph_scraper_helper:
                 network=network, query_name=query_name, **kwargs
             )
 
+        if result is None and pagination == "id":
+            # get data from thegraph using id ranges
+            result = [
+                itm
+                for page in self._iter_id_pages(
+                    network=network, query_name=query_name, shards=shards, **kwargs
+                )
+                for itm in page
+            ]
+
+            # save it to cache, if enabled
+            if (
+                self._CACHE is not None
+                and not self._CACHE.add_data(
+                    data=result, network=network, query_name=query_name, **kwargs
+                )
+                and "block" in kwargs
+            ):
+                # not saved to cache
+                logging.getLogger(__name__).warning(
+                    f"Could not save thegraph data to cache ->  network:{network} query:{query_name} "
+                )
+
         if result is None:
             # get  data from thegraph
             result = []
@@ -187,6 +222,31 @@ class thegraph_scraper_helper:
         # return
         return result
 
+    def iter_results(
+        self, network: str, query_name: str, shards: int = 1, **kwargs
+    ):
+        """Yield result pages using id_gt keyset pagination ( no cache )
+            Items are ordered by id within each shard, but pages of different shards are mixed.
+            Raises when a page can't be retrieved.
+
+        network:str = "ethereum"
+        query_name:str = "uniswapV3Hypervisors" or "accounts"
+        shards:int = id ranges queried concurrently ( sharing the endpoint rate limiter )
+
+        kwargs=
+            where:str = " id : '0x0000000000' "
+            block:str = "number: { 15432282 } "
+
+        """
+        for page in self._iter_id_pages(
+            network=network, query_name=query_name, shards=shards, **kwargs
+        ):
+            # convert result
+            if self._CONVERT:
+                for itm in page:
+                    self._converter(itm, query_name, network)
+            yield page
+
     @property
     def networks(self) -> list[str]:
         """available networks
@@ -237,6 +297,152 @@ class thegraph_scraper_helper:
     def _url_constructor(self, network, query_name: str = ""):
         return self._URLS[network]
 
+    def _iter_id_pages(self, network: str, query_name: str, shards: int = 1, **kwargs):
+        """Yield raw result pages of all id ranges ( each range is queried in its own thread )"""
+        _url = self._url_constructor(network, query_name)
+        bounds = self._id_shard_bounds(shards)
+        if len(bounds) == 1:
+            yield from self._iter_id_shard(_url, query_name, *bounds[0], **kwargs)
+            return
+
+        # bounded: workers wait while the consumer is behind
+        pages = queue.Queue(maxsize=2 * len(bounds))
+        stop = threading.Event()
+        _done = object()
+
+        def _put(item) -> bool:
+            """Queue an item unless the consumer stopped"""
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _worker(lower: str, upper: str):
+            try:
+                for page in self._iter_id_shard(
+                    _url, query_name, lower, upper, **kwargs
+                ):
+                    if not _put(page):
+                        return
+            except Exception as e:
+                # raised by the consumer
+                _put(e)
+            finally:
+                _put(_done)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(bounds)) as executor:
+            for lower, upper in bounds:
+                executor.submit(_worker, lower, upper)
+            try:
+                pending = len(bounds)
+                while pending:
+                    page = pages.get()
+                    if page is _done:
+                        pending -= 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        yield page
+            finally:
+                # consumer may stop early ( or a shard failed )
+                stop.set()
+
+    def _iter_id_shard(
+        self, url: str, query_name: str, lower: str = "", upper: str = "", **kwargs
+    ):
+        """Yield raw result pages with ids in [lower, upper), using id_gt pagination"""
+        last_id = None
+        while True:
+            _where = ", ".join(
+                x
+                for x in (
+                    kwargs.get("where", ""),
+                    f'id_gt: "{last_id}"'
+                    if last_id is not None
+                    else (f'id_gte: "{lower}"' if lower else ""),
+                    f'id_lt: "{upper}"' if upper else "",
+                )
+                if x
+            )
+            _filter = self._filter_constructor(
+                **{
+                    **kwargs,
+                    "where": _where,
+                    "orderby": "id",
+                    "orderDirection": "asc",
+                }
+            )
+            _query, path_to_data = self._query_constructor(
+                skip=0, name=query_name, filter=_filter
+            )
+            _data = self._query_page(
+                url=url, query=_query, path_to_data=path_to_data, query_name=query_name
+            )
+            if _data is None:
+                # do not return incomplete results
+                raise ValueError(
+                    f" Could not retrieve {query_name} ids after {last_id or lower or 'start'} from {url}"
+                )
+            if not _data:
+                break
+
+            yield _data
+
+            if len(_data) < 1000:
+                # qtty is less than window ("first" var at query)
+                break
+            if "id" not in _data[-1]:
+                logging.getLogger(__name__).error(
+                    f" {query_name} query does not return the id field needed for id pagination"
+                )
+                break
+            last_id = _data[-1]["id"]
+
+    def _query_page(
+        self, url: str, query: str, path_to_data: list, query_name: str
+    ) -> list | None:
+        """Place a query and return the data found following path_to_data ( None on error )"""
+        while True:
+            response = place_rate_limited_query(
+                url=url,
+                query=query,
+                retry=0,
+                max_retry=2,
+                wait_secs=5,
+                timeout_secs=self.timeout_secs,
+            )
+            try:
+                _data = response
+                for key in path_to_data:
+                    _data = _data[key]
+                return _data
+            except (KeyError, TypeError):
+                if (
+                    "database unavailable"
+                    in f"{(response or {}).get('errors', '')}".lower()
+                ):
+                    # connection error: wait and loop again
+                    logging.getLogger(__name__).error(
+                        f" Seems like subgraph isnt available temporarily. Retrying in 5sec."
+                    )
+                    time.sleep(5)
+                    continue
+
+                logging.getLogger(__name__).error(
+                    f" Unexpected error retrieving data path  query name:{query_name}   data:{response}"
+                )
+                return None
+
+    @staticmethod
+    def _id_shard_bounds(shards: int) -> list[tuple[str, str]]:
+        """Id ranges [lower, upper) splitting the hex id space by its first byte ( "" when open )"""
+        shards = max(1, min(shards, 256))
+        cuts = [f"0x{256 * i // shards:02x}" for i in range(1, shards)]
+        return list(zip([""] + cuts, cuts + [""]))
+
 
 ## SPECIFIC ##
 class gamma_scraper(thegraph_scraper_helper):
@@ -399,7 +399,9 @@ class standard_thegraph_cache(file_backend):
     """
 
     # THE GRAPH VARS & HELPERS
-    RATE_LIMIT = net_utilities.rate_limit(rate_max_sec=4)  # thegraph rate limiter
+    RATE_LIMIT = net_utilities.rate_limit(
+        rate_max_sec=4, name="thegraph_cache"
+    )  # thegraph rate limiter
 
     def _init_cache(self):
         # init price cache
@@ -143,6 +143,8 @@ def load_configuration() -> config:
         telegram_enabled=cfg.logs.telegram.enabled,
         telegram_token=cfg.logs.telegram.token,
         telegram_chatid=cfg.logs.telegram.chat_id,
+        background=cfg.logs.background,
+        telegram_min_interval=cfg.logs.telegram.min_interval,
     )
 
     # 4) load database configuration
@@ -6,6 +6,7 @@ class config_telegram:
     enabled: bool = False  # enable or disable telegram
     token: str = None
     chat_id: str = None
+    min_interval: float = 3  # minimum seconds between telegram messages
 
     def to_dict(self):
         """convert object and subobjects to dictionary"""
@@ -20,6 +21,8 @@ class config_logs:
 
     # debug.log file is populated with functions execution time
     log_execution_time: bool = False
+    # handle log records in a background thread
+    background: bool = False
     telegram: config_telegram = None
 
     def __post_init__(self):
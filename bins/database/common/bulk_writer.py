@@ -0,0 +1,242 @@
+import atexit
+from collections import deque
+import logging
+import threading
+import time
+
+from pymongo.errors import BulkWriteError
+
+from ...database.common.db_managers import MongoDbManager
+
+
+class bulk_writer:
+    """Buffered upserts ( by id ) of one database collection.
+    Items are accumulated and written as unordered bulk batches when the batch size is reached,
+    when the oldest pending item is older than the maximum time ( a timer flushes quiet writers ),
+    or when flush or close is called explicitly ( pending items are also flushed at exit ).
+    """
+
+    def __init__(
+        self,
+        mongo_url: str,
+        db_name: str,
+        db_collections: dict,
+        collection_name: str,
+        mode: str = "update",
+        batch_size: int = 500,
+        max_seconds: float = 10,
+    ):
+        """
+
+        Args:
+            mongo_url (str):
+            db_name (str):
+            db_collections (dict): database collections configuration
+            collection_name (str):
+            mode (str, optional): "update" ( $set ) or "replace" the whole document. Defaults to "update".
+            batch_size (int, optional): flush when this many items are pending. Defaults to 500.
+            max_seconds (float, optional): flush when the oldest pending item is older than this. Defaults to 10.
+        """
+        if mode not in ("update", "replace"):
+            raise ValueError(f" Invalid bulk writer mode {mode}")
+
+        self.mongo_url = mongo_url
+        self.db_name = db_name
+        self.db_collections = db_collections
+        self.collection_name = collection_name
+        self.mode = mode
+        self.batch_size = batch_size
+        self.max_seconds = max_seconds
+
+        self._lock = threading.RLock()
+        # pending items by id ( last one wins )
+        self._items: dict[str, dict] = {}
+        self._oldest = None
+        # flushes pending items max_seconds after the first one was added
+        self._timer: threading.Timer | None = None
+        # latest errors [{ "id", "code", "message" }]
+        self.errors: deque[dict] = deque(maxlen=1000)
+        # items not saved since created ( including size and timer flushes )
+        self.error_count = 0
+        # called with the items saved after each flush
+        self._saved_callbacks: list = []
+
+    def add_saved_callback(self, callback):
+        """Call a function with the list of items saved after each flush ( once per function )
+
+        Args:
+            callback (Callable[[list[dict]], None]):
+        """
+        with self._lock:
+            if callback not in self._saved_callbacks:
+                self._saved_callbacks.append(callback)
+
+    def add(self, data: dict):
+        """Queue an item to be upserted by its id ( flushing when needed )
+
+        Args:
+            data (dict): item with an "id" field
+        """
+        with self._lock:
+            if not self._items:
+                self._oldest = time.monotonic()
+                self._start_timer()
+            self._items[data["id"]] = data
+
+            if (
+                len(self._items) >= self.batch_size
+                or time.monotonic() - self._oldest >= self.max_seconds
+            ):
+                self.flush()
+
+    def flush(self) -> list[dict]:
+        """Write all pending items to database
+
+        Returns:
+            list[dict]: items not saved [{ "id", "code", "message" }]
+        """
+        with self._lock:
+            self._cancel_timer()
+            if not self._items:
+                return []
+            items = list(self._items.values())
+            self._items = {}
+            self._oldest = None
+
+            errors = []
+            try:
+                with MongoDbManager(
+                    url=self.mongo_url,
+                    db_name=self.db_name,
+                    collections=self.db_collections,
+                ) as _db_manager:
+                    if self.mode == "replace":
+                        _db_manager.replace_items_bulk(
+                            coll_name=self.collection_name,
+                            data=[
+                                {"filter": {"id": item["id"]}, "data": item}
+                                for item in items
+                            ],
+                            ordered=False,
+                        )
+                    else:
+                        _db_manager.update_items_bulk(
+                            coll_name=self.collection_name,
+                            data=[
+                                {"filter": {"id": item["id"]}, "data": {"$set": item}}
+                                for item in items
+                            ],
+                            ordered=False,
+                        )
+            except BulkWriteError as bwe:
+                # unordered: only the failed items are not saved
+                errors = [
+                    {
+                        "id": items[error["index"]]["id"],
+                        "code": error.get("code"),
+                        "message": error.get("errmsg"),
+                    }
+                    for error in bwe.details.get("writeErrors", [])
+                ]
+            except Exception as e:
+                errors = [
+                    {"id": item["id"], "code": None, "message": f"{e}"}
+                    for item in items
+                ]
+
+            if errors:
+                logging.getLogger(__name__).error(
+                    f" {len(errors)} of {len(items)} items could not be saved to {self.db_name}'s {self.collection_name} collection. first error-> {errors[0]}"
+                )
+                self.errors.extend(errors)
+                self.error_count += len(errors)
+            else:
+                logging.getLogger(__name__).debug(
+                    f" {len(items)} items saved to {self.db_name}'s {self.collection_name} collection"
+                )
+
+            if self._saved_callbacks:
+                failed = {x["id"] for x in errors}
+                saved = [x for x in items if x["id"] not in failed]
+                for callback in self._saved_callbacks:
+                    try:
+                        callback(saved)
+                    except Exception as e:
+                        logging.getLogger(__name__).exception(
+                            f" Error calling {self.collection_name} bulk writer saved callback: {e}"
+                        )
+            return errors
+
+    def close(self) -> list[dict]:
+        """Flush pending items and stop the timer
+
+        Returns:
+            list[dict]: items not saved [{ "id", "code", "message" }]
+        """
+        return self.flush()
+
+    def _start_timer(self):
+        self._cancel_timer()
+        self._timer = threading.Timer(self.max_seconds, self.flush)
+        # do not keep the process alive: pending items are flushed at exit
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            # the timer thread itself may be flushing
+            if self._timer is not threading.current_thread():
+                self._timer.cancel()
+            self._timer = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+# one writer per database collection ( and process )
+BULK_WRITERS: dict[tuple, bulk_writer] = {}
+BULK_WRITERS_LOCK = threading.Lock()
+
+
+def get_bulk_writer(
+    mongo_url: str,
+    db_name: str,
+    db_collections: dict,
+    collection_name: str,
+    mode: str = "update",
+) -> bulk_writer:
+    key = (mongo_url, db_name, collection_name, mode)
+    with BULK_WRITERS_LOCK:
+        if key not in BULK_WRITERS:
+            BULK_WRITERS[key] = bulk_writer(
+                mongo_url=mongo_url,
+                db_name=db_name,
+                db_collections=db_collections,
+                collection_name=collection_name,
+                mode=mode,
+            )
+        return BULK_WRITERS[key]
+
+
+def flush_bulk_writers() -> list[dict]:
+    """Flush all pending items of all writers
+
+    Returns:
+        list[dict]: items not saved [{ "id", "code", "message" }]
+    """
+    with BULK_WRITERS_LOCK:
+        writers = list(BULK_WRITERS.values())
+    errors = []
+    for writer in writers:
+        errors += writer.close()
+    return errors
+
+
+# do not lose pending items on exit
+atexit.register(flush_bulk_writers)
@@ -17,6 +17,10 @@ from ...database.common.database_ids import (
     create_id_user_status,
 )
 from ...database.common.db_managers import MongoDbManager
+from ...database.common.bulk_writer import (
+    bulk_writer,
+    get_bulk_writer as _get_bulk_writer,
+)
 from ...general.enums import Chain, queueItemType, rewarderType
 from pymongo.results import (
     BulkWriteResult,
@@ -97,16 +101,20 @@ class db_collections_common:
         collection_name: str,
     ) -> BulkWriteResult:
         """Save multiple items in a collection at once ( in bulk)
+            Items are upserted by id with $set ( update operations need operator documents )
 
         Args:
-            data (list[dict]): _description_
-            collection_name (str): _description_
-        """
-        # TODO: solve error not saving  :
+            data (list[dict]): items with an "id" field
+            collection_name (str):
 
+        Returns:
+            BulkWriteResult: None when the items could not be saved
+        """
         try:
             # create bulk data object
-            bulk_data = [{"filter": {"id": item["id"]}, "data": item} for item in data]
+            bulk_data = [
+                {"filter": {"id": item["id"]}, "data": {"$set": item}} for item in data
+            ]
 
             with MongoDbManager(
                 url=self._db_mongo_url,
@@ -126,6 +134,24 @@ class db_collections_common:
                 f" Unable to save multiple items to mongo's {collection_name} collection. Items qtty: {len(data)}  error-> {e}"
             )
 
+    def get_bulk_writer(
+        self, collection_name: str, mode: str = "update"
+    ) -> bulk_writer:
+        """Shared buffered writer of a collection of this database.
+            Items added are saved in bulk: call its flush ( or bulk_writer.flush_bulk_writers ) when done
+
+        Args:
+            collection_name (str):
+            mode (str, optional): "update" or "replace". Defaults to "update".
+        """
+        return _get_bulk_writer(
+            mongo_url=self._db_mongo_url,
+            db_name=self._db_name,
+            db_collections=self._db_collections,
+            collection_name=collection_name,
+            mode=mode,
+        )
+
     def save_item_to_database(
         self,
         data: dict,
@@ -283,6 +309,24 @@ class db_collections_common:
             else:
                 return []
 
+    def iter_items_from_database(self, collection_name: str, **kwargs):
+        """Yield items one by one while the cursor fetches them in batches
+            ( use projection and batch_size to keep memory low )
+
+        Args:
+            collection_name (str):
+            **kwargs: same as get_items_from_database
+        """
+        with MongoDbManager(
+            url=self._db_mongo_url,
+            db_name=self._db_name,
+            collections=self._db_collections,
+        ) as _db_manager:
+            if data := self.get_cursor(
+                db_manager=_db_manager, collection_name=collection_name, **kwargs
+            ):
+                yield from data
+
     def get_distinct_items_from_database(
         self, collection_name: str, field: str, condition: dict = None
     ) -> list:
@@ -299,6 +343,25 @@ class db_collections_common:
 
         return result
 
+    def get_missing_ids(self, collection_name: str, ids: list[str]) -> set[str]:
+        """Check the existence of multiple ids at once ( single $in query )
+
+        Args:
+            collection_name (str):
+            ids (list[str]): ids to check
+
+        Returns:
+            set[str]: ids not found in the collection
+        """
+        if not ids:
+            return set()
+        found = self.get_distinct_items_from_database(
+            collection_name=collection_name,
+            field="id",
+            condition={"id": {"$in": list(set(ids))}},
+        )
+        return set(ids) - set(found)
+
     def get_cursor(self, db_manager: MongoDbManager, collection_name: str, **kwargs):
         return db_manager.get_items(coll_name=collection_name, **kwargs)
 
@@ -484,7 +547,7 @@ class database_global(db_collections_common):
                     ],
                 },
                 "current_usd_prices": {
-                    "mono_indexes": {"id": True, "address": False},
+                    "mono_indexes": {"id": True, "address": False, "timestamp": False},
                     "multi_indexes": [
                         [
                             ("address", ASCENDING),
@@ -533,7 +596,13 @@ class database_global(db_collections_common):
         token_address: str,
         price_usd: float,
         source: str,
-    ) -> UpdateResult:
+        bulk: bool = False,
+    ) -> UpdateResult | None:
+        """Save a token usd price
+
+        Args:
+            bulk (bool, optional): queue it in the collection bulk writer instead of saving it now. Defaults to False.
+        """
         data = {
             "id": create_id_price(
                 network=network, block=block, token_address=token_address
@@ -545,7 +614,19 @@ class database_global(db_collections_common):
             "source": source,
         }
 
-        return self.save_item_to_database(data=data, collection_name="usd_prices")
+        # keep the price coverage index up to date once saved ( avoid circular imports )
+        from bins.database.common.price_coverage import register_saved_prices
+
+        if bulk:
+            writer = self.get_bulk_writer(collection_name="usd_prices")
+            writer.add_saved_callback(register_saved_prices)
+            return writer.add(data)
+
+        if result := self.save_item_to_database(
+            data=data, collection_name="usd_prices"
+        ):
+            register_saved_prices(items=[data])
+        return result
 
     def set_current_price_usd(
         self,
@@ -899,6 +980,7 @@ class database_local(db_collections_common):
                     "mono_indexes": {
                         "id": True,
                         "type": False,
+                        "dependencies": False,
                     },
                     "multi_indexes": [
                         [
@@ -967,6 +1049,33 @@ class database_local(db_collections_common):
                     },
                     "multi_indexes": [],
                 },
+                # per hypervisor running returns aggregates ( last analyzed period )
+                "hypervisor_returns_checkpoints": {
+                    "mono_indexes": {
+                        "id": True,
+                        "address": True,
+                        "block": False,
+                    },
+                    "multi_indexes": [],
+                },
+                # per hypervisor running returns aggregates including latest hypervisor returns
+                "latest_hypervisor_returns_checkpoints": {
+                    "mono_indexes": {
+                        "id": True,
+                        "address": True,
+                        "block": False,
+                    },
+                    "multi_indexes": [],
+                },
+                # contract address -> creator, txHash, block and timestamp
+                "contract_creation": {
+                    "mono_indexes": {
+                        "id": True,
+                        "address": True,
+                        "block": False,
+                    },
+                    "multi_indexes": [],
+                },
             }
 
         else:
@@ -1006,6 +1115,9 @@ class database_local(db_collections_common):
             find = {"processing": 0}
         if types:
             find["type"] = {"$in": types}
+        # only hand out items with all their dependencies processed ( items without the field are ready )
+        if "ready" not in find:
+            find["ready"] = {"$ne": False}
 
         if not sort:
             sort = [("creation", ASCENDING)]
@@ -1059,6 +1171,72 @@ class database_local(db_collections_common):
             update=update,
         )
 
+    def release_queue_item_dependents(self, id: str) -> UpdateResult | None:
+        """Remove a processed queue item id from its dependents and set
+            as ready those left without pending dependencies
+
+        Args:
+            id (str): processed queue item id
+        """
+        if db_return := self.update_many(
+            collection_name="queue",
+            find={"dependencies": id},
+            update={"$pull": {"dependencies": id}},
+        ):
+            if db_return.modified_count:
+                return self.update_many(
+                    collection_name="queue",
+                    find={"ready": False, "dependencies": {"$size": 0}},
+                    update={"$set": {"ready": True}},
+                )
+        return db_return
+
+    def release_queue_items_missing_dependencies(
+        self, ids: list[str]
+    ) -> UpdateResult | None:
+        """Remove from queue items the dependencies no longer in queue ( processed before the items were saved )
+            and set as ready those left without pending dependencies
+
+        Args:
+            ids (list[str]): saved queue item ids
+        """
+        if not ids:
+            return None
+
+        dependencies = {
+            dependency
+            for item in self.get_items_from_database(
+                collection_name="queue",
+                find={"id": {"$in": ids}, "ready": False},
+                projection={"_id": 0, "dependencies": 1},
+            )
+            for dependency in item.get("dependencies", [])
+        }
+        if not dependencies:
+            return None
+
+        if gone := self.get_missing_ids(collection_name="queue", ids=list(dependencies)):
+            self.update_many(
+                collection_name="queue",
+                find={"id": {"$in": ids}},
+                update={"$pull": {"dependencies": {"$in": list(gone)}}},
+            )
+        return self.update_many(
+            collection_name="queue",
+            find={"id": {"$in": ids}, "ready": False, "dependencies": {"$size": 0}},
+            update={"$set": {"ready": True}},
+        )
+
+    def get_queue_depth(self) -> list[dict]:
+        """Number of queue items waiting by type and ready state
+
+        Returns:
+            list[dict]: of { "type": <queueItemType>, "ready": <bool>, "qtty": <int> }
+        """
+        return self.get_items_from_database(
+            collection_name="queue", aggregate=self.query_queue_depth()
+        )
+
     # static
 
     def set_static(self, data: dict) -> UpdateResult:
@@ -1242,11 +1420,13 @@ class database_local(db_collections_common):
 
     # status
 
-    def set_status(self, data: dict):
+    def set_status(self, data: dict, bulk: bool = False):
         # define database id
         data["id"] = create_id_hypervisor_status(
             hypervisor_address=data["address"], block=data["block"]
         )
+        if bulk:
+            return self.get_bulk_writer(collection_name="status").add(data)
         return self.save_item_to_database(data=data, collection_name="status")
 
     def get_all_status(self, hypervisor_address: str) -> list:
@@ -1472,7 +1652,7 @@ class database_local(db_collections_common):
         return self.get_items_from_database(collection_name="rewards_static", find=find)
 
     # rewards status
-    def set_rewards_status(self, data: dict) -> UpdateResult:
+    def set_rewards_status(self, data: dict, bulk: bool = False) -> UpdateResult | None:
         """Save rewarder status data to db
 
         Args:
@@ -1494,6 +1674,7 @@ class database_local(db_collections_common):
                                 "token 0 price"
                                 "token 1 price"
                                 "rewardToken_price"
+            bulk (bool, optional): queue it in the collection bulk writer instead of saving it now. Defaults to False.
 
         """
         # define database id-->
@@ -1505,6 +1686,8 @@ class database_local(db_collections_common):
             rewardToken_address=data["rewardToken"],
             block=data["block"],
         )
+        if bulk:
+            return self.get_bulk_writer(collection_name="rewards_status").add(data)
         return self.save_item_to_database(data=data, collection_name="rewards_status")
 
     # hypervisor returns
@@ -1527,6 +1710,33 @@ class database_local(db_collections_common):
             data=data, collection_name="hypervisor_returns"
         )
 
+    def set_hypervisor_returns_checkpoint(
+        self, data: dict, collection_name: str = "hypervisor_returns_checkpoints"
+    ) -> UpdateResult:
+        return self.replace_item_to_database(
+            data=self.convert_decimal_to_d128(data),
+            collection_name=collection_name,
+        )
+
+    def get_hypervisor_returns_checkpoint(
+        self, address: str, collection_name: str = "hypervisor_returns_checkpoints"
+    ) -> dict | None:
+        """Running returns aggregates of a hypervisor ( see period_yield_analyzer.get_checkpoint )
+            from hypervisor_returns_checkpoints or latest_hypervisor_returns_checkpoints
+        """
+        if result := self.get_items_from_database(
+            collection_name=collection_name,
+            find={"address": address},
+            projection={"_id": 0},
+        ):
+            return self.convert_d128_to_decimal(result[0])
+        return None
+
+    def delete_hypervisor_returns_checkpoint(self, address: str) -> DeleteResult:
+        return self.delete_item(
+            collection_name="hypervisor_returns_checkpoints", item_id=address
+        )
+
     # all
     def get_items(self, collection_name: str, **kwargs) -> list:
         """Any
@@ -1673,6 +1883,28 @@ class database_local(db_collections_common):
             {"$unset": ["_id"]},
         ]
 
+    @staticmethod
+    def query_queue_depth() -> list[dict]:
+        return [
+            {
+                "$group": {
+                    "_id": {
+                        "type": "$type",
+                        "ready": {"$ifNull": ["$ready", True]},
+                    },
+                    "qtty": {"$sum": 1},
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "type": "$_id.type",
+                    "ready": "$_id.ready",
+                    "qtty": 1,
+                }
+            },
+        ]
+
     @staticmethod
     def query_max(field: str) -> list[dict]:
         return [
@@ -3334,6 +3566,150 @@ class database_local(db_collections_common):
         # debug_query = f"{query}"
         return query
 
+    @staticmethod
+    def query_hypervisor_periods_match(
+        hypervisor_addresses: list[str] | None = None,
+        timestamp_ini: int | None = None,
+        timestamp_end: int | None = None,
+        block_ini: int | None = None,
+        block_end: int | None = None,
+    ) -> dict:
+        """Operations match used to define hypervisor periods ( same as in query_hypervisor_periods )
+            Use it to get the period blocks: <operation block> and <operation block - 1>
+
+        Returns:
+            dict: find condition for the operations collection
+        """
+        _and = [
+            {
+                "$or": [
+                    {"src": {"$exists": 0}},
+                    {"src": {"$ne": "0x0000000000000000000000000000000000000000"}},
+                ]
+            },
+            {
+                "$or": [
+                    {"dst": {"$exists": 0}},
+                    {"dst": {"$ne": "0x0000000000000000000000000000000000000000"}},
+                ]
+            },
+        ]
+        _match = {
+            "topic": {"$in": ["deposit", "withdraw", "rebalance", "zeroBurn"]},
+        }
+
+        # add block and timestamp in query
+        if block_ini:
+            _and.append({"blockNumber": {"$gte": block_ini}})
+        if timestamp_ini:
+            _and.append({"timestamp": {"$gte": timestamp_ini}})
+        if block_end:
+            _and.append({"blockNumber": {"$lte": block_end}})
+        if timestamp_end:
+            _and.append({"timestamp": {"$lte": timestamp_end}})
+
+        # add hype address
+        if hypervisor_addresses:
+            _and.append({"address": {"$in": hypervisor_addresses}})
+
+        _match["$and"] = _and
+        return _match
+
+    @staticmethod
+    def query_hypervisor_periods_status(
+        hypervisor_address: str, blocks: list[int]
+    ) -> list[dict]:
+        """Hypervisor status items at the specified blocks, sorted by block, including
+            rewards_static, rewards_status and operations ( affecting totalSupply ) like query_hypervisor_periods does.
+            To be used on the status collection with a bounded list of blocks ( streaming hypervisor periods )
+
+        Args:
+            hypervisor_address (str):
+            blocks (list[int]):
+
+        Returns:
+            list[dict]:
+        """
+        return [
+            {"$match": {"address": hypervisor_address, "block": {"$in": blocks}}},
+            {"$sort": {"block": 1}},
+            # find hype's reward static
+            {
+                "$lookup": {
+                    "from": "rewards_static",
+                    "let": {"op_address": "$address"},
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "$expr": {
+                                    "$eq": ["$hypervisor_address", "$$op_address"],
+                                }
+                            }
+                        },
+                    ],
+                    "as": "rewards_static",
+                }
+            },
+            # find hype's reward status
+            {
+                "$lookup": {
+                    "from": "rewards_status",
+                    "let": {"op_block": "$block", "op_address": "$address"},
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "$expr": {
+                                    "$and": [
+                                        {
+                                            "$eq": [
+                                                "$hypervisor_address",
+                                                "$$op_address",
+                                            ]
+                                        },
+                                        {"$eq": ["$block", "$$op_block"]},
+                                    ],
+                                }
+                            }
+                        },
+                    ],
+                    "as": "rewards_status",
+                }
+            },
+            # find operations sorted by logIndex ( there are hype status without operations [end of period]])
+            {
+                "$lookup": {
+                    "from": "operations",
+                    "let": {"op_block": "$block", "op_address": "$address"},
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "$expr": {
+                                    "$and": [
+                                        {"$eq": ["$address", "$$op_address"]},
+                                        {"$eq": ["$blockNumber", "$$op_block"]},
+                                        # only operations affecting totalSupply
+                                        {
+                                            "$in": [
+                                                "$topic",
+                                                [
+                                                    "deposit",
+                                                    "withdraw",
+                                                    "rebalance",
+                                                    "zeroBurn",
+                                                ],
+                                            ]
+                                        },
+                                    ],
+                                }
+                            }
+                        },
+                        {"$sort": {"logIndex": 1}},
+                    ],
+                    "as": "operations",
+                }
+            },
+        ]
+
     @staticmethod
     def query_hypervisor_periods_flatten(
         hypervisor_addresses: list[str] | None = None,
@@ -1,4 +1,4 @@
-from pymongo import DeleteOne, MongoClient
+from pymongo import DeleteOne, MongoClient, monitoring
 from pymongo.errors import ConnectionFailure, BulkWriteError
 from pymongo import InsertOne, DeleteMany, ReplaceOne, UpdateOne
 from pymongo.cursor import Cursor
@@ -10,6 +10,35 @@ from pymongo.results import (
     UpdateResult,
 )
 
+from ...performance.costs import report_cost
+
+
+class command_cost_listener(monitoring.CommandListener):
+    """Report every database command wall time to the current cost tracker ( if any )"""
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        report_cost(
+            kind="db",
+            operation=event.command_name,
+            source=getattr(event, "database_name", ""),
+            seconds=event.duration_micros / 1_000_000,
+        )
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        report_cost(
+            kind="db",
+            operation=event.command_name,
+            source=getattr(event, "database_name", ""),
+            seconds=event.duration_micros / 1_000_000,
+        )
+
+
+# singleton
+COMMAND_COST_LISTENER = command_cost_listener()
+
 
 class MongoDbManager:
     def __init__(self, url: str, db_name: str, collections: dict):
@@ -34,7 +63,9 @@ class MongoDbManager:
 
         # connect to mongo database
         try:
-            self.mongo_client = MongoClient(url)
+            self.mongo_client = MongoClient(
+                url, event_listeners=[COMMAND_COST_LISTENER]
+            )
         except ConnectionFailure as e:
             raise ValueError(f"Failed not connect to {url}") from e
         self.database = self.mongo_client[db_name]
@@ -133,7 +164,7 @@ class MongoDbManager:
         )
 
     def add_items_bulk(
-        self, coll_name: str, data: list, upsert=True
+        self, coll_name: str, data: list, upsert=True, ordered: bool = True
     ) -> BulkWriteResult:
         """Add or Update item
 
@@ -142,6 +173,7 @@ class MongoDbManager:
            dbFilter (dict): filter to use as to replacement filter, like { address:<>, chain:<>}
            data (dict): data to save
            upsert (bool, optional): replace or add item. Defaults to True.
+           ordered (bool, optional): stop at the first error. Defaults to True.
 
         Raises:
            ValueError: if coll_name is not defined at the class init <collections> field
@@ -162,7 +194,8 @@ class MongoDbManager:
             [
                 UpdateOne(filter=item["filter"], update=item["data"], upsert=upsert)
                 for item in data
-            ]
+            ],
+            ordered=ordered,
         )
 
     def replace_item(
@@ -196,7 +229,7 @@ class MongoDbManager:
         )
 
     def replace_items_bulk(
-        self, coll_name: str, data: list, upsert=True
+        self, coll_name: str, data: list, upsert=True, ordered: bool = True
     ) -> BulkWriteResult:
         """Add or Rewrite items
 
@@ -204,6 +237,7 @@ class MongoDbManager:
            coll_name (str): collection name
            data (list): list of data to save
            upsert (bool, optional): replace or add item. Defaults to True.
+           ordered (bool, optional): stop at the first error. Defaults to True.
 
         Raises:
            ValueError: if coll_name is not defined at the class init <collections> field
@@ -224,17 +258,19 @@ class MongoDbManager:
             [
                 ReplaceOne(filter=item["filter"], replacement=item["data"], upsert=True)
                 for item in data
-            ]
+            ],
+            ordered=ordered,
         )
 
     def update_items_bulk(
-        self, coll_name: str, data: list, upsert=True
+        self, coll_name: str, data: list, upsert=True, ordered: bool = True
     ) -> BulkWriteResult:
         """Update items
 
         Args:
            coll_name (str): collection name
            data (list): list of data to save
+           ordered (bool, optional): stop at the first error. Defaults to True.
 
         Raises:
            ValueError: if coll_name is not defined at the class init <collections> field
@@ -256,7 +292,8 @@ class MongoDbManager:
             [
                 UpdateOne(filter=item["filter"], update=item["data"], upsert=True)
                 for item in data
-            ]
+            ],
+            ordered=ordered,
         )
 
     def get_items(self, coll_name: str, **kwargs) -> Cursor:
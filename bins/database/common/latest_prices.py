@@ -0,0 +1,128 @@
+import logging
+import threading
+import time
+
+from bins.configuration import CONFIGURATION
+from bins.database.common.db_collections_common import database_global
+
+
+class latest_price_snapshot:
+    """In memory copy of the current_usd_prices of one network, shared by all queue items processed in the process.
+    The whole snapshot is reloaded when it is older than ttl seconds or when the "timestamp" watermark
+    ( latest price update time, checked at most every check_seconds ) moves. Each reload increases the version.
+    """
+
+    def __init__(self, network: str, ttl: float = 300, check_seconds: float = 15):
+        """
+
+        Args:
+            network (str):
+            ttl (float, optional): maximum snapshot age in seconds. Defaults to 300.
+            check_seconds (float, optional): minimum seconds between watermark checks. Defaults to 15.
+        """
+        self.network = network
+        self.ttl = ttl
+        self.check_seconds = check_seconds
+
+        self._lock = threading.RLock()
+        # token address: usd price
+        self._prices: dict[str, float] = {}
+        self._watermark = None
+        self._loaded_at = None
+        self._checked_at = None
+        self.version = 0
+
+    # PUBLIC
+
+    def get(self, address: str, default: float | None = None) -> float | None:
+        """Latest usd price of a token
+
+        Args:
+            address (str): token address
+            default (float | None, optional): returned when not found. Defaults to None.
+        """
+        return self.prices.get(address, default)
+
+    @property
+    def prices(self) -> dict[str, float]:
+        """Latest usd prices { token address: price } ( do not modify )"""
+        self._refresh()
+        return self._prices
+
+    def invalidate(self):
+        """Reload on next access"""
+        with self._lock:
+            self._loaded_at = None
+
+    # INTERNAL
+
+    def _refresh(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._loaded_at is None or now - self._loaded_at >= self.ttl:
+                self._load()
+            elif now - self._checked_at >= self.check_seconds:
+                self._checked_at = now
+                if self._get_watermark() != self._watermark:
+                    self._load()
+
+    def _load(self):
+        if (
+            items := self._query_database(
+                find={"network": self.network},
+                projection={"_id": 0, "address": 1, "price": 1, "timestamp": 1},
+            )
+        ) is None:
+            # keep the current snapshot and retry on next access
+            return
+
+        prices = {}
+        watermark = None
+        for item in items:
+            prices[item["address"]] = item["price"]
+            if watermark is None or item.get("timestamp", 0) > watermark:
+                watermark = item.get("timestamp", 0)
+
+        self._prices = prices
+        self._watermark = watermark
+        self._loaded_at = self._checked_at = time.monotonic()
+        self.version += 1
+        logging.getLogger(__name__).debug(
+            f" {len(prices)} {self.network} latest prices loaded ( version {self.version} )"
+        )
+
+    def _get_watermark(self) -> int | None:
+        """Latest price update timestamp"""
+        if items := self._query_database(
+            find={"network": self.network},
+            projection={"_id": 0, "timestamp": 1},
+            sort=[("timestamp", -1)],
+            limit=1,
+        ):
+            return items[0].get("timestamp", 0)
+        return None
+
+    def _query_database(self, find: dict, **kwargs) -> list[dict] | None:
+        try:
+            return database_global(
+                mongo_url=CONFIGURATION["sources"]["database"]["mongo_server_url"]
+            ).get_items_from_database(
+                collection_name="current_usd_prices", find=find, **kwargs
+            )
+        except Exception as e:
+            logging.getLogger(__name__).error(
+                f" Could not get {self.network} latest prices from database. error: {e}"
+            )
+            return None
+
+
+# one snapshot per network ( and process )
+LATEST_PRICE_SNAPSHOTS = {}
+LATEST_PRICE_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def get_latest_price_snapshot(network: str) -> latest_price_snapshot:
+    with LATEST_PRICE_SNAPSHOTS_LOCK:
+        if network not in LATEST_PRICE_SNAPSHOTS:
+            LATEST_PRICE_SNAPSHOTS[network] = latest_price_snapshot(network=network)
+        return LATEST_PRICE_SNAPSHOTS[network]
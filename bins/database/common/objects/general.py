@@ -6,7 +6,7 @@ import logging
 from bson import ObjectId
 
 
-@dataclass
+@dataclass(slots=True)
 class token_group_object:
     token0: int | Decimal = None
     token1: int | Decimal = None
@@ -75,15 +75,20 @@ class dict_to_object:
         return None
 
     def __sub__(self, other):
-        # create new object
-        result = deepcopy(self)
+        # create new object ( without copying this one: its values are either replaced or immutable )
+        result = self.__class__.__new__(self.__class__)
         # loop thru all properties and substract from other object properties
-        for key, value in result.__dict__.items():
+        for key, value in self.__dict__.items():
             # check if property exists in other object
             if key in other.__dict__:
                 _value_processed = self.pre_subtraction(key=key, value=value)
                 if _value_processed != None:
-                    result.__dict__[key] = _value_processed
+                    # lists are the only mutable values kept
+                    result.__dict__[key] = (
+                        deepcopy(_value_processed)
+                        if isinstance(_value_processed, list)
+                        else _value_processed
+                    )
                     # if processed, continue
                     continue
 
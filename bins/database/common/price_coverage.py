@@ -0,0 +1,278 @@
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+from bins.configuration import CONFIGURATION
+from bins.database.common.database_ids import create_id_price
+from bins.database.common.db_collections_common import database_global
+from bins.general.enums import text_to_chain
+
+
+class price_coverage_index:
+    """Token blocks referenced by the hypervisor status of one network that have no usd price ( greater than zero ),
+    kept as one sorted array of blocks per token. It is built by streaming the status token blocks and checking them
+    against the database prices in batches ( only the missing blocks are kept ), rebuilt once older than max_age seconds
+    and updated in between as prices are saved ( add_prices ) and new status are queued ( add_references ).
+    Missing blocks of a token within a block range are found with binary searches.
+    """
+
+    def __init__(self, network: str, max_age: float = 3600, batch_size: int = 5000):
+        """
+
+        Args:
+            network (str):
+            max_age (float, optional): seconds before the index is rebuilt from the database. Defaults to 3600.
+            batch_size (int, optional): token blocks checked against the database prices at once. Defaults to 5000.
+        """
+        self.network = network
+        self.max_age = max_age
+        self.batch_size = batch_size
+
+        self._lock = threading.RLock()
+        # token address: sorted blocks
+        self._missing: dict[str, array] = {}
+        self._loaded_at: float | None = None
+
+    # PUBLIC
+
+    @property
+    def loaded(self) -> bool:
+        """Built and not expired"""
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.max_age
+        )
+
+    def load(self):
+        """(Re)build the index from the database"""
+        with self._lock:
+            missing = {}
+            for address, block in self._iter_missing_from_database():
+                missing.setdefault(address, array("q")).append(block)
+            for blocks in missing.values():
+                _sort_array(blocks, unique=True)
+
+            self._missing = missing
+            self._loaded_at = time.monotonic()
+            logging.getLogger(__name__).debug(
+                f" {self.network} price coverage loaded: {self.count_missing()} token blocks without price"
+            )
+
+    def invalidate(self):
+        """Rebuild on next access"""
+        with self._lock:
+            self._loaded_at = None
+
+    def missing(
+        self, address: str, block_ini: int = 0, block_end: int | None = None
+    ) -> list[int]:
+        """Blocks of a token without price, between two blocks ( both included )
+
+        Args:
+            address (str): token address
+            block_ini (int, optional): . Defaults to 0.
+            block_end (int | None, optional): . Defaults to any.
+        """
+        self._check_loaded()
+        with self._lock:
+            if (blocks := self._missing.get(address.lower())) is None:
+                return []
+            ini, end = _range(blocks, block_ini, block_end)
+            return blocks[ini:end].tolist()
+
+    def count_missing(
+        self,
+        address: str | None = None,
+        block_ini: int = 0,
+        block_end: int | None = None,
+    ) -> int:
+        """Number of blocks without price of a token ( or all ) between two blocks ( both included )"""
+        self._check_loaded()
+        with self._lock:
+            tokens = (
+                [self._missing.get(address.lower())]
+                if address
+                else list(self._missing.values())
+            )
+            total = 0
+            for blocks in tokens:
+                if blocks:
+                    ini, end = _range(blocks, block_ini, block_end)
+                    total += end - ini
+            return total
+
+    def iter_missing(self, block_ini: int = 0, block_end: int | None = None):
+        """Yield the token blocks without price between two blocks ( both included )
+
+        Yields:
+            tuple[str, int]: token address, block
+        """
+        self._check_loaded()
+        with self._lock:
+            items = []
+            for address, blocks in self._missing.items():
+                ini, end = _range(blocks, block_ini, block_end)
+                items += [(address, block) for block in blocks[ini:end]]
+        yield from items
+
+    def add_prices(self, items: list[tuple[str, int]]):
+        """Register prices saved to database
+
+        Args:
+            items (list[tuple[str, int]]): token address, block
+        """
+        if not self.loaded:
+            return
+        with self._lock:
+            for address, block in items:
+                if (blocks := self._missing.get(address.lower())) is not None:
+                    _remove(blocks, int(block))
+
+    def add_references(self, items: list[tuple[str, int]]):
+        """Register token blocks without price referenced by new hypervisor status
+
+        Args:
+            items (list[tuple[str, int]]): token address, block
+        """
+        if not self.loaded:
+            return
+        with self._lock:
+            for address, block in items:
+                _insert(
+                    self._missing.setdefault(address.lower(), array("q")), int(block)
+                )
+
+    # INTERNAL
+
+    def _check_loaded(self):
+        if not self.loaded:
+            self.load()
+
+    def _iter_missing_from_database(self):
+        """Yield the status token blocks without price, checked against the database prices in batches
+
+        Yields:
+            tuple[str, int]: token address, block
+        """
+        items = []
+        for item in self._iter_referenced():
+            items.append(item)
+            if len(items) >= self.batch_size:
+                priced = self._get_priced(items=items)
+                yield from (x for x in items if x not in priced)
+                items = []
+        if items:
+            priced = self._get_priced(items=items)
+            yield from (x for x in items if x not in priced)
+
+    def _get_priced(self, items: list[tuple[str, int]]) -> set[tuple[str, int]]:
+        """Token blocks with price ( greater than zero ) of a batch
+
+        Args:
+            items (list[tuple[str, int]]): token address, block
+        """
+        # avoid circular imports
+        from apps.checks.helpers.database import get_prices_missing
+
+        ids = {
+            create_id_price(network=self.network, block=block, token_address=address): (
+                address,
+                block,
+            )
+            for address, block in items
+        }
+        missing = get_prices_missing(
+            database=database_global(
+                mongo_url=CONFIGURATION["sources"]["database"]["mongo_server_url"]
+            ),
+            ids=list(ids),
+        )
+        return {item for price_id, item in ids.items() if price_id not in missing}
+
+    def _iter_referenced(self):
+        """Yield the unique token blocks of the hypervisor status collection
+
+        Yields:
+            tuple[str, int]: token address, block
+        """
+        # avoid circular imports
+        from apps.checks.helpers.database import iter_status_token_blocks
+
+        for address, block in iter_status_token_blocks(
+            chain=text_to_chain(self.network), batch_size=self.batch_size
+        ):
+            yield address.lower(), int(block)
+
+
+def _range(blocks: array, block_ini: int, block_end: int | None) -> tuple[int, int]:
+    """Array slice of the blocks between block_ini and block_end ( both included )"""
+    return bisect_left(blocks, block_ini), (
+        len(blocks) if block_end is None else bisect_right(blocks, block_end)
+    )
+
+
+def _insert(blocks: array, block: int):
+    idx = bisect_left(blocks, block)
+    if idx == len(blocks) or blocks[idx] != block:
+        blocks.insert(idx, block)
+
+
+def _remove(blocks: array, block: int):
+    idx = bisect_left(blocks, block)
+    if idx < len(blocks) and blocks[idx] == block:
+        del blocks[idx]
+
+
+def _sort_array(blocks: array, unique: bool = False):
+    """Sort an array in place"""
+    blocks[:] = array("q", sorted(set(blocks) if unique else blocks))
+
+
+# one index per network ( and process )
+PRICE_COVERAGE_INDEXES = {}
+PRICE_COVERAGE_INDEXES_LOCK = threading.Lock()
+
+
+def get_price_coverage_index(network: str) -> price_coverage_index:
+    with PRICE_COVERAGE_INDEXES_LOCK:
+        if network not in PRICE_COVERAGE_INDEXES:
+            PRICE_COVERAGE_INDEXES[network] = price_coverage_index(network=network)
+        return PRICE_COVERAGE_INDEXES[network]
+
+
+def update_price_coverage(
+    network: str,
+    prices: list[tuple[str, int]] | None = None,
+    references: list[tuple[str, int]] | None = None,
+):
+    """Update the network price coverage index, when it has been loaded in this process ( and not expired )
+
+    Args:
+        network (str):
+        prices (list[tuple[str, int]] | None, optional): prices saved to database ( token address, block ). Defaults to None.
+        references (list[tuple[str, int]] | None, optional): token blocks without price of new status ( token address, block ). Defaults to None.
+    """
+    if (index := PRICE_COVERAGE_INDEXES.get(network)) is None:
+        return
+    if prices:
+        index.add_prices(items=prices)
+    if references:
+        index.add_references(items=references)
+
+
+def register_saved_prices(items: list[dict]):
+    """Bulk writer callback: register the usd prices saved to database in their network price coverage index
+
+    Args:
+        items (list[dict]): usd_prices items saved
+    """
+    prices = {}
+    for item in items:
+        if item.get("price", 0) > 0:
+            prices.setdefault(item["network"], []).append(
+                (item["address"], item["block"])
+            )
+    for network, network_prices in prices.items():
+        update_price_coverage(network=network, prices=network_prices)
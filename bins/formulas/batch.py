@@ -0,0 +1,237 @@
+# Batch ( array ) versions of the uniswap v3 formulas, with exact 256-bit results.
+#   Same names and results as the scalar functions in tick_math, liquidity_math, fees and full_math,
+#   but each argument is a sequence ( one item per position ).
+#   Big ints are kept in numpy object arrays so results are exact python ints;
+#   branches are solved with masks and per call checks are done once for the whole batch.
+#   When numpy is not installed, the scalar functions are mapped over the items.
+
+from .constants import MAX_TICK, MAX_UINT256, X128, FixedPoint96_Q96
+from . import fees as _fees
+from . import full_math as _full_math
+from . import liquidity_math as _liquidity_math
+from . import tick_math as _tick_math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# getSqrtRatioAtTick magic constants ( bit of the absolute tick, multiplier )
+_SQRT_RATIO_MULTIPLIERS = (
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+)
+
+
+def getSqrtRatioAtTick(ticks) -> list[int]:
+    """Calculates sqrt(1.0001^tick) * 2^96 of each tick
+
+    Args:
+        ticks (list[int]):
+
+    Returns:
+        list[int]: Q64.96 sqrt ratios ( numpy object array when numpy is available )
+    """
+    if np is None:
+        return [_tick_math.getSqrtRatioAtTick(int(x)) for x in ticks]
+
+    ticks = np.asarray(ticks, dtype=np.int64)
+    abs_ticks = np.abs(ticks)
+    if np.any(abs_ticks > MAX_TICK):
+        raise ValueError(" Tick is not within uniswap's min-max parameters")
+
+    ratio = np.full(len(ticks), 0x100000000000000000000000000000000, dtype=object)
+    ratio[(abs_ticks & 0x1) != 0] = 0xFFFCB933BD6FAD37AA2D162D1A594001
+    for bit, multiplier in _SQRT_RATIO_MULTIPLIERS:
+        if (mask := (abs_ticks & bit) != 0).any():
+            ratio[mask] = (ratio[mask] * multiplier) >> 128
+
+    if (mask := ticks > 0).any():
+        ratio[mask] = MAX_UINT256 // ratio[mask]
+
+    # Q128.128 to Q128.96 rounding up
+    return (ratio >> 32) + ((ratio & 0xFFFFFFFF) != 0).astype(object)
+
+
+def mulDiv(a, b, c) -> list[int]:
+    """Calculates floor(a×b÷denominator) of each item with full precision. Throws if any result overflows a uint256 or denominator == 0
+
+    Returns:
+        list[int]: 256-bit results
+    """
+    if np is None:
+        return [_full_math.mulDiv(x, y, z) for x, y, z in zip(a, b, c)]
+
+    result = _object_array(a) * _object_array(b) // _object_array(c)
+    _check_uint256(result)
+    return result
+
+
+def getAmountsForLiquidity(
+    sqrtRatioX96, sqrtRatioAX96, sqrtRatioBX96, liquidity
+) -> tuple[list[int], list[int]]:
+    """Token amounts of each position
+
+    Args:
+       sqrtRatioX96 (list[int]): current pool sqrt prices
+       sqrtRatioAX96 (list[int]): lower tick sqrt prices
+       sqrtRatioBX96 (list[int]): upper tick sqrt prices
+       liquidity (list[int]): positions liquidity
+
+    Returns:
+       tuple[list[int], list[int]]: amount0, amount1
+    """
+    if np is None:
+        result = [
+            _liquidity_math.getAmountsForLiquidity(x, a, b, l)
+            for x, a, b, l in zip(sqrtRatioX96, sqrtRatioAX96, sqrtRatioBX96, liquidity)
+        ]
+        return [x[0] for x in result], [x[1] for x in result]
+
+    current = _object_array(sqrtRatioX96)
+    ratio_a = _object_array(sqrtRatioAX96)
+    ratio_b = _object_array(sqrtRatioBX96)
+    liquidity = _object_array(liquidity)
+
+    amount0 = np.zeros(len(liquidity), dtype=object)
+    amount1 = np.zeros(len(liquidity), dtype=object)
+
+    # below range: all token0
+    below = current <= ratio_a
+    # in range: both tokens
+    within = ~below & (current < ratio_b)
+    # above range: all token1
+    above = ~below & ~within
+
+    if below.any():
+        amount0[below] = _amount0(
+            ratio_a[below], ratio_b[below], liquidity[below]
+        )
+    if within.any():
+        amount0[within] = _amount0(
+            current[within], ratio_b[within], liquidity[within]
+        )
+        amount1[within] = _amount1(
+            ratio_a[within], current[within], liquidity[within]
+        )
+    if above.any():
+        amount1[above] = _amount1(
+            ratio_a[above], ratio_b[above], liquidity[above]
+        )
+
+    return amount0, amount1
+
+
+def fees_uncollected_inRange(
+    liquidity,
+    tick,
+    tickUpper,
+    tickLower,
+    feeGrowthGlobal,
+    feeGrowthOutsideUpper,
+    feeGrowthOutsideLower,
+    feeGrowthInsideLast,
+) -> list[int]:
+    """Uncollected fees of each position
+        liquidity * ( pool fee returns at time T - pool fee returns at time 0 )  / 2^128
+
+    Returns:
+        list[int]: fees uncollected in range
+    """
+    if np is None:
+        return [
+            _fees.fees_uncollected_inRange(*x)
+            for x in zip(
+                liquidity,
+                tick,
+                tickUpper,
+                tickLower,
+                feeGrowthGlobal,
+                feeGrowthOutsideUpper,
+                feeGrowthOutsideLower,
+                feeGrowthInsideLast,
+            )
+        ]
+
+    tick = np.asarray(tick, dtype=np.int64)
+    feeGrowthGlobal = _object_array(feeGrowthGlobal)
+    feeGrowthOutsideUpper = _object_array(feeGrowthOutsideUpper)
+    feeGrowthOutsideLower = _object_array(feeGrowthOutsideLower)
+    feeGrowthInsideLast = _object_array(feeGrowthInsideLast)
+    _check_uint256(
+        feeGrowthGlobal,
+        feeGrowthOutsideUpper,
+        feeGrowthOutsideLower,
+        feeGrowthInsideLast,
+    )
+
+    # ( uint256 wrapping subtractions, like safe_math.sub(ui256=True) )
+    below = np.where(
+        tick >= np.asarray(tickLower, dtype=np.int64),
+        feeGrowthOutsideLower,
+        (feeGrowthGlobal - feeGrowthOutsideLower) & MAX_UINT256,
+    )
+    above = np.where(
+        tick >= np.asarray(tickUpper, dtype=np.int64),
+        (feeGrowthGlobal - feeGrowthOutsideUpper) & MAX_UINT256,
+        feeGrowthOutsideUpper,
+    )
+    inside = (((feeGrowthGlobal - below) & MAX_UINT256) - above) & MAX_UINT256
+
+    return mulDiv(
+        liquidity,
+        (inside - feeGrowthInsideLast) & MAX_UINT256,
+        np.full(len(inside), X128, dtype=object),
+    )
+
+
+# helpers
+def _amount0(ratio_a, ratio_b, liquidity):
+    # liquidity_math.getAmount0ForLiquidity
+    low = np.minimum(ratio_a, ratio_b)
+    high = np.maximum(ratio_a, ratio_b)
+    result = (liquidity << 96) * (high - low) // high
+    _check_uint256(result)
+    return result // low
+
+
+def _amount1(ratio_a, ratio_b, liquidity):
+    # liquidity_math.getAmount1ForLiquidity
+    result = (
+        liquidity
+        * (np.maximum(ratio_a, ratio_b) - np.minimum(ratio_a, ratio_b))
+        // FixedPoint96_Q96
+    )
+    _check_uint256(result)
+    return result
+
+
+def _object_array(values):
+    """python ints array ( no overflow )"""
+    if isinstance(values, np.ndarray) and values.dtype == object:
+        return values
+    return np.array([int(x) for x in values], dtype=object)
+
+
+def _check_uint256(*arrays):
+    for values in arrays:
+        if len(values) and ((values < 0).any() or (values > MAX_UINT256).any()):
+            raise ValueError("Input must be between 0 and 2^256 - 1")
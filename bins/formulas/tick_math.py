@@ -1,5 +1,6 @@
 # https://github.com/chainflip-io/chainflip-uniswapV3-python
-
+from functools import lru_cache
+import threading
 
 from .checks import checkInt24, checkUInt160
 from .constants import (
@@ -85,6 +86,63 @@ def getSqrtRatioAtTick(tick: int) -> int:
     return result
 
 
+class sqrt_ratio_table:
+    """Lazily built table of sqrt(1.0001^tick) * 2^96 for ticks multiple of a tick spacing.
+    Position ticks are always multiple of the pool tick spacing and repeat across every hypervisor status,
+    so each one is computed only once.
+    """
+
+    def __init__(self, tick_spacing: int = 1, max_size: int = 2**14):
+        self.tick_spacing = tick_spacing
+        # oldest ticks are dropped once max_size ratios are kept
+        self.max_size = max_size
+        self._ratios: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def getSqrtRatioAtTick(self, tick: int) -> int:
+        """Same as getSqrtRatioAtTick ( ticks not multiple of the tick spacing are not kept )"""
+        try:
+            return self._ratios[tick]
+        except KeyError:
+            ratio = getSqrtRatioAtTick(tick)
+            if tick % self.tick_spacing == 0:
+                with self._lock:
+                    while len(self._ratios) >= self.max_size:
+                        del self._ratios[next(iter(self._ratios))]
+                    self._ratios[tick] = ratio
+            return ratio
+
+    def price_float(
+        self, tick: int, token0_decimals: int, token1_decimals: int
+    ) -> float:
+        """Decimal adjusted price at tick"""
+        return sqrtPriceX96_to_price_float(
+            sqrtPriceX96=self.getSqrtRatioAtTick(tick),
+            token0_decimals=token0_decimals,
+            token1_decimals=token1_decimals,
+        )
+
+    def __len__(self) -> int:
+        return len(self._ratios)
+
+
+# one table per tick spacing ( and process )
+SQRT_RATIO_TABLES: dict[int, sqrt_ratio_table] = {}
+SQRT_RATIO_TABLES_LOCK = threading.Lock()
+
+
+def get_sqrt_ratio_table(tick_spacing: int = 1) -> sqrt_ratio_table:
+    with SQRT_RATIO_TABLES_LOCK:
+        if tick_spacing not in SQRT_RATIO_TABLES:
+            SQRT_RATIO_TABLES[tick_spacing] = sqrt_ratio_table(tick_spacing=tick_spacing)
+        return SQRT_RATIO_TABLES[tick_spacing]
+
+
+def getSqrtRatioAtTick_cached(tick: int, tick_spacing: int = 1) -> int:
+    """getSqrtRatioAtTick using the shared sqrt ratio table of the tick spacing"""
+    return get_sqrt_ratio_table(tick_spacing).getSqrtRatioAtTick(tick)
+
+
 def getTickAtSqrtRatio(sqrtPriceX96) -> int:
     """Calculates the greatest tick value such that getRatioAtTick(tick) <= ratio
 
@@ -189,6 +247,7 @@ def sqrtPriceX96_to_price_float(
     )
 
 
+@lru_cache(maxsize=2**16)
 def convert_tick_to_price(tick: int) -> float:
     """convert int ticks into not decimal adjusted float price
 
@@ -244,76 +303,12 @@ class TickMath:
         if tick < TickMath.MIN_TICK or tick > TickMath.MAX_TICK or type(tick) != int:
             raise ValueError(" Tick is not within uniswap's min-max parameters")
 
-        absTick: int = abs(tick)
-
-        ratio: int = (
-            0xFFFCB933BD6FAD37AA2D162D1A594001
-            if (absTick & 0x1) != 0
-            else 0x100000000000000000000000000000000
-        )
-
-        if (absTick & 0x2) != 0:
-            ratio = (ratio * 0xFFF97272373D413259A46990580E213A) >> 128
-
-        if (absTick & 0x4) != 0:
-            ratio = (ratio * 0xFFF2E50F5F656932EF12357CF3C7FDCC) >> 128
-
-        if (absTick & 0x8) != 0:
-            ratio = (ratio * 0xFFE5CACA7E10E4E61C3624EAA0941CD0) >> 128
+        return getSqrtRatioAtTick_cached(tick)
 
-        if (absTick & 0x10) != 0:
-            ratio = (ratio * 0xFFCB9843D60F6159C9DB58835C926644) >> 128
-
-        if (absTick & 0x20) != 0:
-            ratio = (ratio * 0xFF973B41FA98C081472E6896DFB254C0) >> 128
-
-        if (absTick & 0x40) != 0:
-            ratio = (ratio * 0xFF2EA16466C96A3843EC78B326B52861) >> 128
-
-        if (absTick & 0x80) != 0:
-            ratio = (ratio * 0xFE5DEE046A99A2A811C461F1969C3053) >> 128
-
-        if (absTick & 0x100) != 0:
-            ratio = (ratio * 0xFCBE86C7900A88AEDCFFC83B479AA3A4) >> 128
-
-        if (absTick & 0x200) != 0:
-            ratio = (ratio * 0xF987A7253AC413176F2B074CF7815E54) >> 128
-
-        if (absTick & 0x400) != 0:
-            ratio = (ratio * 0xF3392B0822B70005940C7A398E4B70F3) >> 128
-
-        if (absTick & 0x800) != 0:
-            ratio = (ratio * 0xE7159475A2C29B7443B29C7FA6E889D9) >> 128
-
-        if (absTick & 0x1000) != 0:
-            ratio = (ratio * 0xD097F3BDFD2022B8845AD8F792AA5825) >> 128
-
-        if (absTick & 0x2000) != 0:
-            ratio = (ratio * 0xA9F746462D870FDF8A65DC1F90E061E5) >> 128
-
-        if (absTick & 0x4000) != 0:
-            ratio = (ratio * 0x70D869A156D2A1B890BB3DF62BAF32F7) >> 128
-
-        if (absTick & 0x8000) != 0:
-            ratio = (ratio * 0x31BE135F97D08FD981231505542FCFA6) >> 128
-
-        if (absTick & 0x10000) != 0:
-            ratio = (ratio * 0x9AA508B5B7A84E1C677DE54F3E99BC9) >> 128
-
-        if (absTick & 0x20000) != 0:
-            ratio = (ratio * 0x5D6AF8DEDB81196699C329225EE604) >> 128
-
-        if (absTick & 0x40000) != 0:
-            ratio = (ratio * 0x2216E584F5FA1EA926041BEDFE98) >> 128
-
-        if (absTick & 0x80000) != 0:
-            ratio = (ratio * 0x48A170391F7DC42444E8FA2) >> 128
-
-        if tick > 0:
-            ratio = ((2**256) - 1) // ratio
-
-        # back to Q96
-        return (ratio // X32) + 1 if ratio % X32 > 0 else ratio // X32
+    @staticmethod
+    def getSqrtRatioAtTick_table(tick_spacing: int = 1) -> sqrt_ratio_table:
+        """Shared sqrt ratio table of a tick spacing"""
+        return get_sqrt_ratio_table(tick_spacing)
 
     @staticmethod
     def getTickAtSqrtRatio(sqrtRatioX96: int) -> int:
@@ -1,7 +1,7 @@
 import sys
 import argparse
 
-from ..general.enums import Chain, Protocol, queueItemType
+from ..general.enums import Chain, Protocol, queueItemType, test_type
 
 
 # validations
@@ -179,7 +179,7 @@ def parse_commandLine_args():
     # tests
     par_test = exGroup.add_argument(
         "--test",
-        choices=["protocols", "hypervisors"],
+        choices=[x.value for x in test_type],
         help=" execute tests ",
     )
 
@@ -391,6 +391,26 @@ class frontendType(str, Enum):
     REVENUE_STATS_DAILY = "revenue_stats_daily"
 
 
+class test_type(str, Enum):
+    """Tests executed with the --test command line option ( see tests/test.py )"""
+
+    Protocols = "protocols"
+    Hypervisors = "hypervisors"
+    Formulas = "formulas"
+    Thegraph = "thegraph"
+    ContractCreation = "contract_creation"
+    LatestPrices = "latest_prices"
+    Rewarders = "rewarders"
+    Registries = "registries"
+    Transfers = "transfers"
+    PriceCoverage = "price_coverage"
+    Etherscan = "etherscan"
+    QueueDependencies = "queue_dependencies"
+    Returns = "returns"
+    ListSync = "list_sync"
+    StatusChecks = "status_checks"
+
+
 class cuType(str, Enum):
     """Computer units used by RPC providers"""
 
@@ -1,4 +1,9 @@
+import contextlib
+from email.utils import parsedate_to_datetime
+import hashlib
 import json
+import os
+import struct
 from websocket import create_connection, WebSocketConnectionClosedException
 import sys
 from datetime import datetime, timezone, timedelta
@@ -7,6 +12,12 @@ import logging
 import time
 import threading
 
+try:
+    import fcntl
+except ImportError:
+    # no file locks available: rate limits are not shared between processes
+    fcntl = None
+
 from requests import exceptions as req_exceptions
 
 
@@ -63,6 +74,7 @@ def get_request(
     max_retry: int = 2,
     wait_secs: int = 5,
     timeout_secs: int = 10,
+    session: requests.Session | None = None,
 ) -> dict:
     try:
         return get_response(
@@ -71,6 +83,7 @@ def get_request(
             max_retry=max_retry,
             wait_secs=wait_secs,
             timeout_secs=timeout_secs,
+            session=session,
         ).json()
     except Exception as e:
         pass
@@ -82,10 +95,15 @@ def get_response(
     max_retry: int = 2,
     wait_secs: int = 5,
     timeout_secs: int = 10,
+    session: requests.Session | None = None,
 ):
+    """
+    Args:
+        session (requests.Session | None, optional): reuse its connections ( see get_session ). Defaults to a new connection.
+    """
     # query url
     try:
-        return requests.get(url=url, timeout=timeout_secs)
+        return (session or requests).get(url=url, timeout=timeout_secs)
 
     except (req_exceptions.ConnectionError, ConnectionError) as err:
         # wait and try one last time
@@ -109,17 +127,245 @@ def get_response(
             max_retry=max_retry,
             wait_secs=wait_secs,
             timeout_secs=timeout_secs,
+            session=session,
         )
 
 
+# shared http sessions  { (name, process id): requests.Session }
+SESSIONS = {}
+SESSIONS_LOCK = threading.Lock()
+
+
+def get_session(name: str, pool_maxsize: int = 10) -> requests.Session:
+    """Get the http session shared by all threads of this process for an api:
+        connections are kept alive and reused by all requests to the same host
+
+    Args:
+        name (str): like etherscan
+        pool_maxsize (int, optional): connections kept per host. Defaults to 10.
+
+    Returns:
+        requests.Session:
+    """
+    # connections can't be shared with forked processes
+    key = (name, os.getpid())
+    with SESSIONS_LOCK:
+        if key not in SESSIONS:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            SESSIONS[key] = session
+        return SESSIONS[key]
+
+
+class token_bucket:
+    """Token bucket rate limiter.
+    When a name is provided, its state is saved in a small file locked while in use,
+    so all threads and processes ( pool workers ) using the same name share the same limit.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        name: str | None = None,
+        folder: str = "data/cache/rate_limits",
+    ):
+        """
+        Args:
+            rate (float): tokens added per second
+            capacity (float | None, optional): maximum tokens ( burst ). Defaults to max(1, rate).
+            name (str | None, optional): shared state name. Defaults to None ( not shared ).
+            folder (str, optional): shared state folder. Defaults to "data/cache/rate_limits".
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1, rate)
+        self.name = name
+
+        self._lock = threading.Lock()
+        # [ tokens, last refill timestamp, blocked until timestamp ]
+        self._state = [self.capacity, time.time(), 0.0]
+
+        self._path = None
+        self._fd = None
+        self._fd_pid = None
+        if name and fcntl:
+            os.makedirs(folder, exist_ok=True)
+            self._path = os.path.join(folder, f"{name}.bucket")
+
+    def acquire(self, tokens: float = 1, timeout: float | None = None) -> bool:
+        """Wait ( sleeping ) till tokens are available and take them
+
+        Args:
+            tokens (float, optional): . Defaults to 1.
+            timeout (float | None, optional): maximum seconds to wait. Defaults to forever.
+
+        Returns:
+            bool: tokens taken or timed out
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._locked_state() as state:
+                now = time.time()
+                self._refill(state=state, now=now)
+                if state[2] > now:
+                    # backing off
+                    wait = state[2] - now
+                elif state[0] >= tokens:
+                    state[0] -= tokens
+                    return True
+                else:
+                    wait = (tokens - state[0]) / self.rate
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def backoff(self, seconds: float):
+        """Stop handing out tokens for some time ( ex: 429 responses )
+
+        Args:
+            seconds (float):
+        """
+        with self._locked_state() as state:
+            state[0] = 0
+            state[1] = time.time()
+            state[2] = max(state[2], time.time() + seconds)
+
+    def update_from_response(
+        self, response: requests.Response | None, default_backoff: float = 1
+    ):
+        """Feed response rate limit information back to the bucket:
+            Retry-After header ( seconds or http date ) or 429 status codes
+
+        Args:
+            response (requests.Response | None):
+            default_backoff (float, optional): seconds to back off on 429 without Retry-After. Defaults to 1.
+        """
+        if response is None:
+            return
+
+        if retry_after := response.headers.get("Retry-After"):
+            try:
+                seconds = float(retry_after)
+            except ValueError:
+                try:
+                    seconds = (
+                        parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)
+                    ).total_seconds()
+                except Exception:
+                    seconds = default_backoff
+            logging.getLogger(__name__).debug(
+                f" {self.name} rate limiter backing off {seconds} seconds ( Retry-After )"
+            )
+            self.backoff(seconds=max(seconds, 0))
+        elif response.status_code == 429:
+            logging.getLogger(__name__).debug(
+                f" {self.name} rate limiter backing off {default_backoff} seconds ( 429 )"
+            )
+            self.backoff(seconds=default_backoff)
+
+    def _refill(self, state: list, now: float):
+        state[0] = min(self.capacity, state[0] + (now - state[1]) * self.rate)
+        state[1] = now
+
+    @contextlib.contextmanager
+    def _locked_state(self):
+        with self._lock:
+            if not self._path:
+                yield self._state
+                return
+
+            # one file descriptor per process ( flock is shared by forked descriptors )
+            if self._fd_pid != os.getpid():
+                self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+                self._fd_pid = os.getpid()
+
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                data = os.pread(self._fd, 24, 0)
+                state = (
+                    list(struct.unpack("ddd", data))
+                    if len(data) == 24
+                    else [self.capacity, time.time(), 0.0]
+                )
+                yield state
+                os.pwrite(self._fd, struct.pack("ddd", *state), 0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+# shared rate limiters  { name: token_bucket }
+RATE_LIMITERS = {}
+RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(
+    api: str,
+    rate: float,
+    capacity: float | None = None,
+    key: str = "",
+    endpoint: str = "",
+) -> token_bucket:
+    """Get the rate limiter shared by all threads and processes for an api ( key and endpoint )
+        Configuration sources.rate_limits.<api> ( rate, capacity ) overrides the defaults
+
+    Args:
+        api (str): like coingecko, geckoterminal, thegraph...
+        rate (float): default requests per second
+        capacity (float | None, optional): default burst. Defaults to None.
+        key (str, optional): api key ( each key has its own limit ). Defaults to "".
+        endpoint (str, optional): endpoint ( when limits are per endpoint ). Defaults to "".
+
+    Returns:
+        token_bucket:
+    """
+    # do not expose api keys in file names
+    key_hash = hashlib.sha1(key.encode()).hexdigest()[:10] if key else ""
+    name = "_".join(
+        x for x in (api, key_hash, endpoint.replace("/", "-")) if x
+    )
+    with RATE_LIMITERS_LOCK:
+        if name not in RATE_LIMITERS:
+            # avoid circular imports
+            from ..configuration import CONFIGURATION
+
+            config = (
+                CONFIGURATION.get("sources", {}).get("rate_limits", {}).get(api, {})
+                or {}
+            )
+            RATE_LIMITERS[name] = token_bucket(
+                rate=config.get("rate", rate),
+                capacity=config.get("capacity", capacity),
+                name=name,
+                folder=os.path.join(
+                    CONFIGURATION.get("cache", {}).get("save_path", None)
+                    or "data/cache",
+                    "rate_limits",
+                ),
+            )
+        return RATE_LIMITERS[name]
+
+
 class rate_limit:
-    def __init__(self, rate_max_sec: float):
+    def __init__(self, rate_max_sec: float, name: str | None = None):
+        """
+        Args:
+            rate_max_sec (float): maximum requests per second
+            name (str | None, optional): api name to share the limit with all processes ( see get_rate_limiter ). Defaults to None ( this process only ).
+        """
         self.rate_max_sec: float = rate_max_sec
+        self.name = name
         self.rate_sec: int = 0
         self.rate_count_lastupdate: datetime = datetime.now(timezone.utc) - timedelta(
             hours=8
         )
         self.lock = threading.Lock()  # threading.RLock
+        # used to wait without spinning ( created when first needed )
+        self._bucket = None
 
     def hit(self) -> bool:
         """Report a query to rate limit and
@@ -153,27 +399,25 @@ class rate_limit:
 
     def continue_when_safe(self):
         """Wait here till rate is in bounds"""
-        _safe_break = datetime.now(timezone.utc)
-        while (self.im_safe) == False:
-            if (datetime.now(timezone.utc) - _safe_break).total_seconds() >= 30:
-                logging.getLogger(__name__).error(
-                    f"Waited for 30 seconds for rate limit to be safe.  Breaking."
-                )
-                return True
-            with self.lock:
-                if (
-                    datetime.now(timezone.utc) - self.rate_count_lastupdate
-                ).total_seconds() <= 1:
-                    # set current rate
-                    self.rate_sec += 1
-                else:
-                    self.rate_sec = 1
-                    # update last date
-                    self.rate_count_lastupdate = datetime.now(timezone.utc)
+        if not self._get_bucket().acquire(timeout=30):
+            logging.getLogger(__name__).error(
+                f"Waited for 30 seconds for rate limit to be safe.  Breaking."
+            )
+            return True
 
         # keep track
         self.hit()
 
+    def _get_bucket(self) -> token_bucket:
+        with self.lock:
+            if self._bucket is None:
+                self._bucket = (
+                    get_rate_limiter(api=self.name, rate=self.rate_max_sec)
+                    if self.name
+                    else token_bucket(rate=self.rate_max_sec)
+                )
+            return self._bucket
+
 
 # ws client
 class WebsocketClient(object):
@@ -1,6 +1,9 @@
+import atexit
 import os
+import queue
 import yaml
 import logging.config
+import logging.handlers
 import logging
 from . import telegram_logger
 
@@ -28,6 +31,11 @@ def setup_logging(customconf, default_level=logging.INFO, env_key="LOG_CFG"):
     telegram_logger.TELEGRAM_CHAT_ID = (
         customconf.get("logs", {}).get("telegram", {}).get("chat_id", "")
     )
+    telegram_logger.TELEGRAM_MIN_INTERVAL = (
+        customconf.get("logs", {})
+        .get("telegram", {})
+        .get("min_interval", telegram_logger.TELEGRAM_MIN_INTERVAL)
+    )
 
     # create logs dir if not exists
     if not os.path.exists(customconf["logs"]["save_path"]):
@@ -86,6 +94,10 @@ def setup_logging(customconf, default_level=logging.INFO, env_key="LOG_CFG"):
     # setup custom duplicate filter
     logging.getLogger().addFilter(DuplicateFilter())  # add the filter to it
 
+    # move handlers to a background thread
+    if customconf["logs"].get("background", False):
+        setup_background_logging()
+
 
 # NEW IMPLEMENTATION
 def setup_logging_module(
@@ -96,6 +108,8 @@ def setup_logging_module(
     telegram_token: str,
     telegram_chatid: str,
     default_level=logging.INFO,
+    background: bool = False,
+    telegram_min_interval: float | None = None,
 ):
     """Setup logging
 
@@ -107,12 +121,16 @@ def setup_logging_module(
         telegram_token (str): Telegram bot token
         telegram_chatid (str): Telegram chat id
         default_level (_type_, optional): Default. Defaults to logging.INFO.
+        background (bool, optional): handle log records in a background thread. Defaults to False.
+        telegram_min_interval (float | None, optional): minimum seconds between Telegram messages. Defaults to None.
     """
 
     # load telegram chatid n token
     telegram_logger.TELEGRAM_ENABLED = telegram_enabled
     telegram_logger.TELEGRAM_TOKEN = telegram_token
     telegram_logger.TELEGRAM_CHAT_ID = telegram_chatid
+    if telegram_min_interval is not None:
+        telegram_logger.TELEGRAM_MIN_INTERVAL = telegram_min_interval
 
     # create logs dir if not exists
     if not os.path.exists(save_path):
@@ -171,6 +189,111 @@ def setup_logging_module(
     # setup custom duplicate filter
     logging.getLogger().addFilter(DuplicateFilter())  # add the filter to it
 
+    # move handlers to a background thread
+    if background:
+        setup_background_logging()
+
+
+# BACKGROUND LOGGING
+#   Loggers only put records in a queue. One listener thread per process runs the
+#   configured handlers ( files, console, telegram...) routing each record to the
+#   handlers of the logger that created it.
+
+_BACKGROUND_LOGGING = {"queue_handlers": [], "routes": {}, "listener": None}
+
+
+def setup_background_logging() -> logging.handlers.QueueListener | None:
+    """Replace the configured logger handlers with queue handlers and
+    process the records in a background thread.
+    Call it after the logging configuration has been loaded.
+
+    Returns:
+        logging.handlers.QueueListener | None: the listener running the handlers
+    """
+    if _BACKGROUND_LOGGING["listener"]:
+        # already set
+        return _BACKGROUND_LOGGING["listener"]
+
+    log_queue = queue.SimpleQueue()
+    loggers = [logging.getLogger()] + [
+        logger
+        for logger in logging.root.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        if not logger.handlers:
+            continue
+        # save original handlers
+        _BACKGROUND_LOGGING["routes"][logger.name] = list(logger.handlers)
+        # replace them with a queue handler
+        queue_handler = routingQueueHandler(queue=log_queue, route=logger.name)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+        _BACKGROUND_LOGGING["queue_handlers"].append(queue_handler)
+
+    _start_background_listener(log_queue=log_queue)
+
+    # threads do not survive forks: restart the listener in child processes ( pool workers )
+    os.register_at_fork(after_in_child=_restart_background_listener)
+    # process the remaining records on exit
+    atexit.register(_stop_background_listener)
+
+    return _BACKGROUND_LOGGING["listener"]
+
+
+def _start_background_listener(log_queue: queue.SimpleQueue):
+    _BACKGROUND_LOGGING["listener"] = logging.handlers.QueueListener(
+        log_queue, routingHandler(routes=_BACKGROUND_LOGGING["routes"])
+    )
+    _BACKGROUND_LOGGING["listener"].start()
+
+
+def _restart_background_listener():
+    # use a new queue: the old one may have been locked at fork time
+    log_queue = queue.SimpleQueue()
+    for queue_handler in _BACKGROUND_LOGGING["queue_handlers"]:
+        queue_handler.queue = log_queue
+    _start_background_listener(log_queue=log_queue)
+
+
+def _stop_background_listener():
+    if listener := _BACKGROUND_LOGGING["listener"]:
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+
+class routingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler tagging records with the logger whose handlers must process them"""
+
+    def __init__(self, queue, route: str):
+        super().__init__(queue)
+        self.route = route
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.log_route = self.route
+        return record
+
+
+class routingHandler(logging.Handler):
+    """Send queued records to the original handlers of their logger"""
+
+    def __init__(self, routes: dict[str, list[logging.Handler]]):
+        super().__init__()
+        self.routes = routes
+
+    def handle(self, record):
+        for handler in self.routes.get(getattr(record, "log_route", None), []):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):
+        self.handle(record)
+
 
 class infoFilter(logging.Filter):
     def filter(self, rec):
@@ -1,3 +1,8 @@
+import collections
+import os
+import sys
+import threading
+import time
 import requests
 from logging import Handler, Formatter
 import logging
@@ -6,24 +11,100 @@ import datetime
 TELEGRAM_ENABLED = True
 TELEGRAM_TOKEN = ""
 TELEGRAM_CHAT_ID = ""
+TELEGRAM_MIN_INTERVAL = 3  # minimum seconds between telegram messages sent by the log handler
 
 
 class RequestsHandler(Handler):
+    """Telegram log handler.
+    Log entries are queued and sent in batches ( up to 4096 chars per message ) by a background thread,
+    so a slow Telegram API never stalls the thread logging.
+    """
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self._pending = collections.deque(maxlen=1000)
+        self._condition = threading.Condition()
+        self._sender_pid = None
+        self._sender_lock = threading.Lock()
+
     def emit(self, record):
-        if TELEGRAM_ENABLED == True:
-            log_entry = self.format(record)
-            payload = {
+        if TELEGRAM_ENABLED == True and TELEGRAM_TOKEN != "" and TELEGRAM_CHAT_ID != "":
+            try:
+                log_entry = self.format(record)
+                self._start_sender()
+                with self._condition:
+                    self._pending.append(log_entry)
+                    self._condition.notify()
+            except Exception:
+                self.handleError(record)
+
+    def close(self):
+        # send what is left ( best effort )
+        try:
+            with self._condition:
+                message = self._pop_message()
+            if message:
+                self._post(message)
+        except Exception:
+            pass
+        super().close()
+
+    def _start_sender(self):
+        # one sender thread per process ( threads do not survive forks )
+        if self._sender_pid == os.getpid():
+            return
+        with self._sender_lock:
+            # another thread may have started it while waiting
+            if self._sender_pid != os.getpid():
+                self._condition = threading.Condition()
+                threading.Thread(
+                    target=self._send_loop, name="telegram_logger", daemon=True
+                ).start()
+                self._sender_pid = os.getpid()
+
+    def _send_loop(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                message = self._pop_message()
+            try:
+                self._post(message)
+            except Exception as e:
+                # do not log here: it would end up in this same handler
+                if logging.raiseExceptions and sys.stderr:
+                    sys.stderr.write(
+                        f"--- Telegram log message could not be sent: {e}\n"
+                    )
+            # rate limit
+            time.sleep(TELEGRAM_MIN_INTERVAL)
+
+    def _pop_message(self) -> str:
+        """Join as many pending entries as possible in one message ( call it holding the condition )"""
+        entries = []
+        size = 0
+        while self._pending and size + len(self._pending[0]) + 1 <= 4096:
+            entry = self._pending.popleft()
+            entries.append(entry)
+            size += len(entry) + 1
+        if not entries and self._pending:
+            # entry too big for a single message
+            entries.append(self._pending.popleft()[:4096])
+        return "\n".join(entries)
+
+    @staticmethod
+    def _post(message: str):
+        return requests.post(
+            "https://api.telegram.org/bot{token}/sendMessage".format(
+                token=TELEGRAM_TOKEN
+            ),
+            data={
                 "chat_id": TELEGRAM_CHAT_ID,
-                "text": log_entry,
+                "text": message,
                 "parse_mode": "HTML",
-            }
-            if TELEGRAM_TOKEN != "" and TELEGRAM_CHAT_ID != "":
-                return requests.post(
-                    "https://api.telegram.org/bot{token}/sendMessage".format(
-                        token=TELEGRAM_TOKEN
-                    ),
-                    data=payload,
-                ).content
+            },
+            timeout=10,
+        ).content
 
 
 class LogstashFormatter(Formatter):
@@ -3,7 +3,6 @@ import sys
 import logging
 import time
 
-from ratelimit.exception import RateLimitException
 from bins.config.price.chainlink_feeds import CHAINLINK_USD_PRICE_FEEDS
 from bins.config.price.oneinch_contracts import ONEINCH_SPOT_PRICE_CONTRACTS
 
@@ -29,12 +28,12 @@ from ..configuration import (
 )
 from ..config.price.pools_price_paths import DEX_POOLS_PRICE_PATHS
 
-from ..database.common.db_collections_common import database_global
 from ..formulas.tick_math import sqrtPriceX96_to_price_float
 
 from ..general import file_utilities
 from ..general.enums import Chain, Protocol, databaseSource, text_to_chain
 from ..w3.builders import build_erc20_helper, build_protocol_pool
+from ..w3.helpers.block_time import get_block_time_service
 
 
 LOG_NAME = "price"
@@ -495,17 +494,12 @@ class price_scraper:
                 )
                 # convert block to timestamp
                 if timestamp:
-                    try:
-                        # get price at block
-                        _price = self.geckoterminal_price_connector.get_price_historic(
-                            network=network,
-                            token_address=token_id,
-                            before_timestamp=timestamp,
-                        )
-                    except RateLimitException as err:
-                        logging.getLogger(__name__).debug(
-                            f" geckoterminal auto rate limit fired"
-                        )
+                    # get price at block
+                    _price = self.geckoterminal_price_connector.get_price_historic(
+                        network=network,
+                        token_address=token_id,
+                        before_timestamp=timestamp,
+                    )
 
                     # if no historical price was found but timestamp is 5 minute close to current time, get current price
                     if _price in [0, None] and (time.time() - timestamp) <= (5 * 60):
@@ -598,22 +592,15 @@ class price_scraper:
 
     # HELPERS
     def _convert_block_to_timestamp(self, network: str, block: int) -> int:
-        # try database
+        # try known blocks ( memory, database ) and web3
         try:
-            # create global database manager
-            global_db = database_global(
-                mongo_url=CONFIGURATION["sources"]["database"]["mongo_server_url"]
-            )
-            return global_db.get_items_from_database(
-                collection_name="blocks", find={"block": block}
-            )[0]["timestamp"]
-        except IndexError:
-            logging.getLogger(__name__).error(
-                f" {network}'s block {block} not found in database"
-            )
+            if timestamp := get_block_time_service(network=network).get_timestamp(
+                block=block
+            ):
+                return timestamp
         except Exception as e:
             logging.getLogger(LOG_NAME).exception(
-                f"Error while getting block {block} timestamp from database. Error: {e}"
+                f"Error while getting {network}'s block {block} timestamp. Error: {e}"
             )
 
         # try thegraph
@@ -629,7 +616,9 @@ class price_scraper:
                     logging.getLogger(__name__).error(
                         f"     --> {network}'s block {block} found in subgraph"
                     )
-
+                    get_block_time_service(network=network).add(
+                        block=block, timestamp=int(block_data["timestamp"])
+                    )
                     return block_data["timestamp"]
             else:
                 logging.getLogger(__name__).debug(
@@ -639,27 +628,8 @@ class price_scraper:
             logging.getLogger(LOG_NAME).exception(
                 f"Error while getting block {block} timestamp from thegraph. Error: {e}"
             )
-            return 0
-
-        # try web3
-        try:
-            # create an erc20 dummy token
-            from bins.w3.protocols.general import erc20
-
-            dummy = erc20(
-                address="0x0000000000000000000000000000000000000000", network=network
-            )
-            if block_data := dummy._getBlockData(block=block):
-                logging.getLogger(__name__).error(
-                    f"     --> {network}'s block {block} found placing web3 calls"
-                )
-                return block_data["timestamp"]
 
-        except Exception as e:
-            logging.getLogger(LOG_NAME).exception(
-                f"Error while getting block {block} timestamp from web3. Error: {e}"
-            )
-            return 0
+        return 0
 
     def _get_connector_candidates(self, network: str) -> dict:
         """get thegraph connectors with data for the specified network
@@ -0,0 +1,126 @@
+# Context-local cost accounting:
+#   RPC and database operations report their cost ( calls, compute units, bytes and wall time )
+#   to the tracker active in the current context ( ex: the queue item being processed ), if any.
+
+import contextvars
+from contextlib import contextmanager
+
+
+class cost_tracker:
+    def __init__(self, **labels):
+        # what is being tracked  ( ex: network, queue item type ... )
+        self.labels = labels
+        # { (kind, operation, source): { "calls", "cus", "bytes", "seconds" } }
+        self.costs = {}
+
+    def add(
+        self,
+        kind: str,
+        operation: str,
+        source: str = "",
+        cus: int = 0,
+        bytes: int = 0,
+        seconds: float = 0,
+        calls: int = 1,
+    ):
+        key = (kind, operation, source)
+        if key not in self.costs:
+            self.costs[key] = {"calls": 0, "cus": 0, "bytes": 0, "seconds": 0}
+        self.costs[key]["calls"] += calls
+        self.costs[key]["cus"] += cus
+        self.costs[key]["bytes"] += bytes
+        self.costs[key]["seconds"] += seconds
+
+    def totals(self, kind: str | None = None) -> dict:
+        """Aggregated costs
+
+        Args:
+            kind (str | None, optional): rpc or db. Defaults to all.
+
+        Returns:
+            dict: { "calls", "cus", "bytes", "seconds" }
+        """
+        result = {"calls": 0, "cus": 0, "bytes": 0, "seconds": 0}
+        for (_kind, _operation, _source), values in self.costs.items():
+            if kind and _kind != kind:
+                continue
+            for k, v in values.items():
+                result[k] += v
+        return result
+
+    def as_list(self) -> list[dict]:
+        return [
+            {"kind": kind, "operation": operation, "source": source, **values}
+            for (kind, operation, source), values in self.costs.items()
+        ]
+
+
+_CURRENT_TRACKER: contextvars.ContextVar[cost_tracker | None] = contextvars.ContextVar(
+    "cost_tracker", default=None
+)
+
+
+@contextmanager
+def track_costs(**labels):
+    """Track the costs of all operations executed within the context
+
+    Usage:
+        with track_costs(network="ethereum", type="price") as tracker:
+            ...
+        tracker.totals()
+    """
+    tracker = cost_tracker(**labels)
+    token = _CURRENT_TRACKER.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _CURRENT_TRACKER.reset(token)
+
+
+def is_tracking_costs() -> bool:
+    """Use it to avoid calculating expensive costs ( like bytes ) when nobody is tracking"""
+    return _CURRENT_TRACKER.get() is not None
+
+
+def report_cost(
+    kind: str,
+    operation: str,
+    source: str = "",
+    cus: int = 0,
+    bytes: int = 0,
+    seconds: float = 0,
+    calls: int = 1,
+):
+    """Add a cost to the current context tracker ( if any )
+
+    Args:
+        kind (str): rpc or db
+        operation (str): function name, rpc method or db command
+        source (str, optional): wrapper or database originating the cost. Defaults to "".
+        cus (int, optional): compute units. Defaults to 0.
+        bytes (int, optional): approximate response size. Defaults to 0.
+        seconds (float, optional): wall time. Defaults to 0.
+        calls (int, optional): Defaults to 1.
+    """
+    if (tracker := _CURRENT_TRACKER.get()) is not None:
+        tracker.add(
+            kind=kind,
+            operation=operation,
+            source=source,
+            cus=cus,
+            bytes=bytes,
+            seconds=seconds,
+            calls=calls,
+        )
+
+
+def source_from_module(module: str) -> str:
+    """Short cost source name from a wrapper module
+        bins.w3.protocols.uniswap.pool -> uniswap.pool
+
+    Args:
+        module (str): python module name
+    """
+    if ".protocols." in module:
+        return module.split(".protocols.", 1)[1]
+    return module.rsplit(".", 1)[-1]
@@ -0,0 +1,419 @@
+# Live queue telemetry:
+#   counters, histograms and gauges kept in memory, exposed through a local
+#   prometheus-style http endpoint and appended to a JSONL file.
+#   Pool workers send their queue item events to the main process using a multiprocessing queue.
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# histogram buckets ( upper bounds )
+PROCESSING_TIME_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 900, 3600)  # seconds
+LIFETIME_BUCKETS = (60, 300, 900, 3600, 21600, 86400, 604800)  # seconds
+RPC_CALLS_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000)  # calls
+
+
+class histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        # last position is +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.sum += value
+        self.count += 1
+        for idx, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                self.counts[idx] += 1
+                return
+        self.counts[-1] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "buckets": {
+                str(upper_bound): count
+                for upper_bound, count in zip(
+                    (*self.buckets, "+Inf"), self.cumulative_counts()
+                )
+            },
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+    def cumulative_counts(self) -> list[int]:
+        result = []
+        total = 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+class metrics_registry:
+    """Thread safe in-memory metrics store"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # { name: { labels tuple: value } }
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+        self._help = {}
+
+    def inc(self, name: str, labels: dict, value: float = 1, help: str = ""):
+        with self._lock:
+            key = self._labels_key(labels)
+            self._counters.setdefault(name, {})
+            self._counters[name][key] = self._counters[name].get(key, 0) + value
+            self._help.setdefault(name, help)
+
+    def set_gauge(self, name: str, labels: dict, value: float, help: str = ""):
+        with self._lock:
+            self._gauges.setdefault(name, {})[self._labels_key(labels)] = value
+            self._help.setdefault(name, help)
+
+    def observe(
+        self, name: str, labels: dict, value: float, buckets: tuple, help: str = ""
+    ):
+        with self._lock:
+            key = self._labels_key(labels)
+            self._histograms.setdefault(name, {})
+            if key not in self._histograms[name]:
+                self._histograms[name][key] = histogram(buckets=buckets)
+            self._histograms[name][key].observe(value)
+            self._help.setdefault(name, help)
+
+    def record_queue_item(self, event: dict):
+        """Add a queue item processing event ( check build_queue_item_event )
+
+        Args:
+            event (dict):
+        """
+        labels = {"network": event["network"], "type": event["type"]}
+        self.inc(
+            name="gamma_queue_items_total",
+            labels={**labels, "result": "ok" if event["result"] else "fail"},
+            help="Queue items processed",
+        )
+        self.observe(
+            name="gamma_queue_item_processing_seconds",
+            labels=labels,
+            value=event["processing_time"],
+            buckets=PROCESSING_TIME_BUCKETS,
+            help="Time since the queue item was picked until it was processed",
+        )
+        if event["result"]:
+            self.observe(
+                name="gamma_queue_item_lifetime_seconds",
+                labels=labels,
+                value=event["lifetime"],
+                buckets=LIFETIME_BUCKETS,
+                help="Time since the queue item was created until it was processed",
+            )
+        self.observe(
+            name="gamma_queue_item_rpc_calls",
+            labels=labels,
+            value=event["rpc_calls"],
+            buckets=RPC_CALLS_BUCKETS,
+            help="RPC calls made to process one queue item",
+        )
+        self.inc(
+            name="gamma_queue_rpc_calls_total",
+            labels=labels,
+            value=event["rpc_calls"],
+            help="RPC calls made processing queue items",
+        )
+        self.inc(
+            name="gamma_queue_rpc_compute_units_total",
+            labels=labels,
+            value=event["rpc_cus"],
+            help="RPC compute units spent processing queue items",
+        )
+        # rpc and db costs breakdown by kind and source ( wrapper or database )
+        for cost in event.get("costs", []):
+            cost_labels = {
+                "type": event["type"],
+                "kind": cost["kind"],
+                "source": cost["source"],
+            }
+            self.inc(
+                name="gamma_queue_cost_calls_total",
+                labels=cost_labels,
+                value=cost["calls"],
+                help="RPC/DB calls made processing queue items",
+            )
+            self.inc(
+                name="gamma_queue_cost_compute_units_total",
+                labels=cost_labels,
+                value=cost["cus"],
+                help="RPC compute units spent processing queue items",
+            )
+            self.inc(
+                name="gamma_queue_cost_bytes_total",
+                labels=cost_labels,
+                value=cost["bytes"],
+                help="Approximate RPC response bytes received processing queue items",
+            )
+            self.inc(
+                name="gamma_queue_cost_seconds_total",
+                labels=cost_labels,
+                value=cost["seconds"],
+                help="RPC/DB wall time spent processing queue items",
+            )
+
+    # exports
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "counters": {
+                    name: [
+                        {"labels": dict(key), "value": value}
+                        for key, value in values.items()
+                    ]
+                    for name, values in self._counters.items()
+                },
+                "gauges": {
+                    name: [
+                        {"labels": dict(key), "value": value}
+                        for key, value in values.items()
+                    ]
+                    for name, values in self._gauges.items()
+                },
+                "histograms": {
+                    name: [
+                        {"labels": dict(key), **hist.as_dict()}
+                        for key, hist in values.items()
+                    ]
+                    for name, values in self._histograms.items()
+                },
+            }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for kind, store in (("counter", self._counters), ("gauge", self._gauges)):
+                for name, values in store.items():
+                    lines.append(f"# HELP {name} {self._help.get(name, '')}")
+                    lines.append(f"# TYPE {name} {kind}")
+                    lines.extend(
+                        f"{name}{self._labels_text(key)} {value}"
+                        for key, value in values.items()
+                    )
+            for name, values in self._histograms.items():
+                lines.append(f"# HELP {name} {self._help.get(name, '')}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, hist in values.items():
+                    for upper_bound, count in zip(
+                        (*hist.buckets, "+Inf"), hist.cumulative_counts()
+                    ):
+                        lines.append(
+                            f"{name}_bucket{self._labels_text(key + (('le', str(upper_bound)),))} {count}"
+                        )
+                    lines.append(f"{name}_sum{self._labels_text(key)} {hist.sum}")
+                    lines.append(f"{name}_count{self._labels_text(key)} {hist.count}")
+
+        return "\n".join(lines) + "\n"
+
+    # helpers
+    @staticmethod
+    def _labels_key(labels: dict) -> tuple:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    @staticmethod
+    def _labels_text(key: tuple) -> str:
+        if not key:
+            return ""
+        return "{" + ",".join(f'{k}="{v}"' for k, v in key) + "}"
+
+
+# singleton
+METRICS = metrics_registry()
+
+# set at pool workers to send events to the main process
+_EVENTS_QUEUE = None
+
+
+def build_queue_item_event(
+    network: str,
+    queue_item,
+    result: bool,
+    rpc_calls: int = 0,
+    rpc_cus: int = 0,
+    costs: list[dict] | None = None,
+) -> dict:
+    """Create a serializable queue item processing event
+
+    Args:
+        network (str):
+        queue_item (QueueItem):
+        result (bool): processed successfully or not
+        rpc_calls (int, optional): rpc calls made while processing. Defaults to 0.
+        rpc_cus (int, optional): rpc compute units spent while processing. Defaults to 0.
+        costs (list[dict] | None, optional): cost_tracker.as_list() breakdown. Defaults to None.
+    """
+    curr_time = time.time()
+    return {
+        "timestamp": curr_time,
+        "network": network,
+        "type": str(getattr(queue_item.type, "value", queue_item.type)),
+        "id": queue_item.id,
+        "block": queue_item.block,
+        "count": queue_item.count,
+        "result": bool(result),
+        "processing_time": curr_time - queue_item.processing
+        if queue_item.processing
+        else 0,
+        "lifetime": curr_time - queue_item.creation,
+        "rpc_calls": rpc_calls,
+        "rpc_cus": rpc_cus,
+        "costs": costs or [],
+    }
+
+
+def report_queue_item_event(event: dict):
+    """Send the event to the main process when running in a pool worker,
+    or record it in this process registry otherwise
+
+    Args:
+        event (dict):
+    """
+    if _EVENTS_QUEUE is not None:
+        try:
+            _EVENTS_QUEUE.put_nowait(event)
+        except queue.Full:
+            logging.getLogger(__name__).debug(
+                f" Queue metrics events queue is full. Discarding event {event['id']}"
+            )
+        except Exception as e:
+            logging.getLogger(__name__).debug(
+                f" Can't send queue metrics event {event['id']} to main process: {e}"
+            )
+    else:
+        METRICS.record_queue_item(event)
+
+
+def init_worker_metrics(events_queue):
+    """multiprocessing Pool initializer: send worker events to the main process
+
+    Args:
+        events_queue (multiprocessing.Queue):
+    """
+    global _EVENTS_QUEUE
+    _EVENTS_QUEUE = events_queue
+
+
+# main process services
+
+
+def start_metrics_collector(events_queue, jsonl_path: str | None = None):
+    """Collect pool worker events into the main process registry ( and JSONL file ) using a daemon thread
+
+    Args:
+        events_queue (multiprocessing.Queue):
+        jsonl_path (str | None, optional): JSONL file to append events to. Defaults to None.
+    """
+    if jsonl_path:
+        os.makedirs(os.path.dirname(jsonl_path) or ".", exist_ok=True)
+
+    def _collect():
+        while True:
+            try:
+                event = events_queue.get()
+                METRICS.record_queue_item(event)
+                if jsonl_path:
+                    with open(jsonl_path, "a") as f:
+                        f.write(json.dumps(event) + "\n")
+            except Exception as e:
+                logging.getLogger(__name__).error(
+                    f" Error collecting queue metrics event: {e}"
+                )
+
+    thread = threading.Thread(target=_collect, name="queue_metrics", daemon=True)
+    thread.start()
+    return thread
+
+
+def start_queue_depth_updater(networks: list[str], interval: int = 60):
+    """Periodically set the queue depth gauges using a daemon thread
+
+    Args:
+        networks (list[str]):
+        interval (int, optional): seconds between updates. Defaults to 60.
+    """
+    # avoid circular imports
+    from bins.database.helpers import get_default_localdb
+
+    def _update():
+        while True:
+            for network in networks:
+                try:
+                    for item in get_default_localdb(
+                        network=network
+                    ).get_queue_depth():
+                        METRICS.set_gauge(
+                            name="gamma_queue_depth",
+                            labels={
+                                "network": network,
+                                "type": item["type"],
+                                "ready": item["ready"],
+                            },
+                            value=item["qtty"],
+                            help="Queue items waiting to be processed",
+                        )
+                except Exception as e:
+                    logging.getLogger(__name__).error(
+                        f" Error updating {network}'s queue depth metrics: {e}"
+                    )
+            time.sleep(interval)
+
+    thread = threading.Thread(target=_update, name="queue_depth", daemon=True)
+    thread.start()
+    return thread
+
+
+class _metrics_request_handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/metrics.json"):
+            body = json.dumps(METRICS.as_dict()).encode()
+            content_type = "application/json"
+        elif self.path.startswith("/metrics"):
+            body = METRICS.render_prometheus().encode()
+            content_type = "text/plain; version=0.0.4"
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # do not log every scrape
+        pass
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve /metrics ( prometheus text ) and /metrics.json using a daemon thread
+
+    Args:
+        port (int):
+        host (str, optional): Defaults to "127.0.0.1".
+    """
+    server = ThreadingHTTPServer((host, port), _metrics_request_handler)
+    threading.Thread(
+        target=server.serve_forever, name="metrics_server", daemon=True
+    ).start()
+    logging.getLogger(__name__).info(
+        f" Queue metrics endpoint listening at http://{host}:{port}/metrics"
+    )
+    return server
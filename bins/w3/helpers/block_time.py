@@ -0,0 +1,348 @@
+from array import array
+import bisect
+import logging
+import threading
+
+from bins.configuration import CONFIGURATION
+from bins.database.common.database_ids import create_id_block
+from bins.database.common.db_collections_common import database_global
+
+
+class block_time_service:
+    """Block <-> timestamp resolution for one network.
+    Known points ( loaded from the database "blocks" collection ) are kept in memory as sorted arrays,
+    so lookups are solved with bisect and only unknown blocks are queried on-chain ( interpolation search ).
+    Newly learned points are written back to the database.
+    """
+
+    def __init__(self, network: str, write_back: bool = True):
+        self.network = network
+        self.write_back = write_back
+
+        self._lock = threading.RLock()
+        self._loaded = False
+        # sorted by block ( timestamps are sorted too )
+        self._blocks = array("q")
+        self._timestamps = array("q")
+        # learned points pending to be saved to database
+        self._pending = {}
+        # web3 helper used when no helper is provided
+        self._helper = None
+
+    # PUBLIC
+
+    def get_timestamp(self, block: int, helper=None) -> int:
+        """Timestamp of a block
+
+        Args:
+            block (int):
+            helper (web3wrap, optional): wrapper to place on-chain queries with. Defaults to a dummy erc20.
+
+        Returns:
+            int: timestamp or 0 if not found
+        """
+        return self.get_timestamps(blocks=[block], helper=helper).get(block, 0)
+
+    def get_timestamps(self, blocks: list[int], helper=None) -> dict[int, int]:
+        """Timestamps of multiple blocks at once: memory, then a single database query, then on-chain
+
+        Args:
+            blocks (list[int]):
+            helper (web3wrap, optional): . Defaults to a dummy erc20.
+
+        Returns:
+            dict[int, int]: { block: timestamp }  ( blocks not found are not included )
+        """
+        self._load()
+
+        result = {}
+        missing = []
+        for block in set(blocks):
+            if (timestamp := self._known_timestamp(block)) is not None:
+                result[block] = timestamp
+            else:
+                missing.append(block)
+
+        if missing:
+            # other processes may have saved them meanwhile
+            for item in self._query_database(find={"block": {"$in": missing}}):
+                self.add(block=item["block"], timestamp=item["timestamp"], save=False)
+                result[item["block"]] = item["timestamp"]
+            missing = [x for x in missing if x not in result]
+
+        for block in missing:
+            try:
+                result[block] = self._fetch_timestamp(block=block, helper=helper)
+            except Exception as e:
+                logging.getLogger(__name__).error(
+                    f" Could not get {self.network}'s block {block} timestamp on-chain. error: {e}"
+                )
+
+        self.flush()
+        return result
+
+    def get_block(
+        self,
+        timestamp: int,
+        inexact_mode: str = "before",
+        eq_timestamp_position: str = "first",
+        helper=None,
+    ) -> int:
+        """Block number of a timestamp
+
+        Args:
+            timestamp (int):
+            inexact_mode (str, optional): "before" or "after" -> when no block has that exact timestamp, choose the block before or after. Defaults to "before".
+            eq_timestamp_position (str, optional): "first" or "last" block to choose when multiple blocks share the timestamp. Defaults to "first".
+            helper (web3wrap, optional): . Defaults to a dummy erc20.
+
+        Returns:
+            int: block number
+        """
+        if int(timestamp) == 0:
+            raise ValueError("Timestamp cannot be zero!")
+        if inexact_mode not in ("before", "after"):
+            raise ValueError(f" Inexact method chosen is not valid:->  {inexact_mode}")
+
+        self._load()
+        try:
+            # first block with timestamp >= objective
+            block = self._first_block_from(timestamp=timestamp, helper=helper)
+            if block is None:
+                # objective is later than the latest block
+                return self._latest(helper=helper)[0]
+
+            if self._known_timestamp(block) == timestamp:
+                if eq_timestamp_position == "last":
+                    # last block with the same timestamp
+                    if (
+                        next_block := self._first_block_from(
+                            timestamp=timestamp + 1, helper=helper
+                        )
+                    ) is not None:
+                        return next_block - 1
+                    return self._latest(helper=helper)[0]
+                return block
+
+            return max(block - 1, 1) if inexact_mode == "before" else block
+        finally:
+            self.flush()
+
+    def get_blocks(
+        self,
+        timestamps: list[int],
+        inexact_mode: str = "before",
+        eq_timestamp_position: str = "first",
+        helper=None,
+    ) -> dict[int, int]:
+        """Block numbers of multiple timestamps
+
+        Returns:
+            dict[int, int]: { timestamp: block }
+        """
+        result = {}
+        # sorted, so each search narrows the next one
+        for timestamp in sorted(set(timestamps)):
+            try:
+                result[timestamp] = self.get_block(
+                    timestamp=timestamp,
+                    inexact_mode=inexact_mode,
+                    eq_timestamp_position=eq_timestamp_position,
+                    helper=helper,
+                )
+            except Exception as e:
+                logging.getLogger(__name__).error(
+                    f" Could not get {self.network}'s block of timestamp {timestamp}. error: {e}"
+                )
+        return result
+
+    def add(self, block: int, timestamp: int, save: bool = True):
+        """Add a known block timestamp
+
+        Args:
+            block (int):
+            timestamp (int):
+            save (bool, optional): write it back to database. Defaults to True.
+        """
+        with self._lock:
+            idx = bisect.bisect_left(self._blocks, block)
+            if idx < len(self._blocks) and self._blocks[idx] == block:
+                return
+            self._blocks.insert(idx, block)
+            self._timestamps.insert(idx, timestamp)
+            if save and self.write_back:
+                self._pending[block] = timestamp
+
+    def flush(self):
+        """Save learned points to database ( in bulk )"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+
+        result = None
+        try:
+            # upserted with $set ( save_items_to_database returns None when not saved )
+            result = self._database().save_items_to_database(
+                data=[
+                    {
+                        "id": create_id_block(network=self.network, block=block),
+                        "network": self.network,
+                        "block": block,
+                        "timestamp": timestamp,
+                    }
+                    for block, timestamp in pending.items()
+                ],
+                collection_name="blocks",
+            )
+        except Exception as e:
+            logging.getLogger(__name__).error(
+                f" Could not save {len(pending)} {self.network} blocks to database. error: {e}"
+            )
+        if not result:
+            logging.getLogger(__name__).error(
+                f" {len(pending)} {self.network} blocks not saved to database. Will retry on next flush."
+            )
+            # keep them for the next flush ( newer points win )
+            with self._lock:
+                self._pending = {**pending, **self._pending}
+
+    # INTERNAL
+
+    def _load(self):
+        """Load all known points of the network from database ( once )"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            for item in self._query_database(find={}, sort=[("block", 1)]):
+                self.add(block=item["block"], timestamp=item["timestamp"], save=False)
+            logging.getLogger(__name__).debug(
+                f" {len(self._blocks)} {self.network} block timestamps loaded from database"
+            )
+
+    def _first_block_from(self, timestamp: int, helper=None) -> int | None:
+        """First block with timestamp >= objective
+
+        Returns:
+            int | None: None when the objective is later than the latest block
+        """
+        with self._lock:
+            idx = bisect.bisect_left(self._timestamps, timestamp)
+            lo = (
+                (self._blocks[idx - 1], self._timestamps[idx - 1]) if idx > 0 else None
+            )
+            hi = (
+                (self._blocks[idx], self._timestamps[idx])
+                if idx < len(self._blocks)
+                else None
+            )
+
+        if hi is None:
+            hi = self._latest(helper=helper)
+            if hi[1] < timestamp:
+                return None
+        if lo is None:
+            if (first := self._timestamp(block=1, helper=helper)) >= timestamp:
+                return 1
+            lo = (1, first)
+
+        if hi[0] - lo[0] > 1:
+            # points saved by other processes since loaded
+            for item in self._query_database(
+                find={"block": {"$gt": lo[0], "$lt": hi[0]}}
+            ):
+                self.add(block=item["block"], timestamp=item["timestamp"], save=False)
+                if item["timestamp"] >= timestamp:
+                    if item["block"] < hi[0]:
+                        hi = (item["block"], item["timestamp"])
+                elif item["block"] > lo[0]:
+                    lo = (item["block"], item["timestamp"])
+
+        # invariant:  lo timestamp < objective <= hi timestamp
+        step = 0
+        while hi[0] - lo[0] > 1:
+            step += 1
+            if step % 2 and hi[1] != lo[1]:
+                # interpolation
+                guess = lo[0] + int(
+                    (timestamp - lo[1]) * (hi[0] - lo[0]) / (hi[1] - lo[1])
+                )
+            else:
+                # bisection ( guarantees convergence when block times are irregular )
+                guess = (lo[0] + hi[0]) // 2
+            guess = min(max(guess, lo[0] + 1), hi[0] - 1)
+
+            guess_timestamp = self._timestamp(block=guess, helper=helper)
+            if guess_timestamp >= timestamp:
+                hi = (guess, guess_timestamp)
+            else:
+                lo = (guess, guess_timestamp)
+
+        return hi[0]
+
+    def _known_timestamp(self, block: int) -> int | None:
+        with self._lock:
+            idx = bisect.bisect_left(self._blocks, block)
+            if idx < len(self._blocks) and self._blocks[idx] == block:
+                return self._timestamps[idx]
+        return None
+
+    def _timestamp(self, block: int, helper=None) -> int:
+        if (timestamp := self._known_timestamp(block)) is not None:
+            return timestamp
+        return self._fetch_timestamp(block=block, helper=helper)
+
+    def _fetch_timestamp(self, block: int, helper=None) -> int:
+        block_data = self._get_helper(helper)._getBlockData(block)
+        self.add(block=block_data.number, timestamp=block_data.timestamp)
+        return block_data.timestamp
+
+    def _latest(self, helper=None) -> tuple[int, int]:
+        block_data = self._get_helper(helper)._getBlockData("latest")
+        self.add(block=block_data.number, timestamp=block_data.timestamp)
+        return block_data.number, block_data.timestamp
+
+    def _get_helper(self, helper=None):
+        if helper:
+            return helper
+        if self._helper is None:
+            # avoid circular imports
+            from bins.w3.protocols.general import erc20
+
+            self._helper = erc20(
+                address="0x0000000000000000000000000000000000000000",
+                network=self.network,
+            )
+        return self._helper
+
+    def _query_database(self, find: dict, **kwargs) -> list[dict]:
+        try:
+            return self._database().get_items_from_database(
+                collection_name="blocks",
+                find={"network": self.network, **find},
+                projection={"_id": 0, "block": 1, "timestamp": 1},
+                **kwargs,
+            )
+        except Exception as e:
+            logging.getLogger(__name__).error(
+                f" Could not get {self.network} blocks from database. error: {e}"
+            )
+            return []
+
+    def _database(self) -> database_global:
+        return database_global(
+            mongo_url=CONFIGURATION["sources"]["database"]["mongo_server_url"]
+        )
+
+
+# one service per network ( and process )
+BLOCK_TIME_SERVICES = {}
+BLOCK_TIME_SERVICES_LOCK = threading.Lock()
+
+
+def get_block_time_service(network: str) -> block_time_service:
+    with BLOCK_TIME_SERVICES_LOCK:
+        if network not in BLOCK_TIME_SERVICES:
+            BLOCK_TIME_SERVICES[network] = block_time_service(network=network)
+        return BLOCK_TIME_SERVICES[network]
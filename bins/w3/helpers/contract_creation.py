@@ -0,0 +1,235 @@
+import logging
+import threading
+
+from bins.apis.etherscan_utilities import etherscan_helper
+from bins.configuration import CONFIGURATION
+from bins.database.common.db_collections_common import database_local
+from bins.w3.helpers.block_time import block_time_service, get_block_time_service
+
+
+class contract_creation_index:
+    """Contract address -> creation ( creator, txHash, block, timestamp ) for one network.
+    Known creations are kept in memory and in the local database "contract_creation" collection.
+    Unknown ones are resolved in bulk using etherscan ( 5 addresses per call ) or, when no api key is
+    configured or etherscan does not know the contract, with a binary search over eth_getCode ( creator and txHash unknown ).
+    """
+
+    # etherscan getcontractcreation maximum addresses per call
+    ETHERSCAN_ADDRESSES_PER_CALL = 5
+
+    def __init__(
+        self,
+        network: str,
+        write_back: bool = True,
+        block_time: block_time_service | None = None,
+    ):
+        """
+        Args:
+            network (str):
+            write_back (bool, optional): save new creations to database. Defaults to True.
+            block_time (block_time_service | None, optional): creation timestamps source. Defaults to the network shared service.
+        """
+        self.network = network
+        self.write_back = write_back
+        self.block_time = block_time
+
+        self._lock = threading.RLock()
+        # address: creation data
+        self._items: dict[str, dict] = {}
+        # web3 helper used when no helper is provided
+        self._helper = None
+
+    # PUBLIC
+
+    def get(self, address: str, helper=None) -> dict | None:
+        """Creation of a contract
+
+        Args:
+            address (str): contract address
+            helper (web3wrap, optional): wrapper to place on-chain queries with. Defaults to a dummy erc20/bep20.
+
+        Returns:
+            dict | None: { "address", "creator", "txHash", "block", "timestamp" } or None when not found
+        """
+        return self.get_many(addresses=[address], helper=helper).get(address.lower())
+
+    def get_many(self, addresses: list[str], helper=None) -> dict[str, dict]:
+        """Creation of multiple contracts at once: memory, then a single database query,
+            then etherscan in bulk and finally on-chain
+
+        Args:
+            addresses (list[str]): contract addresses
+            helper (web3wrap, optional): . Defaults to a dummy erc20/bep20.
+
+        Returns:
+            dict[str, dict]: { address ( lower ): creation data }  ( addresses not found are not included )
+        """
+        addresses = {x.lower() for x in addresses}
+
+        with self._lock:
+            result = {x: self._items[x] for x in addresses if x in self._items}
+        missing = [x for x in addresses if x not in result]
+
+        if missing:
+            for item in self._query_database(find={"address": {"$in": missing}}):
+                result[item["address"]] = self._add(item=item, save=False)
+            missing = [x for x in missing if x not in result]
+
+        cg_helper = etherscan_helper(api_keys=CONFIGURATION["sources"]["api_keys"])
+        if missing and cg_helper.has_api_key(network=self.network):
+            for item in self._fetch_etherscan(
+                addresses=missing, cg_helper=cg_helper, helper=helper
+            ):
+                result[item["address"]] = self._add(item=item)
+            missing = [x for x in missing if x not in result]
+
+        for address in missing:
+            try:
+                if item := self._fetch_onchain(address=address, helper=helper):
+                    result[address] = self._add(item=item)
+            except Exception as e:
+                logging.getLogger(__name__).error(
+                    f" Could not find {self.network}'s {address} contract creation on-chain. error: {e}"
+                )
+
+        return result
+
+    # INTERNAL
+
+    def _add(self, item: dict, save: bool = True) -> dict:
+        item = {
+            "address": item["address"],
+            "creator": item.get("creator"),
+            "txHash": item.get("txHash"),
+            "block": item["block"],
+            "timestamp": item["timestamp"],
+        }
+        with self._lock:
+            self._items[item["address"]] = item
+
+        if save and self.write_back:
+            try:
+                self._database().replace_item_to_database(
+                    data={"id": item["address"], **item},
+                    collection_name="contract_creation",
+                )
+            except Exception as e:
+                logging.getLogger(__name__).error(
+                    f" Could not save {self.network}'s {item['address']} contract creation to database. error: {e}"
+                )
+        return item
+
+    def _fetch_etherscan(
+        self, addresses: list[str], cg_helper: etherscan_helper, helper=None
+    ) -> list[dict]:
+        """Creation of contracts using etherscan ( creation tx ) and the tx receipt ( block )"""
+        result = []
+        for i in range(0, len(addresses), self.ETHERSCAN_ADDRESSES_PER_CALL):
+            for item in cg_helper.get_contract_creation(
+                network=self.network,
+                contract_addresses=addresses[i : i + self.ETHERSCAN_ADDRESSES_PER_CALL],
+            ):
+                try:
+                    if creation_tx := self._get_helper(helper)._getTransactionReceipt(
+                        txHash=item["txHash"]
+                    ):
+                        result.append(
+                            {
+                                "address": item["contractAddress"].lower(),
+                                "creator": item["contractCreator"].lower(),
+                                "txHash": item["txHash"],
+                                "block": creation_tx.blockNumber,
+                                "timestamp": self._block_time().get_timestamp(
+                                    block=creation_tx.blockNumber,
+                                    helper=self._get_helper(helper),
+                                ),
+                            }
+                        )
+                    else:
+                        logging.getLogger(__name__).error(
+                            f" Can't get the tx receipt for {item['txHash']}"
+                        )
+                except Exception as e:
+                    logging.getLogger(__name__).error(
+                        f" Error while fetching contract creation data from etherscan. error: {e}"
+                    )
+        return result
+
+    def _fetch_onchain(self, address: str, helper=None) -> dict | None:
+        """Creation block of a contract: first block with bytecode at the address ( binary search )
+
+        Returns:
+            dict | None: None when there is no bytecode at the latest block
+        """
+        _helper = self._get_helper(helper)
+        hi = _helper._getBlockData("latest").number
+        if not _helper._getCode(address=address, block=hi):
+            return None
+
+        # invariant: no bytecode at lo, bytecode at hi
+        lo = -1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if _helper._getCode(address=address, block=mid):
+                hi = mid
+            else:
+                lo = mid
+
+        return {
+            "address": address,
+            "creator": None,
+            "txHash": None,
+            "block": hi,
+            "timestamp": self._block_time().get_timestamp(block=hi, helper=_helper),
+        }
+
+    def _block_time(self) -> block_time_service:
+        return self.block_time or get_block_time_service(network=self.network)
+
+    def _get_helper(self, helper=None):
+        if helper:
+            return helper
+        if self._helper is None:
+            # avoid circular imports
+            from bins.w3.protocols.general import bep20, erc20
+
+            self._helper = (bep20 if self.network == "binance" else erc20)(
+                address="0x0000000000000000000000000000000000000000",
+                network=self.network,
+                block=0,
+            )
+        return self._helper
+
+    def _query_database(self, find: dict, **kwargs) -> list[dict]:
+        try:
+            return self._database().get_items_from_database(
+                collection_name="contract_creation",
+                find=find,
+                projection={"_id": 0, "id": 0},
+                **kwargs,
+            )
+        except Exception as e:
+            logging.getLogger(__name__).error(
+                f" Could not get {self.network} contract creations from database. error: {e}"
+            )
+            return []
+
+    def _database(self) -> database_local:
+        return database_local(
+            mongo_url=CONFIGURATION["sources"]["database"]["mongo_server_url"],
+            db_name=f"{self.network}_gamma",
+        )
+
+
+# one index per network ( and process )
+CONTRACT_CREATION_INDEXES = {}
+CONTRACT_CREATION_INDEXES_LOCK = threading.Lock()
+
+
+def get_contract_creation_index(network: str) -> contract_creation_index:
+    with CONTRACT_CREATION_INDEXES_LOCK:
+        if network not in CONTRACT_CREATION_INDEXES:
+            CONTRACT_CREATION_INDEXES[network] = contract_creation_index(
+                network=network
+            )
+        return CONTRACT_CREATION_INDEXES[network]
@@ -9,6 +9,7 @@ import math
 from bins.config.current import BLOCKS_PER_SECOND
 
 from bins.w3.helpers.rpcs import RPC_MANAGER
+from bins.w3.helpers.block_time import get_block_time_service
 
 # from ..w3.protocols.gamma.collectors import data_collector_OLD
 from ..w3.protocols.general import erc20, bep20
@@ -481,7 +482,12 @@ class onchain_data_helper:
                 " blockBounds step not implemented: {}".format(step)
             )
 
-        raise NotImplementedError("not implemented")
+        # first block of the step period
+        return get_block_time_service(network=network).get_block(
+            timestamp=dt.datetime.timestamp(result_date_ini),
+            inexact_mode="after",
+            eq_timestamp_position="first",
+        )
 
     def convert_datetime_toComparable(
         self, date_ini: dt.datetime = None, date_end: dt.datetime = None, step="week"
@@ -19,7 +19,7 @@ from ....formulas.fees import feeGrowth_to_fee, fees_uncollected_inRange
 from ....formulas.position import (
     get_positionKey_algebra,
 )
-from ....formulas.tick_math import getSqrtRatioAtTick
+from ....formulas.tick_math import getSqrtRatioAtTick_cached
 from ....formulas.liquidity_math import getAmountsForLiquidity
 from ....general.enums import Protocol, error_identity, text_to_chain
 from ..base_wrapper import web3wrap
@@ -544,8 +544,11 @@ class poolv3(web3wrap):
         # get current tick from slot
         tickCurrent = slot0["tick"]
         sqrtRatioX96 = slot0["sqrtPriceX96"]
-        sqrtRatioAX96 = getSqrtRatioAtTick(tickLower)
-        sqrtRatioBX96 = getSqrtRatioAtTick(tickUpper)
+        # position ticks are multiple of the pool tick spacing: use it when already loaded ( multicall pools )
+        #  instead of calling tickSpacing ( an rpc call on non multicall pools )
+        tickSpacing = getattr(self, "_tickSpacing", None) or 1
+        sqrtRatioAX96 = getSqrtRatioAtTick_cached(tickLower, tickSpacing)
+        sqrtRatioBX96 = getSqrtRatioAtTick_cached(tickUpper, tickSpacing)
         # calc quantity from liquidity
         (
             result["qtty_token0"],
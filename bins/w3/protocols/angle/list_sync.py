@@ -0,0 +1,202 @@
+import logging
+import threading
+
+from ....general import file_utilities
+
+
+class append_only_list_sync:
+    """Persistent copy of an append-only contract list ( like merkl distributionList or campaignList ).
+    Already decoded items are kept in a file with their list index, so each sync only finds the current
+    list length ( exponential + k-ary search over the indexes that revert ) and fetches the new tail.
+    """
+
+    def __init__(
+        self,
+        network: str,
+        address: str,
+        list_name: str,
+        folder: str = "data/cache/merkl",
+    ):
+        """
+
+        Args:
+            network (str):
+            address (str): contract address
+            list_name (str): contract list function name
+            folder (str, optional): where to save the items. Defaults to "data/cache/merkl".
+        """
+        self.network = network
+        self.address = address.lower()
+        self.list_name = list_name
+        self.folder = folder
+        self.filename = f"{network}_{self.address}_{list_name}"
+
+        self._lock = threading.RLock()
+        _saved = (
+            file_utilities.load_json(filename=self.filename, folder_path=self.folder)
+            or {}
+        )
+        # decoded items only: anything after an item that could not be decoded is fetched again
+        self._items: list = _decoded_prefix(_saved.get("items", []))
+        # block of the last sync: known items exist at any later block
+        self._block: int = _saved.get("block", 0)
+
+    @property
+    def high_water(self) -> int:
+        """Number of items already known ( and decoded )"""
+        return len(self._items)
+
+    def sync(
+        self,
+        fetch: callable,
+        block: int,
+        batch_size: int = 100,
+        probes: int = 16,
+        max_index: int = 2**20,
+    ) -> list:
+        """Items of the list at the fetch block
+
+        Args:
+            fetch (callable): fetch(indexes: list[int]) -> dict[int, any]   { index: decoded item } of the indexes that exist ( do not revert ).
+                            Existing items that can't be decoded shall be returned as None ( they are fetched again on next sync ).
+            block (int): block the fetch function queries
+            batch_size (int, optional): maximum indexes to fetch at once. Defaults to 100.
+            probes (int, optional): indexes to probe at once while searching the list length. Defaults to 16.
+            max_index (int, optional): maximum list length. Defaults to 2**20.
+
+        Returns:
+            list: items by index ( None when not decoded )
+        """
+        with self._lock:
+            # items fetched while searching
+            found = {}
+            length = self.find_length(
+                fetch=fetch,
+                probes=probes,
+                max_index=max_index,
+                found=found,
+                known=self.high_water if block >= self._block else 0,
+            )
+
+            items = list(self._items)
+            if length > len(items):
+                logging.getLogger(__name__).debug(
+                    f" {self.network} {self.address} {self.list_name}: {length - len(items)} new items to be fetched ( {len(items)} known )"
+                )
+                for ini in range(len(items), length, batch_size):
+                    end = min(ini + batch_size, length)
+                    if indexes := [x for x in range(ini, end) if x not in found]:
+                        found.update(fetch(indexes))
+                    # append in order, stop at the first index not found
+                    for idx in range(len(items), end):
+                        if idx not in found:
+                            break
+                        items.append(found[idx])
+                    if len(items) < end:
+                        logging.getLogger(__name__).error(
+                            f" {self.network} {self.address} {self.list_name}: index {len(items)} could not be fetched. Syncing will continue on next run."
+                        )
+                        break
+
+                # only decoded items are kept
+                decoded = _decoded_prefix(items)
+                if len(decoded) < len(items):
+                    logging.getLogger(__name__).warning(
+                        f" {self.network} {self.address} {self.list_name}: index {len(decoded)} could not be decoded. Items from it will be fetched again on next sync."
+                    )
+                if len(decoded) > self.high_water:
+                    self._items = decoded
+                    self._block = max(self._block, block)
+                    self.save()
+
+            return items[:length]
+
+    def find_length(
+        self,
+        fetch: callable,
+        probes: int = 16,
+        max_index: int = 2**20,
+        found: dict | None = None,
+        known: int = 0,
+    ) -> int:
+        """Current length of the list, probing indexes from the known length
+
+        Args:
+            fetch (callable): see sync
+            probes (int, optional): indexes to probe at once. Defaults to 16.
+            max_index (int, optional): maximum list length. Defaults to 2**20.
+            found (dict, optional): filled with the items fetched while probing. Defaults to None.
+            known (int, optional): number of items known to exist. Defaults to 0.
+
+        Returns:
+            int: list length
+        """
+        if found is None:
+            found = {}
+
+        # exponential: known + 2^k - 1
+        indexes = []
+        step = 1
+        while known + step - 1 < max_index:
+            indexes.append(known + step - 1)
+            step *= 2
+        lo, hi = self._bracket(
+            fetch=fetch, indexes=indexes, found=found, lo=known - 1
+        )
+        if hi is None:
+            logging.getLogger(__name__).warning(
+                f" {self.network} {self.address} {self.list_name} has more than {max_index} items"
+            )
+            return max_index
+
+        # k-ary search between the last existing and the first reverting index
+        while hi - lo > 1:
+            span = hi - lo
+            indexes = sorted(
+                {lo + max(1, span * x // (probes + 1)) for x in range(1, probes + 1)}
+                - {hi}
+            )
+            lo, hi = self._bracket(
+                fetch=fetch, indexes=indexes, found=found, lo=lo, hi=hi
+            )
+
+        return lo + 1
+
+    def save(self):
+        file_utilities.save_json(
+            filename=self.filename,
+            data={
+                "network": self.network,
+                "address": self.address,
+                "list_name": self.list_name,
+                "block": self._block,
+                "items": self._items,
+            },
+            folder_path=self.folder,
+        )
+
+    def _bracket(
+        self,
+        fetch: callable,
+        indexes: list[int],
+        found: dict,
+        lo: int,
+        hi: int | None = None,
+    ) -> tuple[int, int | None]:
+        """Last existing and first missing index after probing indexes ( sorted )"""
+        result = fetch([x for x in indexes if x not in found])
+        found.update(result)
+        for idx in indexes:
+            if idx in found:
+                lo = idx
+            else:
+                return lo, idx
+        return lo, hi
+
+
+def _decoded_prefix(items: list) -> list:
+    """Items before the first one that could not be decoded ( None )"""
+    for idx, item in enumerate(items):
+        if item is None:
+            return items[:idx]
+    return items
@@ -8,6 +8,7 @@ from ....configuration import TOKEN_ADDRESS_EXCLUDE
 from ....general.enums import rewarderType, text_to_chain
 
 from ..gamma.rewarder import gamma_rewarder
+from .list_sync import append_only_list_sync
 
 
 class angle_merkle_distributor_v2(gamma_rewarder):
@@ -454,7 +455,7 @@ class angle_merkle_distributor_creator(gamma_rewarder):
                     "boostedReward": _data_decoded[6],
                     "whitelist": _data_decoded[7],
                     "blacklist": _data_decoded[8],
-                    "extra": _data_decoded[9],
+                    "extra": "0x" + _data_decoded[9].hex(),
                 },
             }
         except Exception as e:
@@ -471,71 +472,26 @@ class angle_merkle_distributor_creator(gamma_rewarder):
         result = []
 
         if multicall:
-            # create all calls
-            _calls = [
-                build_call_with_abi_part(
-                    abi_part=self.get_abi_function("distributionList"),
-                    inputs_values=[i],
-                    address=self.address,
-                    object="merkl_distributor",
-                )
-                for i in range(0, max_index)
-            ]
-
-            logging.getLogger(__name__).info(
-                f" {self._network}: {len(_calls)} fn calls will be executed for {self._address} angle merkl distributor, meaning that will be splited in {round(len(_calls)/max_calls_atOnce):,.0f} batches of {max_calls_atOnce} function calls, for each web3 call to RPC."
-            )
-
-            # execute multicall in batches
-            for i in range(0, len(_calls), max_calls_atOnce):
-                # get multicall data
-                _tmp_multicall_data = execute_parse_calls(
+            # only the distributions not already known are fetched
+            result = [
+                x
+                for x in append_only_list_sync(
                     network=self._network,
+                    address=self.address,
+                    list_name="distributionList",
+                ).sync(
+                    fetch=lambda indexes: self._fetch_list_items(
+                        function_name="distributionList",
+                        indexes=indexes,
+                        decode=self._format_distribution,
+                        max_calls_atOnce=max_calls_atOnce,
+                    ),
                     block=self.block,
-                    calls=_calls[i : i + max_calls_atOnce],
-                    convert_bint=False,
-                    requireSuccess=False,
-                    timestamp=self._timestamp,
+                    batch_size=max_calls_atOnce,
+                    max_index=max_index,
                 )
-                # convert and add temporary data to multicall_result
-                _errors = 0
-                for itm in _tmp_multicall_data:
-                    if not itm["outputs"]:
-                        logging.getLogger(__name__).debug(
-                            f" Bruteforce index multicall stopped bc no results found in a call."
-                        )
-                        _errors += max_calls_atOnce
-                        break
-                    try:
-                        result.append(
-                            {
-                                "rewardId": "0x" + itm["outputs"][0]["value"].hex(),
-                                "pool": itm["outputs"][1]["value"],
-                                "rewardToken": itm["outputs"][2]["value"],
-                                "amount": itm["outputs"][3]["value"],
-                                "propToken0": itm["outputs"][4]["value"],
-                                "propToken1": itm["outputs"][5]["value"],
-                                "propFees": itm["outputs"][6]["value"],
-                                "epochStart": itm["outputs"][7]["value"],
-                                "numEpoch": itm["outputs"][8]["value"],
-                                "isOutOfRangeIncetivized": itm["outputs"][9]["value"],
-                                "boostedReward": itm["outputs"][10]["value"],
-                                "boostingAddress": itm["outputs"][11]["value"],
-                                "additionalData": "0x"
-                                + itm["outputs"][12]["value"].hex(),
-                            }
-                        )
-                    except Exception as e:
-                        _errors += 1
-                        # abort on too many errors
-                        if _errors >= max_calls_atOnce * 0.10:
-                            logging.getLogger(__name__).debug(
-                                f" Bruteforce index multicall stopped bc no more results found in a loop"
-                            )
-                            break
-
-                if _errors >= max_calls_atOnce * 0.10:
-                    break
+                if x
+            ]
 
         else:
             logging.getLogger(__name__).debug(
@@ -606,65 +562,30 @@ class angle_merkle_distributor_creator(gamma_rewarder):
         result = []
 
         if multicall:
-            # create all calls
-            _calls = [
-                build_call_with_abi_part(
-                    abi_part=self.get_abi_function("campaignList"),
-                    inputs_values=[i],
-                    address=self.address,
-                    object="merkl_distributor",
-                )
-                for i in range(0, max_index)
-            ]
-
-            logging.getLogger(__name__).info(
-                f" {self._network}: {len(_calls)} fn calls will be executed for {self._address} angle merkl distributor, meaning that will be splited in {round(len(_calls)/max_calls_atOnce):,.0f} batches of {max_calls_atOnce} function calls, for each web3 call to RPC."
-            )
-
-            # execute multicall in batches
-            for i in range(0, len(_calls), max_calls_atOnce):
-                # get multicall data
-                _tmp_multicall_data = execute_parse_calls(
+            # only the campaigns not already known are fetched
+            result = [
+                x
+                for x in append_only_list_sync(
                     network=self._network,
+                    address=self.address,
+                    list_name="campaignList",
+                ).sync(
+                    fetch=lambda indexes: self._fetch_list_items(
+                        function_name="campaignList",
+                        indexes=indexes,
+                        decode=lambda outputs: self.format_campaign(
+                            campaign_data=[outputs[i]["value"] for i in range(8)]
+                        ),
+                        max_calls_atOnce=max_calls_atOnce,
+                    ),
                     block=self.block,
-                    calls=_calls[i : i + max_calls_atOnce],
-                    convert_bint=False,
-                    requireSuccess=False,
-                    timestamp=self._timestamp,
+                    batch_size=max_calls_atOnce,
+                    max_index=max_index,
                 )
-                # convert and add temporary data to multicall_result
-                _errors = 0
-                for itm in _tmp_multicall_data:
-                    if not itm["outputs"]:
-                        logging.getLogger(__name__).debug(
-                            f" Bruteforce index multicall stopped bc no results found in a call."
-                        )
-                        _errors += max_calls_atOnce
-                        break
-                    try:
-                        result.append(
-                            self.format_campaign(
-                                campaign_data=[
-                                    itm["outputs"][i]["value"]
-                                    for i in range(8)
-                                    if f"0x{i[0].hex()}"
-                                    not in ANGLE_CAMPAIGN_IDS_EXCLUDE.get(
-                                        self._network, []
-                                    )
-                                ]
-                            )
-                        )
-                    except Exception as e:
-                        _errors += 1
-                        # abort on too many errors
-                        if _errors >= max_calls_atOnce * 0.25:
-                            logging.getLogger(__name__).debug(
-                                f" Bruteforce index multicall stopped bc no more results found in a loop"
-                            )
-                            break
-
-                if _errors >= max_calls_atOnce * 0.25:
-                    break
+                if x
+                and x["campaignId"]
+                not in ANGLE_CAMPAIGN_IDS_EXCLUDE.get(self._network, [])
+            ]
 
         else:
             logging.getLogger(__name__).debug(
@@ -688,6 +609,74 @@ class angle_merkle_distributor_creator(gamma_rewarder):
 
         return result
 
+    def _fetch_list_items(
+        self,
+        function_name: str,
+        indexes: list[int],
+        decode: callable,
+        max_calls_atOnce: int = 100,
+    ) -> dict[int, dict | None]:
+        """Get the items of a contract list at the indexes specified, using multicall
+
+        Args:
+            function_name (str): list function name
+            indexes (list[int]):
+            decode (callable): decode(outputs) -> dict | None
+            max_calls_atOnce (int, optional): . Defaults to 100.
+
+        Returns:
+            dict[int, dict | None]: { index: decoded item } of the existing indexes ( None when not decoded )
+        """
+        result = {}
+        for i in range(0, len(indexes), max_calls_atOnce):
+            _indexes = indexes[i : i + max_calls_atOnce]
+            _tmp_multicall_data = execute_parse_calls(
+                network=self._network,
+                block=self.block,
+                calls=[
+                    build_call_with_abi_part(
+                        abi_part=self.get_abi_function(function_name),
+                        inputs_values=[idx],
+                        address=self.address,
+                        object="merkl_distributor",
+                    )
+                    for idx in _indexes
+                ],
+                convert_bint=False,
+                requireSuccess=False,
+                timestamp=self._timestamp,
+            )
+            for idx, itm in zip(_indexes, _tmp_multicall_data):
+                if not itm["outputs"]:
+                    # index out of the list
+                    continue
+                try:
+                    result[idx] = decode(itm["outputs"])
+                except Exception as e:
+                    logging.getLogger(__name__).error(
+                        f" Error decoding {self._network} {self.address} {function_name} index {idx}: {e}"
+                    )
+                    result[idx] = None
+
+        return result
+
+    def _format_distribution(self, outputs: list[dict]) -> dict:
+        return {
+            "rewardId": "0x" + outputs[0]["value"].hex(),
+            "pool": outputs[1]["value"],
+            "rewardToken": outputs[2]["value"],
+            "amount": outputs[3]["value"],
+            "propToken0": outputs[4]["value"],
+            "propToken1": outputs[5]["value"],
+            "propFees": outputs[6]["value"],
+            "epochStart": outputs[7]["value"],
+            "numEpoch": outputs[8]["value"],
+            "isOutOfRangeIncetivized": outputs[9]["value"],
+            "boostedReward": outputs[10]["value"],
+            "boostingAddress": outputs[11]["value"],
+            "additionalData": "0x" + outputs[12]["value"].hex(),
+        }
+
     def get_active_campaigns_manual(self, pool_address: str | None = None):
         """Get all active campaigns using a manual loop
 
@@ -1,6 +1,7 @@
 from http.client import RemoteDisconnected
 import logging
 import math
+import time
 import datetime as dt
 
 import requests
@@ -9,6 +10,7 @@ from web3.contract import Contract
 from web3.middleware import geth_poa_middleware, simple_cache_middleware
 
 from ..helpers.rpcs import RPC_MANAGER, w3Provider
+from ..helpers.block_time import get_block_time_service
 from ...errors.general import ProcessingError
 
 from ...configuration import CONFIGURATION
@@ -16,6 +18,7 @@ from ...config.current import WEB3_CHAIN_IDS  # ,CFG
 from ...general import file_utilities
 from ...cache import cache_utilities
 from ...general.enums import Chain, cuType, error_identity, text_to_chain
+from ...performance.costs import is_tracking_costs, report_cost, source_from_module
 
 
 # main base class
@@ -161,6 +164,11 @@ class web3wrap:
         # where to find the abi files
         return CONFIGURATION.get("data", {}).get("abi_path", None) or "data/abi"
 
+    @property
+    def _cost_source(self) -> str:
+        """Name used to attribute rpc costs to this wrapper ( like uniswap.pool )"""
+        return source_from_module(type(self).__module__)
+
     @property
     def address(self) -> str:
         return self._address
@@ -232,8 +240,9 @@ class web3wrap:
         inexact_mode="before",
         eq_timestamp_position="first",
     ) -> int:
-        """Will
-           At least 15 queries are needed to come close to a timestamp block number
+        """Block number of a timestamp
+           Solved using the network's known block timestamps ( database ) and only placing on-chain queries
+           for blocks not known yet ( learned blocks are saved )
 
         Args:
            timestamp (dt.datetime.timestamp): _description_
@@ -243,134 +252,20 @@ class web3wrap:
         Returns:
            int: blocknumber
         """
-
-        if int(timestamp) == 0:
-            raise ValueError("Timestamp cannot be zero!")
-
-        # check min timestamp
-        min_block = self._getBlockData(1)
-        if min_block.timestamp > timestamp:
-            return 1
-
-        queries_cost = 0
-        found_exact = False
-
-        block_curr = self._getBlockData("latest")
-        first_step = math.ceil(block_curr.number * 0.85)
-
-        # make sure we have positive block result
-        while (block_curr.number + first_step) <= 0:
-            first_step -= 1
-        # calc blocks to go up/down closer to goal
-        block_past = self._getBlockData(block_curr.number - (first_step))
-        blocks_x_timestamp = (
-            abs(block_curr.timestamp - block_past.timestamp) / first_step
+        return get_block_time_service(network=self._network).get_block(
+            timestamp=timestamp,
+            inexact_mode=inexact_mode,
+            eq_timestamp_position=eq_timestamp_position,
+            helper=self,
         )
 
-        block_step = (block_curr.timestamp - timestamp) / blocks_x_timestamp
-        block_step_sign = -1
-
-        _startime = dt.datetime.now(dt.timezone.utc)
-
-        while block_curr.timestamp != timestamp:
-            queries_cost += 1
-
-            # make sure we have positive block result
-            while (block_curr.number + (block_step * block_step_sign)) <= 0:
-                if queries_cost != 1:
-                    # change sign and lower steps
-                    block_step_sign *= -1
-                # first time here, set lower block steps
-                block_step /= 2
-            # go to block
-            try:
-                block_curr = self._getBlockData(
-                    math.floor(block_curr.number + (block_step * block_step_sign))
-                )
-            except exceptions.BlockNotFound:
-                # diminish step
-                block_step /= 2
-                continue
-
-            blocks_x_timestamp = (
-                (
-                    abs(block_curr.timestamp - block_past.timestamp)
-                    / abs(block_curr.number - block_past.number)
-                )
-                if abs(block_curr.number - block_past.number) != 0
-                else 0
-            )
-            if blocks_x_timestamp != 0:
-                block_step = math.ceil(
-                    abs(block_curr.timestamp - timestamp) / blocks_x_timestamp
-                )
-
-            if block_curr.timestamp < timestamp:
-                # block should be higher than current
-                block_step_sign = 1
-            elif block_curr.timestamp > timestamp:
-                # block should be lower than current
-                block_step_sign = -1
-            else:
-                # got it
-                found_exact = True
-                # exit loop
-                break
-
-            # set block past
-            block_past = block_curr
-
-            # 15sec while loop safe exit (an eternity to find the block)
-            if (dt.datetime.now(dt.timezone.utc) - _startime).total_seconds() > 15:
-                if inexact_mode == "before":
-                    # select block smaller than objective
-                    while block_curr.timestamp > timestamp:
-                        block_curr = self._getBlockData(block_curr.number - 1)
-                elif inexact_mode == "after":
-                    # select block greater than objective
-                    while block_curr.timestamp < timestamp:
-                        block_curr = self._getBlockData(block_curr.number + 1)
-                else:
-                    raise ValueError(
-                        f" Inexact method chosen is not valid:->  {inexact_mode}"
-                    )
-                # exit loop
-                break
-
-        # define result
-        result = block_curr.number
-
-        # get blocks with same timestamp
-        sametimestampBlocks = self.get_sameTimestampBlocks(block_curr, queries_cost)
-        if len(sametimestampBlocks) > 0:
-            if eq_timestamp_position == "first":
-                result = sametimestampBlocks[0]
-            elif eq_timestamp_position == "last":
-                result = sametimestampBlocks[-1]
-
-        # log result
-        if found_exact:
-            logging.getLogger(__name__).debug(
-                f" Took {queries_cost} on-chain queries to find block number {block_curr.number} of timestamp {timestamp}"
-            )
-
-        else:
-            logging.getLogger(__name__).warning(
-                f" Could not find the exact block number from timestamp -> took {queries_cost} on-chain queries to find block number {block_curr.number} ({block_curr.timestamp}) closest to timestamp {timestamp}  -> original-found difference {timestamp - block_curr.timestamp}"
-            )
-
-        # return closest block found
-        return result
-
     def timestampFromBlockNumber(self, block: int) -> int:
-        block_obj = None
         if block < 1:
-            block_obj = self._getBlockData("latest")
-        else:
-            block_obj = self._getBlockData(block)
+            return self._getBlockData("latest").timestamp
 
-        # return closest block found
-        return block_obj.timestamp
+        return get_block_time_service(network=self._network).get_timestamp(
+            block=block, helper=self
+        ) or self._getBlockData(block).timestamp
 
     def get_sameTimestampBlocks(self, block, queries_cost: int):
         result = []
@@ -474,6 +369,7 @@ class web3wrap:
                 f"   Using {rpc.url_short} to gather {self._network}'s events"
             )
             # get chunk entries
+            _ini_time = time.perf_counter()
             try:
                 # add rpc attempt
                 rpc.add_attempt(method=cuType.eth_getLogs)
@@ -518,6 +414,14 @@ class web3wrap:
                 rpc.add_failed(error=e)
                 # try changing the rpcURL and retry
                 continue
+            finally:
+                report_cost(
+                    kind="rpc",
+                    operation=cuType.eth_getLogs.value,
+                    source=self._cost_source,
+                    cus=rpc._compute_unit_prices(cuType.eth_getLogs),
+                    seconds=time.perf_counter() - _ini_time,
+                )
 
         # return all found
         return entries
@@ -638,6 +542,8 @@ class web3wrap:
     def call_function(self, function_name: str, rpcs: list[w3Provider], *args):
         # loop choose url
         for rpc in rpcs:
+            _ini_time = time.perf_counter()
+            _result_bytes = 0
             try:
                 rpc.add_attempt(method=cuType.eth_call)
                 # create web3 conn
@@ -652,9 +558,13 @@ class web3wrap:
                 result = getattr(contract.functions, function_name)(*args).call(
                     block_identifier=self.block
                 )
-                logging.getLogger(__name__).debug(
-                    f" {rpc.type} RPC {rpc.url_short} successfully returned result when calling function {function_name} in {self._network}'s contract {self.address} at block {self.block}"
-                )
+                if is_tracking_costs():
+                    _result_bytes = len(repr(result))
+                # avoid building the message when not needed ( hot path )
+                if logging.getLogger(__name__).isEnabledFor(logging.DEBUG):
+                    logging.getLogger(__name__).debug(
+                        f" {rpc.type} RPC {rpc.url_short} successfully returned result when calling function {function_name} in {self._network}'s contract {self.address} at block {self.block}"
+                    )
                 return result
 
             except ValueError as e:
@@ -872,6 +782,15 @@ class web3wrap:
                     f"  Error calling function {function_name} using {rpc.url_short} rpc: {e}  address: {self._address}"
                 )
                 rpc.add_failed(error=e)
+            finally:
+                report_cost(
+                    kind="rpc",
+                    operation=function_name,
+                    source=self._cost_source,
+                    cus=rpc._compute_unit_prices(cuType.eth_call),
+                    bytes=_result_bytes,
+                    seconds=time.perf_counter() - _ini_time,
+                )
 
         # no rpcUrl worked
         return None
@@ -1008,6 +927,7 @@ class web3wrap:
         for rpc in RPC_MANAGER.get_rpc_list(
             network=self._network, rpcKey_names=["private", "public"]
         ):
+            _ini_time = time.perf_counter()
             try:
                 rpc.add_attempt(method=cuType.eth_getBlockByNumber)
                 _w3 = self.setup_w3(network=self._network, web3Url=rpc.url)
@@ -1016,9 +936,10 @@ class web3wrap:
                         f" ERROR --> Block {block} is not valid. address:{self._address} {self._network} {rpc.url_short}"
                     )
                 result = _w3.eth.get_block(block)
-                logging.getLogger(__name__).debug(
-                    f" {rpc.type} RPC {rpc.url_short} successfully returned result when getting {block} BLOCK number in {self._network} network (returned: {result.number})"
-                )
+                if logging.getLogger(__name__).isEnabledFor(logging.DEBUG):
+                    logging.getLogger(__name__).debug(
+                        f" {rpc.type} RPC {rpc.url_short} successfully returned result when getting {block} BLOCK number in {self._network} network (returned: {result.number})"
+                    )
                 return result
 
             except exceptions.BlockNotFound as e:
@@ -1059,6 +980,46 @@ class web3wrap:
                             f"Block {block} not found at {self._network} using {rpc.url_short}"
                         )
                 rpc.add_failed(error=e)
+            finally:
+                report_cost(
+                    kind="rpc",
+                    operation=cuType.eth_getBlockByNumber.value,
+                    source=self._cost_source,
+                    cus=rpc._compute_unit_prices(cuType.eth_getBlockByNumber),
+                    seconds=time.perf_counter() - _ini_time,
+                )
+
+        # raise last error if there is no result to return, and there was an error
+        if last_error:
+            raise last_error
+
+        return None
+
+    def _getCode(self, address: str, block: int | str = "latest") -> bytes | None:
+        """Get the bytecode of an address at a block
+
+        Args:
+            address (str):
+            block (int | str, optional): block number or 'latest'. Defaults to "latest".
+
+        Returns:
+            bytes | None: bytecode ( empty when not a contract ) or None when no rpc could be used
+        """
+        last_error = None
+
+        # get w3Provider list
+        for rpc in RPC_MANAGER.get_rpc_list(network=self._network):
+            try:
+                rpc.add_attempt(method=cuType.eth_getCode)
+                _w3 = self.setup_w3(network=self._network, web3Url=rpc.url)
+                return _w3.eth.get_code(Web3.toChecksumAddress(address), block)
+            except Exception as e:
+                logging.getLogger(__name__).debug(
+                    f" error getting {address} bytecode at block {block} using {rpc.url_short} rpc: {e}"
+                )
+                rpc.add_failed(error=e)
+                last_error = e
+                continue
 
         # raise last error if there is no result to return, and there was an error
         if last_error:
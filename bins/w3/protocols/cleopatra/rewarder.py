@@ -41,33 +41,14 @@ class gauge(ramses_rewarder.gauge):
                         rewards_perSecond: int
                                 total_hypervisorToken_qtty: int = None
         """
-
-        result = []
-        for reward_token in self.getRewardTokens:
-            # get reward rate
-            RewardsPerSec = self.rewardRate(reward_token)
-
-            result.append(
-                {
-                    # "network": self._network,
-                    "block": self.block,
-                    "timestamp": self._timestamp,
-                    "hypervisor_address": None,
-                    "rewarder_address": self.address.lower(),
-                    "rewarder_type": rewarderType.CLEOPATRA,
-                    "rewarder_refIds": [],
-                    "rewarder_registry": "",  # should be hypervisor receiver address
-                    "rewardToken": reward_token.lower(),
-                    "rewardToken_symbol": None,
-                    "rewardToken_decimals": None,
-                    "rewards_perSecond": (
-                        str(RewardsPerSec) if convert_bint else RewardsPerSec
-                    ),
-                    "total_hypervisorToken_qtty": None,
-                }
-            )
-
-        return result
+        return ramses_rewarder.get_gauges_rewards(
+            network=self._network,
+            gauges=[(self.address, self.block)],
+            rewarder_type=rewarderType.CLEOPATRA,
+            convert_bint=convert_bint,
+            timestamps={self.block: self._timestamp},
+            helper=self,
+        )
 
 
 # MultiFeeDistribution (hypervisor receiver )
@@ -205,6 +205,34 @@ class data_collector:
                     remaining=block_end - filter["toBlock"],
                 )
 
+    def decode_transfer(self, event) -> dict:
+        """Convert a Transfer log entry to an operation item
+
+        Args:
+            event: log entry
+
+        Returns:
+            dict: transactionHash, blockHash, blockNumber, address, src, dst, qtty, topic, logIndex
+        """
+        # decode:
+        try:
+            data = abi.decode(["uint256"], HexBytes(event.data))
+        except exceptions.InsufficientDataBytes:
+            # probably a transfer of a non ERC20 token ( veNFT ? )
+            data = None
+        except Exception as e:
+            logging.getLogger(__name__).error(
+                f" Error decoding data of event at block {event.blockNumber}  event:{event}"
+            )
+            raise
+
+        # convert data
+        result_item = self._convert_topic("transfer", event, data)
+        # add topic to result item
+        result_item["topic"] = "transfer"
+        result_item["logIndex"] = event.logIndex
+        return result_item
+
     # HELPERS
     def _convert_topic(self, topic: str, event, data) -> dict:
         # init result
@@ -441,39 +469,17 @@ class wallet_transfers_collector(data_collector):
             if entries:
                 chunk_result = []
                 for event in entries:
-                    # get topic name found
-                    topic = "transfer"
-                    # first topic is topic id
-                    custom_abi_data = ["uint256"]
-                    # decode:
-                    try:
-                        data = abi.decode(custom_abi_data, HexBytes(event.data))
-                    except exceptions.InsufficientDataBytes:
-                        # probably a transfer of a non ERC20 token ( veNFT ? )
-                        data = None
-                    except Exception as e:
-                        logging.getLogger(__name__).error(
-                            f" Error decoding data of event at block {event.blockNumber}  event:{event}"
-                        )
-                        raise
-
                     # show progress
                     if self._progress_callback:
                         self._progress_callback(
                             text="processing {} at block:{}".format(
-                                topic, event.blockNumber
+                                "transfer", event.blockNumber
                             ),
                             remaining=block_end - event.blockNumber,
                             total=block_end - block_ini,
                         )
 
-                    # convert data
-                    result_item = self._convert_topic(topic, event, data)
-                    # add topic to result item
-                    result_item["topic"] = "transfer"
-                    result_item["logIndex"] = event.logIndex
-
-                    chunk_result.append(result_item)
+                    chunk_result.append(self.decode_transfer(event))
 
                 # yield when there is data
                 if chunk_result:
@@ -841,39 +847,17 @@ class generic_transfer_collector(data_collector):
             if entries:
                 chunk_result = []
                 for event in entries:
-                    # get topic name found
-                    topic = "transfer"
-                    # first topic is topic id
-                    custom_abi_data = ["uint256"]
-                    # decode:
-                    try:
-                        data = abi.decode(custom_abi_data, HexBytes(event.data))
-                    except exceptions.InsufficientDataBytes:
-                        # probably a transfer of a non ERC20 token ( veNFT ? )
-                        data = None
-                    except Exception as e:
-                        logging.getLogger(__name__).error(
-                            f" Error decoding data of event at block {event.blockNumber}  event:{event}"
-                        )
-                        raise
-
                     # show progress
                     if self._progress_callback:
                         self._progress_callback(
                             text="processing {} at block:{}".format(
-                                topic, event.blockNumber
+                                "transfer", event.blockNumber
                             ),
                             remaining=block_end - event.blockNumber,
                             total=block_end - block_ini,
                         )
 
-                    # convert data
-                    result_item = self._convert_topic(topic, event, data)
-                    # add topic to result item
-                    result_item["topic"] = "transfer"
-                    result_item["logIndex"] = event.logIndex
-
-                    chunk_result.append(result_item)
+                    chunk_result.append(self.decode_transfer(event))
 
                 # yield when there is data
                 if chunk_result:
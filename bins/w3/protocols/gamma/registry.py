@@ -1,5 +1,7 @@
 import logging
 from web3 import Web3
+
+from bins.w3.helpers.multicaller import build_call_with_abi_part, execute_parse_calls
 from ..base_wrapper import web3wrap
 
 
@@ -131,6 +133,48 @@ class gamma_hypervisor_registry(web3wrap):
 
         return result, disabled
 
+    def get_registry_indexes(
+        self, addresses: list[str], max_calls_atOnce: int = 1000
+    ) -> dict[str, int]:
+        """registryMap of multiple hypervisors, using multicall
+            ( 0 when the hypervisor has been removed from the registry )
+
+        Args:
+            addresses (list[str]): hypervisor addresses
+            max_calls_atOnce (int, optional): . Defaults to 1000.
+
+        Returns:
+            dict[str, int]: { address ( lower ): registry index }  ( failed calls are not included )
+        """
+        abi_part = self.get_abi_function("registryMap")
+        result = {}
+        for i in range(0, len(addresses), max_calls_atOnce):
+            for call in execute_parse_calls(
+                network=self._network,
+                block=self.block,
+                calls=[
+                    build_call_with_abi_part(
+                        abi_part=abi_part,
+                        inputs_values=[Web3.toChecksumAddress(address)],
+                        address=self.address,
+                        object="registry",
+                    )
+                    for address in addresses[i : i + max_calls_atOnce]
+                ],
+                convert_bint=False,
+                requireSuccess=False,
+                timestamp=self._timestamp,
+            ):
+                if "value" in call["outputs"][0]:
+                    result[call["inputs"][0]["value"].lower()] = call["outputs"][0][
+                        "value"
+                    ]
+        return result
+
+    def is_blacklisted(self, address: str) -> bool:
+        """Address is in the hardcoded ( or applied ) blacklist"""
+        return address.lower() in self.__blacklist_addresses.get(self._network, [])
+
     def apply_blacklist(self, blacklist: list[str]):
         """Save filters to be applied to the registry
 
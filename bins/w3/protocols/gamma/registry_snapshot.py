@@ -0,0 +1,183 @@
+import logging
+import threading
+
+from ....general import file_utilities
+
+
+class hypervisor_registry_snapshot:
+    """Persistent state of a gamma hypervisor registry: counter, last index read, block and the hypervisors found by index.
+    Each sync reads the counter, checks the known hypervisors are still registered ( one registryMap multicall )
+    and only reads the registry indexes after the last one seen, returning the hypervisors added and removed since the previous sync.
+    """
+
+    # maximum registry indexes read in one sync ( avoid infinite loops )
+    MAX_INDEXES_PER_SYNC = 10000
+
+    def __init__(
+        self,
+        network: str,
+        address: str,
+        folder: str = "data/cache/registries",
+    ):
+        """
+
+        Args:
+            network (str):
+            address (str): registry address
+            folder (str, optional): where to save the snapshot. Defaults to "data/cache/registries".
+        """
+        self.network = network
+        self.address = address.lower()
+        self.folder = folder
+        self.filename = f"{network}_{self.address}"
+
+        self._lock = threading.RLock()
+        self._state = self._empty_state()
+        if _saved := file_utilities.load_json(
+            filename=self.filename, folder_path=self.folder
+        ):
+            self._state.update(
+                {k: _saved[k] for k in self._state if k in _saved}
+            )
+
+    @property
+    def block(self) -> int:
+        """Block of the last sync"""
+        return self._state["block"]
+
+    @property
+    def hypervisors(self) -> list[str]:
+        """Registered hypervisor addresses, by registry index"""
+        return sorted(
+            self._state["hypervisors"], key=lambda x: self._state["hypervisors"][x]
+        )
+
+    @property
+    def disabled(self) -> list[str]:
+        """Hypervisor addresses removed from the registry"""
+        return list(self._state["disabled"])
+
+    def sync(self, registry) -> dict[str, list[str]]:
+        """Bring the snapshot to the registry wrapper block
+
+        Args:
+            registry (gamma_hypervisor_registry): registry wrapper at the block to sync to.
+                        Syncing to a block older than the snapshot is done from scratch and not saved.
+
+        Returns:
+            dict[str, list[str]]: { "added": [addresses], "removed": [addresses], "hypervisors": [registered addresses], "disabled": [removed addresses] }
+        """
+        with self._lock:
+            save = registry.block >= self._state["block"]
+            state = self._state if save else self._empty_state()
+
+            added = []
+            removed = []
+            last_block = state["block"]
+            if (counter := registry.counter) is None:
+                logging.getLogger(__name__).error(
+                    f" Could not get the {self.network} {self.address} registry counter at block {registry.block}. Using the last snapshot."
+                )
+                save = False
+            else:
+                # known hypervisors removed since the last sync
+                if state["hypervisors"]:
+                    indexes = registry.get_registry_indexes(
+                        addresses=list(state["hypervisors"])
+                    )
+                    for address in [
+                        x for x in state["hypervisors"] if indexes.get(x) == 0
+                    ]:
+                        state["disabled"][address] = state["hypervisors"].pop(address)
+                        removed.append(address)
+
+                # new registry indexes
+                for index in range(
+                    state["last_index"] + 1,
+                    state["last_index"] + 1 + self.MAX_INDEXES_PER_SYNC,
+                ):
+                    if len(state["hypervisors"]) >= counter:
+                        break
+                    try:
+                        hypervisor_id, idx = registry.hypeByIndex(index=index)
+                        if idx:
+                            state["hypervisors"][hypervisor_id.lower()] = index
+                            state["disabled"].pop(hypervisor_id.lower(), None)
+                            added.append(hypervisor_id.lower())
+                        else:
+                            state["disabled"][hypervisor_id.lower()] = index
+                    except TypeError as e:
+                        # index out of bounds
+                        logging.getLogger(__name__).error(
+                            f" {self.network} {self.address} registry index {index} is out of bounds while not all hypervisors have been returned. This should not happen. error-> {e}"
+                        )
+                        break
+                    except Exception as e:
+                        if index != 0:
+                            # rpc errors: read again from this index next sync
+                            logging.getLogger(__name__).warning(
+                                f" Error while retrieving addresses from registry {self.network} {self.address} index {index}. Retrying from it next sync  error-> {e} "
+                            )
+                            break
+                        # execution reverted: arbitrum and mainnet have diff ways of indexing (+1 or 0)
+                        logging.getLogger(__name__).warning(
+                            f" Error while retrieving addresses from registry {self.network} {self.address} index {index}  error-> {e} "
+                        )
+                    state["last_index"] = index
+
+                state["counter"] = counter
+                state["block"] = max(state["block"], registry.block)
+
+            if save:
+                self.save()
+
+            if added or removed:
+                logging.getLogger(__name__).debug(
+                    f" {self.network} {self.address} registry: {len(added)} hypervisors added and {len(removed)} removed since block {last_block}"
+                )
+
+            return {
+                "added": added,
+                "removed": removed,
+                "hypervisors": sorted(
+                    state["hypervisors"], key=lambda x: state["hypervisors"][x]
+                ),
+                "disabled": list(state["disabled"]),
+            }
+
+    def save(self):
+        file_utilities.save_json(
+            filename=self.filename,
+            data={
+                "network": self.network,
+                "address": self.address,
+                **self._state,
+            },
+            folder_path=self.folder,
+        )
+
+    def _empty_state(self) -> dict:
+        return {
+            "block": 0,
+            "counter": 0,
+            "last_index": -1,
+            # address: registry index
+            "hypervisors": {},
+            "disabled": {},
+        }
+
+
+# one snapshot per registry ( and process )
+HYPERVISOR_REGISTRY_SNAPSHOTS = {}
+HYPERVISOR_REGISTRY_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def get_hypervisor_registry_snapshot(
+    network: str, address: str
+) -> hypervisor_registry_snapshot:
+    with HYPERVISOR_REGISTRY_SNAPSHOTS_LOCK:
+        if (network, address.lower()) not in HYPERVISOR_REGISTRY_SNAPSHOTS:
+            HYPERVISOR_REGISTRY_SNAPSHOTS[
+                (network, address.lower())
+            ] = hypervisor_registry_snapshot(network=network, address=address)
+        return HYPERVISOR_REGISTRY_SNAPSHOTS[(network, address.lower())]
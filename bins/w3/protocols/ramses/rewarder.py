@@ -1,6 +1,9 @@
+import logging
 from web3 import Web3
 
 from bins.errors.general import ProcessingError
+from bins.w3.helpers.block_time import get_block_time_service
+from bins.w3.helpers.multicaller import build_call_with_abi_part, execute_parse_calls
 from ....general.enums import error_identity, rewarderType, text_to_chain
 from ..base_wrapper import web3wrap
 from .pool import pool
@@ -341,32 +344,165 @@ class gauge(web3wrap):
                         rewards_perSecond: int
                                 total_hypervisorToken_qtty: int = None
         """
-        result = []
-        for reward_token in self.getRewardTokens:
-            # get reward rate
-            RewardsPerSec = self.rewardRate(reward_token)
-
-            result.append(
-                {
-                    # "network": self._network,
-                    "block": self.block,
-                    "timestamp": self._timestamp,
-                    "hypervisor_address": None,
-                    "rewarder_address": self.address.lower(),
-                    "rewarder_type": rewarderType.RAMSES_v2,
-                    "rewarder_refIds": [],
-                    "rewarder_registry": "",  # should be hypervisor receiver address
-                    "rewardToken": reward_token.lower(),
-                    "rewardToken_symbol": None,
-                    "rewardToken_decimals": None,
-                    "rewards_perSecond": str(RewardsPerSec)
-                    if convert_bint
-                    else RewardsPerSec,
-                    "total_hypervisorToken_qtty": None,
-                }
+        return get_gauges_rewards(
+            network=self._network,
+            gauges=[(self.address, self.block)],
+            rewarder_type=rewarderType.RAMSES_v2,
+            convert_bint=convert_bint,
+            timestamps={self.block: self._timestamp},
+            helper=self,
+        )
+
+
+def get_gauges_rewards(
+    network: str,
+    gauges: list[tuple[str, int]],
+    rewarder_type: str = rewarderType.RAMSES_v2,
+    convert_bint: bool = False,
+    timestamps: dict[int, int] | None = None,
+    helper: gauge | None = None,
+) -> list[dict]:
+    """Get the rewards data of multiple gauges using 2 multicalls per distinct block:
+        getRewardTokens of all gauges, then rewardRate of all their reward tokens
+        Be aware that some fields are to be filled outside this func ( same as gauge.get_rewards )
+
+    Args:
+        network (str):
+        gauges (list[tuple[str, int]]): ( gauge address, block ) pairs
+        rewarder_type (str, optional): ramses, pharaoh or cleopatra. Defaults to rewarderType.RAMSES_v2.
+        convert_bint (bool, optional): Convert big integers to string. Defaults to False.
+        timestamps (dict[int, int] | None, optional): known { block: timestamp }. Defaults to the block time service.
+        helper (gauge | None, optional): gauge wrapper to get the abi from. Defaults to a ramses gauge.
+
+    Returns:
+        list[dict]: gauge.get_rewards items of all gauges ( in the same order ).
+                    Gauges with failed calls or at blocks without timestamp are not included.
+    """
+    if not gauges:
+        return []
+
+    # group gauges by block ( each multicall is placed at one block )
+    gauges_by_block = {}
+    for address, block in gauges:
+        gauges_by_block.setdefault(block, {})[address.lower()] = None
+
+    timestamps = dict(timestamps or {})
+    if missing_blocks := [x for x in gauges_by_block if not timestamps.get(x)]:
+        timestamps.update(
+            get_block_time_service(network=network).get_timestamps(
+                blocks=missing_blocks
+            )
+        )
+
+    # abi parts
+    if helper is None:
+        first_address, first_block = gauges[0]
+        helper = gauge(
+            address=first_address,
+            network=network,
+            block=first_block,
+            timestamp=timestamps.get(first_block, 0),
+        )
+    getRewardTokens_abi = helper.get_abi_function("getRewardTokens")
+    rewardRate_abi = helper.get_abi_function("rewardRate")
+
+    for block, block_gauges in gauges_by_block.items():
+        if not (timestamp := timestamps.get(block)):
+            logging.getLogger(__name__).error(
+                f" Could not get {network}'s block {block} timestamp. Skipping {len(block_gauges)} gauges rewards"
+            )
+            continue
+
+        # 1st round: reward tokens of all gauges
+        token_calls = execute_parse_calls(
+            network=network,
+            block=block,
+            calls=[
+                build_call_with_abi_part(
+                    abi_part=getRewardTokens_abi,
+                    inputs_values=[],
+                    address=address,
+                    object="gauge",
+                )
+                for address in block_gauges
+            ],
+            convert_bint=False,
+            requireSuccess=False,
+            timestamp=timestamp,
+        )
+
+        # 2nd round: reward rate of each reward token
+        rate_calls = []
+        for address, call in zip(block_gauges, token_calls):
+            if "value" not in call["outputs"][0]:
+                logging.getLogger(__name__).error(
+                    f" Could not get {network}'s {address} gauge reward tokens at block {block}"
+                )
+                continue
+            block_gauges[address] = []
+            for reward_token in call["outputs"][0]["value"]:
+                block_gauges[address].append(reward_token)
+                rate_calls.append(
+                    build_call_with_abi_part(
+                        abi_part=rewardRate_abi,
+                        inputs_values=[reward_token],
+                        address=address,
+                        object="gauge",
+                    )
+                )
+        if rate_calls:
+            rate_calls = execute_parse_calls(
+                network=network,
+                block=block,
+                calls=rate_calls,
+                convert_bint=False,
+                requireSuccess=False,
+                timestamp=timestamp,
             )
 
-        return result
+        # calls are built in the same order they are consumed here
+        rate_calls = iter(rate_calls)
+        for address, reward_tokens in block_gauges.items():
+            if reward_tokens is None:
+                continue
+            items = []
+            for reward_token in reward_tokens:
+                rate_call = next(rate_calls)
+                if "value" not in rate_call["outputs"][0]:
+                    logging.getLogger(__name__).error(
+                        f" Could not get {network}'s {address} gauge {reward_token} reward rate at block {block}"
+                    )
+                    continue
+                rewards_perSecond = rate_call["outputs"][0]["value"]
+                items.append(
+                    {
+                        # "network": network,
+                        "block": block,
+                        "timestamp": timestamp,
+                        "hypervisor_address": None,
+                        "rewarder_address": address,
+                        "rewarder_type": rewarder_type,
+                        "rewarder_refIds": [],
+                        "rewarder_registry": "",  # should be hypervisor receiver address
+                        "rewardToken": reward_token.lower(),
+                        "rewardToken_symbol": None,
+                        "rewardToken_decimals": None,
+                        "rewards_perSecond": str(rewards_perSecond)
+                        if convert_bint
+                        else rewards_perSecond,
+                        "total_hypervisorToken_qtty": None,
+                    }
+                )
+            block_gauges[address] = items
+
+    # return in the same order as requested
+    result = []
+    for address, block in gauges:
+        if items := gauges_by_block[block].get(address.lower()):
+            result += items
+            # do not repeat duplicated gauge requests
+            gauges_by_block[block][address.lower()] = None
+    return result
 
 
 # MultiFeeDistribution (hypervisor receiver )
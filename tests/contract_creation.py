@@ -0,0 +1,84 @@
+import logging
+import random
+from types import SimpleNamespace
+
+from bins.w3.helpers.block_time import block_time_service
+from bins.w3.helpers.contract_creation import contract_creation_index
+
+
+class _local_chain:
+    """Chain stand-in with contracts deployed at known blocks
+    ( implements the web3 wrapper methods used by the contract creation index )"""
+
+    def __init__(self, latest_block: int, deployments: dict[str, int]):
+        self.latest_block = latest_block
+        self.deployments = deployments
+        self.calls = 0
+
+    def _getBlockData(self, block: int | str):
+        if block == "latest":
+            block = self.latest_block
+        return SimpleNamespace(number=block, timestamp=1600000000 + block * 2)
+
+    def _getCode(self, address: str, block: int | str = "latest") -> bytes:
+        self.calls += 1
+        if block == "latest":
+            block = self.latest_block
+        deployed = self.deployments.get(address.lower())
+        return b"\x60\x80" if deployed is not None and block >= deployed else b""
+
+
+class _local_block_time(block_time_service):
+    """Block time service without database ( timestamps come from the chain stand-in only )"""
+
+    def __init__(self, network: str):
+        super().__init__(network=network, write_back=False)
+
+    def _query_database(self, find: dict, **kwargs) -> list[dict]:
+        return []
+
+
+def test_contract_creation_onchain(
+    qtty: int = 20, latest_block: int = 20_000_000, seed: int | None = None
+):
+    """Check the on-chain ( eth_getCode binary search ) contract creation fallback against
+        a local chain stand-in deploying contracts at random blocks
+
+    Args:
+        qtty (int, optional): contracts deployed. Defaults to 20.
+        latest_block (int, optional): . Defaults to 20_000_000.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    deployments = {
+        f"0x{rnd.getrandbits(160):040x}": rnd.randint(0, latest_block)
+        for _ in range(qtty)
+    }
+    # include the edge blocks
+    deployments[f"0x{1:040x}"] = 0
+    deployments[f"0x{2:040x}"] = latest_block
+    not_deployed = f"0x{3:040x}"
+
+    chain = _local_chain(latest_block=latest_block, deployments=deployments)
+    index = contract_creation_index(
+        network="ethereum",
+        write_back=False,
+        block_time=_local_block_time(network="ethereum"),
+    )
+
+    for address, block in deployments.items():
+        found = index._fetch_onchain(address=address, helper=chain)
+        if (
+            not found
+            or found["block"] != block
+            or found["timestamp"] != chain._getBlockData(block).timestamp
+        ):
+            raise AssertionError(
+                f" {address} deployed at block {block} but found {found}"
+            )
+    if index._fetch_onchain(address=not_deployed, helper=chain) is not None:
+        raise AssertionError(f" {not_deployed} is not deployed but was found")
+
+    logging.getLogger(__name__).info(
+        f" {len(deployments)} contract creations found on-chain using {chain.calls / (len(deployments) + 1):,.1f} eth_getCode calls per contract"
+    )
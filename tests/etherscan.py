@@ -0,0 +1,221 @@
+import concurrent.futures
+import http.server
+import json
+import logging
+import tempfile
+import threading
+import time
+import urllib.parse
+
+from bins.apis.etherscan_utilities import etherscan_helper
+from bins.configuration import CONFIGURATION
+from bins.general import net_utilities
+
+
+class _local_etherscan(http.server.ThreadingHTTPServer):
+    """Etherscan api stand-in recording the requests and connections received"""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _local_etherscan_handler)
+        self.delay = delay
+        # [ query arguments ]
+        self.requests = []
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def actions(self, action: str) -> list[dict]:
+        return [x for x in self.requests if x["action"] == action]
+
+    def respond(self, query: dict) -> dict:
+        with self._lock:
+            self.requests.append(query)
+        # slow responses make concurrent identical requests overlap
+        time.sleep(self.delay)
+
+        if query["action"] == "getabi":
+            abi = [{"type": "function", "name": f"f_{query['address']}"}]
+            return {"status": "1", "message": "OK", "result": json.dumps(abi)}
+        if query["action"] == "getcontractcreation":
+            return {
+                "status": "1",
+                "message": "OK",
+                "result": [
+                    {
+                        "contractAddress": address,
+                        "contractCreator": f"0x{1:040x}",
+                        "txHash": f"0x{int(address, 16):064x}",
+                    }
+                    for address in query["contractaddresses"].split(",")
+                ],
+            }
+        return {"status": "0", "message": "NOTOK", "result": "Unknown action"}
+
+
+class _local_etherscan_handler(http.server.BaseHTTPRequestHandler):
+    # keep connections alive
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server._lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(self.path).query))
+        body = json.dumps(self.server.respond(query)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_etherscan_client(keys: int = 3, addresses: int = 12):
+    """Query a local etherscan stand-in checking connection reuse, api key rotation,
+        concurrent identical requests coalescing, contract creation batching and that cached responses are not requested again
+
+    Args:
+        keys (int, optional): api keys to rotate. Defaults to 3.
+        addresses (int, optional): contract addresses. Defaults to 12.
+    """
+    server = _local_etherscan(delay=0.2)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    contracts = [f"0x{i + 1:040x}" for i in range(addresses)]
+
+    def _helper(folder: str) -> etherscan_helper:
+        helper = etherscan_helper(
+            api_keys={"etherscan": [f"key{i}" for i in range(keys)]},
+            cache_folder=folder,
+        )
+        helper._urls = {"ethereum": server.url}
+        return helper
+
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            helper = _helper(folder)
+
+            # concurrent identical requests are made once
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+                abis = list(
+                    ex.map(
+                        lambda _: helper.get_contract_abi(
+                            network="ethereum", contract_address=contracts[0]
+                        ),
+                        range(8),
+                    )
+                )
+            if len(set(abis)) != 1 or len(server.actions("getabi")) != 1:
+                raise AssertionError(
+                    f" {len(server.actions('getabi'))} requests made for 8 concurrent identical abi calls"
+                )
+
+            # sequential requests reuse the same connection
+            server.delay = 0
+            connections = server.connections
+            for address in contracts:
+                helper.get_contract_abi(network="ethereum", contract_address=address)
+            if server.connections != connections:
+                raise AssertionError(
+                    f" {server.connections - connections} new connections made for {addresses} sequential requests"
+                )
+
+            # api keys are used in turns
+            used_keys = [x["apiKey"] for x in server.requests]
+            if len(set(used_keys)) != keys:
+                raise AssertionError(f" api keys were not rotated: {used_keys}")
+
+            # creation requested in batches of addresses
+            creations = helper.get_contract_creation(
+                network="ethereum", contract_addresses=contracts
+            )
+            expected_calls = -(-addresses // helper._creation_addresses_per_call)
+            if sorted(x["contractAddress"] for x in creations) != contracts or (
+                len(server.actions("getcontractcreation")) != expected_calls
+            ):
+                raise AssertionError(
+                    f" wrong contract creation batching: {len(server.actions('getcontractcreation'))} requests"
+                )
+
+            # cached abi and creation responses are never requested again ( even by new helpers )
+            requests_made = len(server.requests)
+            helper = _helper(folder)
+            for address in contracts:
+                if helper.get_contract_abi(
+                    network="ethereum", contract_address=address
+                ) != json.dumps([{"type": "function", "name": f"f_{address}"}]):
+                    raise AssertionError(f" wrong cached abi for {address}")
+            helper.get_contract_creation(
+                network="ethereum", contract_addresses=contracts[::-1]
+            )
+            if len(server.requests) != requests_made:
+                raise AssertionError(
+                    f" {len(server.requests) - requests_made} requests made for cached responses"
+                )
+
+            logging.getLogger(__name__).info(
+                f" {len(server.requests)} requests over {server.connections} connections ( {len(server.actions('getabi'))} abi, {len(server.actions('getcontractcreation'))} creation ) using keys {sorted(set(used_keys))}"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_etherscan_rate_limits():
+    """Check calls made with an api key use the configured etherscan limit
+    while keyless calls keep their own ( lower ) limit
+    """
+    server = _local_etherscan()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # record the limiters used
+    used = {}
+    get_rate_limiter = net_utilities.get_rate_limiter
+
+    def _get_rate_limiter(**kwargs):
+        used[kwargs["key"]] = get_rate_limiter(**kwargs)
+        return used[kwargs["key"]]
+
+    rate_limits = CONFIGURATION.setdefault("sources", {}).setdefault("rate_limits", {})
+    configured = {x: rate_limits.get(x) for x in ("etherscan", "etherscan_no_key")}
+    rate_limits["etherscan"] = {"rate": 5, "capacity": 5}
+    rate_limits.pop("etherscan_no_key", None)
+    net_utilities.get_rate_limiter = _get_rate_limiter
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            for i, api_key in enumerate(("ratekey", "")):
+                helper = etherscan_helper(
+                    api_keys={"etherscan": api_key}, cache_folder=folder
+                )
+                helper._urls = {"ethereum": server.url}
+                helper.get_contract_abi(
+                    network="ethereum", contract_address=f"0x{i + 1:040x}"
+                )
+
+            if used["ratekey"].rate != 5:
+                raise AssertionError(
+                    f" api key calls rate limited at {used['ratekey'].rate} requests per second"
+                )
+            if used[""].rate != etherscan_helper._rate_no_key:
+                raise AssertionError(
+                    f" keyless calls rate limited at {used[''].rate} requests per second"
+                )
+
+            logging.getLogger(__name__).info(
+                f" etherscan calls limited at {used['ratekey'].rate} requests per second with api key and {used[''].rate} without"
+            )
+    finally:
+        net_utilities.get_rate_limiter = get_rate_limiter
+        for api, config in configured.items():
+            if config is None:
+                rate_limits.pop(api, None)
+            else:
+                rate_limits[api] = config
+        server.shutdown()
+        server.server_close()
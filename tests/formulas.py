@@ -0,0 +1,132 @@
+import logging
+import random
+import time
+
+from bins.formulas import batch, fees, liquidity_math, tick_math
+from bins.formulas.constants import MAX_TICK, MAX_UINT128, MAX_UINT256
+
+
+def test_formulas(qtty: int = 20000, seed: int | None = None):
+    """Cross check the batch formulas against the scalar ones using random positions,
+        and log the time spent by each.
+
+    Args:
+        qtty (int, optional): number of random positions. Defaults to 20000.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+
+    # random positions
+    ticks = [rnd.randint(-MAX_TICK, MAX_TICK) for _ in range(qtty)]
+    ticks_lower = [rnd.randint(-MAX_TICK, MAX_TICK - 1) for _ in range(qtty)]
+    ticks_upper = [rnd.randint(x + 1, MAX_TICK) for x in ticks_lower]
+    liquidity = [rnd.randint(0, MAX_UINT128 >> rnd.randint(0, 127)) for _ in range(qtty)]
+    fee_growths = [
+        [rnd.randint(0, MAX_UINT256 >> rnd.randint(0, 128)) for _ in range(qtty)]
+        for _ in range(4)
+    ]
+
+    # sqrt prices
+    sqrt_prices, elapsed_scalar = _timeit(
+        lambda: [tick_math.getSqrtRatioAtTick(x) for x in ticks]
+    )
+    sqrt_prices_batch, elapsed_batch = _timeit(
+        lambda: batch.getSqrtRatioAtTick(ticks)
+    )
+    _check("getSqrtRatioAtTick", sqrt_prices, sqrt_prices_batch)
+    _log("getSqrtRatioAtTick", qtty, elapsed_scalar, elapsed_batch)
+
+    # amounts
+    sqrt_lower = [tick_math.getSqrtRatioAtTick(x) for x in ticks_lower]
+    sqrt_upper = [tick_math.getSqrtRatioAtTick(x) for x in ticks_upper]
+    amounts, elapsed_scalar = _timeit(
+        lambda: [
+            liquidity_math.getAmountsForLiquidity(x, a, b, l)
+            for x, a, b, l in zip(sqrt_prices, sqrt_lower, sqrt_upper, liquidity)
+        ]
+    )
+    amounts_batch, elapsed_batch = _timeit(
+        lambda: batch.getAmountsForLiquidity(
+            sqrt_prices, sqrt_lower, sqrt_upper, liquidity
+        )
+    )
+    _check("getAmountsForLiquidity 0", [x[0] for x in amounts], amounts_batch[0])
+    _check("getAmountsForLiquidity 1", [x[1] for x in amounts], amounts_batch[1])
+    _log("getAmountsForLiquidity", qtty, elapsed_scalar, elapsed_batch)
+
+    # fees
+    arguments = [liquidity, ticks, ticks_upper, ticks_lower, *fee_growths]
+    uncollected, elapsed_scalar = _timeit(
+        lambda: [fees.fees_uncollected_inRange(*x) for x in zip(*arguments)]
+    )
+    uncollected_batch, elapsed_batch = _timeit(
+        lambda: batch.fees_uncollected_inRange(*arguments)
+    )
+    _check("fees_uncollected_inRange", uncollected, uncollected_batch)
+    _log("fees_uncollected_inRange", qtty, elapsed_scalar, elapsed_batch)
+
+    test_sqrt_ratio_table(qtty=qtty, seed=seed)
+
+
+def test_sqrt_ratio_table(
+    qtty: int = 20000, tick_spacing: int = 60, seed: int | None = None
+):
+    """Cross check the sqrt ratio table against getSqrtRatioAtTick and log the time spent by each,
+        using a few position ticks repeated ( like base/limit ticks across hypervisor statuses ).
+
+    Args:
+        qtty (int, optional): number of lookups. Defaults to 20000.
+        tick_spacing (int, optional): . Defaults to 60.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    position_ticks = [
+        rnd.randint(-MAX_TICK // tick_spacing, MAX_TICK // tick_spacing)
+        * tick_spacing
+        for _ in range(50)
+    ]
+    ticks = [rnd.choice(position_ticks) for _ in range(qtty)]
+
+    table = tick_math.sqrt_ratio_table(tick_spacing=tick_spacing)
+    sqrt_prices, elapsed_scalar = _timeit(
+        lambda: [tick_math.getSqrtRatioAtTick(x) for x in ticks]
+    )
+    sqrt_prices_table, elapsed_table = _timeit(
+        lambda: [table.getSqrtRatioAtTick(x) for x in ticks]
+    )
+    _check("sqrt_ratio_table", sqrt_prices, sqrt_prices_table)
+    _log("sqrt_ratio_table", qtty, elapsed_scalar, elapsed_table)
+
+    # a bounded table keeps returning the same ratios
+    table = tick_math.sqrt_ratio_table(tick_spacing=tick_spacing, max_size=10)
+    _check(
+        "bounded sqrt_ratio_table",
+        sqrt_prices,
+        [table.getSqrtRatioAtTick(x) for x in ticks],
+    )
+    if len(table) > table.max_size:
+        raise AssertionError(
+            f" sqrt_ratio_table kept {len(table)} ratios ( max {table.max_size} )"
+        )
+
+
+def _timeit(func) -> tuple[any, float]:
+    _startime = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - _startime
+
+
+def _check(name: str, expected: list, result: list):
+    differences = [
+        (idx, x, y) for idx, (x, y) in enumerate(zip(expected, result)) if x != y
+    ]
+    if differences or len(expected) != len(result):
+        raise AssertionError(
+            f" {name} differs from scalar in {len(differences)} items. first: {differences[:1]}"
+        )
+
+
+def _log(name: str, qtty: int, elapsed_scalar: float, elapsed_batch: float):
+    logging.getLogger(__name__).info(
+        f" {name} x{qtty}:  scalar {elapsed_scalar:,.3f}s  vs {elapsed_batch:,.3f}s  ->  {elapsed_scalar/elapsed_batch if elapsed_batch else 0:,.1f}x"
+    )
@@ -0,0 +1,67 @@
+import logging
+import random
+
+from bins.database.common.latest_prices import latest_price_snapshot
+
+
+class _counting_snapshot(latest_price_snapshot):
+    """Snapshot over a synthetic current_usd_prices collection, counting database reads"""
+
+    def __init__(self, items: list[dict], **kwargs):
+        super().__init__(network="ethereum", **kwargs)
+        self.items = items
+        self.reads = {"load": 0, "watermark": 0}
+
+    def _query_database(self, find: dict, **kwargs) -> list[dict]:
+        if "limit" in kwargs:
+            self.reads["watermark"] += 1
+            return sorted(self.items, key=lambda x: x["timestamp"], reverse=True)[:1]
+        self.reads["load"] += 1
+        return [dict(x) for x in self.items]
+
+
+def test_latest_price_snapshot(qtty: int = 500, tokens: int = 2000, seed: int | None = None):
+    """Count the database reads done by the latest price snapshot while processing qtty synthetic
+        mfd queue items ( each one reading the price of a random token ), with a price update in the middle
+
+    Args:
+        qtty (int, optional): queue items. Defaults to 500.
+        tokens (int, optional): tokens in the price collection. Defaults to 2000.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    items = [
+        {
+            "address": f"0x{rnd.getrandbits(160):040x}",
+            "price": rnd.random() * 100,
+            "timestamp": 1700000000,
+        }
+        for _ in range(tokens)
+    ]
+
+    for check_seconds in (3600, 0):
+        snapshot = _counting_snapshot(
+            items=[dict(x) for x in items], ttl=3600, check_seconds=check_seconds
+        )
+        for i in range(qtty):
+            if i == qtty // 2:
+                # latest price feed updates a token
+                snapshot.items[0]["price"] += 1
+                snapshot.items[0]["timestamp"] += 60
+            token = rnd.choice(snapshot.items)
+            if snapshot.get(token["address"]) is None:
+                raise AssertionError(f" price of {token['address']} not found")
+
+        expected_loads = 1 if check_seconds else 2
+        if snapshot.reads["load"] != expected_loads:
+            raise AssertionError(
+                f" {snapshot.reads['load']} full loads instead of {expected_loads}"
+            )
+        if check_seconds == 0 and (
+            snapshot.get(snapshot.items[0]["address"]) != snapshot.items[0]["price"]
+        ):
+            raise AssertionError(" price update not seen by the snapshot")
+
+        logging.getLogger(__name__).info(
+            f" {qtty} queue items ( watermark checked every {check_seconds}s ): {snapshot.reads['load']} full loads and {snapshot.reads['watermark']} watermark reads, instead of {qtty} full loads. Snapshot version {snapshot.version}"
+        )
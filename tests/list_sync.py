@@ -0,0 +1,76 @@
+import logging
+import tempfile
+
+from bins.w3.protocols.angle.list_sync import append_only_list_sync
+
+
+class _fake_distributor:
+    """Append-only distribution list recording the indexes requested"""
+
+    def __init__(self, length: int, undecodable: set[int] | None = None):
+        self.length = length
+        # existing indexes that can't be decoded ( yet )
+        self.undecodable = undecodable or set()
+        self.requested: list[int] = []
+
+    def fetch(self, indexes: list[int]) -> dict:
+        self.requested += indexes
+        return {
+            x: (None if x in self.undecodable else {"index": x})
+            for x in indexes
+            if x < self.length
+        }
+
+
+def test_list_sync(length: int = 500, new_items: int = 120):
+    """Sync a fake distributor list twice checking the second sync only fetches new entries,
+        and that entries that could not be decoded are fetched again
+
+    Args:
+        length (int, optional): initial list length. Defaults to 500.
+        new_items (int, optional): items appended before the next sync. Defaults to 120.
+    """
+    undecodable = length - 10
+
+    with tempfile.TemporaryDirectory() as folder:
+
+        def _sync(distributor: _fake_distributor, block: int) -> list:
+            distributor.requested = []
+            return append_only_list_sync(
+                network="ethereum",
+                address=f"0x{1:040x}",
+                list_name="distributionList",
+                folder=folder,
+            ).sync(fetch=distributor.fetch, block=block, batch_size=100)
+
+        # first sync: one item can't be decoded
+        distributor = _fake_distributor(length=length, undecodable={undecodable})
+        items = _sync(distributor, block=100)
+        if len(items) != length or items[undecodable] is not None:
+            raise AssertionError(f" first sync returned {len(items)} items")
+
+        # second sync: new items appended and the failed one decodes now
+        distributor.length += new_items
+        distributor.undecodable = set()
+        items = _sync(distributor, block=200)
+        if items != [{"index": x} for x in range(length + new_items)]:
+            raise AssertionError(" second sync items do not match the list")
+        if min(distributor.requested) != undecodable:
+            raise AssertionError(
+                f" second sync fetched indexes from {min(distributor.requested)} ( expected from {undecodable} )"
+            )
+        if len(set(distributor.requested)) != len(distributor.requested):
+            raise AssertionError(" second sync fetched some indexes twice")
+
+        # third sync: nothing new, only the list end is probed
+        items = _sync(distributor, block=300)
+        if len(items) != length + new_items or min(distributor.requested) < len(
+            items
+        ):
+            raise AssertionError(
+                f" third sync fetched known indexes: {sorted(distributor.requested)}"
+            )
+
+        logging.getLogger(__name__).info(
+            f" list synced with {len(distributor.requested)} index requests when unchanged ( {len(items)} items )"
+        )
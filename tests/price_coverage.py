@@ -0,0 +1,105 @@
+import logging
+import random
+
+from bins.database.common.price_coverage import price_coverage_index
+
+
+class _synthetic_coverage(price_coverage_index):
+    """Price coverage index over synthetic price and status token block sets"""
+
+    def __init__(self, priced: set[tuple[str, int]], referenced: set[tuple[str, int]]):
+        super().__init__(network="ethereum", batch_size=1000)
+        self.priced = priced
+        self.referenced = referenced
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        super().load()
+
+    def _get_priced(self, items: list[tuple[str, int]]) -> set[tuple[str, int]]:
+        return {x for x in items if x in self.priced}
+
+    def _iter_referenced(self):
+        yield from self.referenced
+
+
+def test_price_coverage(
+    tokens: int = 50,
+    blocks: int = 1_000_000,
+    qtty: int = 50000,
+    queries: int = 2000,
+    seed: int | None = None,
+):
+    """Compare the price coverage index against the set difference of synthetic status and price token blocks,
+        before and after registering new prices and status, and after the index expires
+
+    Args:
+        tokens (int, optional): token addresses. Defaults to 50.
+        blocks (int, optional): block range. Defaults to 1_000_000.
+        qtty (int, optional): status token blocks. Defaults to 50000.
+        queries (int, optional): random range queries. Defaults to 2000.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    addresses = [f"0x{rnd.getrandbits(160):040x}" for _ in range(tokens)]
+    referenced = {(rnd.choice(addresses), rnd.randrange(blocks)) for _ in range(qtty)}
+    # most referenced blocks are priced, plus prices not referenced by any status
+    priced = {x for x in referenced if rnd.random() < 0.9} | {
+        (rnd.choice(addresses), rnd.randrange(blocks)) for _ in range(qtty // 10)
+    }
+
+    coverage = _synthetic_coverage(priced=set(priced), referenced=set(referenced))
+
+    def _compare(step: str):
+        expected = referenced - priced
+        if set(coverage.iter_missing()) != expected:
+            raise AssertionError(f" {step}: missing token blocks do not match")
+        for _ in range(queries):
+            address = rnd.choice(addresses)
+            block_ini = rnd.randrange(blocks)
+            block_end = block_ini + rnd.randrange(blocks // 10)
+            naive = sorted(
+                block
+                for _address, block in expected
+                if _address == address and block_ini <= block <= block_end
+            )
+            if coverage.missing(
+                address=address, block_ini=block_ini, block_end=block_end
+            ) != naive or coverage.count_missing(
+                address=address, block_ini=block_ini, block_end=block_end
+            ) != len(naive):
+                raise AssertionError(
+                    f" {step}: {address} missing blocks between {block_ini} and {block_end} do not match"
+                )
+        logging.getLogger(__name__).info(
+            f" {step}: {len(expected)} token blocks without price of {len(referenced)} referenced match the set difference ( {queries} range queries )"
+        )
+
+    _compare("loaded")
+
+    # price feed saves some of the missing prices and new status reference new token blocks
+    new_prices = set(
+        rnd.sample(sorted(referenced - priced), k=len(referenced - priced) // 2)
+    )
+    new_references = {
+        (rnd.choice(addresses), rnd.randrange(blocks)) for _ in range(qtty // 10)
+    } | set(rnd.sample(sorted(priced), k=100))
+    # only saved prices and new status token blocks without price are registered
+    coverage.priced |= new_prices
+    coverage.add_prices(items=list(new_prices))
+    coverage.add_references(items=list(new_references - coverage.priced))
+    coverage.referenced |= new_references
+    priced |= new_prices
+    referenced |= new_references
+
+    _compare("updated")
+
+    # prices saved by other processes are seen once the index expires
+    other_prices = set(rnd.sample(sorted(referenced - priced), k=100))
+    coverage.priced |= other_prices
+    priced |= other_prices
+    coverage._loaded_at -= coverage.max_age
+    _compare("expired")
+    if coverage.loads != 2:
+        raise AssertionError(" expired index was not rebuilt")
@@ -0,0 +1,159 @@
+import logging
+from types import SimpleNamespace
+
+from apps.feeds.queue.helpers import to_free_or_not_to_free_item
+from apps.feeds.queue.queue_item import QueueItem
+from bins.database.common.db_collections_common import database_local
+from bins.general.enums import queueItemType
+
+
+class _local_queue_database(database_local):
+    """In memory queue collection implementing the database methods ( and the mongo operators ) used by the queue"""
+
+    def __init__(self):
+        self.items: dict[str, dict] = {}
+
+    def replace_items_to_database(self, data: list[dict], collection_name: str):
+        for item in data:
+            self.items[item["id"]] = dict(item)
+
+    def delete_item(self, collection_name: str, item_id: str):
+        return SimpleNamespace(
+            deleted_count=int(self.items.pop(item_id, None) is not None),
+            acknowledged=True,
+        )
+
+    def get_items_from_database(
+        self, collection_name: str, find: dict, **kwargs
+    ) -> list[dict]:
+        return [dict(x) for x in self.items.values() if _match(x, find)]
+
+    def get_distinct_items_from_database(
+        self, collection_name: str, field: str, condition: dict
+    ) -> list:
+        return list(
+            {x[field] for x in self.items.values() if _match(x, condition)}
+        )
+
+    def update_many(self, collection_name: str, find: dict, update: dict):
+        found = [x for x in self.items.values() if _match(x, find)]
+        return SimpleNamespace(
+            modified_count=sum(_update(x, update) for x in found), acknowledged=True
+        )
+
+    def find_one_and_update(
+        self, collection_name: str, find: dict, update: dict, sort=None, upsert=False
+    ):
+        for item in sorted(self.items.values(), key=lambda x: x["creation"]):
+            if _match(item, find):
+                _update(item, update)
+                return dict(item)
+        return None
+
+
+def _match(item: dict, find: dict) -> bool:
+    for field, condition in find.items():
+        value = item.get(field)
+        values = value if isinstance(value, list) else [value]
+        if not isinstance(condition, dict):
+            if condition not in values:
+                return False
+            continue
+        for operator, argument in condition.items():
+            if operator == "$in" and not any(x in argument for x in values):
+                return False
+            if operator == "$ne" and value == argument:
+                return False
+            if operator == "$size" and (
+                not isinstance(value, list) or len(value) != argument
+            ):
+                return False
+    return True
+
+
+def _update(item: dict, update: dict) -> bool:
+    before = {k: list(v) if isinstance(v, list) else v for k, v in item.items()}
+    for field, value in update.get("$set", {}).items():
+        item[field] = value
+    for field, value in update.get("$pull", {}).items():
+        pulled = value["$in"] if isinstance(value, dict) else [value]
+        item[field] = [x for x in item.get(field, []) if x not in pulled]
+    return item != before
+
+
+def _queue_items(block: int, price_addresses: list[str]) -> tuple[list[dict], dict]:
+    """Price queue items and a reward status item depending on them"""
+    prices = [
+        QueueItem(
+            type=queueItemType.PRICE, block=block, address=address, data={}
+        ).as_dict
+        for address in price_addresses
+    ]
+    reward = QueueItem(
+        type=queueItemType.REWARD_STATUS,
+        block=block,
+        address=f"0x{2:040x}",
+        data={
+            "reward_static": {
+                "hypervisor_address": f"0x{1:040x}",
+                "rewarder_address": f"0x{2:040x}",
+                "rewardToken": f"0x{3:040x}",
+            },
+            "hypervisor_status": {},
+        },
+        dependencies=[x["id"] for x in prices],
+    ).as_dict
+    return prices, reward
+
+
+def test_queue_dependencies():
+    """Check reward status queue items are released when the price items they wait for
+    fail for good or were processed before the reward item was saved
+    """
+    # dependency failing for good
+    database = _local_queue_database()
+    prices, reward = _queue_items(block=100, price_addresses=[f"0x{10:040x}"])
+    database.replace_items_to_database(
+        data=prices + [reward], collection_name="queue"
+    )
+
+    if database.get_queue_item(types=[queueItemType.REWARD_STATUS]) is not None:
+        raise AssertionError(" reward item handed out with pending dependencies")
+
+    # price item fails its fifth time ( count is increased when loaded )
+    database.items[prices[0]["id"]]["count"] = 4
+    price_item = QueueItem(**database.get_queue_item(types=[queueItemType.PRICE]))
+    if to_free_or_not_to_free_item(
+        network="ethereum", queue_item=price_item, local_db=database
+    ):
+        raise AssertionError(" price item failing 5 times was freed")
+    if database.get_queue_item(types=[queueItemType.REWARD_STATUS]) is None:
+        raise AssertionError(" reward item not released after its dependency failed")
+
+    # dependencies processed before the dependent item is saved
+    database = _local_queue_database()
+    prices, reward = _queue_items(
+        block=200, price_addresses=[f"0x{11:040x}", f"0x{12:040x}"]
+    )
+    # only the second price is still in queue
+    database.replace_items_to_database(
+        data=prices[1:] + [reward], collection_name="queue"
+    )
+    database.release_queue_items_missing_dependencies(ids=[reward["id"]])
+    if database.items[reward["id"]]["dependencies"] != [prices[1]["id"]]:
+        raise AssertionError(" missing dependency was not removed")
+    if database.get_queue_item(types=[queueItemType.REWARD_STATUS]) is not None:
+        raise AssertionError(" reward item handed out with pending dependencies")
+
+    # the second price is processed before the reward item is saved again
+    database.delete_item(collection_name="queue", item_id=prices[1]["id"])
+    database.replace_items_to_database(data=[reward], collection_name="queue")
+    database.release_queue_items_missing_dependencies(ids=[reward["id"]])
+    if database.get_queue_item(types=[queueItemType.REWARD_STATUS]) is None:
+        raise AssertionError(
+            " reward item not released when its dependencies were already processed"
+        )
+
+    logging.getLogger(__name__).info(
+        " reward status items released after their price dependencies failed or were already processed"
+    )
@@ -0,0 +1,107 @@
+import logging
+import random
+import tempfile
+
+from bins.w3.protocols.gamma.registry_snapshot import hypervisor_registry_snapshot
+
+
+class _local_registry:
+    """Hypervisor registry stand-in ( implements the registry wrapper methods used by the snapshot ), recording the indexes read"""
+
+    def __init__(self, block: int = 1000):
+        self.block = block
+        # [address, registry index ( 0 when removed )]
+        self.entries = []
+        self.indexes_read = []
+        self.registry_map_calls = 0
+        # indexes failing once ( transient rpc errors )
+        self.failing: set[int] = set()
+
+    @property
+    def counter(self) -> int:
+        return len([x for x in self.entries if x[1]])
+
+    def hypeByIndex(self, index: int) -> tuple[str, int]:
+        self.indexes_read.append(index)
+        if index in self.failing:
+            self.failing.discard(index)
+            raise ValueError("rpc error")
+        if index >= len(self.entries):
+            # out of bounds -> call_function_autoRpc returns None
+            raise TypeError("cannot unpack non-iterable NoneType object")
+        return tuple(self.entries[index])
+
+    def get_registry_indexes(self, addresses: list[str]) -> dict[str, int]:
+        self.registry_map_calls += 1
+        registry_map = {x[0]: x[1] for x in self.entries}
+        return {x: registry_map.get(x, 0) for x in addresses}
+
+    def add(self, address: str):
+        self.entries.append([address, len(self.entries) + 1])
+        self.block += 100
+
+    def remove(self, address: str):
+        next(x for x in self.entries if x[0] == address)[1] = 0
+        self.block += 100
+
+
+def test_registry_snapshot(runs: int = 5, seed: int | None = None):
+    """Sync a hypervisor registry snapshot against a registry stand-in growing ( and removing hypervisors ) between runs,
+        checking only the new registry indexes are read and the add/remove events
+
+    Args:
+        runs (int, optional): . Defaults to 5.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    registry = _local_registry()
+
+    with tempfile.TemporaryDirectory() as folder:
+        for run in range(runs):
+            added = [f"0x{rnd.getrandbits(160):040x}" for _ in range(rnd.randint(0, 40))]
+            for address in added:
+                registry.add(address)
+            active = [x[0] for x in registry.entries if x[1]]
+            removed = rnd.sample(active, k=min(len(active), rnd.randint(0, 3)))
+            for address in removed:
+                registry.remove(address)
+
+            # a new snapshot instance each run: state is loaded from disk
+            snapshot = hypervisor_registry_snapshot(
+                network="ethereum", address=f"0x{0:040x}", folder=folder
+            )
+            last_index = snapshot._state["last_index"]
+            registry.indexes_read = []
+            result = snapshot.sync(registry=registry)
+
+            # only new indexes are read
+            if any(x <= last_index for x in registry.indexes_read):
+                raise AssertionError(
+                    f" run {run}: known registry indexes were read again {registry.indexes_read}"
+                )
+            expected_added = [x for x in added if x not in removed]
+            if sorted(result["added"]) != sorted(expected_added):
+                raise AssertionError(f" run {run}: wrong added hypervisors")
+            expected_removed = [x for x in removed if x not in added]
+            if sorted(result["removed"]) != sorted(expected_removed):
+                raise AssertionError(f" run {run}: wrong removed hypervisors")
+            if result["hypervisors"] != [x[0] for x in registry.entries if x[1]]:
+                raise AssertionError(f" run {run}: wrong registered hypervisors")
+
+            logging.getLogger(__name__).info(
+                f" run {run}: {len(registry.indexes_read)} registry indexes read of {len(registry.entries)} ( {len(result['added'])} added, {len(result['removed'])} removed )"
+            )
+
+        # an index failing once is read again ( with the ones after it ) next sync
+        new_addresses = [f"0x{rnd.getrandbits(160):040x}" for _ in range(5)]
+        for address in new_addresses:
+            registry.add(address)
+        registry.failing = {len(registry.entries) - 3}
+        for expected_added in (new_addresses[:2], new_addresses[2:]):
+            result = hypervisor_registry_snapshot(
+                network="ethereum", address=f"0x{0:040x}", folder=folder
+            ).sync(registry=registry)
+            if result["added"] != expected_added:
+                raise AssertionError(
+                    f" hypervisors added {result['added']} instead of {expected_added} around a failing index"
+                )
@@ -0,0 +1,199 @@
+from decimal import Decimal
+import logging
+import math
+import random
+
+from apps.feeds.returns.analysis import period_yield_analyzer
+from apps.feeds.returns.objects import (
+    period_status,
+    period_timeframe,
+    period_yield_data,
+    qtty_usd_yield,
+    rewards_group,
+    status_group,
+    time_location,
+    token_group,
+    underlying_value,
+)
+from apps.feeds.returns.vectorized import period_yield_vector_analyzer
+from bins.general.enums import Chain
+
+
+def _synthetic_periods(qtty: int, seed: int | None = None) -> list[period_yield_data]:
+    """Consecutive hypervisor periods with random prices, underlying, fees and rewards ( including outliers )"""
+    rnd = random.Random(seed)
+
+    def _decimal(value: float) -> Decimal:
+        return Decimal(f"{value:.12f}")
+
+    result = []
+    timestamp = 1_600_000_000
+    block = 10_000_000
+    price0, price1 = 1800.0, 1.0
+    qtty0, qtty1, supply = 100.0, 150000.0, 1000.0
+    for i in range(qtty):
+        seconds = rnd.choice([0] if i % 97 == 5 else [600, 3600, 86400, 7 * 86400])
+        end_price0 = price0 * (1 + rnd.uniform(-0.05, 0.05))
+        end_price1 = price1 * (1 + rnd.uniform(-0.001, 0.001))
+        fees0, fees1 = qtty0 * rnd.uniform(0, 0.002), qtty1 * rnd.uniform(0, 0.002)
+        end_qtty0 = qtty0 * (1 + rnd.uniform(-0.02, 0.02)) + fees0
+        end_qtty1 = qtty1 * (1 + rnd.uniform(-0.02, 0.02)) + fees1
+        # a few humongous rewards to be discarded as outliers
+        rewards_usd = (qtty0 * price0 + qtty1 * price1) * (
+            rnd.uniform(0, 0.001) if i % 53 != 7 else 5
+        )
+
+        item = period_yield_data(
+            address=f"0x{1:040x}",
+            timeframe=period_timeframe(
+                ini=time_location(timestamp=timestamp, block=block),
+                end=time_location(
+                    timestamp=timestamp + seconds, block=block + seconds // 12
+                ),
+            ),
+            status=period_status(
+                ini=status_group(
+                    prices=token_group(
+                        token0=_decimal(price0), token1=_decimal(price1)
+                    ),
+                    underlying=underlying_value(
+                        qtty=token_group(token0=_decimal(qtty0), token1=_decimal(qtty1)),
+                        details={},
+                    ),
+                    supply=_decimal(supply),
+                ),
+                end=status_group(
+                    prices=token_group(
+                        token0=_decimal(end_price0), token1=_decimal(end_price1)
+                    ),
+                    underlying=underlying_value(
+                        qtty=token_group(
+                            token0=_decimal(end_qtty0), token1=_decimal(end_qtty1)
+                        ),
+                        details={},
+                    ),
+                    supply=_decimal(supply),
+                ),
+            ),
+            fees=qtty_usd_yield(
+                qtty=token_group(token0=_decimal(fees0), token1=_decimal(fees1)),
+                period_yield=Decimal("0"),
+            ),
+            rewards=rewards_group(
+                usd=_decimal(rewards_usd),
+                period_yield=Decimal("0"),
+                details=[
+                    {
+                        "symbol": "RWD",
+                        "qtty": _decimal(rewards_usd / 2),
+                        "usd": _decimal(rewards_usd),
+                        "seconds": seconds,
+                        "period yield": Decimal("0"),
+                    }
+                ]
+                if rewards_usd
+                else [],
+            ),
+        )
+        result.append(item)
+
+        # next period starts where this one ends, with deposits or withdrawals
+        timestamp += seconds + 12
+        block += seconds // 12 + 1
+        price0, price1 = end_price0, end_price1
+        change = rnd.uniform(0.9, 1.1)
+        qtty0, qtty1, supply = end_qtty0 * change, end_qtty1 * change, supply * change
+
+    return result
+
+
+def _compare_values(scalar, vector, path: str, rel_tol: float | None):
+    """Compare nested analyzer results: exactly when rel_tol is None, as floats otherwise"""
+    if isinstance(scalar, dict):
+        if set(scalar) != set(vector):
+            raise AssertionError(f" {path}: different keys")
+        for key in scalar:
+            _compare_values(scalar[key], vector[key], f"{path}.{key}", rel_tol)
+    elif isinstance(scalar, list):
+        if len(scalar) != len(vector):
+            raise AssertionError(f" {path}: different lengths")
+        for i, (x, y) in enumerate(zip(scalar, vector)):
+            _compare_values(x, y, f"{path}[{i}]", rel_tol)
+    elif isinstance(scalar, (int, float, Decimal)) and not isinstance(scalar, bool):
+        if rel_tol is None:
+            if scalar != vector:
+                raise AssertionError(f" {path}: {scalar} != {vector}")
+        elif not math.isclose(
+            float(scalar), float(vector), rel_tol=rel_tol, abs_tol=1e-9
+        ):
+            raise AssertionError(f" {path}: {scalar} != {vector}")
+    elif scalar != vector:
+        raise AssertionError(f" {path}: {scalar} != {vector}")
+
+
+def test_returns_analyzers(qtty: int = 1000, seed: int | None = None):
+    """Compare the vectorized returns analyzer against period_yield_analyzer over the same synthetic periods:
+        graph and checkpoint values must be equal in decimal mode and close in float mode,
+        also when the analysis continues from a checkpoint
+
+    Args:
+        qtty (int, optional): periods. Defaults to 1000.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    yield_data_list = _synthetic_periods(qtty=qtty, seed=seed)
+    hypervisor_static = {"address": f"0x{1:040x}", "symbol": "xTEST"}
+
+    def _analyze(analyzer, checkpoint: dict | None = None, **kwargs):
+        return analyzer(
+            chain=Chain.ETHEREUM,
+            yield_data_list=yield_data_list,
+            hypervisor_static=hypervisor_static,
+            checkpoint=checkpoint,
+            **kwargs,
+        )
+
+    scalar = _analyze(period_yield_analyzer)
+    for mode, rel_tol in (("decimal", None), ("float", 1e-9)):
+        vector = _analyze(period_yield_vector_analyzer, mode=mode)
+        _compare_values(
+            scalar.get_graph(), vector.get_graph(), f"{mode} graph", rel_tol
+        )
+        _compare_values(
+            scalar.get_checkpoint(),
+            vector.get_checkpoint(),
+            f"{mode} checkpoint",
+            rel_tol,
+        )
+
+    # continue from a checkpoint built with the first half of the periods
+    middle = yield_data_list[len(yield_data_list) // 2].timeframe.end.block
+    half = period_yield_analyzer(
+        chain=Chain.ETHEREUM,
+        yield_data_list=[x for x in yield_data_list if x.timeframe.end.block <= middle],
+        hypervisor_static=hypervisor_static,
+    ).get_checkpoint()
+    scalar_continued = _analyze(period_yield_analyzer, checkpoint=half)
+    _compare_values(
+        scalar.get_checkpoint(),
+        scalar_continued.get_checkpoint(),
+        "scalar continued checkpoint",
+        None,
+    )
+    for mode, rel_tol in (("decimal", None), ("float", 1e-9)):
+        vector = _analyze(period_yield_vector_analyzer, checkpoint=half, mode=mode)
+        _compare_values(
+            scalar_continued.get_graph(),
+            vector.get_graph(),
+            f"{mode} continued graph",
+            rel_tol,
+        )
+        _compare_values(
+            scalar_continued.get_checkpoint(),
+            vector.get_checkpoint(),
+            f"{mode} continued checkpoint",
+            rel_tol,
+        )
+
+    logging.getLogger(__name__).info(
+        f" {len(scalar.yield_data_list)} of {qtty} periods analyzed with the same results by both analyzers ( decimal and float modes, with and without checkpoint )"
+    )
@@ -0,0 +1,128 @@
+import logging
+import random
+
+from bins.configuration import CONFIGURATION
+from bins.general.file_utilities import load_json
+from bins.w3.protocols.ramses import rewarder as ramses_rewarder
+
+
+class _abi_helper:
+    """Gauge wrapper stand-in: only provides the abi parts"""
+
+    def __init__(self, abi_filename: str = "RamsesGaugeV2"):
+        # same abi root as the web3 wrappers
+        abi_root_path = (
+            CONFIGURATION.get("data", {}).get("abi_path", None) or "data/abi"
+        )
+        self.abi = load_json(
+            filename=abi_filename, folder_path=f"{abi_root_path}/ramses"
+        )
+
+    def get_abi_function(self, name: str) -> dict:
+        return next(x for x in self.abi if x.get("name") == name)
+
+
+class _no_block_time_service:
+    """Block time service stand-in not knowing any timestamp"""
+
+    def get_timestamps(self, blocks: list[int]) -> dict[int, int]:
+        return {}
+
+
+class _local_gauges:
+    """Multicall executor stand-in answering gauge calls from known data, counting round trips"""
+
+    def __init__(self, gauges: dict[tuple[str, int], dict[str, int]]):
+        # ( gauge address, block ): { reward token: reward rate }
+        self.gauges = gauges
+        self.round_trips = 0
+
+    def execute_parse_calls(self, network: str, block: int, calls: list, **kwargs):
+        self.round_trips += 1
+        for call in calls:
+            rewards = self.gauges[(call["address"].lower(), block)]
+            if call["name"] == "getRewardTokens":
+                value = list(rewards)
+            elif call["name"] == "rewardRate":
+                value = rewards[call["inputs"][0]["value"]]
+            call["outputs"][0]["value"] = value
+        return calls
+
+
+def test_gauges_rewards_multicall(
+    qtty: int = 50, blocks: int = 3, seed: int | None = None
+):
+    """Check the batched gauge rewards against known gauge data, counting multicall round trips.
+        Gauges at the block without timestamp are expected to be skipped
+
+    Args:
+        qtty (int, optional): gauges. Defaults to 50.
+        blocks (int, optional): distinct blocks. Defaults to 3.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    gauges = {
+        (f"0x{rnd.getrandbits(160):040x}", 1_000_000 + rnd.randrange(blocks)): {
+            f"0x{rnd.getrandbits(160):040x}": rnd.getrandbits(64)
+            for _ in range(rnd.randint(1, 4))
+        }
+        for _ in range(qtty)
+    }
+    # gauges at one block without timestamp
+    no_timestamp_block = 999_999
+    gauges |= {
+        (f"0x{rnd.getrandbits(160):040x}", no_timestamp_block): {
+            f"0x{rnd.getrandbits(160):040x}": rnd.getrandbits(64)
+        }
+        for _ in range(3)
+    }
+    chain = _local_gauges(gauges=gauges)
+
+    _execute_parse_calls = ramses_rewarder.execute_parse_calls
+    _get_block_time_service = ramses_rewarder.get_block_time_service
+    ramses_rewarder.execute_parse_calls = chain.execute_parse_calls
+    ramses_rewarder.get_block_time_service = lambda network: _no_block_time_service()
+    try:
+        result = ramses_rewarder.get_gauges_rewards(
+            network="arbitrum",
+            gauges=list(gauges),
+            convert_bint=True,
+            timestamps={
+                block: 1700000000 + block
+                for _, block in gauges
+                if block != no_timestamp_block
+            },
+            helper=_abi_helper(),
+        )
+    finally:
+        ramses_rewarder.execute_parse_calls = _execute_parse_calls
+        ramses_rewarder.get_block_time_service = _get_block_time_service
+
+    expected = [
+        (address, block, 1700000000 + block, token, str(rate))
+        for (address, block), rewards in gauges.items()
+        for token, rate in rewards.items()
+        if block != no_timestamp_block
+    ]
+    found = [
+        (
+            x["rewarder_address"],
+            x["block"],
+            x["timestamp"],
+            x["rewardToken"],
+            x["rewards_perSecond"],
+        )
+        for x in result
+    ]
+    if found != expected:
+        raise AssertionError(" batched gauge rewards do not match the gauges data")
+
+    distinct_blocks = len({block for _, block in gauges}) - 1
+    if chain.round_trips != 2 * distinct_blocks:
+        raise AssertionError(
+            f" {chain.round_trips} multicall round trips instead of {2 * distinct_blocks}"
+        )
+
+    logging.getLogger(__name__).info(
+        f" {len(result)} rewards of {len(gauges)} gauges at {distinct_blocks} blocks using {chain.round_trips} multicall round trips, instead of {len(gauges) + len(result)} calls"
+    )
@@ -0,0 +1,178 @@
+import logging
+import random
+import resource
+import tracemalloc
+
+from apps.checks.helpers import database as checks_database
+from bins.configuration import CONFIGURATION
+from bins.database.common.database_ids import create_id_price
+from bins.database.common.db_collections_common import (
+    database_global,
+    database_local,
+)
+from bins.database.common.db_managers import MongoDbManager
+from bins.general.enums import Chain
+
+
+def _seed(
+    local_db: database_local,
+    global_db: database_global,
+    qtty: int,
+    filler: int,
+    rnd: random.Random,
+    batch_size: int = 2000,
+) -> tuple[set[str], list[str]]:
+    """Save synthetic status documents and the usd prices of most of their token blocks, in batches
+
+    Returns:
+        tuple[set[str], list[str]]: price ids without price, status ids with a non int block
+    """
+    tokens = [f"0x{rnd.getrandbits(160):040x}" for _ in range(20)]
+    hypervisors = [f"0x{rnd.getrandbits(160):040x}" for _ in range(50)]
+    # { price id: last price saved } of all status token blocks ( None when not saved )
+    prices_saved = {}
+    wrong_blocks = []
+
+    status, prices = [], []
+    for i in range(qtty):
+        block = 15_000_000 + rnd.randrange(qtty * 2)
+        token0, token1 = rnd.sample(tokens, k=2)
+        item = {
+            "id": f"{hypervisors[i % len(hypervisors)]}_{i}",
+            "address": hypervisors[i % len(hypervisors)],
+            "block": block,
+            "pool": {
+                "token0": {"address": token0, "block": block},
+                "token1": {"address": token1, "block": block},
+            },
+            # the rest of the document ( never needed by the checks )
+            "filler": "x" * filler,
+        }
+        if i % 1000 == 3:
+            item["block"] = str(block)
+            wrong_blocks.append(item["id"])
+        status.append(item)
+
+        for token in (token0, token1):
+            price_id = create_id_price(
+                network=Chain.ETHEREUM.database_name, block=block, token_address=token
+            )
+            prices_saved.setdefault(price_id, None)
+            chance = rnd.random()
+            if chance < 0.03:
+                # no price
+                continue
+            # some zero prices
+            prices_saved[price_id] = 0 if chance < 0.05 else rnd.uniform(0.1, 3000)
+            prices.append(
+                {
+                    "id": price_id,
+                    "network": Chain.ETHEREUM.database_name,
+                    "block": block,
+                    "address": token,
+                    "price": prices_saved[price_id],
+                }
+            )
+
+        if len(status) >= batch_size or i == qtty - 1:
+            if (
+                local_db.save_items_to_database(data=status, collection_name="status")
+                is None
+                or global_db.save_items_to_database(
+                    data=prices, collection_name="usd_prices"
+                )
+                is None
+            ):
+                raise ValueError(" Could not seed the test databases")
+            status, prices = [], []
+
+    return {k for k, v in prices_saved.items() if not v}, wrong_blocks
+
+
+def test_status_checks_memory(
+    mongo_url: str | None = None,
+    qtty: int = 100_000,
+    filler: int = 2000,
+    max_memory_mb: float = 64,
+    seed: int | None = None,
+):
+    """Seed a local mongod with synthetic status documents and prices, then run the status price
+        and block type checks checking their results and that their memory does not grow with the documents size.
+        Temporary databases are created and dropped ( nothing is written to the configured ones )
+
+    Args:
+        mongo_url (str | None, optional): local mongod. Defaults to the configured mongo_server_url.
+        qtty (int, optional): status documents. Defaults to 100_000.
+        filler (int, optional): bytes of each status document not used by the checks. Defaults to 2000.
+        max_memory_mb (float, optional): maximum python memory peak and RSS growth of each check. Defaults to 64.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    mongo_url = mongo_url or CONFIGURATION["sources"]["database"]["mongo_server_url"]
+    suffix = f"{rnd.getrandbits(32):08x}"
+    local_db = database_local(mongo_url=mongo_url, db_name=f"test_checks_{suffix}")
+    global_db = database_global(
+        mongo_url=mongo_url, db_name=f"test_checks_global_{suffix}"
+    )
+
+    # the checks use the temporary databases
+    _get_default_localdb = checks_database.get_default_localdb
+    _get_default_globaldb = checks_database.get_default_globaldb
+    checks_database.get_default_localdb = lambda network: local_db
+    checks_database.get_default_globaldb = lambda: global_db
+    try:
+        missing_prices, wrong_blocks = _seed(
+            local_db=local_db, global_db=global_db, qtty=qtty, filler=filler, rnd=rnd
+        )
+        logging.getLogger(__name__).info(
+            f" {qtty} status documents of ~{filler / 1000:,.0f}KB seeded ( {qtty * filler / 1024**2:,.0f}MB ): {len(missing_prices)} token blocks without price, {len(wrong_blocks)} non int blocks"
+        )
+
+        def _measure(name: str, check):
+            rss_ini = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            tracemalloc.start()
+            try:
+                result = check()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            # ru_maxrss is in KB ( linux )
+            rss_growth = (
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_ini
+            ) / 1024
+            if peak / 1024**2 > max_memory_mb or rss_growth > max_memory_mb:
+                raise AssertionError(
+                    f" {name} used {peak / 1024**2:,.1f}MB python memory peak and {rss_growth:,.1f}MB peak RSS growth ( max {max_memory_mb}MB )"
+                )
+            logging.getLogger(__name__).info(
+                f" {name}: {peak / 1024**2:,.1f}MB python memory peak, {rss_growth:,.1f}MB peak RSS growth"
+            )
+            return result
+
+        found = _measure(
+            "status prices check",
+            lambda: checks_database.get_status_prices_missing(chain=Chain.ETHEREUM),
+        )
+        if found != missing_prices:
+            raise AssertionError(
+                f" status prices check found {len(found)} token blocks without price instead of {len(missing_prices)}"
+            )
+
+        found = _measure(
+            "status block type check",
+            lambda: checks_database.get_offending_ids(
+                database=local_db,
+                collection_name="status",
+                find={"block": {"$not": {"$type": "int"}}},
+            ),
+        )
+        if sorted(found) != sorted(wrong_blocks):
+            raise AssertionError(
+                f" status block type check found {len(found)} non int blocks instead of {len(wrong_blocks)}"
+            )
+    finally:
+        checks_database.get_default_localdb = _get_default_localdb
+        checks_database.get_default_globaldb = _get_default_globaldb
+        with MongoDbManager(url=mongo_url, db_name="admin", collections={}) as db:
+            for database in (local_db, global_db):
+                db.mongo_client.drop_database(database._db_name)
@@ -1,11 +1,19 @@
-from enum import Enum
+from bins.general.enums import test_type
+from tests.contract_creation import test_contract_creation_onchain
+from tests.etherscan import test_etherscan_client, test_etherscan_rate_limits
+from tests.formulas import test_formulas
 from tests.hypervisors import test_hypervisors
+from tests.latest_prices import test_latest_price_snapshot
+from tests.list_sync import test_list_sync
+from tests.price_coverage import test_price_coverage
 from tests.protocols import test_protocols
-
-
-class test_type(str, Enum):
-    Protocols = "protocols"
-    Hypervisors = "hypervisors"
+from tests.queue_dependencies import test_queue_dependencies
+from tests.registries import test_registry_snapshot
+from tests.returns import test_returns_analyzers
+from tests.rewarders import test_gauges_rewards_multicall
+from tests.status_checks import test_status_checks_memory
+from tests.thegraph import test_thegraph_pagination
+from tests.transfers import test_transfer_scan, test_wallet_transfers_collector
 
 
 def main(option):
@@ -15,3 +23,44 @@ def main(option):
     elif option == test_type.Hypervisors:
         # test hypervisors
         test_hypervisors(qtty_per_protocol=1)
+    elif option == test_type.Formulas:
+        # test batch formulas against scalar ones
+        test_formulas()
+    elif option == test_type.Thegraph:
+        # test thegraph pagination against a local subgraph stand-in
+        test_thegraph_pagination()
+    elif option == test_type.ContractCreation:
+        # test the on-chain contract creation search against a local chain stand-in
+        test_contract_creation_onchain()
+    elif option == test_type.LatestPrices:
+        # count database reads of the shared latest price snapshot
+        test_latest_price_snapshot()
+    elif option == test_type.Rewarders:
+        # count multicall round trips of the batched gauge rewards
+        test_gauges_rewards_multicall()
+    elif option == test_type.Registries:
+        # check hypervisor registry snapshots only read new indexes
+        test_registry_snapshot()
+    elif option == test_type.Transfers:
+        # check resumable transfer scans against recorded transfers
+        test_transfer_scan()
+        test_wallet_transfers_collector()
+    elif option == test_type.PriceCoverage:
+        # compare the price coverage index against a naive set difference
+        test_price_coverage()
+    elif option == test_type.Etherscan:
+        # etherscan client against a local http stand-in
+        test_etherscan_client()
+        test_etherscan_rate_limits()
+    elif option == test_type.QueueDependencies:
+        # queue items released when their dependencies fail or are gone
+        test_queue_dependencies()
+    elif option == test_type.Returns:
+        # vectorized returns analyzer against the scalar one
+        test_returns_analyzers()
+    elif option == test_type.ListSync:
+        # append-only contract list sync against a fake distributor
+        test_list_sync()
+    elif option == test_type.StatusChecks:
+        # status checks memory against a local mongod
+        test_status_checks_memory()
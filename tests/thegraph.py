@@ -0,0 +1,159 @@
+import json
+import logging
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bins.apis.thegraph_utilities import thegraph_scraper_helper
+from bins.configuration import CONFIGURATION
+
+
+class _local_scraper(thegraph_scraper_helper):
+    """Scraper of the local subgraph stand-in"""
+
+    def __init__(self, url: str):
+        self._url = url
+        super().__init__(cache=False, convert=False)
+
+    def init_URLS(self):
+        self._URLS = {"local": self._url}
+
+    def _query_constructor(self, skip: int, name: str, filter: str) -> tuple:
+        return (
+            """{{ items({}, skip: {}) {{ id value }} }}""".format(filter, skip),
+            ["data", "items"],
+        )
+
+
+def _local_subgraph(
+    items: list[dict], max_skip: int, fail_after: str | None = None
+) -> ThreadingHTTPServer:
+    """Serve items like a subgraph would ( first, skip, id_gt, id_gte, id_lt ),
+    rejecting skips greater than max_skip ( and id_gt pages from fail_after, when set )"""
+
+    class _handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))[
+                "query"
+            ]
+            first = int(re.search(r"first:\s*(\d+)", query)[1])
+            skip = int(re.search(r"skip:\s*(\d+)", query)[1])
+            id_gt = re.search(r'id_gt:\s*"([^"]*)"', query)
+            if fail_after is not None and id_gt and id_gt[1] >= fail_after:
+                response = {"errors": [{"message": "indexing error"}]}
+            elif skip > max_skip:
+                response = {
+                    "errors": [
+                        {
+                            "message": f"The `skip` argument must be between 0 and {max_skip}, but is {skip}"
+                        }
+                    ]
+                }
+            else:
+                result = items
+                for operator, compare in (
+                    ("id_gt", lambda x, y: x > y),
+                    ("id_gte", lambda x, y: x >= y),
+                    ("id_lt", lambda x, y: x < y),
+                ):
+                    if found := re.search(rf'{operator}:\s*"([^"]*)"', query):
+                        result = [x for x in result if compare(x["id"], found[1])]
+                response = {"data": {"items": result[skip : skip + first]}}
+
+            body = json.dumps(response).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_thegraph_pagination(
+    qtty: int = 50000, max_skip: int = 5000, shards: int = 4, seed: int | None = None
+):
+    """Compare skip and id pagination against a local subgraph stand-in serving qtty items
+
+    Args:
+        qtty (int, optional): number of items served. Defaults to 50000.
+        max_skip (int, optional): maximum skip accepted by the stand-in. Defaults to 5000.
+        shards (int, optional): id ranges queried concurrently. Defaults to 4.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    items = sorted(
+        (
+            {"id": f"0x{rnd.getrandbits(160):040x}", "value": str(i)}
+            for i in range(qtty)
+        ),
+        key=lambda x: x["id"],
+    )
+
+    # do not wait for the public thegraph rate limit
+    CONFIGURATION.setdefault("sources", {}).setdefault("rate_limits", {})[
+        "thegraph"
+    ] = {"rate": 1000, "capacity": 1000}
+
+    server = _local_subgraph(items=items, max_skip=max_skip)
+    try:
+        scraper = _local_scraper(url=f"http://127.0.0.1:{server.server_port}")
+
+        # skip pagination can't get past the skip ceiling
+        _startime = time.perf_counter()
+        result = scraper.get_all_results(network="local", query_name="items")
+        logging.getLogger(__name__).info(
+            f" skip pagination: {len(result)} of {qtty} items in {time.perf_counter()-_startime:,.2f}s"
+        )
+
+        for _shards in sorted({1, shards}):
+            _startime = time.perf_counter()
+            result = scraper.get_all_results(
+                network="local", query_name="items", pagination="id", shards=_shards
+            )
+            logging.getLogger(__name__).info(
+                f" id pagination ( {_shards} shards ): {len(result)} of {qtty} items in {time.perf_counter()-_startime:,.2f}s"
+            )
+            if sorted(x["id"] for x in result) != [x["id"] for x in items]:
+                raise AssertionError(
+                    f" id pagination with {_shards} shards returned {len(result)} items ( {len({x['id'] for x in result})} unique ) of {qtty}"
+                )
+
+        # streaming
+        pages = 0
+        for page in scraper.iter_results(
+            network="local", query_name="items", shards=shards
+        ):
+            pages += 1
+        logging.getLogger(__name__).info(f" {pages} pages streamed")
+    finally:
+        server.shutdown()
+
+    # pages that can't be retrieved raise instead of returning partial results
+    server = _local_subgraph(
+        items=items, max_skip=max_skip, fail_after=items[qtty * 3 // 4]["id"]
+    )
+    try:
+        scraper = _local_scraper(url=f"http://127.0.0.1:{server.server_port}")
+        for _shards in sorted({1, shards}):
+            try:
+                result = scraper.get_all_results(
+                    network="local", query_name="items", pagination="id", shards=_shards
+                )
+            except ValueError as e:
+                logging.getLogger(__name__).info(
+                    f" id pagination ( {_shards} shards ) failing page raised: {e}"
+                )
+            else:
+                raise AssertionError(
+                    f" id pagination with {_shards} shards returned {len(result)} of {qtty} items from a failing subgraph"
+                )
+    finally:
+        server.shutdown()
@@ -0,0 +1,232 @@
+import logging
+import os
+import random
+import tempfile
+from types import SimpleNamespace
+
+from hexbytes import HexBytes
+
+from apps.checks.helpers.transfers import transfer_scan
+from bins.errors.general import ProcessingError
+from bins.general.enums import Chain, error_identity
+from bins.w3.protocols.gamma.collectors import wallet_transfers_collector
+
+
+class _recorded_transfer_scan(transfer_scan):
+    """Transfer scan over recorded transfers, recording the block ranges queried.
+    Queries wider than max_range blocks fail like RPCs limiting eth_getLogs ranges"""
+
+    def __init__(self, transfers: list[dict], max_range: int, **kwargs):
+        super().__init__(**kwargs)
+        self.recorded = transfers
+        self.max_range = max_range
+        self.queries = []
+
+    def _get_logs(self, block_ini: int, block_end: int) -> list[dict]:
+        if block_end - block_ini + 1 > self.max_range:
+            raise ProcessingError(
+                chain=self.chain,
+                item={},
+                identity=error_identity.TOO_MANY_BLOCKS_TO_QUERY,
+                message=" too many blocks to query",
+            )
+        self.queries.append((block_ini, block_end))
+        return [
+            dict(x)
+            for x in self.recorded
+            if block_ini <= x["blockNumber"] <= block_end
+            and x["src"] in self.from_addresses
+            and x["dst"] in self.to_addresses
+        ]
+
+
+class _recorded_logs:
+    """web3 helper stand-in returning recorded log entries ( in chunks of blocks )"""
+
+    def __init__(self, entries: list):
+        self.entries = entries
+
+    def create_eventFilter_chunks(self, eventfilter: dict, max_blocks: int):
+        for block in range(eventfilter["fromBlock"], eventfilter["toBlock"] + 1, max_blocks):
+            yield {
+                **eventfilter,
+                "fromBlock": block,
+                "toBlock": min(eventfilter["toBlock"], block + max_blocks - 1),
+            }
+
+    def get_all_entries(self, filter: dict, rpcKey_names: list[str]) -> list:
+        return [
+            x
+            for x in self.entries
+            if filter["fromBlock"] <= x.blockNumber <= filter["toBlock"]
+        ]
+
+
+class _recorded_wallet_transfers_collector(wallet_transfers_collector):
+    def __init__(self, wallet_addresses: list[str], entries: list):
+        self.network = "ethereum"
+        self.wallet_addresses = wallet_addresses
+        self._progress_callback = None
+        self._token_helpers = dict()
+        self._data = dict()
+        self._web3_helper = _recorded_logs(entries=entries)
+
+
+def test_wallet_transfers_collector(qtty: int = 200, seed: int | None = None):
+    """Decode recorded Transfer log entries with the wallet transfers collector
+
+    Args:
+        qtty (int, optional): log entries. Defaults to 200.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    wallet = f"0x{rnd.getrandbits(160):040x}"
+    entries = []
+    for i in range(qtty):
+        block = rnd.randrange(100_000)
+        entries.append(
+            SimpleNamespace(
+                transactionHash=HexBytes(rnd.getrandbits(256).to_bytes(32, "big")),
+                blockHash=HexBytes(block.to_bytes(32, "big")),
+                blockNumber=block,
+                address=f"0x{rnd.getrandbits(160):040x}",
+                topics=[
+                    HexBytes(bytes(32)),
+                    HexBytes(bytes(12) + rnd.getrandbits(160).to_bytes(20, "big")),
+                    HexBytes(bytes(12) + bytes.fromhex(wallet[2:])),
+                ],
+                # every tenth entry is a non ERC20 transfer ( no data )
+                data="0x" if i % 10 == 0 else f"0x{i + 1:064x}",
+                logIndex=i,
+            )
+        )
+
+    collector = _recorded_wallet_transfers_collector(
+        wallet_addresses=[wallet], entries=entries
+    )
+    found = [
+        x
+        for chunk in collector.operations_generator(
+            block_ini=0, block_end=99_999, max_blocks=10_000
+        )
+        for x in chunk
+    ]
+
+    if len(found) != qtty:
+        raise AssertionError(f" {len(found)} transfers decoded of {qtty}")
+    for x in found:
+        entry = entries[x["logIndex"]]
+        expected_qtty = "1" if x["logIndex"] % 10 == 0 else str(x["logIndex"] + 1)
+        if (
+            x["topic"] != "transfer"
+            or x["dst"] != wallet
+            or x["qtty"] != expected_qtty
+            or x["blockNumber"] != entry.blockNumber
+        ):
+            raise AssertionError(f" wrong decoded transfer {x}")
+
+    logging.getLogger(__name__).info(
+        f" {len(found)} wallet transfers decoded from {qtty} log entries"
+    )
+
+
+def test_transfer_scan(
+    blocks: int = 2_000_000, qtty: int = 3000, seed: int | None = None
+):
+    """Scan recorded transfers to each hypervisor three times ( extending the block range ) checking the transfers found,
+        that only the new block range is queried and that transfers are appended to the saved file
+
+    Args:
+        blocks (int, optional): recorded block range. Defaults to 2_000_000.
+        qtty (int, optional): recorded transfers. Defaults to 3000.
+        seed (int, optional): random seed. Defaults to None.
+    """
+    rnd = random.Random(seed)
+    wallet = f"0x{rnd.getrandbits(160):040x}"
+    hypervisors = [f"0x{rnd.getrandbits(160):040x}" for _ in range(5)]
+    tokens = [f"0x{rnd.getrandbits(160):040x}" for _ in range(5)]
+
+    # dense activity in the middle of the range
+    transfers = []
+    for i in range(qtty):
+        block = (
+            int(rnd.triangular(0, blocks, blocks / 2))
+            if i % 2
+            else rnd.randrange(blocks)
+        )
+        hypervisor = rnd.choice(hypervisors)
+        transfers.append(
+            {
+                "transactionHash": f"0x{rnd.getrandbits(256):064x}",
+                "blockHash": f"0x{block:064x}",
+                "blockNumber": block,
+                # token transferred: the hypervisor share token itself when withdrawing
+                "address": rnd.choice(tokens + [hypervisor]),
+                "src": rnd.choice([wallet, f"0x{rnd.getrandbits(160):040x}"]),
+                "dst": hypervisor,
+                "qtty": str(rnd.getrandbits(64)),
+                "topic": "transfer",
+                "logIndex": 0,
+            }
+        )
+
+    def _expected(block_ini: int, block_end: int, hypervisor: str) -> list[tuple]:
+        return sorted(
+            (x["blockNumber"], x["transactionHash"])
+            for x in transfers
+            if block_ini <= x["blockNumber"] <= block_end
+            and x["src"] == wallet
+            and x["dst"] == hypervisor
+            and x["address"] != hypervisor
+        )
+
+    with tempfile.TemporaryDirectory() as folder:
+        middle = blocks // 2
+        for run, (block_ini, block_end) in enumerate(
+            [(blocks // 4, middle), (blocks // 4, blocks - 1), (0, blocks - 1)]
+        ):
+            for hypervisor in hypervisors:
+                # a new scan each run: scanned range and transfers are loaded from disk
+                scan = _recorded_transfer_scan(
+                    transfers=transfers,
+                    max_range=50_000,
+                    chain=Chain.ETHEREUM,
+                    from_addresses=[wallet],
+                    to_addresses=[hypervisor],
+                    folder=folder,
+                    target_logs=5,
+                )
+                scanned = (scan._block_ini, scan._block_end)
+                found = sorted(
+                    (x["blockNumber"], x["transactionHash"])
+                    for x in scan.get_transfers(
+                        block_ini=block_ini, block_end=block_end
+                    )
+                )
+                if found != _expected(block_ini, block_end, hypervisor):
+                    raise AssertionError(
+                        f" run {run}: wrong direct transfers to {hypervisor}"
+                    )
+
+                # only blocks outside the previously scanned range are queried
+                if scanned[0] is not None and any(
+                    scanned[0] <= x <= scanned[1]
+                    for query in scan.queries
+                    for x in query
+                ):
+                    raise AssertionError(
+                        f" run {run}: blocks {scanned} were queried again"
+                    )
+
+                # each transfer is appended once
+                if os.path.exists(scan._transfers_path):
+                    with open(scan._transfers_path) as f:
+                        saved = sum(1 for _ in f)
+                    if saved != len(scan._transfers):
+                        raise AssertionError(
+                            f" run {run}: {saved} transfers saved for {len(scan._transfers)} found"
+                        )
+
+                logging.getLogger(__name__).info(
+                    f" run {run}: {hypervisor} blocks {block_ini}-{block_end} needed {len(scan.queries)} queries over {scan.blocks_queried:,} blocks ( previously scanned {scanned} )"
+                )